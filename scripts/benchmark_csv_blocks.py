@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark CSV block parsing on SoftMax Pro and Envision test files.
+
+Converts each test file with the regular block fast path (converting the blocks read together, e.g.
+the plate grids of a kinetic read, with a single numpy conversion), with the fast path converting
+one block at a time, and with the fast path disabled (forcing every block through pd.read_csv), and
+reports the time spent in each mode.
+"""
+
+from pathlib import Path
+import time
+from unittest import mock
+
+import click
+import pandas as pd
+
+from allotropy.parser_factory import Vendor
+from allotropy.parsers.utils import csv_blocks
+from allotropy.to_allotrope import allotrope_model_from_file
+
+TESTDATA_DIRS = {
+    Vendor.MOLDEV_SOFTMAX_PRO: Path("tests/parsers/moldev_softmax_pro/testdata"),
+    Vendor.PERKIN_ELMER_ENVISION: Path("tests/parsers/perkin_elmer_envision/testdata"),
+}
+
+
+_convert_blocks = csv_blocks._convert_blocks
+
+
+def _convert_one_at_a_time(
+    blocks: list[csv_blocks._RegularBlock],
+) -> list[pd.DataFrame]:
+    return [df for block in blocks for df in _convert_blocks([block])]
+
+
+def _time_conversion(path: Path, vendor: Vendor, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        allotrope_model_from_file(str(path), vendor)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option(
+    "--repeat", default=3, help="Number of runs per file, the best is reported."
+)
+@click.option(
+    "--top", default=10, help="Number of files with the largest difference to show."
+)
+def _benchmark(repeat: int, top: int) -> None:
+    """Benchmark the CSV block fast path against pd.read_csv."""
+    results = []
+    for vendor, testdata_dir in TESTDATA_DIRS.items():
+        for path in sorted(testdata_dir.rglob("*")):
+            if path.suffix.lower()[1:] not in vendor.supported_extensions:
+                continue
+            try:
+                fast = _time_conversion(path, vendor, repeat)
+                with mock.patch.object(
+                    csv_blocks, "_convert_blocks", _convert_one_at_a_time
+                ):
+                    per_block = _time_conversion(path, vendor, repeat)
+                with mock.patch.object(
+                    csv_blocks._RegularBlock, "create", return_value=None
+                ):
+                    slow = _time_conversion(path, vendor, repeat)
+            except Exception as e:
+                print(f"Skipping {path}: {e}")
+                continue
+            results.append((path, fast, per_block, slow))
+
+    total_fast = sum(fast for _, fast, _, _ in results)
+    total_per_block = sum(per_block for _, _, per_block, _ in results)
+    total_slow = sum(slow for _, _, _, slow in results)
+    print(
+        f"{'file':<70} {'read_csv (s)':>12} {'per block (s)':>13} {'batched (s)':>11} {'speedup':>8}"
+    )
+    for path, fast, per_block, slow in sorted(results, key=lambda r: r[1] - r[3])[:top]:
+        print(
+            f"{path.name[:70]:<70} {slow:>12.3f} {per_block:>13.3f} {fast:>11.3f} {slow / fast:>7.2f}x"
+        )
+    print(
+        f"{'TOTAL (' + str(len(results)) + ' files)':<70} {total_slow:>12.3f} {total_per_block:>13.3f} {total_fast:>11.3f} {total_slow / total_fast:>7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark extracting the XML payload of Unicorn archive members.
+
+Compares UnicornZipHandler.filter_xml_metadata against the previous implementation, which looked for
+the first "<" and the last ">" one byte at a time in Python, then copied the payload twice (a slice,
+and a BytesIO read). Runs on the XML members of the Unicorn test files, and on a synthetic payload
+of the given size wrapped in binary padding.
+"""
+
+from collections.abc import Callable
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+import time
+from typing import Any
+
+import click
+
+from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
+    UnicornZipHandler,
+)
+
+TESTDATA_DIR = Path("tests/parsers/cytiva_unicorn/testdata")
+XML_MEMBERS = ("Chrom.1.Xml", "Result.xml", "EvaluationLog.xml")
+
+
+def _filter_xml_metadata_loop(stream: BytesIO) -> BytesIO:
+    data = stream.read()
+    start = -1
+    for idx, element in enumerate(data):
+        if int(element) == 60:  # 60 == '<' ASCII char
+            start = idx
+            break
+
+    end = -1
+    for idx, element in enumerate(reversed(data)):
+        if int(element) == 62:  # 62 == '>' ASCII char
+            end = len(data) - idx
+            break
+
+    return BytesIO(data[start:end])
+
+
+def _extract_with_loop(data: bytes) -> bytes:
+    return _filter_xml_metadata_loop(BytesIO(data)).read()
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _get_payloads(size_mb: float) -> list[tuple[str, bytes]]:
+    payloads = []
+    for path in sorted(TESTDATA_DIR.glob("*.zip")):
+        handler = UnicornZipHandler.create_from_path(str(path))
+        for member in XML_MEMBERS:
+            if inner_path := handler.get_inner_path_or_none(f"{member}$"):
+                payloads.append(
+                    (f"{path.name}/{inner_path}", handler.get_bytes(inner_path))
+                )
+    element = b"<Point><Volume>1.2345</Volume><Amplitude>6.789</Amplitude></Point>"
+    body = element * int(size_mb * 1024 * 1024 / len(element))
+    # Binary headers and trailers, with a "<" and ">" free padding to scan through.
+    padding = b"\x00" * 1024
+    payloads.append(
+        (
+            f"synthetic ({size_mb} MB)",
+            padding + b"<Points>" + body + b"</Points>" + padding,
+        )
+    )
+    return payloads
+
+
+@click.command()
+@click.option(
+    "--repeat", default=5, help="Number of runs per payload, the best is reported."
+)
+@click.option("--size-mb", default=8.0, help="Size of the synthetic payload in MB.")
+def _benchmark(repeat: int, size_mb: float) -> None:
+    """Benchmark Unicorn XML payload extraction."""
+    handler = UnicornZipHandler.create_from_path(str(next(TESTDATA_DIR.glob("*.zip"))))
+    print(
+        f"{'payload':<60} {'size (KB)':>10} {'loop (ms)':>10} {'find (ms)':>10} {'speedup':>8}"
+    )
+    for name, data in _get_payloads(size_mb):
+        expected = _extract_with_loop(data)
+        if bytes(handler.filter_xml_metadata(data)) != expected:
+            msg = f"Extracted XML of {name} does not match the previous implementation."
+            raise click.ClickException(msg)
+        loop = _time(partial(_extract_with_loop, data), repeat)
+        find = _time(partial(handler.filter_xml_metadata, data), repeat)
+        print(
+            f"{name[:60]:<60} {len(data) / 1024:>10.0f} {loop * 1000:>10.2f} {find * 1000:>10.3f} {loop / find:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    _benchmark()
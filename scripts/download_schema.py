@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import click
 
+from allotropy.allotrope.schemas import write_schema_index
 from allotropy.schema_gen.fetcher import SchemaFetcher
 from allotropy.schema_gen.technique_resolver import (
     is_shorthand,
@@ -36,6 +37,7 @@ def _download_schema(schema_input: str) -> None:
         schemas = fetcher.fetch_with_dependencies(url)
         total += len(schemas)
     click.echo(f"Downloaded {total} schema(s) to cache")
+    write_schema_index()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import click
 
+from allotropy.allotrope.schemas import write_schema_index
 from allotropy.schema_gen.generate import (
     _discover_cached_technique_urls,
     generate_models,
+    generate_validators,
 )
 from allotropy.schema_gen.technique_resolver import (
     is_shorthand,
@@ -52,6 +54,8 @@ def _generate_schemas(
         msg = "Provide schema URLs/shorthands or use --all."
         raise click.UsageError(msg)
     generate_models(urls)
+    write_schema_index()
+    generate_validators()
 
 
 if __name__ == "__main__":
@@ -3,17 +3,49 @@ from __future__ import annotations
 from typing import Any
 
 from allotropy.allotrope.converter import unstructure
+from allotropy.allotrope.data_cube_encoding import (
+    DataCubeEncodingOptions,
+    unstructure_with_encoded_data_cubes,
+    with_placeholder_arrays,
+)
 from allotropy.allotrope.schemas import validate_asm_schema
 from allotropy.exceptions import AllotropeSerializationError
+from allotropy.profiling import profile_stage, UNSTRUCTURE, VALIDATE
 
 
-def serialize_and_validate_allotrope(model: Any) -> dict[str, Any]:
+def serialize_allotrope(
+    model: Any, data_cube_encoding: DataCubeEncodingOptions | None = None
+) -> dict[str, Any]:
     try:
-        allotrope_dict: dict[str, Any] = unstructure(model)
+        with profile_stage(UNSTRUCTURE):
+            allotrope_dict: dict[str, Any] = (
+                unstructure(model)
+                if data_cube_encoding is None
+                else unstructure_with_encoded_data_cubes(model, data_cube_encoding)
+            )
     except Exception as e:
         msg = f"Failed to serialize allotrope model: {e}"
         raise AllotropeSerializationError(msg) from e
+    return allotrope_dict
+
+
+def validate_allotrope(
+    allotrope_dict: dict[str, Any], *, encoded_data_cubes: bool = False
+) -> None:
+    # Encoded data cube arrays are not valid ASM, each is validated as an array of numbers instead.
+    validate_asm_schema(
+        with_placeholder_arrays(allotrope_dict)
+        if encoded_data_cubes
+        else allotrope_dict
+    )
 
-    validate_asm_schema(allotrope_dict)
 
+def serialize_and_validate_allotrope(
+    model: Any, data_cube_encoding: DataCubeEncodingOptions | None = None
+) -> dict[str, Any]:
+    allotrope_dict = serialize_allotrope(model, data_cube_encoding)
+    with profile_stage(VALIDATE):
+        validate_allotrope(
+            allotrope_dict, encoded_data_cubes=data_cube_encoding is not None
+        )
     return allotrope_dict
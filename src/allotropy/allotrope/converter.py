@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import asdict, field, fields, is_dataclass, make_dataclass, MISSING
 from enum import Enum
 import keyword
@@ -8,6 +8,8 @@ import sys
 import types
 from typing import Any, get_args, get_origin, get_type_hints, TypeVar, Union
 
+import numpy as np
+
 from allotropy.allotrope.path_util import get_model_class_from_schema
 from allotropy.schema_gen.naming import default_json_name
 
@@ -154,18 +156,70 @@ def add_custom_information_document(
     )
 
     try:
-        model.custom_information_document = custom_info_doc  # type: ignore
-    except AttributeError:
         # Frozen dataclasses block __setattr__; bypass with object.__setattr__
         object.__setattr__(model, "custom_information_document", custom_info_doc)
+    except AttributeError:
+        # Slotted models have no room for it, so copy the model to a subclass that does.
+        model = _copy_with_custom_information_document_slot(model)
+        object.__setattr__(model, "custom_information_document", custom_info_doc)
     return model
 
 
+# Subclasses of slotted model classes, with a slot for a custom information document.
+_CUSTOM_INFORMATION_DOCUMENT_CLASSES: dict[type, type] = {}
+
+
+def _copy_with_custom_information_document_slot(model: Any) -> Any:
+    cls = type(model)
+    if cls not in _CUSTOM_INFORMATION_DOCUMENT_CLASSES:
+        # Not a dataclass itself: it shares the fields, repr and equality of the model class.
+        _CUSTOM_INFORMATION_DOCUMENT_CLASSES[cls] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__slots__": ("custom_information_document",),
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+            },
+        )
+    copy: Any = object.__new__(_CUSTOM_INFORMATION_DOCUMENT_CLASSES[cls])
+    for f in fields(model):
+        object.__setattr__(copy, f.name, getattr(model, f.name))
+    return copy
+
+
 # ---------------------------------------------------------------------------
 # unstructure (model → dict)
 # ---------------------------------------------------------------------------
 
 
+def iter_json_fields(obj: Any) -> Iterator[tuple[str, Any]]:
+    """Yield the (JSON key, value) pairs that ``unstructure`` outputs for a dataclass instance.
+
+    Values are not unstructured yet, except for a dynamically-attached
+    ``custom_information_document``, which is yielded as a dict.
+    """
+    dc_fields = fields(obj)
+    for f in dc_fields:
+        value = getattr(obj, f.name)
+        if value is None:
+            # Keep None for required fields (no default) to preserve
+            # explicitly set null values like cycle_threshold_result.
+            is_required = f.default is MISSING and f.default_factory is MISSING
+            if not is_required:
+                continue
+        yield f.metadata.get("json_name", default_json_name(f.name)), value
+    # Handle dynamically-attached custom_information_document (not in fields())
+    if (
+        hasattr(obj, "custom_information_document")
+        and not any(f.name == "custom_information_document" for f in dc_fields)
+        and not isinstance(obj.custom_information_document, list)
+    ):
+        yield "custom information document", _unstructure_custom_information_document(
+            obj.custom_information_document
+        )
+
+
 def unstructure(obj: Any) -> Any:
     """Convert a dataclass instance to a JSON-compatible dict.
 
@@ -173,6 +227,7 @@ def unstructure(obj: Any) -> Any:
       to ``field_name.replace("_", " ")``).
     - ``None`` values on optional fields are omitted.
     - Lists and dicts are recursed into.
+    - NumPy arrays (e.g. data cube values) are converted to lists in one call.
     - Enum values serialize as their value.
     - Dynamically-attached ``custom_information_document`` attributes are
       included at every nesting level.
@@ -182,30 +237,9 @@ def unstructure(obj: Any) -> Any:
         return None
 
     if is_dataclass(obj) and not isinstance(obj, type):
-        result: dict[str, Any] = {}
-        dc_fields = fields(obj)
-        for f in dc_fields:
-            value = getattr(obj, f.name)
-            if value is None:
-                # Keep None for required fields (no default) to preserve
-                # explicitly set null values like cycle_threshold_result.
-                is_required = f.default is MISSING and f.default_factory is MISSING
-                if not is_required:
-                    continue
-            json_key = f.metadata.get("json_name", default_json_name(f.name))
-            result[json_key] = unstructure(value)
-        # Handle dynamically-attached custom_information_document (not in fields())
-        if (
-            hasattr(obj, "custom_information_document")
-            and not any(f.name == "custom_information_document" for f in dc_fields)
-            and not isinstance(obj.custom_information_document, list)
-        ):
-            result[
-                "custom information document"
-            ] = _unstructure_custom_information_document(
-                obj.custom_information_document
-            )
-        return result
+        return {
+            json_key: unstructure(value) for json_key, value in iter_json_fields(obj)
+        }
 
     if isinstance(obj, list):
         # Fast-path: lists of primitives (e.g., data cube float arrays with millions
@@ -219,6 +253,9 @@ def unstructure(obj: Any) -> Any:
                 return obj
         return [unstructure(item) for item in obj]
 
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+
     if isinstance(obj, dict):
         return {k: unstructure(v) for k, v in obj.items()}
 
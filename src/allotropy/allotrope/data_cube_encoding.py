@@ -0,0 +1,340 @@
+"""Compact binary encoding of the data cubes in ASM.
+
+Data cube dimensions and measures serialize as JSON number arrays, so a data cube with a million
+points takes tens of MB of text. encode_data_cubes replaces the numeric arrays of each data cube
+with a reference to the packed values, either inline as base64 encoded little-endian bytes:
+
+    {"@encoding": "base64", "dtype": "<f8", "data": "AAAAAAAA8D8..."}
+
+or as a .npy file written to a sidecar directory:
+
+    {"@encoding": "npy", "path": "3f9c0a1e5b7d2c48-data-cube-0-measures-0.npy"}
+
+The sidecar files are prefixed with a name for the document, by default a hash of its arrays, so
+that the data cubes of several documents can be written to the same sidecar directory.
+
+Documents with encoded data cubes are not valid ASM. decode_data_cubes reconstitutes the original
+document. Encoding is lossless: arrays with values that cannot be packed exactly (e.g. nulls in
+measures, or mixed ints and floats) are left as they are.
+
+Conversions can encode the data cubes of the model they create, with the data_cube_encoding option of
+the to_allotrope entry points. unstructure_with_encoded_data_cubes then packs the NumPy arrays of the
+model directly, rather than converting them to lists first.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable
+from dataclasses import dataclass, is_dataclass
+from enum import Enum
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from allotropy.allotrope.converter import iter_json_fields, unstructure
+from allotropy.exceptions import AllotropeSerializationError
+
+ENCODING_KEY = "@encoding"
+CUBE_STRUCTURE_KEY = "cube-structure"
+DATA_KEY = "data"
+DATA_ARRAY_KEYS = ("dimensions", "measures")
+
+
+class DataCubeEncoding(Enum):
+    BASE64 = "base64"
+    NPY = "npy"
+
+
+@dataclass(frozen=True)
+class DataCubeEncodingOptions:
+    """How a conversion encodes its data cubes, see encode_data_cubes."""
+
+    encoding: DataCubeEncoding = DataCubeEncoding.BASE64
+    float_dtype: str = "float64"
+    sidecar_dir: str | Path | None = None
+
+
+def _map_data_cubes(value: Any, func: Callable[[dict[str, Any]], Any]) -> Any:
+    """Copy value, replacing the data of each data cube within it with func(data)."""
+    if isinstance(value, dict):
+        if CUBE_STRUCTURE_KEY in value and isinstance(value.get(DATA_KEY), dict):
+            return {
+                key: func(item) if key == DATA_KEY else item
+                for key, item in value.items()
+            }
+        return {key: _map_data_cubes(item, func) for key, item in value.items()}
+    # Lists of values (rather than documents) cannot contain data cubes, skip them.
+    if isinstance(value, list) and value and isinstance(value[0], dict | list):
+        return [_map_data_cubes(item, func) for item in value]
+    return value
+
+
+def _map_data_arrays(
+    data: dict[str, Any], func: Callable[[Any, str, int], Any]
+) -> dict[str, Any]:
+    """Copy the data of a data cube, replacing each array with func(array, key, index)."""
+    result = dict(data)
+    for key in DATA_ARRAY_KEYS:
+        if isinstance(arrays := data.get(key), list):
+            result[key] = [
+                func(values, key, index) for index, values in enumerate(arrays)
+            ]
+    return result
+
+
+class _Encoder:
+    def __init__(
+        self,
+        encoding: DataCubeEncoding,
+        float_dtype: str,
+        sidecar_dir: Path | None,
+        name: str | None,
+    ) -> None:
+        if encoding is DataCubeEncoding.NPY and sidecar_dir is None:
+            msg = "A sidecar directory is required for the npy data cube encoding."
+            raise AllotropeSerializationError(msg)
+        if name is not None and (not name or Path(name).name != name):
+            msg = f"Invalid data cube sidecar name: {name!r}, expected a file name."
+            raise AllotropeSerializationError(msg)
+        if float_dtype not in ("float32", "float64"):
+            msg = f"Unsupported data cube float dtype: {float_dtype}, expected float32 or float64."
+            raise AllotropeSerializationError(msg)
+        self.encoding = encoding
+        self.float_dtype = np.dtype(float_dtype).newbyteorder("<")
+        self.sidecar_dir = sidecar_dir
+        self.name = name
+        self.cube_count = 0
+        # The npy arrays and the references to them, written once the name of the document is known.
+        self.sidecar_arrays: list[tuple[dict[str, Any], np.ndarray[Any, Any]]] = []
+
+    def encode_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        cube_index = self.cube_count
+        self.cube_count += 1
+        return _map_data_arrays(
+            data,
+            lambda values, key, index: self._encode_array(
+                values, f"data-cube-{cube_index}-{key}-{index}"
+            ),
+        )
+
+    def _encode_array(self, values: Any, name: str) -> Any:
+        array = self._pack(values)
+        if array is None:
+            return unstructure(values)
+        if self.encoding is DataCubeEncoding.BASE64:
+            return {
+                ENCODING_KEY: DataCubeEncoding.BASE64.value,
+                "dtype": array.dtype.str,
+                "data": base64.b64encode(array.tobytes()).decode("ascii"),
+            }
+        reference = {ENCODING_KEY: DataCubeEncoding.NPY.value, "path": name}
+        self.sidecar_arrays.append((reference, array))
+        return reference
+
+    def write_sidecar_files(self) -> None:
+        name = self.name
+        if name is None:
+            digest = hashlib.sha256()
+            for reference, array in self.sidecar_arrays:
+                digest.update(f"{reference['path']}:{array.dtype.str}:".encode())
+                digest.update(array.tobytes())
+            name = digest.hexdigest()[:16]
+        for reference, array in self.sidecar_arrays:
+            reference["path"] = f"{name}-{reference['path']}.npy"
+            np.save(
+                Path(self.sidecar_dir or ".", reference["path"]),
+                array,
+                allow_pickle=False,
+            )
+
+    def _pack(self, values: Any) -> np.ndarray[Any, Any] | None:
+        """The values as a little-endian array that unpacks to the same values, or None if there is none."""
+        if isinstance(values, np.ndarray):
+            # Arrays of a model, packed as the list unstructure converts them to would be.
+            if values.ndim != 1 or not values.size:
+                return None
+            if values.dtype.kind == "f":
+                return self._narrow(values.astype("<f8"))
+            if values.dtype.kind in "iu" and values.max() <= np.iinfo(np.int64).max:
+                return values.astype("<i8")
+            return None
+        if not isinstance(values, list) or not values:
+            return None
+        kinds = {type(value) for value in values}
+        if kinds == {float}:
+            return self._narrow(np.array(values, dtype="<f8"))
+        if kinds == {int}:
+            try:
+                return np.array(values, dtype="<i8")
+            except OverflowError:
+                return None
+        return None
+
+    def _narrow(self, array: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        if self.float_dtype != array.dtype:
+            narrowed = array.astype(self.float_dtype)
+            # Values that float32 cannot represent exactly keep their float64 encoding.
+            if np.array_equal(narrowed, array):
+                return narrowed
+        return array
+
+    def _encode_model_data(self, data: Any) -> dict[str, Any]:
+        # The arrays are encoded before they are unstructured, and the references to sidecar files
+        # are not copied, so that write_sidecar_files sets their path in the result.
+        return self.encode_data(
+            {
+                key: value
+                if key in DATA_ARRAY_KEYS and isinstance(value, list)
+                else unstructure(value)
+                for key, value in (
+                    data.items() if isinstance(data, dict) else iter_json_fields(data)
+                )
+            }
+        )
+
+    def unstructure(self, obj: Any) -> Any:
+        """unstructure obj, encoding the arrays of its data cubes as they are found."""
+        if is_dataclass(obj) and not isinstance(obj, type):
+            items = dict(iter_json_fields(obj))
+            data = items.get(DATA_KEY)
+            if CUBE_STRUCTURE_KEY in items and (
+                isinstance(data, dict) or is_dataclass(data)
+            ):
+                return {
+                    key: self._encode_model_data(value)
+                    if key == DATA_KEY
+                    else unstructure(value)
+                    for key, value in items.items()
+                }
+            return {key: self.unstructure(value) for key, value in items.items()}
+        if (
+            isinstance(obj, list)
+            and obj
+            and (is_dataclass(obj[0]) or isinstance(obj[0], dict | list))
+        ):
+            return [self.unstructure(item) for item in obj]
+        # Other values, including custom information documents, have no model data cubes.
+        return _map_data_cubes(unstructure(obj), self.encode_data)
+
+
+def encode_data_cubes(
+    asm: dict[str, Any],
+    encoding: DataCubeEncoding = DataCubeEncoding.BASE64,
+    *,
+    float_dtype: str = "float64",
+    sidecar_dir: str | Path | None = None,
+    name: str | None = None,
+) -> dict[str, Any]:
+    """Return a copy of asm with the numeric arrays of its data cubes encoded.
+
+    With float_dtype="float32", float arrays are packed as float32 where that is lossless. With the
+    npy encoding, arrays are written to sidecar_dir, and referenced by their path within it. The
+    file names are prefixed with name, by default a hash of the arrays.
+    """
+    encoder = _Encoder(
+        encoding, float_dtype, None if sidecar_dir is None else Path(sidecar_dir), name
+    )
+    encoded: dict[str, Any] = _map_data_cubes(asm, encoder.encode_data)
+    if encoder.sidecar_dir is not None:
+        encoder.sidecar_dir.mkdir(parents=True, exist_ok=True)
+        encoder.write_sidecar_files()
+    return encoded
+
+
+def unstructure_with_encoded_data_cubes(
+    model: Any, options: DataCubeEncodingOptions, name: str | None = None
+) -> dict[str, Any]:
+    """Return unstructure(model) with the numeric arrays of its data cubes encoded.
+
+    The result is the same as encode_data_cubes(unstructure(model), ...) with the same options, but
+    the NumPy arrays of the model are packed directly, without converting them to lists first.
+    """
+    encoder = _Encoder(
+        options.encoding,
+        options.float_dtype,
+        None if options.sidecar_dir is None else Path(options.sidecar_dir),
+        name,
+    )
+    encoded: dict[str, Any] = encoder.unstructure(model)
+    if encoder.sidecar_dir is not None:
+        encoder.sidecar_dir.mkdir(parents=True, exist_ok=True)
+        encoder.write_sidecar_files()
+    return encoded
+
+
+def with_placeholder_arrays(asm: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of asm with each encoded data cube array replaced by [0.0].
+
+    Only arrays of numbers are encoded, and the schemas do not constrain the length of data cube
+    arrays, so the copy validates against the schema as the decoded document would.
+    """
+    placeholder: dict[str, Any] = _map_data_cubes(
+        asm,
+        lambda data: _map_data_arrays(
+            data,
+            lambda values, _key, _index: [0.0]
+            if isinstance(values, dict) and ENCODING_KEY in values
+            else values,
+        ),
+    )
+    return placeholder
+
+
+def _get_sidecar_path(sidecar_dir: Path, path: Any) -> Path:
+    if not isinstance(path, str):
+        msg = f"Invalid data cube sidecar path: {path!r}"
+        raise AllotropeSerializationError(msg)
+    root = sidecar_dir.resolve()
+    full_path = Path(root, path).resolve()
+    if not full_path.is_relative_to(root):
+        msg = f"Data cube sidecar path is outside of the sidecar directory: {path}"
+        raise AllotropeSerializationError(msg)
+    return full_path
+
+
+def _decode_array(value: Any, sidecar_dir: Path | None) -> Any:
+    if not isinstance(value, dict) or ENCODING_KEY not in value:
+        return value
+    encoding = value[ENCODING_KEY]
+    try:
+        if encoding == DataCubeEncoding.BASE64.value:
+            array = np.frombuffer(
+                base64.b64decode(value["data"]), dtype=np.dtype(value["dtype"])
+            )
+        elif encoding == DataCubeEncoding.NPY.value:
+            if sidecar_dir is None:
+                msg = (
+                    "A sidecar directory is required to decode npy encoded data cubes."
+                )
+                raise AllotropeSerializationError(msg)
+            array = np.load(
+                _get_sidecar_path(sidecar_dir, value["path"]), allow_pickle=False
+            )
+        else:
+            msg = f"Unrecognized data cube encoding: {encoding}"
+            raise AllotropeSerializationError(msg)
+    except (KeyError, TypeError, ValueError, OSError) as e:
+        msg = f"Failed to decode {encoding} encoded data cube array: {e}"
+        raise AllotropeSerializationError(msg) from e
+    # float32 values widen to the float64 values they were encoded from.
+    values: list[Any] = array.astype(
+        np.float64 if array.dtype.kind == "f" else np.int64
+    ).tolist()
+    return values
+
+
+def decode_data_cubes(
+    asm: dict[str, Any], *, sidecar_dir: str | Path | None = None
+) -> dict[str, Any]:
+    """Return a copy of asm with its encoded data cube arrays decoded, i.e. as standard ASM."""
+    sidecar_path = None if sidecar_dir is None else Path(sidecar_dir)
+    decoded: dict[str, Any] = _map_data_cubes(
+        asm,
+        lambda data: _map_data_arrays(
+            data, lambda values, _key, _index: _decode_array(values, sidecar_path)
+        ),
+    )
+    return decoded
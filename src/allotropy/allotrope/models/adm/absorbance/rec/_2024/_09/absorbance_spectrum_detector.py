@@ -17,7 +17,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -31,7 +31,7 @@ class DeviceControlDocumentItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakItem(OrderedItem):
     peak_height: TQuantityValueMilliAbsorbanceUnit | None = None
     peak_area: TQuantityValueMilliAbsorbanceUnitTimesMilliliter | TQuantityValueMilliAbsorbanceUnitTimesSecond | None = (
@@ -39,34 +39,34 @@ class PeakItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ThreeDimensionalUltravioletSpectrumDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakList:
     peak: list[PeakItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     peak_list: PeakList | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
     three_dimensional_ultraviolet_spectrum_data_cube: ThreeDimensionalUltravioletSpectrumDataCube | None = field(
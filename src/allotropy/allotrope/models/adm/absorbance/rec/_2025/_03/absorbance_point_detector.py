@@ -13,7 +13,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
     detector_wavelength_setting: TQuantityValueNanometer | None = None
@@ -27,12 +27,12 @@ class DeviceControlDocumentItem(OrderedItem):
     electronic_absorbance_wavelength_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     absorbance: TQuantityValueMilliAbsorbanceUnit
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
@@ -11,7 +11,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     p_o2: TQuantityValueKiloPascal | TQuantityValueMillimeterOfMercury = field(
         metadata={"json_name": "pO2"}
@@ -10,7 +10,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     p_o2: TQuantityValueMillimeterOfMercury = field(metadata={"json_name": "pO2"})
     p_co2: TQuantityValueMillimeterOfMercury = field(metadata={"json_name": "pCO2"})
@@ -40,7 +40,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     brand_name: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -62,7 +62,7 @@ class DeviceControlDocumentItem(OrderedItem):
     flow_path: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -77,7 +77,7 @@ class DeviceDocumentItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -85,7 +85,7 @@ class DiagnosticTraceDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReportPointDocumentItem:
     absolute_resonance: TQuantityValueResponseUnit | None = None
     report_point_identifier: TStringValue | None = None
@@ -110,7 +110,7 @@ class SampleRoleType(Enum):
     reference_sample_role = "reference sample role"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SensorChipDocument:
     sensor_chip_identifier: TStringValue | None = None
     sensor_chip_type: TStringValue | None = None
@@ -121,14 +121,14 @@ class SensorChipDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SensorgramDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -136,7 +136,7 @@ class DeviceControlAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     device_identifier: TStringValue
     model_number: TStringValue
@@ -152,7 +152,7 @@ class DeviceSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -160,12 +160,12 @@ class DiagnosticTraceAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReportPointAggregateDocument:
     report_point_document: list[ReportPointDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -180,7 +180,7 @@ class SampleDocument:
     concentration: TQuantityValueNanomolar | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     posix_path: TStringValue | None = field(
         default=None, metadata={"json_name": "POSIX path"}
@@ -212,7 +212,7 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -221,7 +221,7 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     measurement_identifier: TStringValue
@@ -247,7 +247,7 @@ class MeasurementDocumentItem:
     sensor_chip_document: SensorChipDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     measurement_time: TDateTimeStampValue
@@ -265,18 +265,18 @@ class MeasurementAggregateDocument:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class BindingAffinityAnalyzerDocumentItem(TechniqueDocument):
     measurement_aggregate_document: MeasurementAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class BindingAffinityAnalyzerAggregateDocument(TechniqueAggregateDocument):
     binding_affinity_analyzer_document: list[BindingAffinityAnalyzerDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     binding_affinity_analyzer_aggregate_document: BindingAffinityAnalyzerAggregateDocument | None = (
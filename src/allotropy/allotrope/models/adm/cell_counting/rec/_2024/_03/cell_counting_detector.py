@@ -22,7 +22,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     cell_type_processing_method: TStringValue | None = None
     cell_density_dilution_factor: TQuantityValueUnitless | None = None
@@ -30,25 +30,25 @@ class DataProcessingDocument:
     maximum_cell_diameter_setting: TQuantityValueMicrometer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     excitation_wavelength_setting: TQuantityValueNanometer | None = None
     detector_wavelength_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TotalCellDiameterDistribution(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     viability__cell_counter_: TQuantityValuePercent = field(
         metadata={"json_name": "viability (cell counter)"}
@@ -80,12 +80,12 @@ class ProcessedDataDocumentItem:
     average_viable_cell_circularity: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     processed_data_aggregate_document: ProcessedDataAggregateDocument
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
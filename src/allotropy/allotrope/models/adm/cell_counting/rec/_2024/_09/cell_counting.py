@@ -38,7 +38,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     cell_type_processing_method: TStringValue | None = None
     cell_density_dilution_factor: TQuantityValueUnitless | None = None
@@ -46,7 +46,7 @@ class DataProcessingDocument:
     maximum_cell_diameter_setting: TQuantityValueMicrometer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     brand_name: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -71,7 +71,7 @@ class DeviceControlDocumentItem(OrderedItem):
     fluorescent_tag_setting: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -95,14 +95,14 @@ class SampleRoleType(Enum):
     reference_sample_role = "reference sample role"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TotalCellDiameterDistribution(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -110,7 +110,7 @@ class DeviceControlAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -118,7 +118,7 @@ class DiagnosticTraceAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -130,7 +130,7 @@ class SampleDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     data_processing_document: DataProcessingDocument | None = None
     fluorescent_tag_positive_cell_count: TQuantityValueCell | None = None
@@ -173,7 +173,7 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -182,7 +182,7 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     measurement_identifier: TStringValue
@@ -200,7 +200,7 @@ class MeasurementDocumentItem:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -214,17 +214,17 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CellCountingDocumentItem(TechniqueDocument):
     measurement_aggregate_document: MeasurementAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CellCountingAggregateDocument(TechniqueAggregateDocument):
     cell_counting_document: list[CellCountingDocumentItem]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     cell_counting_aggregate_document: CellCountingAggregateDocument | None = None
@@ -16,7 +16,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -26,7 +26,7 @@ class DeviceControlDocumentItem(OrderedItem):
     fluorescent_tag_setting: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     fluorescent_tag_positive_cell_count: TQuantityValueCell
     fluorescent_tag_positive_cell_density: TQuantityValueMillionCellsPerMilliliter | None = (
@@ -35,17 +35,17 @@ class ProcessedDataDocumentItem:
     fluorescent_tag_positive_percentage: TQuantityValuePercent | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
@@ -20,38 +20,38 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChromatogramDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     detector_wavelength_setting: TQuantityValueNm | None = None
     detector_bandwidth_setting: TQuantityValueNm | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakItemMillivolts(OrderedItem):
     peak_height: TQuantityValueMV | None = None
     peak_area: TQuantityValueMVDots | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakItemNanocoulombs(OrderedItem):
     peak_height: TQuantityValueNC | None = None
     peak_area: TQuantityValueNCDots | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakItemPicoamperes(OrderedItem):
     peak_height: TQuantityValuePA | None = None
     peak_area: TQuantityValuePADots | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
@@ -59,36 +59,36 @@ class DeviceControlAggregateDocument:
 PeakItem = PeakItemMillivolts | PeakItemNanocoulombs | PeakItemPicoamperes
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakList:
     peak: list[PeakItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     peak_list: PeakList | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Millivolts:
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
     chromatogram_data_cube: ChromatogramDataCube | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Nanocoulombs:
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
     chromatogram_data_cube: ChromatogramDataCube | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Picoamperes:
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
     chromatogram_data_cube: ChromatogramDataCube | None = None
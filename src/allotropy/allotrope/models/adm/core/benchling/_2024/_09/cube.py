@@ -59,7 +59,7 @@ class Type(Enum):
     logarithmic = "logarithmic"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDatacubeComponent:
     field_component_datatype: ComponentDatatype = field(
         metadata={"json_name": "@componentDatatype"}
@@ -75,7 +75,7 @@ TDimensionArray = TBooleanArray | TNumberArray | TStringArray
 TMeasureArray = TBooleanOrNullArray | TNumberOrNullArray | TStringOrNullArray
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TFunction:
     type: Type | None = None
     start: float | None = None
@@ -83,7 +83,7 @@ class TFunction:
     incr: float | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDatacubeStructure:
     dimensions: list[TDatacubeComponent]
     measures: list[TDatacubeComponent]
@@ -95,17 +95,17 @@ class TMeasureData:
     points: list[TTupleData] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDimensionData:
     dimensions: list[TDimensionArray | TFunction]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDatacubeData(TDimensionData, TMeasureData):
     pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDatacube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -19,7 +19,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalysisSequenceDocument:
     written_name: TStringValue
     end_time: TDateTimeValue | None = None
@@ -34,31 +34,31 @@ class AnalysisSequenceDocument:
     version_number: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationResultDocumentItem:
     calibration_result_name: TStringValue | None = None
     calibration_result: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationDocumentItem(OrderedItem):
     datum_label: TStringValue
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem(OrderedItem):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicProjectRecord:
     written_name: TStringValue
     description: Any | None = None
     start_time: TDateTimeValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicSignatureDocumentItem(OrderedItem):
     account_identifier: TStringValue
     personal_name: TStringValue
@@ -70,19 +70,19 @@ class ElectronicSignatureDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorDocumentItem:
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageDocumentItem:
     experimental_data_identifier: TStringValue | None = None
     index: TIntegerValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReferenceMaterialDocument:
     reference_material_identifier: TStringValue | None = None
     batch_identifier: TStringValue | None = None
@@ -105,7 +105,7 @@ class SampleRoleType(Enum):
     reference_sample_role = "reference sample role"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticDimensionDocumentItem:
     dimension_identifier: TStringValue | None = None
     statistical_value: TQuantityValue | None = None
@@ -321,42 +321,42 @@ class StatisticalFeature(Enum):
     yield_stress = "yield stress"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationResultAggregateDocument:
     calibration_result_document: list[CalibrationResultDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationAggregateDocument:
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicSignatureAggregateDocument:
     electronic_signature_document: list[ElectronicSignatureDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorAggregateDocument:
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageAggregateDocument:
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticDimensionAggregateDocument:
     statistic_dimension_document: list[StatisticDimensionDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationDocumentItem:
     calibration_name: TStringValue | None = None
     calibration_description: TStringValue | None = None
@@ -369,7 +369,7 @@ class CalibrationDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     asm_file_identifier: TStringValue = field(
         metadata={"json_name": "ASM file identifier"}
@@ -393,7 +393,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -408,7 +408,7 @@ class DeviceControlDocumentItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -423,7 +423,7 @@ class DeviceDocumentItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -431,7 +431,7 @@ class DiagnosticTraceDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -444,7 +444,7 @@ class SampleDocument:
     location_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem(OrderedItem):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -454,7 +454,7 @@ class CalculatedDataDocumentItem(OrderedItem):
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -465,7 +465,7 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsDocumentItem:
     statistical_feature: StatisticalFeature
     statistic_dimension_aggregate_document: StatisticDimensionAggregateDocument | None = (
@@ -473,12 +473,12 @@ class StatisticsDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationAggregateDocument:
     calibration_document: list[CalibrationDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -486,7 +486,7 @@ class DeviceControlAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -494,12 +494,12 @@ class DiagnosticTraceAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -508,12 +508,12 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsAggregateDocument:
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue | None = None
     brand_name: TStringValue | None = None
@@ -530,7 +530,7 @@ class DeviceSystemDocument:
     calibration_aggregate_document: CalibrationAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -548,7 +548,7 @@ class MeasurementDocumentItem:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueAggregateDocument:
     analysis_sequence_document: AnalysisSequenceDocument | None = None
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -565,7 +565,7 @@ class TechniqueAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -582,7 +582,7 @@ class MeasurementAggregateDocument:
     experimental_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueDocument:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
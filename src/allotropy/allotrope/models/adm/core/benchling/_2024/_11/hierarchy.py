@@ -16,7 +16,7 @@ from allotropy.allotrope.models.adm.core.benchling._2024._09.core import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalysisSequenceDocument:
     written_name: TStringValue
     end_time: TDateTimeValue | None = None
@@ -31,25 +31,25 @@ class AnalysisSequenceDocument:
     version_number: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationDocumentItem(OrderedItem):
     datum_label: TStringValue
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem(OrderedItem):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicProjectRecord:
     written_name: TStringValue
     description: Any | None = None
     start_time: TDateTimeValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicSignatureDocumentItem(OrderedItem):
     account_identifier: TStringValue
     personal_name: TStringValue
@@ -61,13 +61,13 @@ class ElectronicSignatureDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorDocumentItem:
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageDocumentItem:
     experimental_data_identifier: TStringValue | None = None
     index: TIntegerValue | None = None
@@ -298,37 +298,37 @@ class StatisticalFeature(Enum):
     yield_stress = "yield stress"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationAggregateDocument:
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicSignatureAggregateDocument:
     electronic_signature_document: list[ElectronicSignatureDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorAggregateDocument:
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageAggregateDocument:
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsDocumentItem:
     statistical_feature: StatisticalFeature
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     asm_file_identifier: TStringValue = field(
         metadata={"json_name": "ASM file identifier"}
@@ -352,7 +352,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -367,7 +367,7 @@ class DeviceControlDocumentItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -382,7 +382,7 @@ class DeviceDocumentItem(OrderedItem):
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -390,7 +390,7 @@ class DiagnosticTraceDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -403,7 +403,7 @@ class SampleDocument:
     location_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem(OrderedItem):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -413,7 +413,7 @@ class CalculatedDataDocumentItem(OrderedItem):
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -424,12 +424,12 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsAggregateDocument:
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -437,7 +437,7 @@ class DeviceControlAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue | None = None
     brand_name: TStringValue | None = None
@@ -453,7 +453,7 @@ class DeviceSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -461,12 +461,12 @@ class DiagnosticTraceAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -475,7 +475,7 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -493,7 +493,7 @@ class MeasurementDocumentItem:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueAggregateDocument:
     analysis_sequence_document: AnalysisSequenceDocument | None = None
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -510,7 +510,7 @@ class TechniqueAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -527,7 +527,7 @@ class MeasurementAggregateDocument:
     experimental_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueDocument:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
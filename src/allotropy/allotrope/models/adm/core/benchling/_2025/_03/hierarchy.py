@@ -16,25 +16,25 @@ from allotropy.allotrope.models.adm.core.benchling._2025._03.core import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationDocumentItem(OrderedItem):
     datum_label: TStringValue
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem(OrderedItem):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicProjectRecord:
     written_name: TStringValue
     description: Any | None = None
     start_time: TDateTimeValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicSignatureDocumentItem(OrderedItem):
     account_identifier: TStringValue
     personal_name: TStringValue
@@ -46,13 +46,13 @@ class ElectronicSignatureDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorDocumentItem:
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageDocumentItem:
     experimental_data_identifier: TStringValue | None = None
     index: TIntegerValue | None = None
@@ -283,37 +283,37 @@ class StatisticalFeature(Enum):
     yield_stress = "yield stress"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationAggregateDocument:
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ElectronicSignatureAggregateDocument:
     electronic_signature_document: list[ElectronicSignatureDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorAggregateDocument:
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageAggregateDocument:
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsDocumentItem:
     statistical_feature: StatisticalFeature
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalysisSequenceDocument:
     written_name: TStringValue
     unc_path: TStringValue | None = field(
@@ -331,7 +331,7 @@ class AnalysisSequenceDocument:
     version_number: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     asm_file_identifier: TStringValue = field(
         metadata={"json_name": "ASM file identifier"}
@@ -358,7 +358,7 @@ class DataSystemDocument:
     software_version: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -373,7 +373,7 @@ class DeviceControlDocumentItem(OrderedItem):
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -388,7 +388,7 @@ class DeviceDocumentItem(OrderedItem):
     written_name: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -396,7 +396,7 @@ class DiagnosticTraceDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -409,7 +409,7 @@ class SampleDocument:
     written_name: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem(OrderedItem):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -419,7 +419,7 @@ class CalculatedDataDocumentItem(OrderedItem):
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -430,12 +430,12 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsAggregateDocument:
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -443,7 +443,7 @@ class DeviceControlAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue | None = None
     brand_name: TStringValue | None = None
@@ -459,7 +459,7 @@ class DeviceSystemDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -467,12 +467,12 @@ class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -481,7 +481,7 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -502,7 +502,7 @@ class MeasurementDocumentItem:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueAggregateDocument:
     analysis_sequence_document: AnalysisSequenceDocument | None = None
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -519,7 +519,7 @@ class TechniqueAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -533,7 +533,7 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueDocument:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
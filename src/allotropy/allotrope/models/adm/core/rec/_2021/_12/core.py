@@ -14,17 +14,17 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Asm:
     pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MixedItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OrderedItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
@@ -32,79 +32,79 @@ class OrderedItem:
 TArray = list[Any]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TBooleanValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TByteValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDateTimeStampValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDateTimeValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDateValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDecimalValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: float
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDoubleValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: float
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TDurationValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TFloatValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: float
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TIRIValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TIntValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TIntegerValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TLongValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
@@ -113,7 +113,7 @@ class TLongValueItem:
 TNamed = str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TObject:
     pass
 
@@ -124,43 +124,43 @@ TReference = str
 TResource = str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TShortValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TStringValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TTimeValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TUnsignedByteValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TUnsignedIntValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TUnsignedLongValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TUnsignedShortValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: int
@@ -252,7 +252,7 @@ TOrderedValue = (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TRangeValue:
     min_inclusive: TOrderedValue | None = field(
         default=None, metadata={"json_name": "minInclusive"}
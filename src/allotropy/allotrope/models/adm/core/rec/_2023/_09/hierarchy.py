@@ -17,18 +17,18 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingAggregateDocument:
     data_processing_document: list[dict[str, Any]]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem(OrderedItem):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     asm_converter_name: TStringValue | None = field(
         default=None, metadata={"json_name": "ASM converter name"}
@@ -45,7 +45,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -58,7 +58,7 @@ class DeviceControlDocumentItem(OrderedItem):
     start_time_setting: TDateTimeStampValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -69,7 +69,7 @@ class DeviceDocumentItem(OrderedItem):
     firmware_version: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
 
@@ -281,17 +281,17 @@ class StatisticalFeature(Enum):
     stirring_rate = "stirring rate"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue
     description: Any | None = None
@@ -304,12 +304,12 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     description: Any | None = None
@@ -322,12 +322,12 @@ class SampleDocument:
     flow_rate: TQuantityValueMilliliterPerMinute | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsDocumentItem:
     statistical_feature: StatisticalFeature
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem(OrderedItem):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -336,29 +336,29 @@ class CalculatedDataDocumentItem(OrderedItem):
     calculation_description: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     data_processing_aggregate_document: DataProcessingAggregateDocument | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsAggregateDocument:
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -370,7 +370,7 @@ class MeasurementDocumentItem:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueAggregateDocument:
     data_system_document: DataSystemDocument | None = None
     device_system_document: DeviceSystemDocument | None = None
@@ -379,7 +379,7 @@ class TechniqueAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
@@ -388,7 +388,7 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueDocument:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
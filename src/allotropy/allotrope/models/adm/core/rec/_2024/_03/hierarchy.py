@@ -15,13 +15,13 @@ from allotropy.allotrope.models.adm.core.rec._2024._03.core import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem(OrderedItem):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -33,7 +33,7 @@ class DeviceControlDocumentItem(OrderedItem):
     firmware_version: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -44,18 +44,18 @@ class DeviceDocumentItem(OrderedItem):
     firmware_version: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorDocumentItem:
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageDocumentItem:
     index: TIntegerValue | None = None
     experimental_data_identifier: TStringValue | None = None
@@ -286,17 +286,17 @@ class StatisticalFeature(Enum):
     yield_stress = "yield stress"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue | None = None
     description: Any | None = None
@@ -309,22 +309,22 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorAggregateDocument:
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageAggregateDocument:
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     description: Any | None = None
@@ -333,12 +333,12 @@ class SampleDocument:
     written_name: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsDocumentItem:
     statistical_feature: StatisticalFeature
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem(OrderedItem):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -347,29 +347,29 @@ class CalculatedDataDocumentItem(OrderedItem):
     calculation_description: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     data_processing_document: dict[str, Any] | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsAggregateDocument:
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -383,7 +383,7 @@ class MeasurementDocumentItem:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueAggregateDocument:
     device_system_document: DeviceSystemDocument | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
@@ -391,7 +391,7 @@ class TechniqueAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
@@ -402,7 +402,7 @@ class MeasurementAggregateDocument:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TechniqueDocument:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
@@ -31,13 +31,13 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     method_version: TStringValue | None = None
     data_processing_time: TDateTimeStampValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     brand_name: TStringValue | None = None
@@ -52,7 +52,7 @@ class DeviceControlDocumentItem(OrderedItem):
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -60,7 +60,7 @@ class DiagnosticTraceDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MatrixDocumentItem:
     dimension_identifier: TStringValue | None = None
     compensation_value: TQuantityValueUnitless | None = None
@@ -82,7 +82,7 @@ class SampleRoleType(Enum):
     reference_sample_role = "reference sample role"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticDimensionDocumentItem:
     dimension_identifier: TStringValue | None = None
     statistical_value: TQuantityValue | None = None
@@ -298,7 +298,7 @@ class StatisticalFeature(Enum):
     yield_stress = "yield stress"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VertexDocumentItem:
     vertex_role: TStringValue | None = None
     x_coordinate: TQuantityValueRelativeFluorescenceUnit | TQuantityValueSecondTime | None = field(
@@ -309,7 +309,7 @@ class VertexDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -317,7 +317,7 @@ class DeviceControlAggregateDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -325,12 +325,12 @@ class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MatrixAggregateDocument:
     matrix_document: list[MatrixDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -344,23 +344,23 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticDimensionAggregateDocument:
     statistic_dimension_document: list[StatisticDimensionDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VertexAggregateDocument:
     vertex_document: list[VertexDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CompensationMatrixDocumentItem:
     dimension_identifier: TStringValue | None = None
     matrix_aggregate_document: MatrixAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsDocumentItem:
     statistical_feature: StatisticalFeature
     statistic_dimension_aggregate_document: StatisticDimensionAggregateDocument | None = (
@@ -368,7 +368,7 @@ class StatisticsDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataRegionDocumentItem:
     data_region_identifier: TStringValue | None = None
     region_type: TStringValue | None = None
@@ -382,22 +382,22 @@ class DataRegionDocumentItem:
     vertex_aggregate_document: VertexAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CompensationMatrixAggregateDocument:
     compensation_matrix_document: list[CompensationMatrixDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StatisticsAggregateDocument:
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataRegionAggregateDocument:
     data_region_document: list[DataRegionDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PopulationDocumentItem:
     population_identifier: TStringValue | None = None
     written_name: TStringValue | None = None
@@ -408,12 +408,12 @@ class PopulationDocumentItem:
     population_aggregate_document: list[PopulationAggregateDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PopulationAggregateDocumentItem:
     population_document: list[PopulationDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     data_processing_document: DataProcessingDocument | None = None
     data_region_aggregate_document: DataRegionAggregateDocument | None = None
@@ -426,7 +426,7 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -435,7 +435,7 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     device_control_aggregate_document: DeviceControlAggregateDocument
     measurement_identifier: TStringValue
@@ -456,7 +456,7 @@ class MeasurementDocumentItem:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -477,7 +477,7 @@ class MeasurementAggregateDocument:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FlowCytometryDocumentItem(TechniqueDocument):
     compensation_matrix_aggregate_document: CompensationMatrixAggregateDocument | None = (
         None
@@ -485,12 +485,12 @@ class FlowCytometryDocumentItem(TechniqueDocument):
     measurement_aggregate_document: MeasurementAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FlowCytometryAggregateDocument(TechniqueAggregateDocument):
     flow_cytometry_document: list[FlowCytometryDocumentItem]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     flow_cytometry_aggregate_document: FlowCytometryAggregateDocument | None = None
@@ -12,7 +12,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
     detector_wavelength_setting: TQuantityValueNanometer | None = None
@@ -21,12 +21,12 @@ class DeviceControlDocumentItem(OrderedItem):
     wavelength_filter_cutoff_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     fluorescence: TQuantityValueRelativeFluorescenceUnit
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
@@ -17,13 +17,13 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     dilution_factor_setting: TQuantityValueUnitless
     data_processing_omission_setting: TBooleanValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem:
     flush_volume_setting: TQuantityValueMilliliter
     detector_view_volume: TQuantityValueMilliliter
@@ -31,7 +31,7 @@ class DeviceControlDocumentItem:
     sample_volume_setting: TQuantityValueMilliliter
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DistributionDocumentItem:
     particle_size: TQuantityValueMicrometer
     cumulative_count: TQuantityValueUnitless
@@ -41,28 +41,28 @@ class DistributionDocumentItem:
     distribution_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DistributionAggregateDocument:
     distribution_document: list[DistributionDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     data_processing_document: DataProcessingDocument | None = None
     distribution_aggregate_document: DistributionAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     processed_data_aggregate_document: ProcessedDataAggregateDocument
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
@@ -28,14 +28,14 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChromatogramDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChromatographyColumnDocument:
     chromatography_column_part_number: TStringValue | None = None
     chromatography_column_serial_number: TStringValue | None = None
@@ -46,7 +46,7 @@ class ChromatographyColumnDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem(OrderedItem):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -68,19 +68,19 @@ class DeviceControlDocumentItem(OrderedItem):
     detector_sampling_rate_setting: TQuantityValueHertz | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem(OrderedItem):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class InjectionDocument:
     autosampler_injection_volume_setting__chromatography_: TQuantityValueCubicMillimeter = field(
         metadata={"json_name": "autosampler injection volume setting (chromatography)"}
@@ -89,7 +89,7 @@ class InjectionDocument:
     injection_time: TDateTimeValue
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakItem(OrderedItem):
     retention_time: TQuantityValueSecondTime
     peak_end: TQuantityValueSecondTime | None = None
@@ -210,26 +210,26 @@ class PeakItem(OrderedItem):
     chromatographic_peak_asymmetry_factor: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     description: Any | None = None
     written_name: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ThreeDimensionalUltravioletSpectrumDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue
     description: Any | None = None
@@ -240,22 +240,22 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PeakList:
     peak: list[PeakItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocument:
     peak_list: PeakList | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     chromatography_column_document: ChromatographyColumnDocument
     device_control_aggregate_document: DeviceControlAggregateDocument
@@ -272,25 +272,25 @@ class MeasurementDocumentItem:
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LiquidChromatographyDocumentItem:
     analyst: TStringValue
     measurement_aggregate_document: MeasurementAggregateDocument
     submitter: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LiquidChromatographyAggregateDocument:
     device_system_document: DeviceSystemDocument
     liquid_chromatography_document: list[LiquidChromatographyDocumentItem]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     liquid_chromatography_aggregate_document: LiquidChromatographyAggregateDocument | None = (
         None
@@ -12,7 +12,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalyteDocumentItem:
     analyte_name: TStringValue
     volume_concentration: TQuantityValueMilliliterPerLiter | None = None
@@ -20,11 +20,11 @@ class AnalyteDocumentItem:
     mass_concentration: TQuantityValueGramPerLiter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalyteAggregateDocument:
     analyte_document: list[AnalyteDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     analyte_aggregate_document: AnalyteAggregateDocument
@@ -21,7 +21,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalyteDocumentItem:
     analyte_identifier: TStringValue
     analyte_name: TStringValue
@@ -30,13 +30,13 @@ class AnalyteDocumentItem:
     fluorescence: TQuantityValueRelativeFluorescenceUnit
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationResultDocumentItem:
     calibration_result_name: TStringValue | None = None
     calibration_result: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
@@ -53,7 +53,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem:
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -68,7 +68,7 @@ class DeviceControlDocumentItem:
     minimum_assay_bead_count_setting: TQuantityValueNumber | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem:
     device_identifier: TStringValue | None = None
     device_type: TStringValue | None = None
@@ -80,13 +80,13 @@ class DeviceDocumentItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorDocumentItem:
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReferenceMaterialDocument:
     reference_material_identifier: TStringValue | None = None
     batch_identifier: TStringValue | None = None
@@ -110,27 +110,27 @@ class SampleRoleType(Enum):
     reference_sample_role = "reference sample role"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AnalyteAggregateDocument:
     analyte_document: list[AnalyteDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationResultAggregateDocument:
     calibration_result_document: list[CalibrationResultDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorAggregateDocument:
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     description: Any | None = None
@@ -142,7 +142,7 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationDocumentItem:
     calibration_name: TStringValue | None = None
     calibration_description: TStringValue | None = None
@@ -155,7 +155,7 @@ class CalibrationDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     measurement_identifier: TStringValue
     measurement_time: TDateTimeStampValue
@@ -166,12 +166,12 @@ class MeasurementDocumentItem:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalibrationAggregateDocument:
     calibration_document: list[CalibrationDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_document: list[MeasurementDocumentItem]
     analytical_method_identifier: TStringValue | None = None
@@ -182,7 +182,7 @@ class MeasurementAggregateDocument:
     plate_well_count: TQuantityValueNumber | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     asset_management_identifier: TStringValue | None = None
     description: Any | None = None
@@ -196,14 +196,14 @@ class DeviceSystemDocument:
     calibration_aggregate_document: CalibrationAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MultiAnalyteProfilingDocumentItem:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MultiAnalyteProfilingAggregateDocument:
     device_system_document: DeviceSystemDocument
     multi_analyte_profiling_document: list[MultiAnalyteProfilingDocumentItem]
@@ -211,7 +211,7 @@ class MultiAnalyteProfilingAggregateDocument:
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     multi_analyte_profiling_aggregate_document: MultiAnalyteProfilingAggregateDocument | None = (
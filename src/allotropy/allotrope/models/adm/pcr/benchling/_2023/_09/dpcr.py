@@ -45,7 +45,7 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     reference_dna_description: TStringValue | None = field(
         default=None, metadata={"json_name": "reference DNA description"}
@@ -56,13 +56,13 @@ class DataProcessingDocument:
     fluorescence_intensity_threshold_setting: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem:
     data_source_identifier: TStringValue | None = None
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
@@ -79,7 +79,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem:
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -100,7 +100,7 @@ class DeviceControlDocumentItem:
     passive_reference_dye_setting: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     device_identifier: TStringValue
     asset_management_identifier: TStringValue | None = None
@@ -112,13 +112,13 @@ class DeviceSystemDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorDocumentItem:
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PassiveReferenceDyeDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -127,7 +127,7 @@ class PassiveReferenceDyeDataCube:
     data: TDatacubeData | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReporterDyeDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -136,7 +136,7 @@ class ReporterDyeDataCube:
     data: TDatacubeData | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -145,7 +145,7 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     number_concentration: TQuantityValueNumberPerMicroliter
     positive_partition_count: TQuantityValueNumber
@@ -156,27 +156,27 @@ class ProcessedDataDocumentItem:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ErrorAggregateDocument:
     error_document: list[ErrorDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem:
     calculated_data_identifier: TStringValue | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -186,7 +186,7 @@ class CalculatedDataDocumentItem:
     calculated_datum: TQuantityValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     measurement_identifier: TStringValue
     measurement_time: TDateTimeValue
@@ -202,12 +202,12 @@ class MeasurementDocumentItem:
     passive_reference_dye_data_cube: PassiveReferenceDyeDataCube | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TCalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     plate_well_count: TQuantityValueNumber
     measurement_document: list[MeasurementDocumentItem]
@@ -219,7 +219,7 @@ class MeasurementAggregateDocument:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DPCRDocumentItem:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
@@ -227,7 +227,7 @@ class DPCRDocumentItem:
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DPCRAggregateDocument:
     device_system_document: DeviceSystemDocument
     d_pcr_document: list[DPCRDocumentItem] = field(
@@ -237,7 +237,7 @@ class DPCRAggregateDocument:
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     d_pcr_aggregate_document: DPCRAggregateDocument = field(
@@ -24,7 +24,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class BaselineCorrectedReporterDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -53,7 +53,7 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     cycle_threshold_value_setting: TQuantityValueUnitless
     reference_dna_description: TStringValue | None = field(
@@ -68,13 +68,13 @@ class DataProcessingDocument:
     genotyping_determination_method_setting: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceDocumentItem:
     data_source_identifier: TStringValue | None = None
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
@@ -91,7 +91,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem:
     device_type: TStringValue
     measurement_method_identifier: TStringValue
@@ -112,7 +112,7 @@ class DeviceControlDocumentItem:
     passive_reference_dye_setting: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     device_identifier: TStringValue
     model_number: TStringValue
@@ -135,7 +135,7 @@ class ExperimentType(Enum):
     primary_analysis_experiment = "primary analysis experiment"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeltingCurveDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -144,7 +144,7 @@ class MeltingCurveDataCube:
     data: TDatacubeData | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NormalizedReporterDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -153,7 +153,7 @@ class NormalizedReporterDataCube:
     data: TDatacubeData | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PassiveReferenceDyeDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -162,7 +162,7 @@ class PassiveReferenceDyeDataCube:
     data: TDatacubeData | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReporterDyeDataCube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -171,7 +171,7 @@ class ReporterDyeDataCube:
     data: TDatacubeData | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
@@ -181,17 +181,17 @@ class SampleDocument:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSourceAggregateDocument:
     data_source_document: list[DataSourceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     data_processing_document: DataProcessingDocument
     cycle_threshold_result: TQuantityValueUnitless
@@ -204,7 +204,7 @@ class ProcessedDataDocumentItem:
     genotyping_determination_result: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem:
     calculated_data_identifier: TStringValue | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -214,17 +214,17 @@ class CalculatedDataDocumentItem:
     calculated_datum: TQuantityValueUnitless | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TCalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     measurement_identifier: TStringValue
     measurement_time: TDateTimeValue
@@ -239,7 +239,7 @@ class MeasurementDocumentItem:
     melting_curve_data_cube: MeltingCurveDataCube | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     plate_well_count: TQuantityValueNumber
     measurement_document: list[MeasurementDocumentItem]
@@ -250,7 +250,7 @@ class MeasurementAggregateDocument:
     well_volume: TQuantityValueMicroliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class QPCRDocumentItem:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
@@ -258,7 +258,7 @@ class QPCRDocumentItem:
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class QPCRAggregateDocument:
     device_system_document: DeviceSystemDocument
     q_pcr_document: list[QPCRDocumentItem] = field(
@@ -268,7 +268,7 @@ class QPCRAggregateDocument:
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     q_pcr_aggregate_document: QPCRAggregateDocument = field(
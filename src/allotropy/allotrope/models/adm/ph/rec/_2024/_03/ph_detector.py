@@ -10,7 +10,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     p_h: TQuantityValuePH = field(metadata={"json_name": "pH"})
     temperature: TQuantityValueDegreeCelsius | None = None
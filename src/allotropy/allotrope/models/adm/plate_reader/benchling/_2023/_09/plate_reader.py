@@ -36,7 +36,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem:
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -66,7 +66,7 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationDocumentItem:
     datum_label: TStringValue
     data_cube: TDatacube | None = None
@@ -75,7 +75,7 @@ class CustomInformationDocumentItem:
     scalar_string_datum: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
@@ -92,7 +92,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem:
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -104,18 +104,18 @@ class DeviceDocumentItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageDocumentItem:
     experimental_data_identifier: TStringValue | None = None
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageFeatureDocumentItem:
     image_feature_identifier: TStringValue
     image_feature_name: TStringValue | None = None
@@ -153,17 +153,17 @@ class TransmittedLightSetting(Enum):
     phase_contrast = "phase contrast"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CustomInformationAggregateDocument:
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     device_identifier: TStringValue
     model_number: TStringValue
@@ -176,22 +176,22 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OpticalImagingAggregateDocument:
     image_document: list[ImageDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ImageFeatureAggregateDocument:
     image_feature_document: list[ImageFeatureDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     location_identifier: TStringValue
@@ -205,7 +205,7 @@ class SampleDocument:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocument:
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -228,7 +228,7 @@ class DeviceControlDocument:
     detector_carriage_speed_setting: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     data_processing_document: dict[str, Any] | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -237,7 +237,7 @@ class ProcessedDataDocumentItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -247,14 +247,14 @@ class FluorescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument)
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LuminescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OpticalImagingDeviceControlDocumentItem(DeviceControlDocument):
     excitation_wavelength_setting: TQuantityValueNanometer | None = None
     detector_wavelength_setting: TQuantityValueNanometer | None = None
@@ -268,7 +268,7 @@ class OpticalImagingDeviceControlDocumentItem(DeviceControlDocument):
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -285,7 +285,7 @@ class UltravioletAbsorbancePointDetectionDeviceControlDocumentItem(
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
@@ -308,27 +308,27 @@ UltravioletAbsorbancePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescencePointDetectionDeviceControlAggregateDocument:
     device_control_document: FluorescencePointDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LuminescencePointDetectionDeviceControlAggregateDocument:
     device_control_document: LuminescencePointDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OpticalImagingDeviceControlAggregateDocument:
     device_control_document: OpticalImagingDeviceControlDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument:
     device_control_document: UltravioletAbsorbancePointDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescencePointDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescencePointDetectionDeviceControlAggregateDocument
@@ -343,7 +343,7 @@ class FluorescencePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LuminescencePointDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: LuminescencePointDetectionDeviceControlAggregateDocument
@@ -358,7 +358,7 @@ class LuminescencePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItem:
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -381,7 +381,7 @@ class MeasurementDocumentItem:
     luminescence: TQuantityValueRelativeLightUnit | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OpticalImagingMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: OpticalImagingDeviceControlAggregateDocument
@@ -396,7 +396,7 @@ class OpticalImagingMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument
@@ -411,7 +411,7 @@ class UltravioletAbsorbancePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_time: TDateTimeStampValue
     plate_well_count: TQuantityValueNumber
@@ -428,14 +428,14 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PlateReaderDocumentItem:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PlateReaderAggregateDocument:
     plate_reader_document: list[PlateReaderDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
@@ -445,7 +445,7 @@ class PlateReaderAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     plate_reader_aggregate_document: PlateReaderAggregateDocument | None = None
@@ -42,14 +42,14 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AbsorptionSpectrumDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataDocumentItem:
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
@@ -79,13 +79,13 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataProcessingDocument:
     cell_path_length: TQuantityValueCentimeter | TQuantityValueMillimeter | None = None
     attenuation_coefficient: TQuantityValueSquareCentimetersPerGram | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DataSystemDocument:
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
@@ -102,7 +102,7 @@ class DataSystemDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocument:
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -115,7 +115,7 @@ class DeviceControlDocument:
     exposure_duration_setting: TQuantityValueSecondTime | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceDocumentItem:
     device_type: TStringValue
     device_identifier: TStringValue | None = None
@@ -127,12 +127,12 @@ class DeviceDocumentItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceDocumentItem:
     description: Any
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescenceEmissionSpectrumDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
@@ -155,12 +155,12 @@ class SampleRoleType(Enum):
     reference_sample_role = "reference sample role"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CalculatedDataAggregateDocument:
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     data_processing_document: DataProcessingDocument | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -171,7 +171,7 @@ class ProcessedDataDocumentItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescenceEmissionSpectrumDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -181,7 +181,7 @@ class FluorescenceEmissionSpectrumDetectionDeviceControlDocumentItem(
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -191,14 +191,14 @@ class FluorescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument)
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LuminescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -215,14 +215,14 @@ class UltravioletAbsorbancePointDetectionDeviceControlDocumentItem(
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbanceSpectrumDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceSystemDocument:
     device_identifier: TStringValue
     model_number: TStringValue
@@ -235,12 +235,12 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DiagnosticTraceAggregateDocument:
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SampleDocument:
     sample_identifier: TStringValue
     description: Any | None = None
@@ -251,7 +251,7 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem]
 
@@ -281,32 +281,32 @@ UltravioletAbsorbanceSpectrumDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescenceEmissionSpectrumDetectionDeviceControlAggregateDocument:
     device_control_document: FluorescenceEmissionSpectrumDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescencePointDetectionDeviceControlAggregateDocument:
     device_control_document: FluorescencePointDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LuminescencePointDetectionDeviceControlAggregateDocument:
     device_control_document: LuminescencePointDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument:
     device_control_document: UltravioletAbsorbancePointDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbanceSpectrumDetectionDeviceControlAggregateDocument:
     device_control_document: UltravioletAbsorbanceSpectrumDetectionDeviceControlDocument
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescenceEmissionSpectrumDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescenceEmissionSpectrumDetectionDeviceControlAggregateDocument
@@ -320,7 +320,7 @@ class FluorescenceEmissionSpectrumDetectionMeasurementDocumentItems:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FluorescencePointDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescencePointDetectionDeviceControlAggregateDocument
@@ -335,7 +335,7 @@ class FluorescencePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LuminescencePointDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: LuminescencePointDetectionDeviceControlAggregateDocument
@@ -350,7 +350,7 @@ class LuminescencePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument
@@ -364,7 +364,7 @@ class UltravioletAbsorbancePointDetectionMeasurementDocumentItems:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UltravioletAbsorbanceSpectrumDetectionMeasurementDocumentItems:
     measurement_identifier: TStringValue
     device_control_aggregate_document: UltravioletAbsorbanceSpectrumDetectionDeviceControlAggregateDocument
@@ -378,7 +378,7 @@ class UltravioletAbsorbanceSpectrumDetectionMeasurementDocumentItems:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementAggregateDocument:
     measurement_time: TDateTimeStampValue
     measurement_document: list[
@@ -395,14 +395,14 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SpectrophotometryDocumentItem:
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SpectrophotometryAggregateDocument:
     spectrophotometry_document: list[SpectrophotometryDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
@@ -412,7 +412,7 @@ class SpectrophotometryAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Model:
     field_asm_manifest: str = field(metadata={"json_name": "$asm.manifest"})
     spectrophotometry_aggregate_document: SpectrophotometryAggregateDocument | None = (
@@ -20,7 +20,7 @@ from allotropy.allotrope.models.shared.definitions.quantity_values import (
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlDocumentItem:
     flow_cell_identifier: TStringValue | None = None
     flow_rate: TQuantityValueMicroliterPerMinute | None = None
@@ -29,7 +29,7 @@ class DeviceControlDocumentItem:
     flow_path: TStringValue | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReportPointDocumentItem:
     absolute_resonance: TQuantityValueResponseUnit | None = None
     report_point_identifier: TStringValue | None = None
@@ -38,7 +38,7 @@ class ReportPointDocumentItem:
     time_setting: TQuantityValueSecondTime | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SensorChipDocument:
     sensor_chip_identifier: TStringValue
     sensor_chip_type: TStringValue | None = None
@@ -49,34 +49,34 @@ class SensorChipDocument:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SensorgramDataCube(TDatacube):
     cube_structure: TDatacubeStructure | None = field(
         default=None, metadata={"json_name": "cube-structure"}
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DeviceControlAggregateDocument:
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReportPointAggregateDocument:
     report_point_document: list[ReportPointDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataDocumentItem:
     report_point_aggregate_document: ReportPointAggregateDocument | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ProcessedDataAggregateDocument:
     processed_data_document: list[ProcessedDataDocumentItem] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MeasurementDocumentItems:
     method_name: TStringValue | None = None
     ligand_identifier: TStringValue | None = None
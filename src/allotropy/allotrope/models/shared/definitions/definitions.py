@@ -7,13 +7,13 @@ from typing import Any
 from allotropy.exceptions import AllotropeConversionError
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TBooleanValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: bool
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TIntValueItem:
     value: int
     field_type: str = field(metadata={"json_name": "@type"})
@@ -23,7 +23,7 @@ TIntValue = int | TIntValueItem
 TIntegerValue = TIntValue
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TDoubleValueItem:
     value: float
     field_type: str = field(metadata={"json_name": "@type"})
@@ -34,13 +34,13 @@ TFloatValue = TDoubleValue
 TDecimalValue = TDoubleValue
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TDateTimeValueItem:
     field_type: TClass = field(metadata={"json_name": "@type"})
     value: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TStringValueItem:
     value: str
     field_type: str = field(metadata={"json_name": "@type"})
@@ -110,7 +110,7 @@ JsonFloat = float | InvalidJsonFloat
 NaN = InvalidJsonFloat.NaN
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValue:
     value: JsonFloat
     unit: TUnit
@@ -145,7 +145,7 @@ class Type(Enum):
     logarithmic = "logarithmic"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TFunction:
     type: Type | None = Type.linear
     start: float | None = 1
@@ -153,7 +153,7 @@ class TFunction:
     incr: float | None = 1
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TDatacubeComponent:
     field_componentDatatype: FieldComponentDatatype = field(
         metadata={"json_name": "@componentDatatype"}
@@ -172,7 +172,7 @@ TDimensionArray = TNumberArray | TBooleanArray | TStringArray
 TMeasureArray = TNumberOrNullArray | TBooleanOrNullArray | TStringOrNullArray
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TDatacubeStructure:
     dimensions: list[TDatacubeComponent]
     measures: list[TDatacubeComponent]
@@ -207,7 +207,7 @@ class TDatacubeData(TDimensionData):
 """
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TDatacubeData:
     dimensions: list[TDimensionArray | TFunction]
     measures: list[TMeasureArray] | None = None
@@ -220,7 +220,7 @@ class TDatacubeData:
             raise AllotropeConversionError(msg)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TDatacube:
     label: str | None = None
     cube_structure: TDatacubeStructure | None = field(
@@ -229,6 +229,6 @@ class TDatacube:
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OrderedItem:
     field_index: int | None = field(default=None, metadata={"json_name": "@index"})
@@ -20,3876 +20,3876 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbampere(TQuantityValue):
     unit: str = "abA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbcoulomb(TQuantityValue):
     unit: str = "abC"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbcoulombPerSquareCentimeter(TQuantityValue):
     unit: str = "abC/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbfarad(TQuantityValue):
     unit: str = "abF"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbfaradPerCentimeter(TQuantityValue):
     unit: str = "abF/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbhenry(TQuantityValue):
     unit: str = "abH"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbohm(TQuantityValue):
     unit: str = "abΩ"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbsiemen(TQuantityValue):
     unit: str = "aS"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbsorbanceUnit(TQuantityValue):
     unit: str = "AU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbsorbanceUnitTimesSecond(TQuantityValue):
     unit: str = "AU.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbtesla(TQuantityValue):
     unit: str = "abT"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbvolt(TQuantityValue):
     unit: str = "abV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbvoltCentimeter(TQuantityValue):
     unit: str = "abV cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbvoltPerCentimeter(TQuantityValue):
     unit: str = "abV/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAbvoltSecond(TQuantityValue):
     unit: str = "abV-s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAcre(TQuantityValue):
     unit: str = "ac"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAcreFoot(TQuantityValue):
     unit: str = "ac ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmpere(TQuantityValue):
     unit: str = "A"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmpereHour(TQuantityValue):
     unit: str = "A h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmperePerDegree(TQuantityValue):
     unit: str = "A/deg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmperePerJoule(TQuantityValue):
     unit: str = "A J^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmperePerMeter(TQuantityValue):
     unit: str = "A/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmperePerRadian(TQuantityValue):
     unit: str = "A/rad"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmperePerSquareMeter(TQuantityValue):
     unit: str = "A/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmpereTurn(TQuantityValue):
     unit: str = "At"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmpereTurnPerInch(TQuantityValue):
     unit: str = "At/in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAmpereTurnPerMeter(TQuantityValue):
     unit: str = "At/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAngstrom(TQuantityValue):
     unit: str = "Å"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueArbitraryUnit(TQuantityValue):
     unit: str = "arb'U"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueArbitraryUnitPerVolt(TQuantityValue):
     unit: str = "arb'U/V"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueArbitraryUnitTimesHertz(TQuantityValue):
     unit: str = "arb'U.Hz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueArcMinute(TQuantityValue):
     unit: str = "arcMin"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueArcSecond(TQuantityValue):
     unit: str = "arcSec"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAre(TQuantityValue):
     unit: str = "a"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAstronomicalUnit(TQuantityValue):
     unit: str = "au"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAtmosphereStandard(TQuantityValue):
     unit: str = "atm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAtmosphereTechnical(TQuantityValue):
     unit: str = "at"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAtomicMassUnit(TQuantityValue):
     unit: str = "amu"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAtomicNumber(TQuantityValue):
     unit: str = "Z"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueAvoirdupoisPound(TQuantityValue):
     unit: str = "lb_av"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBan(TQuantityValue):
     unit: str = "ban"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBar(TQuantityValue):
     unit: str = "bar"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBarn(TQuantityValue):
     unit: str = "b"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBarrel(TQuantityValue):
     unit: str = "bbl"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBecquerel(TQuantityValue):
     unit: str = "Bq"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBecquerelPerGram(TQuantityValue):
     unit: str = "Bq/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBillionCFU(TQuantityValue):
     unit: str = "10^9.CFU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBiot(TQuantityValue):
     unit: str = "Bi"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBit(TQuantityValue):
     unit: str = "bit"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBitsPerSecond(TQuantityValue):
     unit: str = "bps"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBoardFoot(TQuantityValue):
     unit: str = "Bf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBreathPerMinute(TQuantityValue):
     unit: str = "breaths/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBritishThermalUnitInternationalTable(TQuantityValue):
     unit: str = "Btu (it)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBritishThermalUnitThermochemical(TQuantityValue):
     unit: str = "Btu (th)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuFoot(TQuantityValue):
     unit: str = "Btu ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuFootPerSquareFootHourDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu ft/(h ft^2 °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuInch(TQuantityValue):
     unit: str = "Btu in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuInchPerSquareFootHourDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu in/(h ft^2 °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuInchPerSquareFootSecondDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu in/(ft^2 s °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu/°F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerDegreeRankine(TQuantityValue):
     unit: str = "Btu/°R"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerHour(TQuantityValue):
     unit: str = "Btu/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerHourSquareFoot(TQuantityValue):
     unit: str = "Btu/(h ft^2)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerPound(TQuantityValue):
     unit: str = "Btu/lb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerPoundDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu/(lb °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerPoundDegreeRankine(TQuantityValue):
     unit: str = "Btu/(lb °R)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerPoundMole(TQuantityValue):
     unit: str = "Btu/(lb mol)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerPoundMoleDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu/(lb mol °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerSecond(TQuantityValue):
     unit: str = "Btu/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerSecondSquareFoot(TQuantityValue):
     unit: str = "Btu/(s ft^2)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerSquareFoot(TQuantityValue):
     unit: str = "Btu/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerSquareFootHourDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu/(h ft^2 °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBtuPerSquareFootSecondDegreeFahrenheit(TQuantityValue):
     unit: str = "Btu/(ft^2 s °F)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueBushel(TQuantityValue):
     unit: str = "bu"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueByte(TQuantityValue):
     unit: str = "B"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCCID50PerMilliliter(TQuantityValue):
     unit: str = "CCID50/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCalorieNutritional(TQuantityValue):
     unit: str = "Cal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCaloriePerGramSecond(TQuantityValue):
     unit: str = "cal/(g.s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCaloriePerSecond(TQuantityValue):
     unit: str = "cal/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCalorieThermochemical(TQuantityValue):
     unit: str = "cal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCandela(TQuantityValue):
     unit: str = "cd"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCandelaPerSquareInch(TQuantityValue):
     unit: str = "cd/in^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCandelaPerSquareMeter(TQuantityValue):
     unit: str = "cd/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCandle(TQuantityValue):
     unit: str = "cdl"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCandlepower(TQuantityValue):
     unit: str = "cp"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCarat(TQuantityValue):
     unit: str = "Nm/ct"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCell(TQuantityValue):
     unit: str = "cell"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentimeter(TQuantityValue):
     unit: str = "cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentimeterOfWater(TQuantityValue):
     unit: str = "cmH2O"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentimeterPerSecond(TQuantityValue):
     unit: str = "cm/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentimeterPerSecondSquared(TQuantityValue):
     unit: str = "cm/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentimeterSecondDegreeCelsius(TQuantityValue):
     unit: str = "cm s °C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentipoise(TQuantityValue):
     unit: str = "cP"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCentistokes(TQuantityValue):
     unit: str = "cSt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueChain(TQuantityValue):
     unit: str = "ch"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCircularMil(TQuantityValue):
     unit: str = "cmil"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueClo(TQuantityValue):
     unit: str = "clo"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueColonyFormingUnit(TQuantityValue):
     unit: str = "CFU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueColumnVolumePerHour(TQuantityValue):
     unit: str = "CV/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCord(TQuantityValue):
     unit: str = "cord"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulomb(TQuantityValue):
     unit: str = "C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombMeter(TQuantityValue):
     unit: str = "C m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombPerCubicMeter(TQuantityValue):
     unit: str = "C m^-3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombPerKilogram(TQuantityValue):
     unit: str = "C/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombPerMeter(TQuantityValue):
     unit: str = "C/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombPerMole(TQuantityValue):
     unit: str = "C/mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombPerSquareMeter(TQuantityValue):
     unit: str = "C m^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCoulombSquareMeter(TQuantityValue):
     unit: str = "C m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCounts(TQuantityValue):
     unit: str = "Counts"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCountsPerMicroliter(TQuantityValue):
     unit: str = "Counts/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCountsPerMilliliter(TQuantityValue):
     unit: str = "Counts/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCountsPerSecond(TQuantityValue):
     unit: str = "Counts/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCountsTimesSecond(TQuantityValue):
     unit: str = "Counts.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicCentimeter(TQuantityValue):
     unit: str = "cm^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicCentimeterPerGramAtSTP(TQuantityValue):
     unit: str = "cm^3/g STP"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicCentimeterPerMinute(TQuantityValue):
     unit: str = "cm^3/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicCoulombMeterPerSquareJoule(TQuantityValue):
     unit: str = "C^3 m^3 J^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicFoot(TQuantityValue):
     unit: str = "ft^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicFootPerMinute(TQuantityValue):
     unit: str = "ft^3/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicFootPerSecond(TQuantityValue):
     unit: str = "ft^3/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicInch(TQuantityValue):
     unit: str = "in^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicInchPerMinute(TQuantityValue):
     unit: str = "in^3/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicKilometerPerSecondSquared(TQuantityValue):
     unit: str = "km^3/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeter(TQuantityValue):
     unit: str = "m^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerHour(TQuantityValue):
     unit: str = "m^3/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerKelvin(TQuantityValue):
     unit: str = "m^3/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerKilogram(TQuantityValue):
     unit: str = "m^3/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerKilogramSecondSquared(TQuantityValue):
     unit: str = "m^3 kg^-1 s^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerMole(TQuantityValue):
     unit: str = "m^3 mol^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerSecond(TQuantityValue):
     unit: str = "m^3/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMeterPerSecondSquared(TQuantityValue):
     unit: str = "m^3/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMile(TQuantityValue):
     unit: str = "mi^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicMillimeter(TQuantityValue):
     unit: str = "mm^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicYard(TQuantityValue):
     unit: str = "yd^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCubicYardPerMinute(TQuantityValue):
     unit: str = "yd^3/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueCurie(TQuantityValue):
     unit: str = "Ci"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDalton(TQuantityValue):
     unit: str = "Da"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDalton2(TQuantityValue):
     unit: str = "u"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDay(TQuantityValue):
     unit: str = "d"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDaySidereal(TQuantityValue):
     unit: str = "d (s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDebye(TQuantityValue):
     unit: str = "D"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDecibel(TQuantityValue):
     unit: str = "dB"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDecibelCarrier(TQuantityValue):
     unit: str = "dBc"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDecibelReferredToOneMilliwatt(TQuantityValue):
     unit: str = "dBm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDecimeter(TQuantityValue):
     unit: str = "dm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeAngle(TQuantityValue):
     unit: str = "°"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeCelsius(TQuantityValue):
     unit: str = "degC"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeCelsiusCentimeter(TQuantityValue):
     unit: str = "cm-degC"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeCelsiusPerHour(TQuantityValue):
     unit: str = "°C/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeCelsiusPerMinute(TQuantityValue):
     unit: str = "°C/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeCelsiusPerSecond(TQuantityValue):
     unit: str = "°C/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeCentigrade(TQuantityValue):
     unit: str = "°C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeFahrenheit(TQuantityValue):
     unit: str = "°F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeFahrenheitHour(TQuantityValue):
     unit: str = "°F h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeFahrenheitHourPerBtu(TQuantityValue):
     unit: str = "°F h/Btu"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeFahrenheitPerHour(TQuantityValue):
     unit: str = "°F/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeFahrenheitPerMinute(TQuantityValue):
     unit: str = "°F/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeFahrenheitPerSecond(TQuantityValue):
     unit: str = "°F/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreePerHour(TQuantityValue):
     unit: str = "°/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreePerMinute(TQuantityValue):
     unit: str = "°/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreePerSecond(TQuantityValue):
     unit: str = "°/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreePerSecondSquared(TQuantityValue):
     unit: str = "° s^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeRankine(TQuantityValue):
     unit: str = "°R"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeRankinePerHour(TQuantityValue):
     unit: str = "°R/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeRankinePerMinute(TQuantityValue):
     unit: str = "°R/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeRankinePerSecond(TQuantityValue):
     unit: str = "°R/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDegreeTimesMilliliterPerGramTimesDecimeter(TQuantityValue):
     unit: str = "deg·mL·g−1·dm−1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDimensionlessMicroPerBar(TQuantityValue):
     unit: str = "10^-6/bar"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDiopter(TQuantityValue):
     unit: str = "dpt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDrop(TQuantityValue):
     unit: str = "drp"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDryGallonUS(TQuantityValue):
     unit: str = "dry_gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDryPintUS(TQuantityValue):
     unit: str = "dry_pt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDryQuartUS(TQuantityValue):
     unit: str = "dry_qt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDyne(TQuantityValue):
     unit: str = "dyn"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDyneCentimeter(TQuantityValue):
     unit: str = "dyn cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueDynePerSquareCentimeter(TQuantityValue):
     unit: str = "dyn/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueE(TQuantityValue):
     unit: str = "e"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueElectronVolt(TQuantityValue):
     unit: str = "eV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueElectronVoltPerKelvin(TQuantityValue):
     unit: str = "eV/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueElectronVoltPerTesla(TQuantityValue):
     unit: str = "eV/T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueElectronVoltSecond(TQuantityValue):
     unit: str = "eV s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueEnzymeUnit(TQuantityValue):
     unit: str = "U"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueErg(TQuantityValue):
     unit: str = "erg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueErgPerCubicCentimeter(TQuantityValue):
     unit: str = "erg/cm^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueErgPerSecond(TQuantityValue):
     unit: str = "erg/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueErgPerSquareCentimeterSecond(TQuantityValue):
     unit: str = "erg/(cm^2 s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueErgSecond(TQuantityValue):
     unit: str = "erg s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueEuro(TQuantityValue):
     unit: str = "€"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFarad(TQuantityValue):
     unit: str = "F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFaradPerMeter(TQuantityValue):
     unit: str = "F/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFaraday(TQuantityValue):
     unit: str = "Fd"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFathom(TQuantityValue):
     unit: str = "fath"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogram(TQuantityValue):
     unit: str = "fg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerFemtoliter(TQuantityValue):
     unit: str = "fg/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerLiter(TQuantityValue):
     unit: str = "fg/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerMicroliter(TQuantityValue):
     unit: str = "fg/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerMilliliter(TQuantityValue):
     unit: str = "fg/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerNanoliter(TQuantityValue):
     unit: str = "fg/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerPicoliter(TQuantityValue):
     unit: str = "fg/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerSquareCentimeter(TQuantityValue):
     unit: str = "fg/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtogramPerSquareMeter(TQuantityValue):
     unit: str = "fg/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtoliter(TQuantityValue):
     unit: str = "fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtometer(TQuantityValue):
     unit: str = "fm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtomolar(TQuantityValue):
     unit: str = "fmol/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFemtomole(TQuantityValue):
     unit: str = "fmol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFermi(TQuantityValue):
     unit: str = "fermi"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFlight(TQuantityValue):
     unit: str = "flight"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFocusFormingUnitPerMilliliter(TQuantityValue):
     unit: str = "FFU/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFoot(TQuantityValue):
     unit: str = "ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootCandle(TQuantityValue):
     unit: str = "fc"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootLambert(TQuantityValue):
     unit: str = "ft L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootOfWater(TQuantityValue):
     unit: str = "ftH2O"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPerHour(TQuantityValue):
     unit: str = "ft/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPerMinute(TQuantityValue):
     unit: str = "ft/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPerSecond(TQuantityValue):
     unit: str = "ft/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPerSecondSquared(TQuantityValue):
     unit: str = "ft/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForce(TQuantityValue):
     unit: str = "ft lbf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForcePerHour(TQuantityValue):
     unit: str = "ft lbf/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForcePerMinute(TQuantityValue):
     unit: str = "ft lbf/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForcePerSecond(TQuantityValue):
     unit: str = "ft lbf/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForcePerSquareFoot(TQuantityValue):
     unit: str = "ft lbf/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForcePerSquareFootSecond(TQuantityValue):
     unit: str = "ft lbf/(ft^2 s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForcePerSquareMeter(TQuantityValue):
     unit: str = "ft lbf/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundForceSecond(TQuantityValue):
     unit: str = "lbf/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootPoundal(TQuantityValue):
     unit: str = "ft-pdl"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFootUSSurvey(TQuantityValue):
     unit: str = "ftUS"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFractionalArea(TQuantityValue):
     unit: str = "fa"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFramePerSecond(TQuantityValue):
     unit: str = "fps"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFranklin(TQuantityValue):
     unit: str = "Fr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueFurlong(TQuantityValue):
     unit: str = "fur"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGal(TQuantityValue):
     unit: str = "Gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGallonImperial(TQuantityValue):
     unit: str = "imp gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGallonUS(TQuantityValue):
     unit: str = "US gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGallonUSPerDay(TQuantityValue):
     unit: str = "gal/d"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGallonUSPerMinute(TQuantityValue):
     unit: str = "gal/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGamma(TQuantityValue):
     unit: str = "gamma"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGauss(TQuantityValue):
     unit: str = "Gs"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGigaElectronVolt(TQuantityValue):
     unit: str = "GeV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGigaHertz(TQuantityValue):
     unit: str = "GHz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGilbert(TQuantityValue):
     unit: str = "Gi"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGlossUnit(TQuantityValue):
     unit: str = "GU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGon(TQuantityValue):
     unit: str = "gon"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGrad(TQuantityValue):
     unit: str = "grad"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGrade(TQuantityValue):
     unit: str = "grd"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGrain(TQuantityValue):
     unit: str = "gr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGrainPerGallon(TQuantityValue):
     unit: str = "gr/gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGram(TQuantityValue):
     unit: str = "g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramDegreeCelsius(TQuantityValue):
     unit: str = "g °C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerCubicCentimeter(TQuantityValue):
     unit: str = "g/cm^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerFemtoliter(TQuantityValue):
     unit: str = "g/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerLiter(TQuantityValue):
     unit: str = "g/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerMicroliter(TQuantityValue):
     unit: str = "g/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerMilliliter(TQuantityValue):
     unit: str = "g/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerMole(TQuantityValue):
     unit: str = "g/mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerNanoliter(TQuantityValue):
     unit: str = "g/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerPicoliter(TQuantityValue):
     unit: str = "g/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerSquareCentimeter(TQuantityValue):
     unit: str = "g/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramPerSquareMeter(TQuantityValue):
     unit: str = "g/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGramsPerMinute(TQuantityValue):
     unit: str = "g/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGravity(TQuantityValue):
     unit: str = "G"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGray(TQuantityValue):
     unit: str = "Gy"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueGrayPerSecond(TQuantityValue):
     unit: str = "Gy/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHartree(TQuantityValue):
     unit: str = "E_h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHeartBeatsPerMinute(TQuantityValue):
     unit: str = "BPM"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHectare(TQuantityValue):
     unit: str = "ha"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHenry(TQuantityValue):
     unit: str = "H"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHenryPerMeter(TQuantityValue):
     unit: str = "H/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHertz(TQuantityValue):
     unit: str = "Hz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHertzPerKelvin(TQuantityValue):
     unit: str = "Hz/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHertzPerTesla(TQuantityValue):
     unit: str = "Hz/T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHertzPerVolt(TQuantityValue):
     unit: str = "Hz/V"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHertzTimesSecond(TQuantityValue):
     unit: str = "Hz.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHorsepower(TQuantityValue):
     unit: str = "HP"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHorsepowerBoiler(TQuantityValue):
     unit: str = "hp/boiler"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHorsepowerElectric(TQuantityValue):
     unit: str = "hp/V"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHorsepowerMetric(TQuantityValue):
     unit: str = "hp/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHorsepowerWater(TQuantityValue):
     unit: str = "hp/H2O"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHour(TQuantityValue):
     unit: str = "h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHourSidereal(TQuantityValue):
     unit: str = "hr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHourSquareFoot(TQuantityValue):
     unit: str = "h ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHundredWeightLong(TQuantityValue):
     unit: str = "lcwt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueHundredWeightShort(TQuantityValue):
     unit: str = "scwt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInch(TQuantityValue):
     unit: str = "in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInchOfMercury(TQuantityValue):
     unit: str = "inHg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInchOfWater(TQuantityValue):
     unit: str = "inAq"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInchPerSecondSquared(TQuantityValue):
     unit: str = "in/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInchPoundForce(TQuantityValue):
     unit: str = "in lbf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInternationalUnit(TQuantityValue):
     unit: str = "IU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueInternationalUnitPerLiter(TQuantityValue):
     unit: str = "IU/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoule(TQuantityValue):
     unit: str = "J"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJouleMeterPerMole(TQuantityValue):
     unit: str = "J m mol^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerCubicMeter(TQuantityValue):
     unit: str = "J/m^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerCubicMeterKelvin(TQuantityValue):
     unit: str = "J/(m^3 K)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerDegreeCelsius(TQuantityValue):
     unit: str = "J/°C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerGram(TQuantityValue):
     unit: str = "J/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerGramDegreeCelsius(TQuantityValue):
     unit: str = "J/(g °C)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerKelvin(TQuantityValue):
     unit: str = "J/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerKilogram(TQuantityValue):
     unit: str = "J/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerKilogramKelvin(TQuantityValue):
     unit: str = "J/(kg K)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerKilogramKelvinPerCubicMeter(TQuantityValue):
     unit: str = "J/(kg K m^3)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerKilogramKelvinPerPascal(TQuantityValue):
     unit: str = "J/(kg K Pa)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerMole(TQuantityValue):
     unit: str = "J/mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerMoleKelvin(TQuantityValue):
     unit: str = "J mol^-1 K^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerSquareMeter(TQuantityValue):
     unit: str = "J/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerSquareTesla(TQuantityValue):
     unit: str = "J T^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJoulePerTesla(TQuantityValue):
     unit: str = "J/T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJouleSecond(TQuantityValue):
     unit: str = "J s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueJouleSecondPerMole(TQuantityValue):
     unit: str = "J s mol^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKatal(TQuantityValue):
     unit: str = "kat"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKelvin(TQuantityValue):
     unit: str = "K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKelvinPerHour(TQuantityValue):
     unit: str = "K/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKelvinPerMinute(TQuantityValue):
     unit: str = "K/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKelvinPerSecond(TQuantityValue):
     unit: str = "K/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKelvinPerTesla(TQuantityValue):
     unit: str = "K/T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKelvinPerWatt(TQuantityValue):
     unit: str = "K/W"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloDalton(TQuantityValue):
     unit: str = "kDa"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloElectronVolt(TQuantityValue):
     unit: str = "keV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloElectronVoltPerMicrometer(TQuantityValue):
     unit: str = "keV/µm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloHertz(TQuantityValue):
     unit: str = "kHz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloJoulePerMoleKelvin(TQuantityValue):
     unit: str = "kJ/(mol K)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloPascal(TQuantityValue):
     unit: str = "kPa"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloPascalAbsolute(TQuantityValue):
     unit: str = "kPaA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloPond(TQuantityValue):
     unit: str = "kp"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKiloVolt(TQuantityValue):
     unit: str = "kV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilobitsPerSecond(TQuantityValue):
     unit: str = "kbps"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocalorie(TQuantityValue):
     unit: str = "kcal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerCentimeterSecondDegreeCelsius(TQuantityValue):
     unit: str = "cal/(cm s °C)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerGram(TQuantityValue):
     unit: str = "kcal/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerGramDegreeCelsius(TQuantityValue):
     unit: str = "kcal/(g °C)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerMinute(TQuantityValue):
     unit: str = "kcal/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerMole(TQuantityValue):
     unit: str = "kcal/mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerMoleDegreeCelsius(TQuantityValue):
     unit: str = "kcal/(mol °C)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerSecond(TQuantityValue):
     unit: str = "kcal/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerSquareCentimeter(TQuantityValue):
     unit: str = "kcal/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerSquareCentimeterMinute(TQuantityValue):
     unit: str = "kcal/(cm^2 min)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilocaloriePerSquareCentimeterSecond(TQuantityValue):
     unit: str = "kcal/(cm^2 s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogram(TQuantityValue):
     unit: str = "kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramForce(TQuantityValue):
     unit: str = "kgf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramForceMeter(TQuantityValue):
     unit: str = "kgf m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramForcePerSquareCentimeter(TQuantityValue):
     unit: str = "kgf/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramKelvin(TQuantityValue):
     unit: str = "kg K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramMeterPerSecond(TQuantityValue):
     unit: str = "kg m s^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramMeterSquared(TQuantityValue):
     unit: str = "kg m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerCubicMeter(TQuantityValue):
     unit: str = "kg/m^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerFemtoliter(TQuantityValue):
     unit: str = "kg/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerHour(TQuantityValue):
     unit: str = "kg/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerLiter(TQuantityValue):
     unit: str = "kg/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerMeter(TQuantityValue):
     unit: str = "kg/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerMicroliter(TQuantityValue):
     unit: str = "kg/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerMilliliter(TQuantityValue):
     unit: str = "kg/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerMole(TQuantityValue):
     unit: str = "kg mol^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerNanoliter(TQuantityValue):
     unit: str = "kg/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerPicoliter(TQuantityValue):
     unit: str = "kg/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerSecond(TQuantityValue):
     unit: str = "kg/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerSquareCentimeter(TQuantityValue):
     unit: str = "kg/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramPerSquareMeter(TQuantityValue):
     unit: str = "kg/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilogramSecondSquared(TQuantityValue):
     unit: str = "kg s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilometer(TQuantityValue):
     unit: str = "km"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilometerPerHour(TQuantityValue):
     unit: str = "km/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilometerPerSecond(TQuantityValue):
     unit: str = "km/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilowatt(TQuantityValue):
     unit: str = "kW"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKilowatthour(TQuantityValue):
     unit: str = "kW h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKip(TQuantityValue):
     unit: str = "kip"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKipPerSquareInch(TQuantityValue):
     unit: str = "kip/in^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKnot(TQuantityValue):
     unit: str = "kn"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueKnotPerSecond(TQuantityValue):
     unit: str = "kt/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLambert(TQuantityValue):
     unit: str = "Lmb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLightYear(TQuantityValue):
     unit: str = "ly"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiquidCupUS(TQuantityValue):
     unit: str = "cup"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiquidOunceUS(TQuantityValue):
     unit: str = "oz fl"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiquidPintUS(TQuantityValue):
     unit: str = "pt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiquidQuartUS(TQuantityValue):
     unit: str = "qt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiter(TQuantityValue):
     unit: str = "L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiterPerGramCentimeter(TQuantityValue):
     unit: str = "L/(g cm)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiterPerKilogram(TQuantityValue):
     unit: str = "L/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiterPerMinute(TQuantityValue):
     unit: str = "L/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLiterPerSecond(TQuantityValue):
     unit: str = "L/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLumen(TQuantityValue):
     unit: str = "lm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLuminescenceUnits(TQuantityValue):
     unit: str = "LU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueLux(TQuantityValue):
     unit: str = "lx"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMassPerCharge(TQuantityValue):
     unit: str = "m/z"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMaxwell(TQuantityValue):
     unit: str = "Mx"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaElectronVolt(TQuantityValue):
     unit: str = "MeV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaElectronVoltFemtometer(TQuantityValue):
     unit: str = "MeV fm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaElectronVoltPerCentimeter(TQuantityValue):
     unit: str = "MeV/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaElectronVoltPerSpeedOfLight(TQuantityValue):
     unit: str = "MeV/c"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaHertz(TQuantityValue):
     unit: str = "MHz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaHertzPerKelvin(TQuantityValue):
     unit: str = "MHz K^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaHertzPerTesla(TQuantityValue):
     unit: str = "MHz T^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegaPascal(TQuantityValue):
     unit: str = "MPa"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMegabitsPerSecond(TQuantityValue):
     unit: str = "mbps"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeter(TQuantityValue):
     unit: str = "m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterKelvin(TQuantityValue):
     unit: str = "m K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterKelvinPerWatt(TQuantityValue):
     unit: str = "K-m/W"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterKilogram(TQuantityValue):
     unit: str = "m-kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterPerFarad(TQuantityValue):
     unit: str = "m/F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterPerHour(TQuantityValue):
     unit: str = "m h^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterPerKelvin(TQuantityValue):
     unit: str = "m/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterPerMinute(TQuantityValue):
     unit: str = "m min^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterPerSecond(TQuantityValue):
     unit: str = "m s^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMeterPerSecondSquared(TQuantityValue):
     unit: str = "m s^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMetricTon(TQuantityValue):
     unit: str = "mT"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMho(TQuantityValue):
     unit: str = "mho"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroCaloriePerDegreeCelsius(TQuantityValue):
     unit: str = "µcal/°C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroFarad(TQuantityValue):
     unit: str = "microF"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroFaradPerMeter(TQuantityValue):
     unit: str = "mF/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroFaradPerMeterKiloHertz(TQuantityValue):
     unit: str = "mF/m kHz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroHenry(TQuantityValue):
     unit: str = "µH"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroInch(TQuantityValue):
     unit: str = "µin"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroSecond(TQuantityValue):
     unit: str = "µs"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroSiemensPerCentimeter(TQuantityValue):
     unit: str = "μS/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroTorr(TQuantityValue):
     unit: str = "µtorr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroVoltTimesSecond(TQuantityValue):
     unit: str = "μV.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroWatt(TQuantityValue):
     unit: str = "µW"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroWattPerGram(TQuantityValue):
     unit: str = "µW/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogram(TQuantityValue):
     unit: str = "μg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerFemtoliter(TQuantityValue):
     unit: str = "μg/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerLiter(TQuantityValue):
     unit: str = "μg/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerMicroliter(TQuantityValue):
     unit: str = "ug/µL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerMilliliter(TQuantityValue):
     unit: str = "ug/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerMinute(TQuantityValue):
     unit: str = "μg/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerNanoliter(TQuantityValue):
     unit: str = "μg/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerPicoliter(TQuantityValue):
     unit: str = "μg/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerSquareCentimeter(TQuantityValue):
     unit: str = "μg/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogramPerSquareMeter(TQuantityValue):
     unit: str = "μg/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrogravity(TQuantityValue):
     unit: str = "µG"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroliter(TQuantityValue):
     unit: str = "μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroliterPerMinute(TQuantityValue):
     unit: str = "µL/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicroliterPerSecond(TQuantityValue):
     unit: str = "µL/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrometer(TQuantityValue):
     unit: str = "µm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicromolar(TQuantityValue):
     unit: str = "μM"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicromole(TQuantityValue):
     unit: str = "μmol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMicrovolt(TQuantityValue):
     unit: str = "µV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilAngle(TQuantityValue):
     unit: str = "mil"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilLength(TQuantityValue):
     unit: str = "mil (l)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMileInternational(TQuantityValue):
     unit: str = "mi"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilePerHour(TQuantityValue):
     unit: str = "mi/hr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilePerMinute(TQuantityValue):
     unit: str = "mi/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMileUSStatute(TQuantityValue):
     unit: str = "miUS"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliAbsorbanceUnit(TQuantityValue):
     unit: str = "mAU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliAbsorbanceUnitTimesLiter(TQuantityValue):
     unit: str = "mAU.L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliAbsorbanceUnitTimesMilliliter(TQuantityValue):
     unit: str = "mAU.mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliAbsorbanceUnitTimesMinute(TQuantityValue):
     unit: str = "mAU.min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliAbsorbanceUnitTimesSecond(TQuantityValue):
     unit: str = "mAU.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliAmpere(TQuantityValue):
     unit: str = "mA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliArbitraryUnit(TQuantityValue):
     unit: str = "mArbU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliCaloriePerMinute(TQuantityValue):
     unit: str = "mcal/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliCaloriePerMoleDegreeCelsius(TQuantityValue):
     unit: str = "mcal/(mol °C)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliCaloriePerSecond(TQuantityValue):
     unit: str = "mcal/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliDegreeAngle(TQuantityValue):
     unit: str = "m°"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliDegreeAngleTimesSecond(TQuantityValue):
     unit: str = "m°.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliHenry(TQuantityValue):
     unit: str = "mH"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliOsmolesPerKilogram(TQuantityValue):
     unit: str = "mosm/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliSecond(TQuantityValue):
     unit: str = "ms"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliTorr(TQuantityValue):
     unit: str = "mtorr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliWatt(TQuantityValue):
     unit: str = "mW"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliWattPerGram(TQuantityValue):
     unit: str = "mW/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillibar(TQuantityValue):
     unit: str = "mbar"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligram(TQuantityValue):
     unit: str = "mg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerDeciliter(TQuantityValue):
     unit: str = "mg/dL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerFemtoliter(TQuantityValue):
     unit: str = "mg/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerKilogram(TQuantityValue):
     unit: str = "mg/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerLiter(TQuantityValue):
     unit: str = "mg/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerMicroliter(TQuantityValue):
     unit: str = "mg/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerMilliliter(TQuantityValue):
     unit: str = "mg/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerMinute(TQuantityValue):
     unit: str = "mg/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerNanoliter(TQuantityValue):
     unit: str = "mg/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerPicoliter(TQuantityValue):
     unit: str = "mg/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerSecond(TQuantityValue):
     unit: str = "mg/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerSquareCentimeter(TQuantityValue):
     unit: str = "mg/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligramPerSquareMeter(TQuantityValue):
     unit: str = "mg/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilligravity(TQuantityValue):
     unit: str = "mG"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliter(TQuantityValue):
     unit: str = "mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliterPerKilogram(TQuantityValue):
     unit: str = "mL/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliterPerLiter(TQuantityValue):
     unit: str = "mL/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliterPerMinute(TQuantityValue):
     unit: str = "mL/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliterPerMinuteSquared(TQuantityValue):
     unit: str = "mL/min^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliterPerSecond(TQuantityValue):
     unit: str = "mL/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMilliliterPerSecondSquared(TQuantityValue):
     unit: str = "mL/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimeter(TQuantityValue):
     unit: str = "mm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimeterOfMercury(TQuantityValue):
     unit: str = "mmHg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimeterOfMercuryAbsolute(TQuantityValue):
     unit: str = "mmHgA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimeterOfMercuryPerMinute(TQuantityValue):
     unit: str = "mmHg/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimeterPerMinute(TQuantityValue):
     unit: str = "mm/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimeterPerSecond(TQuantityValue):
     unit: str = "mm/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimolar(TQuantityValue):
     unit: str = "mM"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimole(TQuantityValue):
     unit: str = "mmol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimolePerLiter(TQuantityValue):
     unit: str = "mmol/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillimolePerMilliliter(TQuantityValue):
     unit: str = "mmol/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillionCellsPerMilliliter(TQuantityValue):
     unit: str = "10^6 cells/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillionDollarsPerFlight(TQuantityValue):
     unit: str = "M$/Flight"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillionDollarsPerYear(TQuantityValue):
     unit: str = "M$/yr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillisiemenPerCentimeter(TQuantityValue):
     unit: str = "mS/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillivolt(TQuantityValue):
     unit: str = "mV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillivoltTimesLiter(TQuantityValue):
     unit: str = "mV.L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMillivoltTimesSecond(TQuantityValue):
     unit: str = "mV.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMinuteAngle(TQuantityValue):
     unit: str = "'"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMinuteSidereal(TQuantityValue):
     unit: str = "min (s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMinuteTime(TQuantityValue):
     unit: str = "min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMolar(TQuantityValue):
     unit: str = "M"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMole(TQuantityValue):
     unit: str = "mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMoleDegreeCelsius(TQuantityValue):
     unit: str = "mol-degC"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMoleKelvin(TQuantityValue):
     unit: str = "mol K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMolePerCubicDecimeter(TQuantityValue):
     unit: str = "mol/dm^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMolePerCubicMeter(TQuantityValue):
     unit: str = "mol/m^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMolePerKilogram(TQuantityValue):
     unit: str = "mol/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueMolePerLiter(TQuantityValue):
     unit: str = "mol/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoAmpere(TQuantityValue):
     unit: str = "nA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoCoulomb(TQuantityValue):
     unit: str = "nC"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoCoulombTimesLiter(TQuantityValue):
     unit: str = "nC.L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoCoulombTimesSecond(TQuantityValue):
     unit: str = "nC.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoFarad(TQuantityValue):
     unit: str = "nF"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoRefractiveIndexUnitTimesSecond(TQuantityValue):
     unit: str = "nano RIU.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogram(TQuantityValue):
     unit: str = "ng"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerFemtoliter(TQuantityValue):
     unit: str = "ng/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerLiter(TQuantityValue):
     unit: str = "ng/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerMicroliter(TQuantityValue):
     unit: str = "ng/µL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerMilliliter(TQuantityValue):
     unit: str = "ng/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerNanoliter(TQuantityValue):
     unit: str = "ng/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerPicoliter(TQuantityValue):
     unit: str = "ng/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerSquareCentimeter(TQuantityValue):
     unit: str = "ng/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanogramPerSquareMeter(TQuantityValue):
     unit: str = "ng/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanoliter(TQuantityValue):
     unit: str = "nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanometer(TQuantityValue):
     unit: str = "nm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanomolar(TQuantityValue):
     unit: str = "nM"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNanomole(TQuantityValue):
     unit: str = "nmol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNat(TQuantityValue):
     unit: str = "nat"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNauticalMile(TQuantityValue):
     unit: str = "n mile"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNauticalMilePerHour(TQuantityValue):
     unit: str = "nmi/hr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNauticalMilePerMinute(TQuantityValue):
     unit: str = "nmi/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNephelometricTurbidityUnit(TQuantityValue):
     unit: str = "NTU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNewton(TQuantityValue):
     unit: str = "N"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNewtonMeter(TQuantityValue):
     unit: str = "N m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNewtonPerCoulomb(TQuantityValue):
     unit: str = "N/C"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNewtonPerKilogram(TQuantityValue):
     unit: str = "N/kg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNewtonPerMeter(TQuantityValue):
     unit: str = "N/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNewtonPerSquareMillimeter(TQuantityValue):
     unit: str = "N/mm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNumber(TQuantityValue):
     unit: str = "#"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNumberPerMicroliter(TQuantityValue):
     unit: str = "#/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueNumberPerYear(TQuantityValue):
     unit: str = "#/yr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOersted(TQuantityValue):
     unit: str = "Oe"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOerstedCentimeter(TQuantityValue):
     unit: str = "Oe cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOhm(TQuantityValue):
     unit: str = "Ω"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOhmMeter(TQuantityValue):
     unit: str = "Ω m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOsmolesPerLiter(TQuantityValue):
     unit: str = "osm/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOunceForce(TQuantityValue):
     unit: str = "ozf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOunceForceInch(TQuantityValue):
     unit: str = "ozf in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOunceImperial(TQuantityValue):
     unit: str = "oz"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOunceMass(TQuantityValue):
     unit: str = "ozm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOuncePerCubicInch(TQuantityValue):
     unit: str = "oz/in^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOuncePerGallon(TQuantityValue):
     unit: str = "oz/gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOuncePerSquareFoot(TQuantityValue):
     unit: str = "oz/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOuncePerSquareYard(TQuantityValue):
     unit: str = "oz/yd^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueOunceTroy(TQuantityValue):
     unit: str = "oz (tr)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePH(TQuantityValue):
     unit: str = "pH"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueParsec(TQuantityValue):
     unit: str = "pc"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePartsPerBillion(TQuantityValue):
     unit: str = "ppb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePartsPerMillion(TQuantityValue):
     unit: str = "ppm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePartsPerMillionTimesArbitraryUnit(TQuantityValue):
     unit: str = "ppm.arb'U"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePascal(TQuantityValue):
     unit: str = "Pa"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePascalPerHour(TQuantityValue):
     unit: str = "Pa/hr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePascalPerSecond(TQuantityValue):
     unit: str = "Pa/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePascalSecond(TQuantityValue):
     unit: str = "Pa s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePeck(TQuantityValue):
     unit: str = "pk"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePennyWeight(TQuantityValue):
     unit: str = "dwt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerCubicMeter(TQuantityValue):
     unit: str = "m^-3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerMeter(TQuantityValue):
     unit: str = "m^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerMeterKelvin(TQuantityValue):
     unit: str = "m^-1 K^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerMinute(TQuantityValue):
     unit: str = "min^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerMolarPerSecond(TQuantityValue):
     unit: str = "M-1s-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerMole(TQuantityValue):
     unit: str = "mol^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerSecond(TQuantityValue):
     unit: str = "s^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerSquareGigaElectronVolt(TQuantityValue):
     unit: str = "GeV^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerTeslaMeter(TQuantityValue):
     unit: str = "m^-1 T^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerTeslaSecond(TQuantityValue):
     unit: str = "s^-1 T^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePercent(TQuantityValue):
     unit: str = "%"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePerson(TQuantityValue):
     unit: str = "person"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePhot(TQuantityValue):
     unit: str = "ph"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePica(TQuantityValue):
     unit: str = "Pm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicoAmpere(TQuantityValue):
     unit: str = "pA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicoAmpereTimesLiter(TQuantityValue):
     unit: str = "pA.L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicoAmpereTimesSecond(TQuantityValue):
     unit: str = "pA.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicoAmperesTimesMinute(TQuantityValue):
     unit: str = "pA.min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicoFarad(TQuantityValue):
     unit: str = "pF"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogram(TQuantityValue):
     unit: str = "pg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerFemtoliter(TQuantityValue):
     unit: str = "pg/fL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerLiter(TQuantityValue):
     unit: str = "pg/L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerMicroliter(TQuantityValue):
     unit: str = "pg/μL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerMilliliter(TQuantityValue):
     unit: str = "pg/mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerNanoliter(TQuantityValue):
     unit: str = "pg/nL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerPicoliter(TQuantityValue):
     unit: str = "pg/pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerSquareCentimeter(TQuantityValue):
     unit: str = "pg/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicogramPerSquareMeter(TQuantityValue):
     unit: str = "pg/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicoliter(TQuantityValue):
     unit: str = "pL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicometer(TQuantityValue):
     unit: str = "pm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicomolar(TQuantityValue):
     unit: str = "pmol/dm^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePicomole(TQuantityValue):
     unit: str = "pmol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePintImperial(TQuantityValue):
     unit: str = "pi"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePixel(TQuantityValue):
     unit: str = "pixel"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePixelPerMillimeter(TQuantityValue):
     unit: str = "pixel/mm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlanckCharge(TQuantityValue):
     unit: str = "Q_p"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlanckLength(TQuantityValue):
     unit: str = "l_P"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlanckMass(TQuantityValue):
     unit: str = "m_P"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlanckTemperature(TQuantityValue):
     unit: str = "Θ_P"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlanckTime(TQuantityValue):
     unit: str = "t_P"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlaqueFormingUnit(TQuantityValue):
     unit: str = "PFU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePlatesPerMeter(TQuantityValue):
     unit: str = "plates/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoint(TQuantityValue):
     unit: str = "pnt"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoise(TQuantityValue):
     unit: str = "P"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundDegreeFahrenheit(TQuantityValue):
     unit: str = "lb-degF"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundDegreeRankine(TQuantityValue):
     unit: str = "lb-degR"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForce(TQuantityValue):
     unit: str = "lbf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForceFoot(TQuantityValue):
     unit: str = "lbf-ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForceInch(TQuantityValue):
     unit: str = "lbf-in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForcePerFoot(TQuantityValue):
     unit: str = "lbf/ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForcePerInch(TQuantityValue):
     unit: str = "lbf/in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForcePerPound(TQuantityValue):
     unit: str = "lbf/lb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForcePerSquareFoot(TQuantityValue):
     unit: str = "lbf/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForcePerSquareInch(TQuantityValue):
     unit: str = "psi"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForcePerSquareInchSecond(TQuantityValue):
     unit: str = "lbf / in^2-s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForceSecondPerSquareFoot(TQuantityValue):
     unit: str = "lbf-s/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundForceSecondPerSquareInch(TQuantityValue):
     unit: str = "lbf-s/in^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundMass(TQuantityValue):
     unit: str = "lbm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundMole(TQuantityValue):
     unit: str = "lb mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundMoleDegreeFahrenheit(TQuantityValue):
     unit: str = "lb mol °F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerCubicFoot(TQuantityValue):
     unit: str = "lb/ft^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerCubicInch(TQuantityValue):
     unit: str = "lb/in^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerCubicMeter(TQuantityValue):
     unit: str = "lbm/m^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerCubicYard(TQuantityValue):
     unit: str = "lb/yd^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerFoot(TQuantityValue):
     unit: str = "lb/ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerFootHour(TQuantityValue):
     unit: str = "lb/(ft-hr)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerFootSecond(TQuantityValue):
     unit: str = "lb/(ft-s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerGallon(TQuantityValue):
     unit: str = "lb/gal"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerHour(TQuantityValue):
     unit: str = "lb/hr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerInch(TQuantityValue):
     unit: str = "lb/in"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerMinute(TQuantityValue):
     unit: str = "lb/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundPerSquareFoot(TQuantityValue):
     unit: str = "lb/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundTroy(TQuantityValue):
     unit: str = "lbm (tr)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundal(TQuantityValue):
     unit: str = "pdl"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValuePoundalPerSquareFoot(TQuantityValue):
     unit: str = "pdl/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueQuad(TQuantityValue):
     unit: str = "quad"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueQuarticCoulombMeterPerCubicEnergy(TQuantityValue):
     unit: str = "C^4 m^4 J^-3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRad(TQuantityValue):
     unit: str = "rad"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRadian(TQuantityValue):
     unit: str = "r"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRadianPerHour(TQuantityValue):
     unit: str = "rad/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRadianPerMinute(TQuantityValue):
     unit: str = "rad/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRadianPerSecond(TQuantityValue):
     unit: str = "rad/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRadianPerSecondSquared(TQuantityValue):
     unit: str = "rad/s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueReciprocalCentimeter(TQuantityValue):
     unit: str = "1/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRefractiveIndexUnit(TQuantityValue):
     unit: str = "RIU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRegisterTon(TQuantityValue):
     unit: str = "RT"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativeFluorescenceUnit(TQuantityValue):
     unit: str = "RFU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativeFluorescenceUnitTimesMilliliter(TQuantityValue):
     unit: str = "RFU.mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativeFluorescenceUnitTimesSecond(TQuantityValue):
     unit: str = "RFU.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativeLightUnit(TQuantityValue):
     unit: str = "RLU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativeLightUnitTimesMilliliter(TQuantityValue):
     unit: str = "RLU.mL"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativeLightUnitTimesSecond(TQuantityValue):
     unit: str = "RLU.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativePermeability(TQuantityValue):
     unit: str = "μr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRelativePermittivity(TQuantityValue):
     unit: str = "εr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRem(TQuantityValue):
     unit: str = "rem"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueResponseUnit(TQuantityValue):
     unit: str = "RU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueResponseUnitPerSecond(TQuantityValue):
     unit: str = "RU/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueResponseUnitTimesSecond(TQuantityValue):
     unit: str = "RU.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRevolution(TQuantityValue):
     unit: str = "rev"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRevolutionPerHour(TQuantityValue):
     unit: str = "rev/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRevolutionPerMinute(TQuantityValue):
     unit: str = "rev/min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRevolutionPerSecond(TQuantityValue):
     unit: str = "rev/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRod(TQuantityValue):
     unit: str = "rd"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueRoentgen(TQuantityValue):
     unit: str = "R"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSamplePerSecond(TQuantityValue):
     unit: str = "[sps]"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSecondAngle(TQuantityValue):
     unit: str = '"'
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSecondSquareFoot(TQuantityValue):
     unit: str = "s ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSecondTime(TQuantityValue):
     unit: str = "s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSecondTimeSquared(TQuantityValue):
     unit: str = "s^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueShake(TQuantityValue):
     unit: str = "Sh"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSiemens(TQuantityValue):
     unit: str = "S"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSiemensPerMeter(TQuantityValue):
     unit: str = "S/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSiemensPerMeterTimesLiter(TQuantityValue):
     unit: str = "[S/m].L"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSiemensPerMeterTimesSecond(TQuantityValue):
     unit: str = "[S/m].s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSiemensTimesSecond(TQuantityValue):
     unit: str = "S.s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSievert(TQuantityValue):
     unit: str = "Sv"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSlug(TQuantityValue):
     unit: str = "slug"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSlugPerCubicFoot(TQuantityValue):
     unit: str = "slug/ft^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSlugPerFoot(TQuantityValue):
     unit: str = "slug/ft"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSlugPerFootSecond(TQuantityValue):
     unit: str = "slug/(ft s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSlugPerSecond(TQuantityValue):
     unit: str = "slug/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSlugPerSquareFoot(TQuantityValue):
     unit: str = "slug/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareAngstrom(TQuantityValue):
     unit: str = "Å^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareCentimeter(TQuantityValue):
     unit: str = "cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareCentimeterMinute(TQuantityValue):
     unit: str = "cm^2 min"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareCentimeterSecond(TQuantityValue):
     unit: str = "cm^2 s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareCentimetersPerGram(TQuantityValue):
     unit: str = "cm^2/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareCentimetersPerMole(TQuantityValue):
     unit: str = "cm^2/mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareCoulombMeterPerJoule(TQuantityValue):
     unit: str = "C^2 m^2 J^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareDegree(TQuantityValue):
     unit: str = "deg^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFoot(TQuantityValue):
     unit: str = "ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootDegreeFahrenheit(TQuantityValue):
     unit: str = "ft^2 °F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootHourDegreeFahrenheit(TQuantityValue):
     unit: str = "ft^2 h °F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootHourDegreeFahrenheitPerBtu(TQuantityValue):
     unit: str = "(°F h ft^2)/Btu"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootPerBtuInch(TQuantityValue):
     unit: str = "ft^2/(Btu in)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootPerHour(TQuantityValue):
     unit: str = "ft^2/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootPerSecond(TQuantityValue):
     unit: str = "ft^2/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareFootSecondDegreeFahrenheit(TQuantityValue):
     unit: str = "ft^2 s °F"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareInch(TQuantityValue):
     unit: str = "in^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMeter(TQuantityValue):
     unit: str = "m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMeterKelvin(TQuantityValue):
     unit: str = "m^2 K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMeterKelvinPerWatt(TQuantityValue):
     unit: str = "(K^2) m/W"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMeterPerKelvin(TQuantityValue):
     unit: str = "m^2/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMeterPerSecond(TQuantityValue):
     unit: str = "m^2/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMeterSteradian(TQuantityValue):
     unit: str = "m^2 sr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMetersPerGram(TQuantityValue):
     unit: str = "m^2/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareMile(TQuantityValue):
     unit: str = "mi^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSquareYard(TQuantityValue):
     unit: str = "yd^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatampere(TQuantityValue):
     unit: str = "statA"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatcoulomb(TQuantityValue):
     unit: str = "statC"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatcoulombPerMole(TQuantityValue):
     unit: str = "statC/mol"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatcoulombPerSquareCentimeter(TQuantityValue):
     unit: str = "statC/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatfarad(TQuantityValue):
     unit: str = "statF"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStathenry(TQuantityValue):
     unit: str = "statH"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStathenryPerCentimeter(TQuantityValue):
     unit: str = "statH/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatmho(TQuantityValue):
     unit: str = "statS"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatohm(TQuantityValue):
     unit: str = "statΩ"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatvolt(TQuantityValue):
     unit: str = "statV"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatvoltCentimeter(TQuantityValue):
     unit: str = "statV cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStatvoltPerCentimeter(TQuantityValue):
     unit: str = "statV/cm"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueSteradian(TQuantityValue):
     unit: str = "sr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStere(TQuantityValue):
     unit: str = "st"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStilb(TQuantityValue):
     unit: str = "sb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueStokes(TQuantityValue):
     unit: str = "St"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTablespoon(TQuantityValue):
     unit: str = "tbsp"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTeaspoon(TQuantityValue):
     unit: str = "tsp"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTesla(TQuantityValue):
     unit: str = "T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTeslaMeter(TQuantityValue):
     unit: str = "m T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTeslaSecond(TQuantityValue):
     unit: str = "s T"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTex(TQuantityValue):
     unit: str = "tex"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueThermEEC(TQuantityValue):
     unit: str = "therm (EC)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueThermUS(TQuantityValue):
     unit: str = "therm (US)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonAssay(TQuantityValue):
     unit: str = "AT"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonEnergy(TQuantityValue):
     unit: str = "t/lbf"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonLong(TQuantityValue):
     unit: str = "ton (l)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonLongPerCubicYard(TQuantityValue):
     unit: str = "ton/yd^3"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonOfOilEquivalent(TQuantityValue):
     unit: str = "toe"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonOfRefrigeration(TQuantityValue):
     unit: str = "t/fg"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonShort(TQuantityValue):
     unit: str = "ton (s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonShortPerCubicYard(TQuantityValue):
     unit: str = "ton/yd"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTonShortPerHour(TQuantityValue):
     unit: str = "ton/h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTorr(TQuantityValue):
     unit: str = "torr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueTwoTheta(TQuantityValue):
     unit: str = "2θ"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueUnifiedAtomicMassUnit(TQuantityValue):
     unit: str = "AMU"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueUnitPole(TQuantityValue):
     unit: str = "U/nWb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueUnitless(TQuantityValue):
     unit: str = "(unitless)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueVolt(TQuantityValue):
     unit: str = "V"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueVoltMeter(TQuantityValue):
     unit: str = "m V"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueVoltPerMeter(TQuantityValue):
     unit: str = "V/m"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueVoltPerSecond(TQuantityValue):
     unit: str = "V/s"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueVoltPerSquareMeter(TQuantityValue):
     unit: str = "V m^-2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWatt(TQuantityValue):
     unit: str = "W"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerGram(TQuantityValue):
     unit: str = "W/g"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerKelvin(TQuantityValue):
     unit: str = "W/K"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerMeterKelvin(TQuantityValue):
     unit: str = "W/(m K)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareCentimeter(TQuantityValue):
     unit: str = "W/cm^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareFoot(TQuantityValue):
     unit: str = "W/ft^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareInch(TQuantityValue):
     unit: str = "W/in^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareMeter(TQuantityValue):
     unit: str = "W/m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareMeterKelvin(TQuantityValue):
     unit: str = "W/(m^2 K)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareMeterQuarticKelvin(TQuantityValue):
     unit: str = "W m^-2 K^-4"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattPerSquareMeterSteradian(TQuantityValue):
     unit: str = "W/(m^2 sr)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattSquareMeter(TQuantityValue):
     unit: str = "W m^2"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWattSquareMeterPerSteradian(TQuantityValue):
     unit: str = "W m^2 sr^-1"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWatthour(TQuantityValue):
     unit: str = "W h"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueWeber(TQuantityValue):
     unit: str = "Wb"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueYard(TQuantityValue):
     unit: str = "yd"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueYear365Day(TQuantityValue):
     unit: str = "yr"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueYearSidereal(TQuantityValue):
     unit: str = "yr (s)"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TQuantityValueYearTropical(TQuantityValue):
     unit: str = "yr (t)"
@@ -0,0 +1,154 @@
+"""Runtime support for the validators generated by allotropy.schema_gen.codegen.validator.
+
+Generated validators are plain Python functions, one per schema node, that return None when the
+instance is valid or a list of SchemaError otherwise. The helpers here implement the parts of
+JSON Schema semantics that are shared between nodes, following jsonschema (Draft 2020-12) so that
+generated validators report the same errors.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+import datetime
+import itertools
+from numbers import Number
+from typing import Any, NamedTuple
+
+from rfc3339_validator import validate_rfc3339  # type: ignore[import-untyped]
+
+
+class SchemaError(NamedTuple):
+    # Path to the failing value within the instance, e.g. ("measurement aggregate document", 0).
+    path: tuple[str | int, ...]
+    # The schema keyword that failed, e.g. "required".
+    validator: str
+    message: str
+
+
+Errors = list[SchemaError]
+NodeValidator = Callable[[Any, bool], "Errors | None"]
+
+
+def error(errors: Errors | None, validator: str, message: str) -> Errors:
+    if errors is None:
+        errors = []
+    errors.append(SchemaError((), validator, message))
+    return errors
+
+
+def child_errors(errors: Errors | None, key: str | int, child: Errors) -> Errors:
+    if errors is None:
+        errors = []
+    errors.extend(
+        SchemaError(
+            (key, *child_error.path), child_error.validator, child_error.message
+        )
+        for child_error in child
+    )
+    return errors
+
+
+def extend_errors(errors: Errors | None, other: Errors) -> Errors:
+    if errors is None:
+        return list(other)
+    errors.extend(other)
+    return errors
+
+
+def is_number(instance: Any) -> bool:
+    return isinstance(instance, Number) and not isinstance(instance, bool)
+
+
+def is_integer(instance: Any) -> bool:
+    if isinstance(instance, bool):
+        return False
+    if isinstance(instance, float):
+        return instance.is_integer()
+    return isinstance(instance, int)
+
+
+def _unbool(element: Any, true: object = object(), false: object = object()) -> Any:
+    # Makes True and 1, and False and 0, compare as different values.
+    if element is True:
+        return true
+    if element is False:
+        return false
+    return element
+
+
+def equal(one: Any, two: Any) -> bool:
+    if isinstance(one, str) or isinstance(two, str):
+        return bool(one == two)
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(
+            equal(i, j) for i, j in zip(one, two, strict=True)
+        )
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return one.keys() == two.keys() and all(
+            equal(value, two[key]) for key, value in one.items()
+        )
+    return bool(_unbool(one) == _unbool(two))
+
+
+def in_enum(instance: Any, enum: Sequence[Any]) -> bool:
+    if instance in (0, 1):
+        unbooled = _unbool(instance)
+        return any(unbooled == _unbool(each) for each in enum)
+    return instance in enum
+
+
+def is_unique(instance: Sequence[Any]) -> bool:
+    try:
+        items = sorted(_unbool(item) for item in instance)
+        return not any(
+            equal(i, j)
+            for i, j in zip(items, itertools.islice(items, 1, None), strict=False)
+        )
+    except (NotImplementedError, TypeError):
+        seen: list[Any] = []
+        for item in instance:
+            unbooled = _unbool(item)
+            if any(equal(other, unbooled) for other in seen):
+                return False
+            seen.append(unbooled)
+    return True
+
+
+def _is_date(instance: str) -> bool:
+    try:
+        return instance.isascii() and bool(datetime.date.fromisoformat(instance))
+    except ValueError:
+        return False
+
+
+def _is_datetime(instance: str) -> bool:
+    return bool(validate_rfc3339(instance.upper()))
+
+
+def _is_time(instance: str) -> bool:
+    return _is_datetime("1970-01-01T" + instance)
+
+
+# The formats checked by default by jsonschema, for the formats used in ASM schemas. The other
+# formats (uri, iri, duration...) are only checked by jsonschema when optional packages are
+# installed, and "uri-reference" is explicitly not checked, so they are not checked here either.
+FORMAT_CHECKS: dict[str, Callable[[str], bool]] = {
+    "date": _is_date,
+    "date-time": _is_datetime,
+    "time": _is_time,
+}
+
+# Errors from these keywords only say that none of the options matched, so are the least useful.
+_WEAK_VALIDATORS = frozenset({"anyOf", "oneOf"})
+
+
+def best_error(errors: Sequence[SchemaError]) -> SchemaError:
+    """The most relevant error to report, preferring errors closest to the root like jsonschema."""
+    return max(
+        errors,
+        key=lambda error: (-len(error.path), error.validator not in _WEAK_VALIDATORS),
+    )
+
+
+def format_path(path: Sequence[str | int]) -> str:
+    return "instance" + "".join(f"[{key!r}]" for key in path)
@@ -9,6 +9,7 @@ ALLOTROPY_DIR: Path = ALLOTROPE_DIR.parent
 ROOT_DIR: Path = ALLOTROPY_DIR.parent.parent
 SCHEMA_DIR_PATH: Path = Path(ALLOTROPE_DIR, "schemas")
 MODEL_DIR_PATH: Path = Path(ALLOTROPE_DIR, "models")
+VALIDATOR_DIR_PATH: Path = Path(ALLOTROPE_DIR, "validators")
 SHARED_MODELS_PATH: Path = Path(MODEL_DIR_PATH, "shared")
 SHARED_MODELS_DEFINITIONS_PATH: Path = Path(SHARED_MODELS_PATH, "definitions")
 
@@ -127,6 +128,12 @@ def get_import_path_from_path(model_path: Path) -> str:
     )
 
 
+def get_validator_import_path_from_schema_path(schema_path: Path) -> str:
+    # Validators are generated to the same relative path as the models.
+    model_path = get_model_path_from_schema_path(schema_path)
+    return f"allotropy.allotrope.validators.{'.'.join(PureWindowsPath(model_path).parts)[:-3]}"
+
+
 def get_model_class_from_schema(asm: Mapping[str, Any]) -> Any:
     schema_path = get_schema_path_from_asm(asm)
     model_path = get_model_path_from_schema_path(Path(schema_path))
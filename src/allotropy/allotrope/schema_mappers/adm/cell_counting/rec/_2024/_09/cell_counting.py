@@ -1,7 +1,11 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
-from allotropy.allotrope.converter import add_custom_information_document
+from allotropy.allotrope.converter import (
+    add_custom_information_document,
+    iter_json_fields,
+)
 from allotropy.allotrope.models.adm.cell_counting.rec._2024._09.cell_counting import (
     CellCountingAggregateDocument,
     CellCountingDocumentItem,
@@ -157,18 +161,22 @@ class CalculatedDataItem:
 @dataclass
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
-    calculated_data: list[CalculatedDataItem] | None = None
+    measurement_groups: Iterable[MeasurementGroup]
+    calculated_data: Iterable[CalculatedDataItem] | None = None
 
 
 def has_value(model: object) -> bool:
-    return any(value is not None for value in model.__dict__.values())
+    return any(value is not None for _, value in iter_json_fields(model))
 
 
 class Mapper(SchemaMapper[Data, Model]):
     MANIFEST = "http://purl.allotrope.org/manifests/cell-counting/REC/2024/09/cell-counting.manifest"
 
     def map_model(self, data: Data) -> Model:
+        # Calculated data is reported in every group, so it is read once for all of them.
+        calculated_data = (
+            None if data.calculated_data is None else list(data.calculated_data)
+        )
         return Model(
             field_asm_manifest=self.MANIFEST,
             cell_counting_aggregate_document=CellCountingAggregateDocument(
@@ -199,7 +207,7 @@ class Mapper(SchemaMapper[Data, Model]):
                 ),
                 cell_counting_document=[
                     self._get_technique_document(
-                        measurement_group, data.metadata, data.calculated_data
+                        measurement_group, data.metadata, calculated_data
                     )
                     for measurement_group in data.measurement_groups
                 ],
@@ -418,8 +426,9 @@ class Mapper(SchemaMapper[Data, Model]):
         )
 
     def _get_calculated_data_aggregate_document(
-        self, calculated_data_items: list[CalculatedDataItem] | None
+        self, calculated_data_items: Iterable[CalculatedDataItem] | None
     ) -> CalculatedDataAggregateDocument | None:
+        calculated_data_items = list(calculated_data_items or [])
         if not calculated_data_items:
             return None
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from allotropy.allotrope.models.adm.core.benchling._2024._09.hierarchy import (
@@ -145,8 +146,8 @@ class Metadata:
 @dataclass(frozen=True)
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
-    calculated_data: list[CalculatedDataItem] | None = None
+    measurement_groups: Iterable[MeasurementGroup]
+    calculated_data: Iterable[CalculatedDataItem] | None = None
 
 
 class Mapper(SchemaMapper[Data, Model]):
@@ -309,8 +310,9 @@ class Mapper(SchemaMapper[Data, Model]):
         )
 
     def _get_calculated_data_aggregate_document(
-        self, calculated_data_items: list[CalculatedDataItem] | None
+        self, calculated_data_items: Iterable[CalculatedDataItem] | None
     ) -> CalculatedDataAggregateDocument | None:
+        calculated_data_items = list(calculated_data_items or [])
         if not calculated_data_items:
             return None
 
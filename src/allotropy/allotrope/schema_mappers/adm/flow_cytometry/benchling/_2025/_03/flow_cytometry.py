@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -164,7 +165,7 @@ class Metadata:
 @dataclass
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
+    measurement_groups: Iterable[MeasurementGroup]
 
 
 class Mapper(SchemaMapper[Data, Model]):
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -254,7 +255,7 @@ class MeasurementGroup:
 @dataclass(frozen=True)
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
+    measurement_groups: Iterable[MeasurementGroup]
 
 
 class Mapper(SchemaMapper[Data, Model]):
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -153,8 +154,8 @@ class Metadata:
 @dataclass(frozen=True)
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
-    calculated_data: list[CalculatedDocument] | None = None
+    measurement_groups: Iterable[MeasurementGroup]
+    calculated_data: Iterable[CalculatedDocument] | None = None
 
 
 class Mapper(SchemaMapper[Data, Model]):
@@ -348,8 +349,9 @@ class Mapper(SchemaMapper[Data, Model]):
         )
 
     def _get_calculated_data_aggregate_document(
-        self, calculated_data_items: list[CalculatedDocument] | None
+        self, calculated_data_items: Iterable[CalculatedDocument] | None
     ) -> CalculatedDataAggregateDocument | None:
+        calculated_data_items = list(calculated_data_items or [])
         if not calculated_data_items:
             return None
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
@@ -125,8 +126,8 @@ class Metadata:
 @dataclass(frozen=True)
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
-    calculated_data: list[CalculatedDataItem] | None = None
+    measurement_groups: Iterable[MeasurementGroup]
+    calculated_data: Iterable[CalculatedDataItem] | None = None
 
 
 CubeClass = TypeVar("CubeClass")
@@ -256,8 +257,9 @@ class Mapper(SchemaMapper[Data, Model]):
         return add_custom_information_document(measurement_doc, measurement.custom_info)
 
     def _get_calculated_data_aggregate_document(
-        self, calculated_data_items: list[CalculatedDataItem] | None
+        self, calculated_data_items: Iterable[CalculatedDataItem] | None
     ) -> TCalculatedDataAggregateDocument | None:
+        calculated_data_items = list(calculated_data_items or [])
         if not calculated_data_items:
             return None
 
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, TypeVar
@@ -207,7 +208,7 @@ class Metadata:
 @dataclass
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
+    measurement_groups: Iterable[MeasurementGroup]
     calculated_data: CalculatedData | None = None
 
 
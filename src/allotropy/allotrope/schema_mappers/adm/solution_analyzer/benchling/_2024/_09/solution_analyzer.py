@@ -1,7 +1,11 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
-from allotropy.allotrope.converter import add_custom_information_document
+from allotropy.allotrope.converter import (
+    add_custom_information_document,
+    iter_json_fields,
+)
 from allotropy.allotrope.models.adm.core.benchling._2024._09.hierarchy import (
     CalculatedDataAggregateDocument,
     CalculatedDataDocumentItem,
@@ -184,8 +188,8 @@ class CalculatedDataItem:
 @dataclass(frozen=True)
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
-    calculated_data: list[CalculatedDataItem] | None = None
+    measurement_groups: Iterable[MeasurementGroup]
+    calculated_data: Iterable[CalculatedDataItem] | None = None
 
 
 def get_ml_hg_or_kpa_quantity_value(
@@ -477,7 +481,7 @@ class Mapper(SchemaMapper[Data, Model]):
             None,
         )
 
-        if all(value is None for value in processed_data_document.__dict__.values()):
+        if all(value is None for _, value in iter_json_fields(processed_data_document)):
             return None
 
         return ProcessedDataAggregateDocument(
@@ -498,8 +502,9 @@ class Mapper(SchemaMapper[Data, Model]):
         )
 
     def _get_calculated_data_aggregate_document(
-        self, calculated_data_items: list[CalculatedDataItem] | None
+        self, calculated_data_items: Iterable[CalculatedDataItem] | None
     ) -> CalculatedDataAggregateDocument | None:
+        calculated_data_items = list(calculated_data_items or [])
         if not calculated_data_items:
             return None
 
@@ -1,7 +1,11 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
-from allotropy.allotrope.converter import add_custom_information_document
+from allotropy.allotrope.converter import (
+    add_custom_information_document,
+    iter_json_fields,
+)
 from allotropy.allotrope.models.adm.core.rec._2024._09.hierarchy import (
     CalculatedDataAggregateDocument,
     CalculatedDataDocumentItem,
@@ -183,8 +187,8 @@ class CalculatedDataItem:
 @dataclass(frozen=True)
 class Data:
     metadata: Metadata
-    measurement_groups: list[MeasurementGroup]
-    calculated_data: list[CalculatedDataItem] | None = None
+    measurement_groups: Iterable[MeasurementGroup]
+    calculated_data: Iterable[CalculatedDataItem] | None = None
 
 
 class Mapper(SchemaMapper[Data, Model]):
@@ -448,7 +452,7 @@ class Mapper(SchemaMapper[Data, Model]):
             None,
         )
 
-        if all(value is None for value in processed_data_document.__dict__.values()):
+        if all(value is None for _, value in iter_json_fields(processed_data_document)):
             return None
 
         return ProcessedDataAggregateDocument(
@@ -469,8 +473,9 @@ class Mapper(SchemaMapper[Data, Model]):
         )
 
     def _get_calculated_data_aggregate_document(
-        self, calculated_data_items: list[CalculatedDataItem] | None
+        self, calculated_data_items: Iterable[CalculatedDataItem] | None
     ) -> CalculatedDataAggregateDocument | None:
+        calculated_data_items = list(calculated_data_items or [])
         if not calculated_data_items:
             return None
 
@@ -1,8 +1,9 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Protocol, TypeVar
+from typing import Any, Protocol, TypeVar
 
 import numpy as np
+from numpy.typing import NDArray
 
 from allotropy.allotrope.models.adm.core.rec._2024._09.cube import (
     TDatacubeComponent,
@@ -25,15 +26,22 @@ class DataCubeComponent:
     unit: str
 
 
+# Dimension and measure values are either sequences of python values, or typed NumPy arrays. Arrays
+# with a numeric, boolean or unicode dtype are carried into the model as they are, and converted to
+# lists only when the model is unstructured, so large data cubes are never copied to lists before that.
+DimensionValues = Sequence[float] | Sequence[str] | Sequence[bool] | NDArray[Any]
+MeasureValues = (
+    Sequence[float | None] | Sequence[str | None] | Sequence[bool | None] | NDArray[Any]
+)
+
+
 @dataclass(frozen=True)
 class DataCube:
     label: str
     structure_dimensions: list[DataCubeComponent]
     structure_measures: list[DataCubeComponent]
-    dimensions: Sequence[Sequence[float] | Sequence[str] | Sequence[bool]]
-    measures: Sequence[
-        Sequence[float | None] | Sequence[str | None] | Sequence[bool | None]
-    ]
+    dimensions: Sequence[DimensionValues]
+    measures: Sequence[MeasureValues]
 
 
 class DataCubeProtocol(Protocol):
@@ -49,113 +57,61 @@ class DataCubeProtocol(Protocol):
 DataCubeType = TypeVar("DataCubeType", bound=DataCubeProtocol)
 
 
-T = TypeVar("T", bound=float | str | bool)
-
+# Array dtypes that are carried into the model without conversion.
+_ARRAY_DTYPE_KINDS = frozenset("biufU")
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
 
-def _is_type(type_: type[T], value: float | str | int) -> bool:
-    return isinstance(value, type_) or type_ is float and isinstance(value, int)
 
+def _get_typed_values(
+    values: DimensionValues | MeasureValues, *, nullable: bool
+) -> list[Any] | NDArray[Any] | None:
+    """The values as a list of floats or strs, or a typed array, or None if they are none of those.
 
-def _get_typed_dimension(
-    type_: type[T], values: Sequence[float | str | bool]
-) -> list[T] | None:
-    # Optimize for numpy arrays: use efficient .tolist() instead of iterating
-    # This reduces memory usage and is much faster for large arrays
+    The type is inferred in a single pass over the values. Ints (and bools, which are ints) and
+    NumPy scalars are accepted as floats.
+    """
     if isinstance(values, np.ndarray):
-        # For float arrays, numpy's tolist() efficiently converts to Python floats
-        if type_ is float and values.dtype in (
-            np.float32,
-            np.float64,
-            np.int32,
-            np.int64,
-        ):
-            return values.tolist()
-        elif type_ is str and values.dtype.kind in (
-            "U",
-            "S",
-            "O",
-        ):  # Unicode, bytes, object
-            return values.tolist()
-        elif type_ is bool and values.dtype == np.bool_:
-            return values.tolist()
-
-    # Fallback to original logic for non-numpy sequences
-    # Allow ints or floats for float list.
-    result: list[T] = [
-        # Typing is not smart enough to tell that calling type_(value) results in a value of type: type_,
-        # which I just can't deal with.
-        type_(value)  # type: ignore[misc]
-        for value in values
-        if _is_type(type_, value)
-    ]
-    return result if len(result) == len(values) else None
+        if values.dtype.kind in _ARRAY_DTYPE_KINDS:
+            return values
+        values = values.tolist()
+
+    kinds = {type(value) for value in values}
+    if nullable:
+        kinds.discard(type(None))
+    if all(issubclass(kind, _NUMBER_TYPES) for kind in kinds):
+        if kinds <= {float} and isinstance(values, list):
+            return values
+        return [None if value is None else float(value) for value in values]
+    if all(issubclass(kind, str) for kind in kinds):
+        if kinds <= {str} and isinstance(values, list):
+            return values
+        return [None if value is None else str(value) for value in values]
+    return None
 
 
 def _get_dimensions(
-    dimensions: Sequence[Sequence[float] | Sequence[str] | Sequence[bool]],
-) -> list[TDimensionArray | TFunction]:
-    result: list[TDimensionArray | TFunction] = []
+    dimensions: Sequence[DimensionValues],
+) -> list[TDimensionArray | TFunction | NDArray[Any]]:
+    result: list[TDimensionArray | TFunction | NDArray[Any]] = []
     for dimension in dimensions:
-        float_list = _get_typed_dimension(float, dimension)
-        str_list = _get_typed_dimension(str, dimension)
-        bool_list = _get_typed_dimension(bool, dimension)
-        # NOTE: given the input types, this should be impossible, however, typing does not believe this, so we
-        # add this check. This allows us to safely put "or []" at the end of result.append, confident that all
-        # 3 lists are only falsy if the input is empty.
-        if float_list is None and str_list is None and bool_list is None:
+        values = _get_typed_values(dimension, nullable=False)
+        if values is None:
             msg = f"Unable to extract a TDimensionArray from datacube dimension: {dimension}"
             raise AllotropeConversionError(msg)
-        result.append(float_list or str_list or bool_list or [])
+        result.append(values)
     return result
 
 
-def _get_typed_measure(
-    type_: type[T], values: Sequence[float | str | bool | None]
-) -> list[T | None] | None:
-    # Optimize for numpy arrays: use efficient .tolist() instead of iterating
-    if isinstance(values, np.ndarray):
-        # For float arrays, numpy's tolist() efficiently converts to Python floats
-        if type_ is float and values.dtype in (
-            np.float32,
-            np.float64,
-            np.int32,
-            np.int64,
-        ):
-            return values.tolist()
-        elif type_ is str and values.dtype.kind in ("U", "S", "O"):
-            return values.tolist()
-        elif type_ is bool and values.dtype == np.bool_:
-            return values.tolist()
-
-    # Fallback to original logic for non-numpy sequences
-    result: list[T | None] = [
-        # Typing is not smart enough to tell that calling type_(value) results in a value of type: type_,
-        # which I just can't deal with.
-        None if value is None else type_(value)  # type: ignore[misc]
-        for value in values
-        if value is None or _is_type(type_, value)
-    ]
-    return result if len(result) == len(values) else None
-
-
 def _get_measures(
-    measures: Sequence[
-        Sequence[float | None] | Sequence[str | None] | Sequence[bool | None]
-    ],
-) -> list[TMeasureArray]:
-    result: list[TMeasureArray] = []
+    measures: Sequence[MeasureValues],
+) -> list[TMeasureArray | NDArray[Any]]:
+    result: list[TMeasureArray | NDArray[Any]] = []
     for measure in measures:
-        float_list = _get_typed_measure(float, measure)
-        str_list = _get_typed_measure(str, measure)
-        bool_list = _get_typed_measure(bool, measure)
-        # NOTE: given the input types, this should be impossible, however, typing does not believe us, so we
-        # add
-        # this check. This allows us to safely put "or []" at the end of result.append, confident that all
-        # 3 lists are only falsy if the input is empty.
-        if float_list is None and str_list is None and bool_list is None:
+        values = _get_typed_values(measure, nullable=True)
+        if values is None:
             msg = f"Unable to extract a TMeasureArray from datacube measure: {measure}"
             raise AllotropeConversionError(msg)
-        result.append(float_list or str_list or bool_list or [])
+        result.append(values)
     return result
 
 
@@ -187,6 +143,6 @@ def get_data_cube(
         ),
         data=TDatacubeData(
             dimensions=_get_dimensions(data_cube.dimensions),  # type: ignore[arg-type]
-            measures=_get_measures(data_cube.measures),
+            measures=_get_measures(data_cube.measures),  # type: ignore[arg-type]
         ),
     )
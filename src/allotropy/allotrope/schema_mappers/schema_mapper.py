@@ -6,6 +6,13 @@ Model = TypeVar("Model")
 
 
 class SchemaMapper(Generic[Data, Model]):
+    """Maps the Data created by a parser to the model of an ASM schema.
+
+    The measurement groups (and calculated data) of Data can be any iterable, e.g. a generator that
+    creates each group from the next record of the input. map_model reads them once, in order, so a
+    parser can create groups while they are mapped, instead of creating all of them beforehand.
+    """
+
     # The manifest of the schema this mapper supports
     MANIFEST: str
 
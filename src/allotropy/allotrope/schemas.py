@@ -1,16 +1,26 @@
-from collections.abc import Mapping
+from collections.abc import Callable, Iterator, Mapping
 import copy
+import importlib
 import json
 from pathlib import Path
 from typing import Any
+from urllib.parse import urldefrag, urljoin
 
 import jsonschema
-from jsonschema import ValidationError
-
+from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+from referencing.jsonschema import DRAFT202012
+
+from allotropy.allotrope.native_validation import (
+    best_error,
+    format_path,
+    SchemaError,
+)
 from allotropy.allotrope.path_util import (
     get_full_schema_path,
     get_schema_path_from_asm,
     get_schema_path_from_manifest,
+    get_validator_import_path_from_schema_path,
     SCHEMA_DIR_PATH,
 )
 from allotropy.exceptions import AllotropeSerializationError, AllotropeValidationError
@@ -88,10 +98,6 @@ def _fast_items_validator(
         yield from _original_items(validator, items_schema, instance, schema)
         return
 
-    if items_schema is False:
-        yield ValidationError(f"Expected at most 0 items, but found {len(instance)}")
-        return
-
     type_info = _extract_accepted_types(items_schema)
     if type_info is None:
         yield from _original_items(validator, items_schema, instance, schema)
@@ -225,24 +231,49 @@ def get_schema_from_model(model: Any) -> dict[str, Any]:
     return get_schema_from_manifest(manifest)
 
 
-_schema_store: dict[str, dict[str, Any]] | None = None
+# Maps the $id of each schema to its path relative to SCHEMA_DIR_PATH, so that referenced schemas can
+# be loaded when first needed, instead of loading every schema to find them.
+SCHEMA_INDEX_PATH = Path(SCHEMA_DIR_PATH, "index.json")
 
 
-def _get_schema_store() -> dict[str, dict[str, Any]]:
-    """Load all schemas into a dict keyed by their $id URI."""
-    global _schema_store  # noqa: PLW0603
-    if _schema_store is not None:
-        return _schema_store
-
-    store: dict[str, dict[str, Any]] = {}
-    for schema_file in SCHEMA_DIR_PATH.rglob("*.schema.json"):
+def build_schema_index() -> dict[str, str]:
+    index: dict[str, str] = {}
+    for schema_file in sorted(SCHEMA_DIR_PATH.rglob("*.schema.json")):
         with open(schema_file, encoding=DEFAULT_ENCODING) as f:
             schema = json.load(f)
         schema_id = schema.get("$id")
         if schema_id:
-            store[schema_id] = schema
-    _schema_store = store
-    return store
+            index[schema_id] = schema_file.relative_to(SCHEMA_DIR_PATH).as_posix()
+    return index
+
+
+def write_schema_index() -> None:
+    """Update SCHEMA_INDEX_PATH, must be run when schemas are added to SCHEMA_DIR_PATH."""
+    with open(SCHEMA_INDEX_PATH, "w", encoding=DEFAULT_ENCODING) as f:
+        json.dump(build_schema_index(), f, indent=2)
+        f.write("\n")
+
+
+_schema_index: dict[str, str] | None = None
+
+
+def _get_schema_index(*, rebuild: bool = False) -> dict[str, str]:
+    global _schema_index  # noqa: PLW0603
+    if _schema_index is not None and not rebuild:
+        return _schema_index
+    index: dict[str, str]
+    if rebuild or not SCHEMA_INDEX_PATH.exists():
+        index = build_schema_index()
+    else:
+        with open(SCHEMA_INDEX_PATH, encoding=DEFAULT_ENCODING) as f:
+            index = json.load(f)
+    _schema_index = index
+    return index
+
+
+def preload_schema_store() -> None:
+    """Load the schema index ahead of the first validation, e.g. when starting a worker process."""
+    _get_schema_index()
 
 
 _schema_cache: dict[str, dict[str, Any]] = {}
@@ -261,6 +292,75 @@ def _get_schema_by_path(schema_path: Path) -> dict[str, Any]:
     return schema
 
 
+_missing_schema_ids: set[str] = set()
+
+
+def _get_schema_by_id(schema_id: str) -> dict[str, Any] | None:
+    index = _get_schema_index()
+    if schema_id not in index and schema_id not in _missing_schema_ids:
+        # The index may be out of date with the schemas directory.
+        index = _get_schema_index(rebuild=True)
+    path = index.get(schema_id)
+    if path is None:
+        _missing_schema_ids.add(schema_id)
+        return None
+    return _get_schema_by_path(Path(path))
+
+
+def _retrieve_schema(uri: str) -> Resource[Any]:
+    """Load a schema referenced by another one from SCHEMA_DIR_PATH when first used."""
+    schema = _get_schema_by_id(uri)
+    if schema is None:
+        raise NoSuchResource(ref=uri)  # type: ignore[call-arg]
+    return DRAFT202012.create_resource(schema)
+
+
+_schema_registry: Registry[Any] = Registry(retrieve=_retrieve_schema)  # type: ignore[call-arg]
+
+
+def _iter_refs(schema: Any) -> Iterator[str]:
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _iter_refs(value)
+
+
+def _get_registry(schema: dict[str, Any]) -> Registry[Any]:
+    """Get the registry with the schema and the schemas it references, directly or not.
+
+    Resources that are only retrieved while validating are not kept by the validator, so they would
+    be retrieved and crawled again on every lookup of a reference to them. Instead, referenced schemas
+    are added to a shared registry and crawled once.
+    """
+    global _schema_registry  # noqa: PLW0603
+    registry = _schema_registry
+    resources: dict[str, Resource[Any]] = {}
+    pending = [schema]
+    while pending:
+        current = pending.pop()
+        base_uri = current.get("$id", "")
+        if base_uri and base_uri not in registry:
+            resources[base_uri] = DRAFT202012.create_resource(current)
+        for ref in _iter_refs(current):
+            uri = urldefrag(urljoin(base_uri, ref)).url
+            if not uri or uri in registry or uri in resources:
+                continue
+            referenced = _get_schema_by_id(uri)
+            # Unknown references are only reported if they are used.
+            if referenced is not None:
+                resources[uri] = DRAFT202012.create_resource(referenced)
+                pending.append(referenced)
+    if resources:
+        registry = registry.with_resources(resources.items()).crawl()
+        _schema_registry = registry
+    return registry
+
+
 _validator_cache: dict[str, Any] = {}
 
 
@@ -271,19 +371,41 @@ def _get_validator(schema_path: Path) -> Any:
     if cached is not None:
         return cached
     schema = _get_schema_by_path(schema_path)
-    store = _get_schema_store()
-    resolver = jsonschema.RefResolver(
-        base_uri=schema.get("$id", ""),
-        referrer=schema,
-        store=store,
-    )
     validator = FastDraft202012Validator(
-        schema, resolver=resolver, format_checker=FORMAT_CHECKER
+        schema, registry=_get_registry(schema), format_checker=FORMAT_CHECKER
     )
     _validator_cache[key] = validator
     return validator
 
 
+NativeValidator = Callable[[Any], list[SchemaError]]
+
+_native_validator_cache: dict[str, NativeValidator | None] = {}
+
+
+def _get_native_validator(schema_path: Path) -> NativeValidator | None:
+    """Get the validator generated for the schema, or None if there is none.
+
+    Validators are generated with the models (see allotropy.schema_gen.generate.generate_validators),
+    schemas without one (e.g. using keywords the generator does not support) are validated with
+    jsonschema.
+    """
+    key = str(schema_path)
+    if key in _native_validator_cache:
+        return _native_validator_cache[key]
+    import_path = get_validator_import_path_from_schema_path(schema_path)
+    try:
+        module = importlib.import_module(import_path)
+    except ModuleNotFoundError as e:
+        if e.name is None or not import_path.startswith(e.name):
+            raise
+        validator = None
+    else:
+        validator = module.validate
+    _native_validator_cache[key] = validator
+    return validator
+
+
 def validate_asm_schema(asm_dict: dict[str, Any]) -> None:
     """Validate an ASM dict against schemas with cross-schema $ref resolution."""
     try:
@@ -293,10 +415,19 @@ def validate_asm_schema(asm_dict: dict[str, Any]) -> None:
         raise AllotropeSerializationError(msg) from e
 
     try:
-        validator = _get_validator(schema_path)
-        validator.validate(asm_dict)
-    except AllotropeValidationError:
-        raise
+        native_validator = _get_native_validator(schema_path)
+        if native_validator is None:
+            _get_validator(schema_path).validate(asm_dict)
+            return
+        errors = native_validator(asm_dict)
     except Exception as e:
         msg = f"Failed to validate allotrope model against schema: {e}"
         raise AllotropeValidationError(msg) from e
+
+    if errors:
+        error = best_error(errors)
+        msg = (
+            f"Failed to validate allotrope model against schema: {error.message}\n\n"
+            f"Failed validating {error.validator!r} on {format_path(error.path)}"
+        )
+        raise AllotropeValidationError(msg)
@@ -0,0 +1,15 @@
+"""Validator for http://purl.allotrope.org/json-schemas/adm/absorbance/REC/2024/06/absorbance-cube-detector.schema, generated by allotropy.schema_gen."""
+
+from typing import Any
+
+from allotropy.allotrope.native_validation import (
+    Errors,
+)
+
+
+def validate(instance: Any) -> Errors:
+    return _valid(instance, False) or []
+
+
+def _valid(x: Any, stop: bool) -> Errors | None:
+    return None
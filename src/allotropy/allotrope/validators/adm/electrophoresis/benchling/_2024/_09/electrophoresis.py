@@ -0,0 +1,12429 @@
+"""Validator for http://purl.allotrope.org/json-schemas/adm/electrophoresis/BENCHLING/2024/09/electrophoresis.embed.schema, generated by allotropy.schema_gen."""
+
+import re
+from typing import Any
+
+from allotropy.allotrope.native_validation import (
+    child_errors as _child_errors,
+    error as _error,
+    Errors,
+    extend_errors as _extend_errors,
+    FORMAT_CHECKS as _FORMAT_CHECKS,
+    is_integer as _is_integer,
+    is_number as _is_number,
+    is_unique as _is_unique,
+)
+
+_c0 = (
+    "{'type': 'string', 'format': 'iri'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/manifest.schema'}",
+)
+_c1 = (
+    "{'properties': {'electropherogram data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0003018', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}}",
+    "{'properties': {'fluorescence emission profile data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0002965', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['fluorescence emission profile data cube']}",
+    "{'properties': {'chromatogram data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0002550', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['chromatogram data cube']}",
+)
+_c2 = (
+    "{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c3 = (
+    "{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c4 = (
+    "{'properties': {'measures': {'type': 'array', 'items': {'$ref': '#/$defs/tMeasureArray'}}}, 'required': ['measures']}",
+    "{'properties': {'points': {'type': 'array', 'items': {'$ref': '#/$defs/tTupleData'}}}, 'required': ['points']}",
+)
+_c5 = (
+    "{'type': 'number'}",
+    "{'type': 'boolean'}",
+    "{'type': 'string'}",
+    "{'type': 'null'}",
+)
+_c6 = (
+    "{'$ref': '#/$defs/tNumberOrNullArray'}",
+    "{'$ref': '#/$defs/tBooleanOrNullArray'}",
+    "{'$ref': '#/$defs/tStringOrNullArray'}",
+)
+_c7 = ("{'$ref': '#/$defs/tDimensionArray'}", "{'$ref': '#/$defs/tFunction'}")
+_c8 = frozenset(["linear", "logarithmic"])
+_c9 = (
+    "{'$ref': '#/$defs/tNumberArray'}",
+    "{'$ref': '#/$defs/tBooleanArray'}",
+    "{'$ref': '#/$defs/tStringArray'}",
+)
+_c10 = re.compile("string|dateTime|date")
+_c11 = re.compile("integer|decimal|long|int|short|byte")
+_c12 = re.compile("double|float")
+_c13 = frozenset(["cardinal", "interval", "nominal", "ordinal", "range"])
+_c14 = frozenset(
+    [
+        "boolean",
+        "byte",
+        "dateTime",
+        "decimal",
+        "double",
+        "float",
+        "int",
+        "integer",
+        "long",
+        "short",
+        "string",
+    ]
+)
+_c15 = ("{'properties': {'@componentDatatype': {'const': 'double'}}}",)
+_c16 = (
+    "{'properties': {'concept': {'const': 'molecular mass'}, 'unit': {'const': 'Da'}, '@componentDatatype': {'const': 'double'}}}",
+    "{'properties': {'concept': {'const': 'polymer length'}, 'unit': {'const': '#'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c17 = (
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/s'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/mL'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/#'}",
+    "{'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tQuantityValue'}, {'$ref': 'http://purl.allotrope.org/json-schemas/qudt/BENCHLING/2023/09/units.schema#/$defs/KiloDalton'}]}",
+)
+_c18 = frozenset(
+    [
+        "arithmetic mean role",
+        "final value role",
+        "initial value role",
+        "maximum value role",
+        "median role",
+        "minimum value role",
+        "relative standard deviation role",
+        "skewness role",
+        "standard deviation role",
+        "variance role",
+    ]
+)
+_c19 = (
+    "{'type': 'string'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'string'}}, 'required': ['@type', 'value']}",
+)
+_c20 = (
+    "{'properties': {'scalar double datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001104', '$asm.type': 'http://www.w3.org/2001/XMLSchema#double', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tDoubleValue'}, 'unit': {'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tUnit'}}, 'required': ['scalar double datum']}",
+    "{'properties': {'scalar string datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001511', '$asm.type': 'http://www.w3.org/2001/XMLSchema#string', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tStringValue'}}, 'required': ['scalar string datum']}",
+    "{'properties': {'scalar timestamp datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001512', '$asm.type': 'http://www.w3.org/2001/XMLSchema#dateTime', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tDateTimeValue'}}, 'required': ['scalar timestamp datum']}",
+    "{'properties': {'scalar boolean datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001510', '$asm.type': 'http://www.w3.org/2001/XMLSchema#boolean', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tBooleanValue'}}, 'required': ['scalar boolean datum']}",
+)
+_c21 = (
+    "{'type': 'boolean'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'boolean'}}, 'required': ['@type', 'value']}",
+)
+_c22 = (
+    "{'type': 'string', 'format': 'date-time'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'string', 'format': 'date-time'}}, 'required': ['@type', 'value']}",
+)
+_c23 = _FORMAT_CHECKS["date-time"]
+_c24 = (
+    "{'type': 'number'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'number'}}, 'required': ['@type', 'value']}",
+)
+_c25 = (
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/%25'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/03/units.schema#/$defs/s'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/#'}",
+    "{'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/core.schema#/$defs/tQuantityValue'}, {'$ref': 'http://purl.allotrope.org/json-schemas/qudt/BENCHLING/2023/09/units.schema#/$defs/KiloDalton'}]}",
+)
+_c26 = (
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/mAU.s'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/mAU.mL'}",
+)
+_c27 = (
+    "{'properties': {'concept': {'const': 'absorbance'}, 'unit': {'const': 'mAU'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c28 = (
+    "{'properties': {'electropherogram data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0003018', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'absorbance'}, 'unit': {'const': 'mAU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['electropherogram data cube']}",
+    "{'properties': {'absorption profile data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0002963', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'absorbance'}, 'unit': {'const': 'mAU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['absorption profile data cube']}",
+    "{'properties': {'chromatogram data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0002550', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2024/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'retention time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}, {'properties': {'concept': {'const': 'retention volume'}, 'unit': {'const': 'mL'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'absorbance'}, 'unit': {'const': 'mAU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['chromatogram data cube']}",
+)
+_c29 = (
+    "{'properties': {'concept': {'const': 'retention time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}",
+    "{'properties': {'concept': {'const': 'retention volume'}, 'unit': {'const': 'mL'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c30 = (
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/09/units.schema#/$defs/mAU'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2024/03/units.schema#/$defs/RFU'}",
+)
+_c31 = frozenset(
+    [
+        "BET C constant",
+        "Raman intensity",
+        "Raman interferogram intensity",
+        "Raman wavenumber shift",
+        "Young modulus",
+        "abrasion weight",
+        "absolute intensity",
+        "absolute water content",
+        "absorbance",
+        "acquisition volume",
+        "actual P/P0 result",
+        "adsorbed volume at STP",
+        "ambient humidity",
+        "ambient pressure",
+        "ambient temperature",
+        "amount of substance",
+        "angle",
+        "angle of optical rotation",
+        "angular velocity",
+        "area",
+        "attenuation coefficient",
+        "average dead cell diameter (cell counter)",
+        "average particle size",
+        "average total cell circularity",
+        "average total cell diameter",
+        "average viable cell circularity",
+        "background corrected turbidity",
+        "birefringence",
+        "break strain",
+        "break stress",
+        "cell path length",
+        "chemical shift",
+        "chromatography column film thickness",
+        "chromatography column length",
+        "chromatography column particle size",
+        "circularity",
+        "coating gap height",
+        "collision energy",
+        "column inner diameter",
+        "compartment temperature",
+        "concentration",
+        "container diameter",
+        "container height",
+        "degassed sample weight",
+        "detector view volume",
+        "diameter",
+        "dielectric polarization",
+        "dilution factor",
+        "dilution volume",
+        "dispensed volume",
+        "dry gas flow rate",
+        "dry sample weight",
+        "eccentricity",
+        "electric charge",
+        "electric conductance",
+        "electric conductivity",
+        "electric current",
+        "electric impedance",
+        "electric resistance",
+        "electric resistivity",
+        "electron beam working distance",
+        "end height",
+        "energy (datum)",
+        "enthalpy",
+        "enthalpy of fusion",
+        "enthalpy of sublimation",
+        "enthalpy of vaporization",
+        "exhaust gas flow rate",
+        "extrapolated moisture content",
+        "fill depth",
+        "flow rate",
+        "flow ratio",
+        "fluorescence",
+        "foam height",
+        "force",
+        "fracture energy",
+        "glass transition temperature",
+        "gloss",
+        "gross weight",
+        "hardness",
+        "heat capacity",
+        "heat capacity (dsc)",
+        "heat flow",
+        "heat seal length",
+        "heat transfer coefficient",
+        "height",
+        "hold-up volume",
+        "humidity",
+        "image height",
+        "image width",
+        "incident radiation angle",
+        "inlet gas pressure",
+        "inner diameter",
+        "intensity",
+        "isocyanate reservoir temperature",
+        "length",
+        "linear velocity",
+        "liquid height",
+        "luminescence",
+        "m/z",
+        "mass",
+        "mass attenuation coefficient",
+        "mass change",
+        "mass concentration",
+        "mass fraction",
+        "measurement chamber free space volume",
+        "molar attenuation coefficient",
+        "molar concentration",
+        "molar enthalpy of fusion",
+        "molar enthalpy of sublimation",
+        "molar enthalpy of vaporization",
+        "molar mass",
+        "molecular mass",
+        "monolayer quantity",
+        "normalized foam height",
+        "number concentration",
+        "osmolality",
+        "pCO2",
+        "pCO2 (bga)",
+        "pH",
+        "pO2",
+        "pO2 (bga)",
+        "partial pressure",
+        "particle size",
+        "peak analyte amount",
+        "peak load force",
+        "peak onset temperature",
+        "peak temperature",
+        "plate heater temperature",
+        "plate temperature",
+        "plate well count",
+        "polarity",
+        "polyol reservoir temperature",
+        "position count",
+        "power",
+        "pressure",
+        "probe volume",
+        "protein attenuation coefficient",
+        "purity",
+        "qNMR purity result",
+        "reference material weight",
+        "reflectance",
+        "refractive index",
+        "relative humidity",
+        "relative intensity",
+        "relative permittivity",
+        "relative pressure (BET)",
+        "relative response",
+        "relative weight loss on drying",
+        "reservoir temperature",
+        "rotational speed",
+        "sample temperature",
+        "sample thickness",
+        "sample weight",
+        "sample weight before drying",
+        "sample width",
+        "saturated gas flow rate",
+        "saturation vapor pressure",
+        "seal initiation temperature",
+        "size (datum)",
+        "solvent reservoir temperature",
+        "specific enthalpy of fusion",
+        "specific enthalpy of sublimation",
+        "specific enthalpy of vaporization",
+        "specific heat capacity",
+        "specific rotation",
+        "specific surface area",
+        "start height",
+        "stirring rate",
+        "strain",
+        "stress",
+        "tablet thickness",
+        "tare weight",
+        "temperature",
+        "temperature rate",
+        "thermal conductance",
+        "thermal conductivity",
+        "thickness",
+        "titer",
+        "torque",
+        "total cell diameter",
+        "total foam height",
+        "total gas flow rate",
+        "total material height",
+        "transition enthalpy",
+        "transmittance",
+        "turbidity",
+        "velocity",
+        "viscosity",
+        "void volume",
+        "voltage",
+        "voltage range",
+        "volume",
+        "volume concentration",
+        "volume fraction",
+        "water mass concentration",
+        "water mass fraction",
+        "wavelength",
+        "wavenumber",
+        "weight loss",
+        "well volume",
+        "width",
+        "yield strain",
+        "yield stress",
+    ]
+)
+_c32 = frozenset(
+    [
+        "blank role",
+        "calibration sample role",
+        "control sample role",
+        "experiment sample role",
+        "quality control sample role",
+        "reference sample role",
+        "sample role",
+        "specimen role",
+        "spiked sample role",
+        "standard sample role",
+        "unknown sample role",
+        "unspiked sample role",
+        "validation sample role",
+    ]
+)
+_c33 = (
+    "{'type': 'integer'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'integer'}}, 'required': ['@type', 'value']}",
+)
+_c34 = re.compile("data cube$")
+_c35 = (
+    "{'required': ['UNC path', 'file name']}",
+    "{'required': ['database primary key']}",
+)
+
+
+def validate(instance: Any) -> Errors:
+    return _v1(instance, False) or []
+
+
+def _valid(x: Any, stop: bool) -> Errors | None:
+    return None
+
+
+def _v1(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "$asm.manifest" not in x:
+            errors = _error(
+                errors, "required", "'$asm.manifest' is a required property"
+            )
+            if stop:
+                return errors
+    e = _v2(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v3(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v3(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "$asm.manifest" in x:
+            e = _v4(x["$asm.manifest"], stop)
+            if e:
+                errors = _child_errors(errors, "$asm.manifest", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v4(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v5(x, True),
+                _v6(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c0[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v6(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "vocabulary" not in x:
+            errors = _error(errors, "required", "'vocabulary' is a required property")
+            if stop:
+                return errors
+        if "json-schemas" not in x:
+            errors = _error(errors, "required", "'json-schemas' is a required property")
+            if stop:
+                return errors
+        if "@id" in x:
+            e = _v7(x["@id"], stop)
+            if e:
+                errors = _child_errors(errors, "@id", e)
+                if stop:
+                    return errors
+        if "@type" in x:
+            e = _v8(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "vocabulary" in x:
+            e = _v9(x["vocabulary"], stop)
+            if e:
+                errors = _child_errors(errors, "vocabulary", e)
+                if stop:
+                    return errors
+        if "shapes" in x:
+            e = _v10(x["shapes"], stop)
+            if e:
+                errors = _child_errors(errors, "shapes", e)
+                if stop:
+                    return errors
+        if "json-schemas" in x:
+            e = _v11(x["json-schemas"], stop)
+            if e:
+                errors = _child_errors(errors, "json-schemas", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v11(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v12(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v12(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v10(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v13(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v13(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v9(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v14(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v14(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v8(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v7(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v5(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v2(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "electrophoresis aggregate document" in x:
+            e = _v15(x["electrophoresis aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "electrophoresis aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v15(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v16(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v17(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v17(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "electrophoresis document" not in x:
+            errors = _error(
+                errors, "required", "'electrophoresis document' is a required property"
+            )
+            if stop:
+                return errors
+        if "electrophoresis document" in x:
+            e = _v18(x["electrophoresis document"], stop)
+            if e:
+                errors = _child_errors(errors, "electrophoresis document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v18(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v19(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v19(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v20(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v21(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v21(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "analyst" not in x:
+            errors = _error(errors, "required", "'analyst' is a required property")
+            if stop:
+                return errors
+        if "measurement aggregate document" in x:
+            e = _v22(x["measurement aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v22(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measurement document" in x:
+            e = _v23(x["measurement document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v23(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v24(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v24(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v25(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v26(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v26(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v27(x, True) and _v28(x, True) and _v29(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v29(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v30(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v31(x, True),
+                _v32(x, True),
+                _v33(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c1[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v33(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatogram data cube" not in x:
+            errors = _error(
+                errors, "required", "'chromatogram data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "chromatogram data cube" in x:
+            e = _v34(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v34(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v36(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v36(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v37(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v37(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v38(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v39(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v39(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v40(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v40(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v41(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c2[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v41(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v42(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v43(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v44(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v44(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v43(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v42(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "fluorescence":
+        errors = _error(errors, "const", "'fluorescence' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v38(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v45(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v45(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v46(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v46(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v47(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v48(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v49(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v49(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v48(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v47(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v35(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "label" in x:
+            e = _v50(x["label"], stop)
+            if e:
+                errors = _child_errors(errors, "label", e)
+                if stop:
+                    return errors
+        if "cube-structure" in x:
+            e = _v51(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+        if "data" in x:
+            e = _v52(x["data"], stop)
+            if e:
+                errors = _child_errors(errors, "data", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v52(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v53(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v54(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v54(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v55(x, True),
+                _v56(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c4[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v56(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "points" not in x:
+            errors = _error(errors, "required", "'points' is a required property")
+            if stop:
+                return errors
+        if "points" in x:
+            e = _v57(x["points"], stop)
+            if e:
+                errors = _child_errors(errors, "points", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v57(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v58(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v58(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v59(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v59(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v60(x, True),
+                _v61(x, True),
+                _v62(x, True),
+                _v63(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v63(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v62(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v61(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v60(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v55(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measures" not in x:
+            errors = _error(errors, "required", "'measures' is a required property")
+            if stop:
+                return errors
+        if "measures" in x:
+            e = _v64(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v64(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v65(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v65(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v66(x, True),
+                _v67(x, True),
+                _v68(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c6[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v68(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str) or v is None):
+                e = _v69(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v69(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v70(x, True) and _v71(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v71(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v70(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v67(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, bool) or v is None):
+                e = _v72(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v72(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v73(x, True) and _v74(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v74(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v73(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v66(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not ((v.__class__ is float or _is_number(v)) or v is None):
+                e = _v75(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v75(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v76(x, True) and _v77(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v77(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v76(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v53(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" not in x:
+            errors = _error(errors, "required", "'dimensions' is a required property")
+            if stop:
+                return errors
+        if "dimensions" in x:
+            e = _v78(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v78(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v79(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v79(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v80(x, True),
+                _v81(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c7[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v81(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "type" in x:
+            e = _v82(x["type"], stop)
+            if e:
+                errors = _child_errors(errors, "type", e)
+                if stop:
+                    return errors
+        if "start" in x:
+            e = _v83(x["start"], stop)
+            if e:
+                errors = _child_errors(errors, "start", e)
+                if stop:
+                    return errors
+        if "length" in x:
+            e = _v84(x["length"], stop)
+            if e:
+                errors = _child_errors(errors, "length", e)
+                if stop:
+                    return errors
+        if "incr" in x:
+            e = _v85(x["incr"], stop)
+            if e:
+                errors = _child_errors(errors, "incr", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v85(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v84(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v83(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v82(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c8):
+        errors = _error(
+            errors, "enum", repr(x) + " is not one of ['linear', 'logarithmic']"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v80(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v86(x, True),
+                _v87(x, True),
+                _v88(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c9[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v88(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str)):
+                e = _v89(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v89(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v87(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, bool)):
+                e = _v90(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v90(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v86(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (v.__class__ is float or _is_number(v)):
+                e = _v91(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v91(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v51(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "dimensions" not in x:
+            errors = _error(errors, "required", "'dimensions' is a required property")
+            if stop:
+                return errors
+        if "measures" not in x:
+            errors = _error(errors, "required", "'measures' is a required property")
+            if stop:
+                return errors
+        if "dimensions" in x:
+            e = _v92(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v93(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v93(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v94(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if not _is_unique(x):
+            errors = _error(errors, "uniqueItems", repr(x) + " has non-unique elements")
+            if stop:
+                return errors
+    return errors
+
+
+def _v94(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@componentDatatype" not in x:
+            errors = _error(
+                errors, "required", "'@componentDatatype' is a required property"
+            )
+            if stop:
+                return errors
+        if "concept" not in x:
+            errors = _error(errors, "required", "'concept' is a required property")
+            if stop:
+                return errors
+        if "@componentDatatype" in x:
+            e = _v95(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+        if "concept" in x:
+            e = _v96(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v97(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "scale" in x:
+            e = _v98(x["scale"], stop)
+            if e:
+                errors = _child_errors(errors, "scale", e)
+                if stop:
+                    return errors
+        if "$asm.fill-value" in x:
+            e = _v99(x["$asm.fill-value"], stop)
+            if e:
+                errors = _child_errors(errors, "$asm.fill-value", e)
+                if stop:
+                    return errors
+    e = _v100(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v101(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v102(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v103(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v103(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v104(x, True) is None:
+        pass
+    return errors
+
+
+def _v104(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v105(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v105(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c10.search(x):
+            errors = _error(
+                errors, "pattern", repr(x) + " does not match 'string|dateTime|date'"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v102(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v106(x, True) is None:
+        pass
+    return errors
+
+
+def _v106(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v107(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v107(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "boolean":
+        errors = _error(errors, "const", "'boolean' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v101(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v108(x, True) is None:
+        pass
+    return errors
+
+
+def _v108(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v109(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v109(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c11.search(x):
+            errors = _error(
+                errors,
+                "pattern",
+                repr(x) + " does not match 'integer|decimal|long|int|short|byte'",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v100(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v110(x, True) is None:
+        pass
+    return errors
+
+
+def _v110(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v111(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v111(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c12.search(x):
+            errors = _error(
+                errors, "pattern", repr(x) + " does not match 'double|float'"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v99(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool | str)):
+        errors = _error(
+            errors,
+            "type",
+            repr(x) + " is not of type 'string', 'number', 'integer', 'boolean'",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v98(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c13):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['nominal', 'ordinal', 'cardinal', 'interval', 'range']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v97(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v96(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v95(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c14):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['double', 'float', 'decimal', 'integer', 'byte', 'int', 'short', 'long', 'string', 'boolean', 'dateTime']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v92(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v94(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if not _is_unique(x):
+            errors = _error(errors, "uniqueItems", repr(x) + " has non-unique elements")
+            if stop:
+                return errors
+    return errors
+
+
+def _v50(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v32(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "fluorescence emission profile data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'fluorescence emission profile data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "fluorescence emission profile data cube" in x:
+            e = _v112(x["fluorescence emission profile data cube"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "fluorescence emission profile data cube", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v112(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v113(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v113(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v114(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v114(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v115(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v116(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v116(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v117(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v117(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v118(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c2[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v118(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v119(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v120(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v121(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v121(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v120(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v119(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "fluorescence":
+        errors = _error(errors, "const", "'fluorescence' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v115(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v122(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v122(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v123(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v123(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v124(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v125(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v126(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v126(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v125(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v124(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v31(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "electropherogram data cube" in x:
+            e = _v127(x["electropherogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "electropherogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v127(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v128(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v128(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v129(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v129(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v130(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v131(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v131(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v132(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v132(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v133(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c2[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v133(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v134(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v135(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v136(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v136(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v135(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v134(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "fluorescence":
+        errors = _error(errors, "const", "'fluorescence' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v130(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v137(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v137(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v138(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v138(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v139(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v140(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v141(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v141(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v140(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v139(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v30(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "compartment temperature" in x:
+            e = _v142(x["compartment temperature"], stop)
+            if e:
+                errors = _child_errors(errors, "compartment temperature", e)
+                if stop:
+                    return errors
+        if "device control document" in x:
+            e = _v143(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v144(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v144(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v145(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v145(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v146(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v146(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v147(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+        if "data region aggregate document" in x:
+            e = _v148(x["data region aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data region aggregate document", e)
+                if stop:
+                    return errors
+        if "derived electropherogram data cube" in x:
+            e = _v149(x["derived electropherogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "derived electropherogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v149(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v150(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v150(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v151(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v151(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v152(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v153(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v153(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v154(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v154(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v155(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c15[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v155(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v156(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v156(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v152(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v157(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v157(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v158(x, True),
+                _v159(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c16[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v159(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v160(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v161(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v162(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v162(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v161(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "#":
+        errors = _error(errors, "const", "'#' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v160(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "polymer length":
+        errors = _error(errors, "const", "'polymer length' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v158(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v163(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v164(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v165(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v165(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v164(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "Da":
+        errors = _error(errors, "const", "'Da' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v163(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "molecular mass":
+        errors = _error(errors, "const", "'molecular mass' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v148(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v166(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data region document" in x:
+            e = _v167(x["data region document"], stop)
+            if e:
+                errors = _child_errors(errors, "data region document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v167(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v168(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v168(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v169(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v170(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@index" in x:
+            e = _v171(x["@index"], stop)
+            if e:
+                errors = _child_errors(errors, "@index", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v171(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    if x.__class__ is float or _is_number(x):
+        if x < 1:
+            errors = _error(
+                errors, "minimum", repr(x) + " is less than the minimum of 1"
+            )
+            if stop:
+                return errors
+        if x > 2147483647:
+            errors = _error(
+                errors,
+                "maximum",
+                repr(x) + " is greater than the maximum of 2147483647",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v169(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v172(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data region end" in x:
+            e = _v173(x["data region end"], stop)
+            if e:
+                errors = _child_errors(errors, "data region end", e)
+                if stop:
+                    return errors
+        if "data region identifier" in x:
+            e = _v174(x["data region identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data region identifier", e)
+                if stop:
+                    return errors
+        if "data region name" in x:
+            e = _v174(x["data region name"], stop)
+            if e:
+                errors = _child_errors(errors, "data region name", e)
+                if stop:
+                    return errors
+        if "data region area" in x:
+            e = _v175(x["data region area"], stop)
+            if e:
+                errors = _child_errors(errors, "data region area", e)
+                if stop:
+                    return errors
+        if "relative data region area" in x:
+            e = _v176(x["relative data region area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative data region area", e)
+                if stop:
+                    return errors
+        if "comment" in x:
+            e = _v174(x["comment"], stop)
+            if e:
+                errors = _child_errors(errors, "comment", e)
+                if stop:
+                    return errors
+        if "data region start" in x:
+            e = _v177(x["data region start"], stop)
+            if e:
+                errors = _child_errors(errors, "data region start", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v177(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v179(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v179(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v183(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v183(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v184(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v185(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v185(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "kDa":
+        errors = _error(errors, "const", "'kDa' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v182(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v186(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v186(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "#":
+        errors = _error(errors, "const", "'#' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v181(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v187(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v187(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v180(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v188(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v188(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v178(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "value" in x:
+            e = _v189(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v97(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "has statistic datum role" in x:
+            e = _v190(x["has statistic datum role"], stop)
+            if e:
+                errors = _child_errors(errors, "has statistic datum role", e)
+                if stop:
+                    return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v190(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c18):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['arithmetic mean role', 'median role', 'relative standard deviation role', 'skewness role', 'standard deviation role', 'variance role', 'maximum value role', 'minimum value role', 'initial value role', 'final value role']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v189(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v176(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v191(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v191(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v192(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v192(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "%":
+        errors = _error(errors, "const", "'%' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v175(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v174(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v193(x, True),
+                _v194(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c19[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v194(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v195(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v195(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v193(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v173(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v196(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v196(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v197(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v197(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v172(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v198(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'custom information document' is a required property",
+            )
+            if stop:
+                return errors
+        if "custom information document" in x:
+            e = _v199(x["custom information document"], stop)
+            if e:
+                errors = _child_errors(errors, "custom information document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v199(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v200(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v200(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v201(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v202(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v202(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v203(x, True),
+                _v204(x, True),
+                _v205(x, True),
+                _v206(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c20[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v206(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar boolean datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar boolean datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar boolean datum" in x:
+            e = _v207(x["scalar boolean datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar boolean datum", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v207(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v208(x, True),
+                _v209(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c21[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v209(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v210(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v210(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v208(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v205(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar timestamp datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar timestamp datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar timestamp datum" in x:
+            e = _v211(x["scalar timestamp datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar timestamp datum", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v211(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v212(x, True),
+                _v213(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c22[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v213(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v214(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v214(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c23(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v212(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c23(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v204(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar string datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar string datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar string datum" in x:
+            e = _v174(x["scalar string datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar string datum", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v203(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar double datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar double datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar double datum" in x:
+            e = _v215(x["scalar double datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar double datum", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v97(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v215(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v216(x, True),
+                _v217(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c24[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v217(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v218(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v218(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v216(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v201(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "datum label" not in x:
+            errors = _error(errors, "required", "'datum label' is a required property")
+            if stop:
+                return errors
+        if "datum label" in x:
+            e = _v174(x["datum label"], stop)
+            if e:
+                errors = _child_errors(errors, "datum label", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v166(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v147(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v219(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "peak" in x:
+            e = _v220(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v220(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v221(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v221(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v222(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v222(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v223(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "peak end" in x:
+            e = _v224(x["peak end"], stop)
+            if e:
+                errors = _child_errors(errors, "peak end", e)
+                if stop:
+                    return errors
+        if "peak position" in x:
+            e = _v225(x["peak position"], stop)
+            if e:
+                errors = _child_errors(errors, "peak position", e)
+                if stop:
+                    return errors
+        if "peak name" in x:
+            e = _v174(x["peak name"], stop)
+            if e:
+                errors = _child_errors(errors, "peak name", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v174(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "relative peak height" in x:
+            e = _v226(x["relative peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak height", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v174(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "peak height" in x:
+            e = _v227(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "capacity factor (chromatography)" in x:
+            e = _v228(x["capacity factor (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "capacity factor (chromatography)", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v229(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+        if "relative peak area" in x:
+            e = _v230(x["relative peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak area", e)
+                if stop:
+                    return errors
+        if "relative corrected peak area" in x:
+            e = _v231(x["relative corrected peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative corrected peak area", e)
+                if stop:
+                    return errors
+        if "comment" in x:
+            e = _v174(x["comment"], stop)
+            if e:
+                errors = _child_errors(errors, "comment", e)
+                if stop:
+                    return errors
+        if "retention time" in x:
+            e = _v232(x["retention time"], stop)
+            if e:
+                errors = _child_errors(errors, "retention time", e)
+                if stop:
+                    return errors
+        if "retention volume" in x:
+            e = _v233(x["retention volume"], stop)
+            if e:
+                errors = _child_errors(errors, "retention volume", e)
+                if stop:
+                    return errors
+        if "peak start" in x:
+            e = _v234(x["peak start"], stop)
+            if e:
+                errors = _child_errors(errors, "peak start", e)
+                if stop:
+                    return errors
+        if "peak selectivity (chromatography)" in x:
+            e = _v235(x["peak selectivity (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "peak selectivity (chromatography)", e)
+                if stop:
+                    return errors
+    if (
+        _v236(x, True)
+        and _v237(x, True)
+        and _v238(x, True)
+        and _v239(x, True)
+        and _v240(x, True)
+        and _v241(x, True)
+        and _v242(x, True)
+        and _v243(x, True)
+        and _v244(x, True)
+        and _v245(x, True)
+        and _v246(x, True)
+        and _v247(x, True)
+        and _v248(x, True)
+        and _v249(x, True)
+        and _v250(x, True)
+        and _v251(x, True)
+        and _v252(x, True)
+        and _v253(x, True)
+        and _v254(x, True)
+        and _v255(x, True)
+        and _v256(x, True)
+        and _v257(x, True)
+        and _v258(x, True)
+        and _v259(x, True)
+        and _v260(x, True)
+        and _v261(x, True)
+        and _v262(x, True)
+        and _v263(x, True)
+        and _v264(x, True)
+        and _v265(x, True)
+    ):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v265(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak asymmetry factor" in x:
+            e = _v266(x["chromatographic peak asymmetry factor"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "chromatographic peak asymmetry factor", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v266(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v267(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v268(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v268(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "(unitless)":
+        errors = _error(errors, "const", "'(unitless)' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v264(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at baseline" in x:
+            e = _v269(x["asymmetry factor measured at baseline"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at baseline", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v269(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v263(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 4.4 % height" in x:
+            e = _v270(x["asymmetry factor measured at 4.4 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 4.4 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v270(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v262(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor squared measured at 4.4 % height" in x:
+            e = _v271(x["asymmetry factor squared measured at 4.4 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor squared measured at 4.4 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v271(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v261(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor squared measured at 10 % height" in x:
+            e = _v272(x["asymmetry factor squared measured at 10 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor squared measured at 10 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v272(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v260(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 10 % height" in x:
+            e = _v273(x["asymmetry factor measured at 10 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 10 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v273(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v259(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 5 % height" in x:
+            e = _v274(x["asymmetry factor measured at 5 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 5 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v274(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v258(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "statistical skew (chromatography)" in x:
+            e = _v275(x["statistical skew (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical skew (chromatography)", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v275(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v257(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width" in x:
+            e = _v276(x["peak width"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v276(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v256(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 10 % of height" in x:
+            e = _v277(x["peak width at 10 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 10 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v277(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v255(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at inflection" in x:
+            e = _v278(x["peak width at inflection"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at inflection", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v278(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v254(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at baseline" in x:
+            e = _v279(x["peak width at baseline"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at baseline", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v279(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v253(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 5 % of height" in x:
+            e = _v280(x["peak width at 5 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 5 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v280(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v252(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at half height" in x:
+            e = _v281(x["peak width at half height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at half height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v281(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v251(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 60.7 % of height" in x:
+            e = _v282(x["peak width at 60.7 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 60.7 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v282(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v250(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 32.4 % of height" in x:
+            e = _v283(x["peak width at 32.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 32.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v283(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v249(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 13.4 % of height" in x:
+            e = _v284(x["peak width at 13.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 13.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v284(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v248(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 4.4 % of height" in x:
+            e = _v285(x["peak width at 4.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 4.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v285(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v247(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by peak width at half height (JP14)" in x:
+            e = _v286(
+                x["number of theoretical plates by peak width at half height (JP14)"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates by peak width at half height (JP14)",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v286(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v246(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by peak width at half height" in x:
+            e = _v287(
+                x["number of theoretical plates by peak width at half height"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates by peak width at half height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v287(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v245(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by tangent method" in x:
+            e = _v288(x["number of theoretical plates by tangent method"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "number of theoretical plates by tangent method", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v288(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v244(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 4.4 % of peak height" in x:
+            e = _v289(
+                x["number of theoretical plates measured at 4.4 % of peak height"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 4.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v289(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v243(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 13.4 % of peak height" in x:
+            e = _v290(
+                x["number of theoretical plates measured at 13.4 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 13.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v290(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v242(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 32.4 % of peak height" in x:
+            e = _v291(
+                x["number of theoretical plates measured at 32.4 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 32.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v291(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v241(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 60.7 % of peak height" in x:
+            e = _v292(
+                x["number of theoretical plates measured at 60.7 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 60.7 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v292(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v240(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates (chromatography)" in x:
+            e = _v293(x["number of theoretical plates (chromatography)"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "number of theoretical plates (chromatography)", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v293(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v239(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using statistical moments" in x:
+            e = _v294(
+                x["chromatographic peak resolution using statistical moments"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using statistical moments",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v294(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v238(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using peak width at half-height" in x:
+            e = _v295(
+                x["chromatographic peak resolution using peak width at half-height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using peak width at half-height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v295(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v237(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using baseline peak widths" in x:
+            e = _v296(
+                x["chromatographic peak resolution using baseline peak widths"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using baseline peak widths",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v296(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v236(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution" in x:
+            e = _v297(x["chromatographic peak resolution"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatographic peak resolution", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v297(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v235(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v234(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v298(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v298(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v299(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v299(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v233(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v181(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v232(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v231(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v191(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v230(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v191(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v229(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v228(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v227(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v226(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v300(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v300(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v191(x, True),
+                _v301(x, True),
+                _v182(x, True),
+                _v302(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c25[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v302(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v301(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v303(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v303(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v225(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v304(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v304(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v305(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v305(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v224(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v306(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v306(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v307(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v307(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v223(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v219(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v143(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v308(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v308(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v309(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v309(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v310(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v311(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+        if "excitation wavelength setting" in x:
+            e = _v312(x["excitation wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "excitation wavelength setting", e)
+                if stop:
+                    return errors
+        if "excitation bandwidth setting" in x:
+            e = _v313(x["excitation bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "excitation bandwidth setting", e)
+                if stop:
+                    return errors
+        if "total measurement time setting" in x:
+            e = _v314(x["total measurement time setting"], stop)
+            if e:
+                errors = _child_errors(errors, "total measurement time setting", e)
+                if stop:
+                    return errors
+        if "read interval setting" in x:
+            e = _v315(x["read interval setting"], stop)
+            if e:
+                errors = _child_errors(errors, "read interval setting", e)
+                if stop:
+                    return errors
+        if "number of scans setting" in x:
+            e = _v316(x["number of scans setting"], stop)
+            if e:
+                errors = _child_errors(errors, "number of scans setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v316(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v182(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v315(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v314(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v313(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v317(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v318(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v318(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "nm":
+        errors = _error(errors, "const", "'nm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v312(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v311(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v310(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v142(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v319(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v319(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v320(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v320(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "degC":
+        errors = _error(errors, "const", "'degC' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v28(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "compartment temperature" in x:
+            e = _v321(x["compartment temperature"], stop)
+            if e:
+                errors = _child_errors(errors, "compartment temperature", e)
+                if stop:
+                    return errors
+        if "device control aggregate document" in x:
+            e = _v322(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "three-dimensional ultraviolet spectrum data cube" in x:
+            e = _v323(x["three-dimensional ultraviolet spectrum data cube"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "three-dimensional ultraviolet spectrum data cube", e
+                )
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v324(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v324(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v325(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v325(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v326(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v326(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v327(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v327(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v328(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v328(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v329(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v329(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v330(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v330(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v331(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v331(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v332(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v333(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v333(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v334(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v334(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v335(x, True),
+                _v336(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c26[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v336(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v337(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v337(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mAU.mL":
+        errors = _error(errors, "const", "'mAU.mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v335(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v338(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v338(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mAU.s":
+        errors = _error(errors, "const", "'mAU.s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v332(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v339(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v339(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v340(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v340(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v323(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v341(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v341(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v342(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v342(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v343(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v344(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v344(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v345(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v345(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v346(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c27[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v346(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v347(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v348(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v349(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v349(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v348(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v347(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "absorbance":
+        errors = _error(errors, "const", "'absorbance' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v343(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v350(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) > 1:
+            e = _v351(x[1], stop)
+            if e:
+                errors = _child_errors(errors, 1, e)
+                if stop:
+                    return errors
+        if len(x) < 2:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+        if len(x) > 2:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v351(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v352(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v353(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v354(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v354(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v353(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "nm":
+        errors = _error(errors, "const", "'nm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v352(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "wavelength":
+        errors = _error(errors, "const", "'wavelength' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v350(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v355(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v356(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v357(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v357(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v356(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v355(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v322(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v358(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v358(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v359(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v359(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v360(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v360(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v361(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v362(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+        if "electronic absorbance wavelength setting" in x:
+            e = _v363(x["electronic absorbance wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance wavelength setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance bandwidth setting" in x:
+            e = _v364(x["electronic absorbance bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference bandwidth setting" in x:
+            e = _v365(x["electronic absorbance reference bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference wavelength setting" in x:
+            e = _v366(x["electronic absorbance reference wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference wavelength setting", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v366(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v365(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v364(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v363(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v362(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v361(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v321(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v319(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v27(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v367(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v368(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "compartment temperature" in x:
+            e = _v369(x["compartment temperature"], stop)
+            if e:
+                errors = _child_errors(errors, "compartment temperature", e)
+                if stop:
+                    return errors
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v370(x, True),
+                _v371(x, True),
+                _v372(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c28[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v372(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatogram data cube" not in x:
+            errors = _error(
+                errors, "required", "'chromatogram data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "chromatogram data cube" in x:
+            e = _v373(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v373(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v374(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v374(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v375(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v375(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v376(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v377(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v377(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v378(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v378(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v379(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c27[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v379(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v380(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v381(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v382(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v382(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v381(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v380(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "absorbance":
+        errors = _error(errors, "const", "'absorbance' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v376(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v383(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v383(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v384(x, True),
+                _v385(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c29[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v385(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v386(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v387(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v388(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v388(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v387(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v386(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v384(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v389(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v390(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v391(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v391(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v390(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v389(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v371(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "absorption profile data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'absorption profile data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "absorption profile data cube" in x:
+            e = _v392(x["absorption profile data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "absorption profile data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v392(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v393(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v393(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v394(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v394(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v395(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v396(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v396(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v397(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v397(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v398(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c27[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v398(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v399(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v400(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v401(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v401(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v400(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v399(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "absorbance":
+        errors = _error(errors, "const", "'absorbance' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v395(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v402(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v402(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v403(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v403(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v404(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v405(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v406(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v406(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v405(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v404(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v370(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "electropherogram data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'electropherogram data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "electropherogram data cube" in x:
+            e = _v407(x["electropherogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "electropherogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v407(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v408(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v408(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v409(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v409(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v410(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v411(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v411(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v412(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v412(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v413(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c27[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v413(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v414(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v415(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v416(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v416(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v415(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v414(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "absorbance":
+        errors = _error(errors, "const", "'absorbance' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v410(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v417(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v417(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v418(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v418(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v419(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v420(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v421(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v421(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v420(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v419(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v369(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v319(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v368(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v422(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v422(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v423(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v423(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v424(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v424(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v425(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v425(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v426(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v426(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v427(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v427(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v428(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v428(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v429(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v430(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v430(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v431(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v431(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v335(x, True),
+                _v336(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c26[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v429(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v432(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v432(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v339(x, True),
+                _v433(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c30[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v433(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v434(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v434(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v367(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v435(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v435(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v436(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v436(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v437(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v437(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v438(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v439(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+        if "electronic absorbance wavelength setting" in x:
+            e = _v440(x["electronic absorbance wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance wavelength setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance bandwidth setting" in x:
+            e = _v441(x["electronic absorbance bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference bandwidth setting" in x:
+            e = _v442(x["electronic absorbance reference bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "total measurement time setting" in x:
+            e = _v443(x["total measurement time setting"], stop)
+            if e:
+                errors = _child_errors(errors, "total measurement time setting", e)
+                if stop:
+                    return errors
+        if "read interval setting" in x:
+            e = _v444(x["read interval setting"], stop)
+            if e:
+                errors = _child_errors(errors, "read interval setting", e)
+                if stop:
+                    return errors
+        if "number of scans setting" in x:
+            e = _v445(x["number of scans setting"], stop)
+            if e:
+                errors = _child_errors(errors, "number of scans setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v445(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v182(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v444(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v443(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v442(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v441(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v440(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v439(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v438(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v317(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v25(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data aggregate document" in x:
+            e = _v446(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "electropherogram data cube" in x:
+            e = _v447(x["electropherogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "electropherogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v447(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v448(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v448(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v449(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v449(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v450(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v451(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v451(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v452(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v452(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v453(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c15[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v453(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v454(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v454(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v450(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v455(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v455(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v456(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v456(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v457(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v458(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v459(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v459(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v458(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v457(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v446(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v460(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v460(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v461(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v461(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v462(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+        if "data region aggregate document" in x:
+            e = _v463(x["data region aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data region aggregate document", e)
+                if stop:
+                    return errors
+        if "derived electropherogram data cube" in x:
+            e = _v464(x["derived electropherogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "derived electropherogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v464(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v465(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v465(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v466(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v466(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v467(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v468(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v468(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v469(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v469(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v470(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c15[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v470(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v471(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v471(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v467(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v472(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v472(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v473(x, True),
+                _v474(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c16[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v474(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v475(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v476(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v477(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v477(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v476(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "#":
+        errors = _error(errors, "const", "'#' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v475(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "polymer length":
+        errors = _error(errors, "const", "'polymer length' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v473(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v478(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v479(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v480(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v480(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v479(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "Da":
+        errors = _error(errors, "const", "'Da' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v478(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "molecular mass":
+        errors = _error(errors, "const", "'molecular mass' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v463(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v481(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data region document" in x:
+            e = _v482(x["data region document"], stop)
+            if e:
+                errors = _child_errors(errors, "data region document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v482(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v483(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v483(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v484(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v484(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v485(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data region end" in x:
+            e = _v486(x["data region end"], stop)
+            if e:
+                errors = _child_errors(errors, "data region end", e)
+                if stop:
+                    return errors
+        if "data region identifier" in x:
+            e = _v174(x["data region identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data region identifier", e)
+                if stop:
+                    return errors
+        if "data region name" in x:
+            e = _v174(x["data region name"], stop)
+            if e:
+                errors = _child_errors(errors, "data region name", e)
+                if stop:
+                    return errors
+        if "data region area" in x:
+            e = _v487(x["data region area"], stop)
+            if e:
+                errors = _child_errors(errors, "data region area", e)
+                if stop:
+                    return errors
+        if "relative data region area" in x:
+            e = _v488(x["relative data region area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative data region area", e)
+                if stop:
+                    return errors
+        if "comment" in x:
+            e = _v174(x["comment"], stop)
+            if e:
+                errors = _child_errors(errors, "comment", e)
+                if stop:
+                    return errors
+        if "data region start" in x:
+            e = _v489(x["data region start"], stop)
+            if e:
+                errors = _child_errors(errors, "data region start", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v489(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v490(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v490(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v491(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v491(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v488(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v191(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v487(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v486(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v492(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v492(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v493(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v493(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v485(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v481(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v462(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v494(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "peak" in x:
+            e = _v495(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v495(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v496(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v496(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v497(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v497(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v498(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "peak end" in x:
+            e = _v499(x["peak end"], stop)
+            if e:
+                errors = _child_errors(errors, "peak end", e)
+                if stop:
+                    return errors
+        if "peak position" in x:
+            e = _v500(x["peak position"], stop)
+            if e:
+                errors = _child_errors(errors, "peak position", e)
+                if stop:
+                    return errors
+        if "peak name" in x:
+            e = _v174(x["peak name"], stop)
+            if e:
+                errors = _child_errors(errors, "peak name", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v174(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "relative peak height" in x:
+            e = _v501(x["relative peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak height", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v174(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "peak height" in x:
+            e = _v502(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "capacity factor (chromatography)" in x:
+            e = _v503(x["capacity factor (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "capacity factor (chromatography)", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v504(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+        if "relative peak area" in x:
+            e = _v505(x["relative peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak area", e)
+                if stop:
+                    return errors
+        if "relative corrected peak area" in x:
+            e = _v506(x["relative corrected peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative corrected peak area", e)
+                if stop:
+                    return errors
+        if "comment" in x:
+            e = _v174(x["comment"], stop)
+            if e:
+                errors = _child_errors(errors, "comment", e)
+                if stop:
+                    return errors
+        if "retention time" in x:
+            e = _v507(x["retention time"], stop)
+            if e:
+                errors = _child_errors(errors, "retention time", e)
+                if stop:
+                    return errors
+        if "retention volume" in x:
+            e = _v508(x["retention volume"], stop)
+            if e:
+                errors = _child_errors(errors, "retention volume", e)
+                if stop:
+                    return errors
+        if "peak start" in x:
+            e = _v509(x["peak start"], stop)
+            if e:
+                errors = _child_errors(errors, "peak start", e)
+                if stop:
+                    return errors
+        if "peak selectivity (chromatography)" in x:
+            e = _v510(x["peak selectivity (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "peak selectivity (chromatography)", e)
+                if stop:
+                    return errors
+    if (
+        _v511(x, True)
+        and _v512(x, True)
+        and _v513(x, True)
+        and _v514(x, True)
+        and _v515(x, True)
+        and _v516(x, True)
+        and _v517(x, True)
+        and _v518(x, True)
+        and _v519(x, True)
+        and _v520(x, True)
+        and _v521(x, True)
+        and _v522(x, True)
+        and _v523(x, True)
+        and _v524(x, True)
+        and _v525(x, True)
+        and _v526(x, True)
+        and _v527(x, True)
+        and _v528(x, True)
+        and _v529(x, True)
+        and _v530(x, True)
+        and _v531(x, True)
+        and _v532(x, True)
+        and _v533(x, True)
+        and _v534(x, True)
+        and _v535(x, True)
+        and _v536(x, True)
+        and _v537(x, True)
+        and _v538(x, True)
+        and _v539(x, True)
+        and _v540(x, True)
+    ):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v540(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak asymmetry factor" in x:
+            e = _v541(x["chromatographic peak asymmetry factor"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "chromatographic peak asymmetry factor", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v541(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v539(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at baseline" in x:
+            e = _v542(x["asymmetry factor measured at baseline"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at baseline", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v542(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v538(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 4.4 % height" in x:
+            e = _v543(x["asymmetry factor measured at 4.4 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 4.4 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v543(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v537(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor squared measured at 4.4 % height" in x:
+            e = _v544(x["asymmetry factor squared measured at 4.4 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor squared measured at 4.4 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v544(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v536(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor squared measured at 10 % height" in x:
+            e = _v545(x["asymmetry factor squared measured at 10 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor squared measured at 10 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v545(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v535(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 10 % height" in x:
+            e = _v546(x["asymmetry factor measured at 10 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 10 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v546(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v534(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 5 % height" in x:
+            e = _v547(x["asymmetry factor measured at 5 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 5 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v547(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v533(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "statistical skew (chromatography)" in x:
+            e = _v548(x["statistical skew (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical skew (chromatography)", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v548(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v532(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width" in x:
+            e = _v549(x["peak width"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v549(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v531(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 10 % of height" in x:
+            e = _v550(x["peak width at 10 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 10 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v550(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v530(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at inflection" in x:
+            e = _v551(x["peak width at inflection"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at inflection", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v551(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v529(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at baseline" in x:
+            e = _v552(x["peak width at baseline"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at baseline", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v552(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v528(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 5 % of height" in x:
+            e = _v553(x["peak width at 5 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 5 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v553(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v527(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at half height" in x:
+            e = _v554(x["peak width at half height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at half height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v554(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v526(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 60.7 % of height" in x:
+            e = _v555(x["peak width at 60.7 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 60.7 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v555(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v525(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 32.4 % of height" in x:
+            e = _v556(x["peak width at 32.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 32.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v556(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v524(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 13.4 % of height" in x:
+            e = _v557(x["peak width at 13.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 13.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v557(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v523(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 4.4 % of height" in x:
+            e = _v558(x["peak width at 4.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 4.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v558(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v522(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by peak width at half height (JP14)" in x:
+            e = _v559(
+                x["number of theoretical plates by peak width at half height (JP14)"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates by peak width at half height (JP14)",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v559(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v521(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by peak width at half height" in x:
+            e = _v560(
+                x["number of theoretical plates by peak width at half height"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates by peak width at half height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v560(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v520(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by tangent method" in x:
+            e = _v561(x["number of theoretical plates by tangent method"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "number of theoretical plates by tangent method", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v561(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v519(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 4.4 % of peak height" in x:
+            e = _v562(
+                x["number of theoretical plates measured at 4.4 % of peak height"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 4.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v562(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v518(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 13.4 % of peak height" in x:
+            e = _v563(
+                x["number of theoretical plates measured at 13.4 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 13.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v563(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v517(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 32.4 % of peak height" in x:
+            e = _v564(
+                x["number of theoretical plates measured at 32.4 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 32.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v564(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v516(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 60.7 % of peak height" in x:
+            e = _v565(
+                x["number of theoretical plates measured at 60.7 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 60.7 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v565(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v515(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates (chromatography)" in x:
+            e = _v566(x["number of theoretical plates (chromatography)"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "number of theoretical plates (chromatography)", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v566(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v514(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using statistical moments" in x:
+            e = _v567(
+                x["chromatographic peak resolution using statistical moments"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using statistical moments",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v567(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v513(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using peak width at half-height" in x:
+            e = _v568(
+                x["chromatographic peak resolution using peak width at half-height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using peak width at half-height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v568(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v512(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using baseline peak widths" in x:
+            e = _v569(
+                x["chromatographic peak resolution using baseline peak widths"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using baseline peak widths",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v569(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v511(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution" in x:
+            e = _v570(x["chromatographic peak resolution"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatographic peak resolution", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v570(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v510(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v509(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v571(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v571(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v572(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v572(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v508(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v181(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v507(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v180(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v506(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v191(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v505(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v191(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v504(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v503(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v267(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v502(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v501(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v573(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v573(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v191(x, True),
+                _v301(x, True),
+                _v182(x, True),
+                _v574(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c25[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v574(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v500(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v575(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v575(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v576(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v576(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v499(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v577(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v577(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v180(x, True),
+                _v181(x, True),
+                _v182(x, True),
+                _v578(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v578(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v498(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v494(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v20(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement aggregate document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'measurement aggregate document' is a required property",
+            )
+            if stop:
+                return errors
+        if "analyst" in x:
+            e = _v174(x["analyst"], stop)
+            if e:
+                errors = _child_errors(errors, "analyst", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v579(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "measurement aggregate document" in x:
+            e = _v580(x["measurement aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement aggregate document", e)
+                if stop:
+                    return errors
+        if "submitter" in x:
+            e = _v174(x["submitter"], stop)
+            if e:
+                errors = _child_errors(errors, "submitter", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v580(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement document" not in x:
+            errors = _error(
+                errors, "required", "'measurement document' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data aggregate document" in x:
+            e = _v581(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v582(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "analytical method identifier" in x:
+            e = _v174(x["analytical method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "analytical method identifier", e)
+                if stop:
+                    return errors
+        if "method version" in x:
+            e = _v174(x["method version"], stop)
+            if e:
+                errors = _child_errors(errors, "method version", e)
+                if stop:
+                    return errors
+        if "experimental data identifier" in x:
+            e = _v174(x["experimental data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "experimental data identifier", e)
+                if stop:
+                    return errors
+        if "diagnostic trace aggregate document" in x:
+            e = _v583(x["diagnostic trace aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "diagnostic trace aggregate document", e)
+                if stop:
+                    return errors
+        if "error aggregate document" in x:
+            e = _v584(x["error aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "error aggregate document", e)
+                if stop:
+                    return errors
+        if "image aggregate document" in x:
+            e = _v585(x["image aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "image aggregate document", e)
+                if stop:
+                    return errors
+        if "measurement document" in x:
+            e = _v586(x["measurement document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v587(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v588(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v588(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v589(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v589(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistics document" in x:
+            e = _v590(x["statistics document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v590(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v591(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v591(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistical feature" not in x:
+            errors = _error(
+                errors, "required", "'statistical feature' is a required property"
+            )
+            if stop:
+                return errors
+        if "statistical feature" in x:
+            e = _v592(x["statistical feature"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v592(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v96(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v593(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v593(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c31):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['BET C constant', 'Raman intensity', 'Raman interferogram intensity', 'Raman wavenumber shift', 'Young modulus', 'abrasion weight', 'absolute intensity', 'absolute water content', 'absorbance', 'acquisition volume', 'actual P/P0 result', 'adsorbed volume at STP', 'ambient humidity', 'ambient pressure', 'ambient temperature', 'amount of substance', 'angle', 'angle of optical rotation', 'angular velocity', 'area', 'attenuation coefficient', 'average dead cell diameter (cell counter)', 'average particle size', 'average total cell circularity', 'average total cell diameter', 'average viable cell circularity', 'background corrected turbidity', 'birefringence', 'break strain', 'break stress', 'cell path length', 'chemical shift', 'chromatography column film thickness', 'chromatography column length', 'chromatography column particle size', 'circularity', 'coating gap height', 'collision energy', 'column inner diameter', 'compartment temperature', 'concentration', 'container diameter', 'container height', 'degassed sample weight', 'detector view volume', 'diameter', 'dielectric polarization', 'dilution factor', 'dilution volume', 'dispensed volume', 'dry gas flow rate', 'dry sample weight', 'eccentricity', 'electric charge', 'electric conductance', 'electric conductivity', 'electric current', 'electric impedance', 'electric resistance', 'electric resistivity', 'electron beam working distance', 'end height', 'energy (datum)', 'enthalpy', 'enthalpy of fusion', 'enthalpy of sublimation', 'enthalpy of vaporization', 'exhaust gas flow rate', 'extrapolated moisture content', 'fill depth', 'flow rate', 'flow ratio', 'fluorescence', 'foam height', 'force', 'fracture energy', 'glass transition temperature', 'gloss', 'gross weight', 'hardness', 'heat capacity', 'heat capacity (dsc)', 'heat flow', 'heat seal length', 'heat transfer coefficient', 'height', 'hold-up volume', 'humidity', 'image height', 'image width', 'incident radiation angle', 'inlet gas pressure', 'inner diameter', 'intensity', 'isocyanate reservoir temperature', 'length', 'linear velocity', 'liquid height', 'luminescence', 'm/z', 'mass', 'mass attenuation coefficient', 'mass change', 'mass concentration', 'mass fraction', 'measurement chamber free space volume', 'molar attenuation coefficient', 'molar concentration', 'molar enthalpy of fusion', 'molar enthalpy of sublimation', 'molar enthalpy of vaporization', 'molar mass', 'molecular mass', 'monolayer quantity', 'normalized foam height', 'number concentration', 'osmolality', 'pCO2', 'pCO2 (bga)', 'pH', 'pO2', 'pO2 (bga)', 'partial pressure', 'particle size', 'peak analyte amount', 'peak load force', 'peak onset temperature', 'peak temperature', 'plate heater temperature', 'plate temperature', 'plate well count', 'polarity', 'polyol reservoir temperature', 'position count', 'power', 'pressure', 'probe volume', 'protein attenuation coefficient', 'purity', 'qNMR purity result', 'reference material weight', 'reflectance', 'refractive index', 'relative humidity', 'relative intensity', 'relative permittivity', 'relative pressure (BET)', 'relative response', 'relative weight loss on drying', 'reservoir temperature', 'rotational speed', 'sample temperature', 'sample thickness', 'sample weight', 'sample weight before drying', 'sample width', 'saturated gas flow rate', 'saturation vapor pressure', 'seal initiation temperature', 'size (datum)', 'solvent reservoir temperature', 'specific enthalpy of fusion', 'specific enthalpy of sublimation', 'specific enthalpy of vaporization', 'specific heat capacity', 'specific rotation', 'specific surface area', 'start height', 'stirring rate', 'strain', 'stress', 'tablet thickness', 'tare weight', 'temperature', 'temperature rate', 'thermal conductance', 'thermal conductivity', 'thickness', 'titer', 'torque', 'total cell diameter', 'total foam height', 'total gas flow rate', 'total material height', 'transition enthalpy', 'transmittance', 'turbidity', 'velocity', 'viscosity', 'void volume', 'voltage', 'voltage range', 'volume', 'volume concentration', 'volume fraction', 'water mass concentration', 'water mass fraction', 'wavelength', 'wavenumber', 'weight loss', 'well volume', 'width', 'yield strain', 'yield stress']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v587(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v594(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v594(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" not in x:
+            errors = _error(
+                errors, "required", "'processed data document' is a required property"
+            )
+            if stop:
+                return errors
+        if "custom information aggregate document" in x:
+            e = _v595(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v596(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "processed data document" in x:
+            e = _v597(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v597(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v598(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v598(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v599(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v599(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v600(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data processing document" in x:
+            e = _v601(x["data processing document"], stop)
+            if e:
+                errors = _child_errors(errors, "data processing document", e)
+                if stop:
+                    return errors
+        if "data source aggregate document" in x:
+            e = _v602(x["data source aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source aggregate document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v603(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "processed data identifier" in x:
+            e = _v174(x["processed data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data identifier", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v603(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v604(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v604(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "written name" not in x:
+            errors = _error(errors, "required", "'written name' is a required property")
+            if stop:
+                return errors
+        if "start time" in x:
+            e = _v211(x["start time"], stop)
+            if e:
+                errors = _child_errors(errors, "start time", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v174(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v602(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v605(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v605(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data source document" not in x:
+            errors = _error(
+                errors, "required", "'data source document' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source document" in x:
+            e = _v606(x["data source document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v606(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v607(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v607(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v608(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v608(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data source identifier" not in x:
+            errors = _error(
+                errors, "required", "'data source identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source feature" in x:
+            e = _v174(x["data source feature"], stop)
+            if e:
+                errors = _child_errors(errors, "data source feature", e)
+                if stop:
+                    return errors
+        if "data source identifier" in x:
+            e = _v174(x["data source identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data source identifier", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v601(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v600(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v596(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v604(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v595(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v586(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v609(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v609(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "sample document" not in x:
+            errors = _error(
+                errors, "required", "'sample document' is a required property"
+            )
+            if stop:
+                return errors
+        if "device control aggregate document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'device control aggregate document' is a required property",
+            )
+            if stop:
+                return errors
+        if "calculated data aggregate document" in x:
+            e = _v610(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v611(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "detection type" in x:
+            e = _v174(x["detection type"], stop)
+            if e:
+                errors = _child_errors(errors, "detection type", e)
+                if stop:
+                    return errors
+        if "device control aggregate document" in x:
+            e = _v612(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v613(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "error aggregate document" in x:
+            e = _v614(x["error aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "error aggregate document", e)
+                if stop:
+                    return errors
+        if "image aggregate document" in x:
+            e = _v615(x["image aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "image aggregate document", e)
+                if stop:
+                    return errors
+        if "measurement identifier" in x:
+            e = _v174(x["measurement identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement identifier", e)
+                if stop:
+                    return errors
+        if "measurement time" in x:
+            e = _v616(x["measurement time"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement time", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v617(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "sample document" in x:
+            e = _v618(x["sample document"], stop)
+            if e:
+                errors = _child_errors(errors, "sample document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v619(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v619(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v589(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v618(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "sample identifier" not in x:
+            errors = _error(
+                errors, "required", "'sample identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "batch identifier" in x:
+            e = _v174(x["batch identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "batch identifier", e)
+                if stop:
+                    return errors
+        if "sample identifier" in x:
+            e = _v174(x["sample identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "sample identifier", e)
+                if stop:
+                    return errors
+        if "location identifier" in x:
+            e = _v174(x["location identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "location identifier", e)
+                if stop:
+                    return errors
+        if "sample role type" in x:
+            e = _v620(x["sample role type"], stop)
+            if e:
+                errors = _child_errors(errors, "sample role type", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v174(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v621(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v621(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v620(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v96(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v622(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v622(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c32):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['control sample role', 'standard sample role', 'validation sample role', 'experiment sample role', 'sample role', 'spiked sample role', 'blank role', 'unknown sample role', 'calibration sample role', 'unspiked sample role', 'specimen role', 'quality control sample role', 'reference sample role']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v617(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v594(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v616(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v623(x, True),
+                _v624(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c22[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v624(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v625(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v625(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c23(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v623(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c23(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v615(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v626(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v626(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "image document" in x:
+            e = _v627(x["image document"], stop)
+            if e:
+                errors = _child_errors(errors, "image document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v627(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v628(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v628(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "experimental data identifier" in x:
+            e = _v174(x["experimental data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "experimental data identifier", e)
+                if stop:
+                    return errors
+        if "index" in x:
+            e = _v629(x["index"], stop)
+            if e:
+                errors = _child_errors(errors, "index", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v629(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v630(x, True),
+                _v631(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c33[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v631(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v96(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v632(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v632(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v630(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v614(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v633(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v633(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "error document" in x:
+            e = _v634(x["error document"], stop)
+            if e:
+                errors = _child_errors(errors, "error document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v634(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v635(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v635(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "error" not in x:
+            errors = _error(errors, "required", "'error' is a required property")
+            if stop:
+                return errors
+        if "error" in x:
+            e = _v174(x["error"], stop)
+            if e:
+                errors = _child_errors(errors, "error", e)
+                if stop:
+                    return errors
+        if "error feature" in x:
+            e = _v174(x["error feature"], stop)
+            if e:
+                errors = _child_errors(errors, "error feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v613(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v604(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v612(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" not in x:
+            errors = _error(
+                errors, "required", "'device control document' is a required property"
+            )
+            if stop:
+                return errors
+        if "device control document" in x:
+            e = _v636(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v637(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v637(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v636(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v638(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v638(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v639(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v639(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device type" not in x:
+            errors = _error(errors, "required", "'device type' is a required property")
+            if stop:
+                return errors
+        if "brand name" in x:
+            e = _v174(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "detection type" in x:
+            e = _v174(x["detection type"], stop)
+            if e:
+                errors = _child_errors(errors, "detection type", e)
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v174(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "device type" in x:
+            e = _v174(x["device type"], stop)
+            if e:
+                errors = _child_errors(errors, "device type", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v174(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v174(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v174(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v174(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v640(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v640(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v611(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v610(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v641(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v641(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "calculated data document" not in x:
+            errors = _error(
+                errors, "required", "'calculated data document' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data document" in x:
+            e = _v642(x["calculated data document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v642(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v643(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v643(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v644(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v644(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "calculated data name" not in x:
+            errors = _error(
+                errors, "required", "'calculated data name' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated result" not in x:
+            errors = _error(
+                errors, "required", "'calculated result' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data identifier" in x:
+            e = _v174(x["calculated data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data identifier", e)
+                if stop:
+                    return errors
+        if "calculated data name" in x:
+            e = _v174(x["calculated data name"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data name", e)
+                if stop:
+                    return errors
+        if "calculated result" in x:
+            e = _v645(x["calculated result"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated result", e)
+                if stop:
+                    return errors
+        if "calculation description" in x:
+            e = _v174(x["calculation description"], stop)
+            if e:
+                errors = _child_errors(errors, "calculation description", e)
+                if stop:
+                    return errors
+        if "data source aggregate document" in x:
+            e = _v646(x["data source aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source aggregate document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v647(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v647(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v604(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v646(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v605(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v645(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v178(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v585(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v626(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v584(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v633(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v583(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "diagnostic trace document" in x:
+            e = _v648(x["diagnostic trace document"], stop)
+            if e:
+                errors = _child_errors(errors, "diagnostic trace document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v649(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v649(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v648(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v650(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v650(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "description" not in x:
+            errors = _error(errors, "required", "'description' is a required property")
+            if stop:
+                return errors
+        if "custom information aggregate document" in x:
+            e = _v651(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        for k, v in x.items():
+            if _c34.search(k):
+                e = _v652(v, stop)
+                if e:
+                    errors = _child_errors(errors, k, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v652(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v35(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v651(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v582(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v581(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v641(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v579(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v604(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v16(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "analysis sequence document" in x:
+            e = _v653(x["analysis sequence document"], stop)
+            if e:
+                errors = _child_errors(errors, "analysis sequence document", e)
+                if stop:
+                    return errors
+        if "calculated data aggregate document" in x:
+            e = _v654(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v655(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data system document" in x:
+            e = _v656(x["data system document"], stop)
+            if e:
+                errors = _child_errors(errors, "data system document", e)
+                if stop:
+                    return errors
+        if "device system document" in x:
+            e = _v657(x["device system document"], stop)
+            if e:
+                errors = _child_errors(errors, "device system document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v658(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "electronic signature aggregate document" in x:
+            e = _v659(x["electronic signature aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic signature aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v660(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v661(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v661(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v589(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v660(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v594(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v659(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v662(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v662(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "electronic signature document" in x:
+            e = _v663(x["electronic signature document"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic signature document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v663(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v664(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v664(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v665(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v666(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v666(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v667(x, True) and _v668(x, True) and _v669(x, True) and _v670(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v670(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "method identifier" not in x:
+            errors = _error(
+                errors, "required", "'method identifier' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v669(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data identifier" not in x:
+            errors = _error(
+                errors, "required", "'processed data identifier' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v668(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measurement identifier" not in x:
+            errors = _error(
+                errors, "required", "'measurement identifier' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v667(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "identifier" not in x:
+            errors = _error(errors, "required", "'identifier' is a required property")
+            if stop:
+                return errors
+    return errors
+
+
+def _v665(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "account identifier" not in x:
+            errors = _error(
+                errors, "required", "'account identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "personal name" not in x:
+            errors = _error(
+                errors, "required", "'personal name' is a required property"
+            )
+            if stop:
+                return errors
+        if "signature role type" not in x:
+            errors = _error(
+                errors, "required", "'signature role type' is a required property"
+            )
+            if stop:
+                return errors
+        if "time" not in x:
+            errors = _error(errors, "required", "'time' is a required property")
+            if stop:
+                return errors
+        if "account identifier" in x:
+            e = _v174(x["account identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "account identifier", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v174(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "measurement identifier" in x:
+            e = _v174(x["measurement identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement identifier", e)
+                if stop:
+                    return errors
+        if "method identifier" in x:
+            e = _v174(x["method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "method identifier", e)
+                if stop:
+                    return errors
+        if "personal name" in x:
+            e = _v174(x["personal name"], stop)
+            if e:
+                errors = _child_errors(errors, "personal name", e)
+                if stop:
+                    return errors
+        if "processed data identifier" in x:
+            e = _v174(x["processed data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data identifier", e)
+                if stop:
+                    return errors
+        if "signature role type" in x:
+            e = _v174(x["signature role type"], stop)
+            if e:
+                errors = _child_errors(errors, "signature role type", e)
+                if stop:
+                    return errors
+        if "time" in x:
+            e = _v174(x["time"], stop)
+            if e:
+                errors = _child_errors(errors, "time", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v658(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v604(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v657(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "asset management identifier" in x:
+            e = _v174(x["asset management identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "asset management identifier", e)
+                if stop:
+                    return errors
+        if "brand name" in x:
+            e = _v174(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "device document" in x:
+            e = _v671(x["device document"], stop)
+            if e:
+                errors = _child_errors(errors, "device document", e)
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v174(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v174(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v174(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v174(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v174(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v672(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v672(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v671(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v673(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v673(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v674(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v170(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v674(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device type" not in x:
+            errors = _error(errors, "required", "'device type' is a required property")
+            if stop:
+                return errors
+        if "brand name" in x:
+            e = _v174(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v174(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "device type" in x:
+            e = _v174(x["device type"], stop)
+            if e:
+                errors = _child_errors(errors, "device type", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v174(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v174(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v174(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v174(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v174(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v675(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v675(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v656(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "ASM file identifier" not in x:
+            errors = _error(
+                errors, "required", "'ASM file identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "data system instance identifier" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'data system instance identifier' is a required property",
+            )
+            if stop:
+                return errors
+        if "ASM converter name" in x:
+            e = _v174(x["ASM converter name"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM converter name", e)
+                if stop:
+                    return errors
+        if "ASM converter version" in x:
+            e = _v174(x["ASM converter version"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM converter version", e)
+                if stop:
+                    return errors
+        if "ASM file identifier" in x:
+            e = _v174(x["ASM file identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM file identifier", e)
+                if stop:
+                    return errors
+        if "data system instance identifier" in x:
+            e = _v174(x["data system instance identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data system instance identifier", e)
+                if stop:
+                    return errors
+        if "database primary key" in x:
+            e = _v174(x["database primary key"], stop)
+            if e:
+                errors = _child_errors(errors, "database primary key", e)
+                if stop:
+                    return errors
+        if "file name" in x:
+            e = _v174(x["file name"], stop)
+            if e:
+                errors = _child_errors(errors, "file name", e)
+                if stop:
+                    return errors
+        if "software name" in x:
+            e = _v174(x["software name"], stop)
+            if e:
+                errors = _child_errors(errors, "software name", e)
+                if stop:
+                    return errors
+        if "software version" in x:
+            e = _v174(x["software version"], stop)
+            if e:
+                errors = _child_errors(errors, "software version", e)
+                if stop:
+                    return errors
+        if "UNC path" in x:
+            e = _v174(x["UNC path"], stop)
+            if e:
+                errors = _child_errors(errors, "UNC path", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v676(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v677(x, True),
+                _v678(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c35[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v678(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "database primary key" not in x:
+            errors = _error(
+                errors, "required", "'database primary key' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v677(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "UNC path" not in x:
+            errors = _error(errors, "required", "'UNC path' is a required property")
+            if stop:
+                return errors
+        if "file name" not in x:
+            errors = _error(errors, "required", "'file name' is a required property")
+            if stop:
+                return errors
+    return errors
+
+
+def _v676(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v655(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v198(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v654(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v641(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v653(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "written name" not in x:
+            errors = _error(errors, "required", "'written name' is a required property")
+            if stop:
+                return errors
+        if "end time" in x:
+            e = _v211(x["end time"], stop)
+            if e:
+                errors = _child_errors(errors, "end time", e)
+                if stop:
+                    return errors
+        if "file name" in x:
+            e = _v174(x["file name"], stop)
+            if e:
+                errors = _child_errors(errors, "file name", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v174(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "method identifier" in x:
+            e = _v174(x["method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "method identifier", e)
+                if stop:
+                    return errors
+        if "method name" in x:
+            e = _v174(x["method name"], stop)
+            if e:
+                errors = _child_errors(errors, "method name", e)
+                if stop:
+                    return errors
+        if "start time" in x:
+            e = _v211(x["start time"], stop)
+            if e:
+                errors = _child_errors(errors, "start time", e)
+                if stop:
+                    return errors
+        if "UNC path" in x:
+            e = _v174(x["UNC path"], stop)
+            if e:
+                errors = _child_errors(errors, "UNC path", e)
+                if stop:
+                    return errors
+        if "version number" in x:
+            e = _v174(x["version number"], stop)
+            if e:
+                errors = _child_errors(errors, "version number", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v174(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+    return errors
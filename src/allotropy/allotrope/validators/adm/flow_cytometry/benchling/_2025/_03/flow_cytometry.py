@@ -0,0 +1,5741 @@
+"""Validator for http://purl.allotrope.org/json-schemas/adm/flow-cytometry/BENCHLING/2025/03/flow-cytometry.embed.schema, generated by allotropy.schema_gen."""
+
+import re
+from typing import Any
+
+from allotropy.allotrope.native_validation import (
+    child_errors as _child_errors,
+    error as _error,
+    Errors,
+    extend_errors as _extend_errors,
+    FORMAT_CHECKS as _FORMAT_CHECKS,
+    is_integer as _is_integer,
+    is_number as _is_number,
+    is_unique as _is_unique,
+)
+
+_c0 = frozenset(
+    [
+        "BET C constant",
+        "Raman intensity",
+        "Raman interferogram intensity",
+        "Raman wavenumber shift",
+        "Young modulus",
+        "abrasion weight",
+        "absolute intensity",
+        "absolute water content",
+        "absorbance",
+        "acquisition volume",
+        "actual P/P0 result",
+        "adsorbed volume at STP",
+        "ambient humidity",
+        "ambient pressure",
+        "ambient temperature",
+        "amount of substance",
+        "angle",
+        "angle of optical rotation",
+        "angular velocity",
+        "area",
+        "attenuation coefficient",
+        "average dead cell diameter (cell counter)",
+        "average particle size",
+        "average total cell circularity",
+        "average total cell diameter",
+        "average viable cell circularity",
+        "background corrected turbidity",
+        "birefringence",
+        "break strain",
+        "break stress",
+        "cell path length",
+        "chemical shift",
+        "chromatography column film thickness",
+        "chromatography column length",
+        "chromatography column particle size",
+        "circularity",
+        "coating gap height",
+        "collision energy",
+        "column inner diameter",
+        "compartment temperature",
+        "concentration",
+        "container diameter",
+        "container height",
+        "count",
+        "degassed sample weight",
+        "detector view volume",
+        "diameter",
+        "dielectric polarization",
+        "dilution factor",
+        "dilution volume",
+        "dispensed volume",
+        "dry gas flow rate",
+        "dry sample weight",
+        "eccentricity",
+        "electric charge",
+        "electric conductance",
+        "electric conductivity",
+        "electric current",
+        "electric impedance",
+        "electric resistance",
+        "electric resistivity",
+        "electron beam working distance",
+        "end height",
+        "energy (datum)",
+        "enthalpy",
+        "enthalpy of fusion",
+        "enthalpy of sublimation",
+        "enthalpy of vaporization",
+        "exhaust gas flow rate",
+        "extrapolated moisture content",
+        "fill depth",
+        "flow rate",
+        "flow ratio",
+        "fluorescence",
+        "foam height",
+        "force",
+        "fracture energy",
+        "glass transition temperature",
+        "gloss",
+        "gross weight",
+        "hardness",
+        "heat capacity",
+        "heat capacity (dsc)",
+        "heat flow",
+        "heat seal length",
+        "heat transfer coefficient",
+        "height",
+        "hold-up volume",
+        "humidity",
+        "image height",
+        "image width",
+        "incident radiation angle",
+        "inlet gas pressure",
+        "inner diameter",
+        "intensity",
+        "isocyanate reservoir temperature",
+        "length",
+        "linear velocity",
+        "liquid height",
+        "luminescence",
+        "m/z",
+        "mass",
+        "mass attenuation coefficient",
+        "mass change",
+        "mass concentration",
+        "mass fraction",
+        "measurement chamber free space volume",
+        "molar attenuation coefficient",
+        "molar concentration",
+        "molar enthalpy of fusion",
+        "molar enthalpy of sublimation",
+        "molar enthalpy of vaporization",
+        "molar mass",
+        "molecular mass",
+        "monolayer quantity",
+        "normalized foam height",
+        "number concentration",
+        "osmolality",
+        "pCO2",
+        "pCO2 (bga)",
+        "pH",
+        "pO2",
+        "pO2 (bga)",
+        "partial pressure",
+        "particle size",
+        "peak analyte amount",
+        "peak load force",
+        "peak onset temperature",
+        "peak temperature",
+        "plate heater temperature",
+        "plate temperature",
+        "plate well count",
+        "polarity",
+        "polyol reservoir temperature",
+        "position count",
+        "power",
+        "pressure",
+        "probe volume",
+        "protein attenuation coefficient",
+        "purity",
+        "qNMR purity result",
+        "reference material weight",
+        "reflectance",
+        "refractive index",
+        "relative humidity",
+        "relative intensity",
+        "relative permittivity",
+        "relative pressure (BET)",
+        "relative response",
+        "relative weight loss on drying",
+        "reservoir temperature",
+        "rotational speed",
+        "sample temperature",
+        "sample thickness",
+        "sample weight",
+        "sample weight before drying",
+        "sample width",
+        "saturated gas flow rate",
+        "saturation vapor pressure",
+        "seal initiation temperature",
+        "size (datum)",
+        "solvent reservoir temperature",
+        "specific enthalpy of fusion",
+        "specific enthalpy of sublimation",
+        "specific enthalpy of vaporization",
+        "specific heat capacity",
+        "specific rotation",
+        "specific surface area",
+        "start height",
+        "stirring rate",
+        "strain",
+        "stress",
+        "tablet thickness",
+        "tare weight",
+        "temperature",
+        "temperature rate",
+        "thermal conductance",
+        "thermal conductivity",
+        "thickness",
+        "titer",
+        "torque",
+        "total cell diameter",
+        "total foam height",
+        "total gas flow rate",
+        "total material height",
+        "transition enthalpy",
+        "transmittance",
+        "turbidity",
+        "velocity",
+        "viscosity",
+        "void volume",
+        "voltage",
+        "voltage range",
+        "volume",
+        "volume concentration",
+        "volume fraction",
+        "water mass concentration",
+        "water mass fraction",
+        "wavelength",
+        "wavenumber",
+        "weight loss",
+        "well volume",
+        "width",
+        "yield strain",
+        "yield stress",
+    ]
+)
+_c1 = frozenset(
+    [
+        "arithmetic mean role",
+        "coefficient of variation role",
+        "final value role",
+        "frequency of grandparent role",
+        "frequency of parent role",
+        "frequency of total role",
+        "geometric mean role",
+        "initial value role",
+        "maximum value role",
+        "median absolute deviation percentile role",
+        "median absolute deviation role",
+        "median role",
+        "minimum value role",
+        "percentile role",
+        "relative standard deviation role",
+        "robust coefficient of variation role",
+        "robust standard deviation role",
+        "skewness role",
+        "standard deviation role",
+        "sum of squares role",
+        "variance role",
+    ]
+)
+_c2 = (
+    "{'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tQuantityValue'}, {'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2025/03/units.schema#/$defs/RFU'}]}",
+    "{'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tQuantityValue'}, {'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2025/03/units.schema#/$defs/s'}]}",
+)
+_c3 = (
+    "{'format': 'date-time', 'type': 'string'}",
+    "{'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'format': 'date-time', 'type': 'string'}}, 'required': ['@type', 'value'], 'type': 'object'}",
+)
+_c4 = _FORMAT_CHECKS["date-time"]
+_c5 = (
+    "{'type': 'string'}",
+    "{'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'string'}}, 'required': ['@type', 'value'], 'type': 'object'}",
+)
+_c6 = frozenset(
+    [
+        "BET C constant",
+        "Raman intensity",
+        "Raman interferogram intensity",
+        "Raman wavenumber shift",
+        "Young modulus",
+        "abrasion weight",
+        "absolute intensity",
+        "absolute water content",
+        "absorbance",
+        "acquisition volume",
+        "actual P/P0 result",
+        "adsorbed volume at STP",
+        "ambient humidity",
+        "ambient pressure",
+        "ambient temperature",
+        "amount of substance",
+        "angle",
+        "angle of optical rotation",
+        "angular velocity",
+        "area",
+        "attenuation coefficient",
+        "average dead cell diameter (cell counter)",
+        "average particle size",
+        "average total cell circularity",
+        "average total cell diameter",
+        "average viable cell circularity",
+        "background corrected turbidity",
+        "birefringence",
+        "break strain",
+        "break stress",
+        "cell path length",
+        "chemical shift",
+        "chromatography column film thickness",
+        "chromatography column length",
+        "chromatography column particle size",
+        "circularity",
+        "coating gap height",
+        "collision energy",
+        "column inner diameter",
+        "compartment temperature",
+        "concentration",
+        "container diameter",
+        "container height",
+        "degassed sample weight",
+        "detector view volume",
+        "diameter",
+        "dielectric polarization",
+        "dilution factor",
+        "dilution volume",
+        "dispensed volume",
+        "dry gas flow rate",
+        "dry sample weight",
+        "eccentricity",
+        "electric charge",
+        "electric conductance",
+        "electric conductivity",
+        "electric current",
+        "electric impedance",
+        "electric resistance",
+        "electric resistivity",
+        "electron beam working distance",
+        "end height",
+        "energy (datum)",
+        "enthalpy",
+        "enthalpy of fusion",
+        "enthalpy of sublimation",
+        "enthalpy of vaporization",
+        "exhaust gas flow rate",
+        "extrapolated moisture content",
+        "fill depth",
+        "flow rate",
+        "flow ratio",
+        "fluorescence",
+        "foam height",
+        "force",
+        "fracture energy",
+        "glass transition temperature",
+        "gloss",
+        "gross weight",
+        "hardness",
+        "heat capacity",
+        "heat capacity (dsc)",
+        "heat flow",
+        "heat seal length",
+        "heat transfer coefficient",
+        "height",
+        "hold-up volume",
+        "humidity",
+        "image height",
+        "image width",
+        "incident radiation angle",
+        "inlet gas pressure",
+        "inner diameter",
+        "intensity",
+        "isocyanate reservoir temperature",
+        "length",
+        "linear velocity",
+        "liquid height",
+        "luminescence",
+        "m/z",
+        "mass",
+        "mass attenuation coefficient",
+        "mass change",
+        "mass concentration",
+        "mass fraction",
+        "measurement chamber free space volume",
+        "molar attenuation coefficient",
+        "molar concentration",
+        "molar enthalpy of fusion",
+        "molar enthalpy of sublimation",
+        "molar enthalpy of vaporization",
+        "molar mass",
+        "molecular mass",
+        "monolayer quantity",
+        "normalized foam height",
+        "number concentration",
+        "osmolality",
+        "pCO2",
+        "pCO2 (bga)",
+        "pH",
+        "pO2",
+        "pO2 (bga)",
+        "partial pressure",
+        "particle size",
+        "peak analyte amount",
+        "peak load force",
+        "peak onset temperature",
+        "peak temperature",
+        "plate heater temperature",
+        "plate temperature",
+        "plate well count",
+        "polarity",
+        "polyol reservoir temperature",
+        "position count",
+        "power",
+        "pressure",
+        "probe volume",
+        "protein attenuation coefficient",
+        "purity",
+        "qNMR purity result",
+        "reference material weight",
+        "reflectance",
+        "refractive index",
+        "relative humidity",
+        "relative intensity",
+        "relative permittivity",
+        "relative pressure (BET)",
+        "relative response",
+        "relative weight loss on drying",
+        "reservoir temperature",
+        "rotational speed",
+        "sample temperature",
+        "sample thickness",
+        "sample weight",
+        "sample weight before drying",
+        "sample width",
+        "saturated gas flow rate",
+        "saturation vapor pressure",
+        "seal initiation temperature",
+        "size (datum)",
+        "solvent reservoir temperature",
+        "specific enthalpy of fusion",
+        "specific enthalpy of sublimation",
+        "specific enthalpy of vaporization",
+        "specific heat capacity",
+        "specific rotation",
+        "specific surface area",
+        "start height",
+        "stirring rate",
+        "strain",
+        "stress",
+        "tablet thickness",
+        "tare weight",
+        "temperature",
+        "temperature rate",
+        "thermal conductance",
+        "thermal conductivity",
+        "thickness",
+        "titer",
+        "torque",
+        "total cell diameter",
+        "total foam height",
+        "total gas flow rate",
+        "total material height",
+        "transition enthalpy",
+        "transmittance",
+        "turbidity",
+        "velocity",
+        "viscosity",
+        "void volume",
+        "voltage",
+        "voltage range",
+        "volume",
+        "volume concentration",
+        "volume fraction",
+        "water mass concentration",
+        "water mass fraction",
+        "wavelength",
+        "wavenumber",
+        "weight loss",
+        "well volume",
+        "width",
+        "yield strain",
+        "yield stress",
+    ]
+)
+_c7 = (
+    "{'properties': {'scalar double datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001104', '$asm.type': 'http://www.w3.org/2001/XMLSchema#double', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tDoubleValue'}, 'unit': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0003122', '$asm.type': 'http://www.w3.org/2001/XMLSchema#string', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tStringValue'}}, 'required': ['scalar double datum']}",
+    "{'properties': {'scalar string datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001511', '$asm.type': 'http://www.w3.org/2001/XMLSchema#string', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tStringValue'}}, 'required': ['scalar string datum']}",
+    "{'properties': {'scalar timestamp datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001512', '$asm.type': 'http://www.w3.org/2001/XMLSchema#dateTime', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tDateTimeValue'}}, 'required': ['scalar timestamp datum']}",
+    "{'properties': {'scalar boolean datum': {'$asm.pattern': 'value datum', '$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0001510', '$asm.type': 'http://www.w3.org/2001/XMLSchema#boolean', '$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2025/03/core.schema#/$defs/tBooleanValue'}}, 'required': ['scalar boolean datum']}",
+)
+_c8 = (
+    "{'type': 'boolean'}",
+    "{'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'boolean'}}, 'required': ['@type', 'value'], 'type': 'object'}",
+)
+_c9 = (
+    "{'type': 'number'}",
+    "{'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'number'}}, 'required': ['@type', 'value'], 'type': 'object'}",
+)
+_c10 = frozenset(
+    [
+        "blank role",
+        "calibration sample role",
+        "control sample role",
+        "experiment sample role",
+        "quality control sample role",
+        "reference sample role",
+        "sample role",
+        "specimen role",
+        "spiked sample role",
+        "standard sample role",
+        "unknown sample role",
+        "unspiked sample role",
+        "validation sample role",
+    ]
+)
+_c11 = (
+    "{'type': 'integer'}",
+    "{'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'integer'}}, 'required': ['@type', 'value'], 'type': 'object'}",
+)
+_c12 = re.compile("data cube$")
+_c13 = (
+    "{'properties': {'measures': {'items': {'$ref': '#/$defs/tMeasureArray'}, 'type': 'array'}}, 'required': ['measures']}",
+    "{'properties': {'points': {'items': {'$ref': '#/$defs/tTupleData'}, 'type': 'array'}}, 'required': ['points']}",
+)
+_c14 = (
+    "{'type': 'number'}",
+    "{'type': 'boolean'}",
+    "{'type': 'string'}",
+    "{'type': 'null'}",
+)
+_c15 = (
+    "{'$ref': '#/$defs/tNumberOrNullArray'}",
+    "{'$ref': '#/$defs/tBooleanOrNullArray'}",
+    "{'$ref': '#/$defs/tStringOrNullArray'}",
+)
+_c16 = ("{'$ref': '#/$defs/tDimensionArray'}", "{'$ref': '#/$defs/tFunction'}")
+_c17 = frozenset(["linear", "logarithmic"])
+_c18 = (
+    "{'$ref': '#/$defs/tNumberArray'}",
+    "{'$ref': '#/$defs/tBooleanArray'}",
+    "{'$ref': '#/$defs/tStringArray'}",
+)
+_c19 = re.compile("string|dateTime|date")
+_c20 = re.compile("integer|decimal|long|int|short|byte")
+_c21 = re.compile("double|float")
+_c22 = frozenset(["cardinal", "interval", "nominal", "ordinal", "range"])
+_c23 = frozenset(
+    [
+        "boolean",
+        "byte",
+        "dateTime",
+        "decimal",
+        "double",
+        "float",
+        "int",
+        "integer",
+        "long",
+        "short",
+        "string",
+    ]
+)
+_c24 = (
+    "{'required': ['UNC path', 'file name']}",
+    "{'required': ['database primary key']}",
+)
+
+
+def validate(instance: Any) -> Errors:
+    return _v1(instance, False) or []
+
+
+def _valid(x: Any, stop: bool) -> Errors | None:
+    return None
+
+
+def _v1(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "$asm.manifest" not in x:
+            errors = _error(
+                errors, "required", "'$asm.manifest' is a required property"
+            )
+            if stop:
+                return errors
+    e = _v2(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v2(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "flow cytometry aggregate document" in x:
+            e = _v3(x["flow cytometry aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "flow cytometry aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v3(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v4(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v5(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v5(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "flow cytometry document" not in x:
+            errors = _error(
+                errors, "required", "'flow cytometry document' is a required property"
+            )
+            if stop:
+                return errors
+        if "flow cytometry document" in x:
+            e = _v6(x["flow cytometry document"], stop)
+            if e:
+                errors = _child_errors(errors, "flow cytometry document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v6(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v7(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v7(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v8(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v9(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v9(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "compensation matrix aggregate document" in x:
+            e = _v10(x["compensation matrix aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "compensation matrix aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "measurement aggregate document" in x:
+            e = _v11(x["measurement aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v11(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "analyst" in x:
+            e = _v12(x["analyst"], stop)
+            if e:
+                errors = _child_errors(errors, "analyst", e)
+                if stop:
+                    return errors
+        if "measurement time" in x:
+            e = _v13(x["measurement time"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement time", e)
+                if stop:
+                    return errors
+        if "experiment type" in x:
+            e = _v12(x["experiment type"], stop)
+            if e:
+                errors = _child_errors(errors, "experiment type", e)
+                if stop:
+                    return errors
+        if "analytical method identifier" in x:
+            e = _v12(x["analytical method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "analytical method identifier", e)
+                if stop:
+                    return errors
+        if "experimental data identifier" in x:
+            e = _v12(x["experimental data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "experimental data identifier", e)
+                if stop:
+                    return errors
+        if "experiment identifier" in x:
+            e = _v12(x["experiment identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "experiment identifier", e)
+                if stop:
+                    return errors
+        if "compartment temperature" in x:
+            e = _v14(x["compartment temperature"], stop)
+            if e:
+                errors = _child_errors(errors, "compartment temperature", e)
+                if stop:
+                    return errors
+        if "measurement document" in x:
+            e = _v15(x["measurement document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v15(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v16(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v16(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v17(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v17(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measurement identifier" not in x:
+            errors = _error(
+                errors, "required", "'measurement identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "sample document" in x:
+            e = _v18(x["sample document"], stop)
+            if e:
+                errors = _child_errors(errors, "sample document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v19(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v19(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v20(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v20(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v21(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v21(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "data processing document" in x:
+            e = _v22(x["data processing document"], stop)
+            if e:
+                errors = _child_errors(errors, "data processing document", e)
+                if stop:
+                    return errors
+        if "data region aggregate document" in x:
+            e = _v23(x["data region aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data region aggregate document", e)
+                if stop:
+                    return errors
+        if "population aggregate document" in x:
+            e = _v24(x["population aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "population aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v24(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v25(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v25(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "population document" in x:
+            e = _v26(x["population document"], stop)
+            if e:
+                errors = _child_errors(errors, "population document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v26(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v27(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v27(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "population identifier" in x:
+            e = _v12(x["population identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "population identifier", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v12(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "count" in x:
+            e = _v28(x["count"], stop)
+            if e:
+                errors = _child_errors(errors, "count", e)
+                if stop:
+                    return errors
+        if "data region identifier" in x:
+            e = _v12(x["data region identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data region identifier", e)
+                if stop:
+                    return errors
+        if "parent population identifier" in x:
+            e = _v12(x["parent population identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "parent population identifier", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v29(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+        if "population aggregate document" in x:
+            e = _v30(x["population aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "population aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v30(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v31(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v31(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "population document" in x:
+            e = _v32(x["population document"], stop)
+            if e:
+                errors = _child_errors(errors, "population document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v32(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v33(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v33(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "population identifier" in x:
+            e = _v12(x["population identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "population identifier", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v12(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "count" in x:
+            e = _v34(x["count"], stop)
+            if e:
+                errors = _child_errors(errors, "count", e)
+                if stop:
+                    return errors
+        if "data region identifier" in x:
+            e = _v12(x["data region identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data region identifier", e)
+                if stop:
+                    return errors
+        if "parent population identifier" in x:
+            e = _v12(x["parent population identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "parent population identifier", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v35(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v35(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistics document" in x:
+            e = _v36(x["statistics document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v36(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v37(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v37(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistical feature" not in x:
+            errors = _error(
+                errors, "required", "'statistical feature' is a required property"
+            )
+            if stop:
+                return errors
+        if "statistic dimension aggregate document" in x:
+            e = _v38(x["statistic dimension aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "statistic dimension aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "statistical feature" in x:
+            e = _v39(x["statistical feature"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v39(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v41(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v41(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c0):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['BET C constant', 'Raman intensity', 'Raman interferogram intensity', 'Raman wavenumber shift', 'Young modulus', 'abrasion weight', 'absolute intensity', 'absolute water content', 'absorbance', 'acquisition volume', 'actual P/P0 result', 'adsorbed volume at STP', 'ambient humidity', 'ambient pressure', 'ambient temperature', 'amount of substance', 'angle', 'angle of optical rotation', 'angular velocity', 'area', 'attenuation coefficient', 'average dead cell diameter (cell counter)', 'average particle size', 'average total cell circularity', 'average total cell diameter', 'average viable cell circularity', 'background corrected turbidity', 'birefringence', 'break strain', 'break stress', 'cell path length', 'chemical shift', 'chromatography column film thickness', 'chromatography column length', 'chromatography column particle size', 'circularity', 'coating gap height', 'collision energy', 'column inner diameter', 'compartment temperature', 'concentration', 'container diameter', 'container height', 'count', 'degassed sample weight', 'detector view volume', 'diameter', 'dielectric polarization', 'dilution factor', 'dilution volume', 'dispensed volume', 'dry gas flow rate', 'dry sample weight', 'eccentricity', 'electric charge', 'electric conductance', 'electric conductivity', 'electric current', 'electric impedance', 'electric resistance', 'electric resistivity', 'electron beam working distance', 'end height', 'energy (datum)', 'enthalpy', 'enthalpy of fusion', 'enthalpy of sublimation', 'enthalpy of vaporization', 'exhaust gas flow rate', 'extrapolated moisture content', 'fill depth', 'flow rate', 'flow ratio', 'fluorescence', 'foam height', 'force', 'fracture energy', 'glass transition temperature', 'gloss', 'gross weight', 'hardness', 'heat capacity', 'heat capacity (dsc)', 'heat flow', 'heat seal length', 'heat transfer coefficient', 'height', 'hold-up volume', 'humidity', 'image height', 'image width', 'incident radiation angle', 'inlet gas pressure', 'inner diameter', 'intensity', 'isocyanate reservoir temperature', 'length', 'linear velocity', 'liquid height', 'luminescence', 'm/z', 'mass', 'mass attenuation coefficient', 'mass change', 'mass concentration', 'mass fraction', 'measurement chamber free space volume', 'molar attenuation coefficient', 'molar concentration', 'molar enthalpy of fusion', 'molar enthalpy of sublimation', 'molar enthalpy of vaporization', 'molar mass', 'molecular mass', 'monolayer quantity', 'normalized foam height', 'number concentration', 'osmolality', 'pCO2', 'pCO2 (bga)', 'pH', 'pO2', 'pO2 (bga)', 'partial pressure', 'particle size', 'peak analyte amount', 'peak load force', 'peak onset temperature', 'peak temperature', 'plate heater temperature', 'plate temperature', 'plate well count', 'polarity', 'polyol reservoir temperature', 'position count', 'power', 'pressure', 'probe volume', 'protein attenuation coefficient', 'purity', 'qNMR purity result', 'reference material weight', 'reflectance', 'refractive index', 'relative humidity', 'relative intensity', 'relative permittivity', 'relative pressure (BET)', 'relative response', 'relative weight loss on drying', 'reservoir temperature', 'rotational speed', 'sample temperature', 'sample thickness', 'sample weight', 'sample weight before drying', 'sample width', 'saturated gas flow rate', 'saturation vapor pressure', 'seal initiation temperature', 'size (datum)', 'solvent reservoir temperature', 'specific enthalpy of fusion', 'specific enthalpy of sublimation', 'specific enthalpy of vaporization', 'specific heat capacity', 'specific rotation', 'specific surface area', 'start height', 'stirring rate', 'strain', 'stress', 'tablet thickness', 'tare weight', 'temperature', 'temperature rate', 'thermal conductance', 'thermal conductivity', 'thickness', 'titer', 'torque', 'total cell diameter', 'total foam height', 'total gas flow rate', 'total material height', 'transition enthalpy', 'transmittance', 'turbidity', 'velocity', 'viscosity', 'void volume', 'voltage', 'voltage range', 'volume', 'volume concentration', 'volume fraction', 'water mass concentration', 'water mass fraction', 'wavelength', 'wavenumber', 'weight loss', 'well volume', 'width', 'yield strain', 'yield stress']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v40(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v38(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "statistic dimension document" in x:
+            e = _v42(x["statistic dimension document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistic dimension document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v42(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v43(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v43(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimension identifier" in x:
+            e = _v12(x["dimension identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "dimension identifier", e)
+                if stop:
+                    return errors
+        if "statistical value" in x:
+            e = _v44(x["statistical value"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v44(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "has statistic datum role" in x:
+            e = _v45(x["has statistic datum role"], stop)
+            if e:
+                errors = _child_errors(errors, "has statistic datum role", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v46(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v47(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v47(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v46(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v45(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c1):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['arithmetic mean role', 'median role', 'relative standard deviation role', 'skewness role', 'standard deviation role', 'variance role', 'maximum value role', 'minimum value role', 'initial value role', 'final value role', 'coefficient of variation role', 'robust coefficient of variation role', 'geometric mean role', 'percentile role', 'median absolute deviation percentile role', 'robust standard deviation role', 'median absolute deviation role', 'frequency of parent role', 'frequency of grandparent role', 'frequency of total role', 'sum of squares role']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v34(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v48(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v48(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v49(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v49(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "Counts":
+        errors = _error(errors, "const", "'Counts' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v29(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistics document" in x:
+            e = _v50(x["statistics document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v50(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v51(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v51(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistical feature" not in x:
+            errors = _error(
+                errors, "required", "'statistical feature' is a required property"
+            )
+            if stop:
+                return errors
+        if "statistic dimension aggregate document" in x:
+            e = _v52(x["statistic dimension aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "statistic dimension aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "statistical feature" in x:
+            e = _v53(x["statistical feature"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v53(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v54(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v54(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c0):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['BET C constant', 'Raman intensity', 'Raman interferogram intensity', 'Raman wavenumber shift', 'Young modulus', 'abrasion weight', 'absolute intensity', 'absolute water content', 'absorbance', 'acquisition volume', 'actual P/P0 result', 'adsorbed volume at STP', 'ambient humidity', 'ambient pressure', 'ambient temperature', 'amount of substance', 'angle', 'angle of optical rotation', 'angular velocity', 'area', 'attenuation coefficient', 'average dead cell diameter (cell counter)', 'average particle size', 'average total cell circularity', 'average total cell diameter', 'average viable cell circularity', 'background corrected turbidity', 'birefringence', 'break strain', 'break stress', 'cell path length', 'chemical shift', 'chromatography column film thickness', 'chromatography column length', 'chromatography column particle size', 'circularity', 'coating gap height', 'collision energy', 'column inner diameter', 'compartment temperature', 'concentration', 'container diameter', 'container height', 'count', 'degassed sample weight', 'detector view volume', 'diameter', 'dielectric polarization', 'dilution factor', 'dilution volume', 'dispensed volume', 'dry gas flow rate', 'dry sample weight', 'eccentricity', 'electric charge', 'electric conductance', 'electric conductivity', 'electric current', 'electric impedance', 'electric resistance', 'electric resistivity', 'electron beam working distance', 'end height', 'energy (datum)', 'enthalpy', 'enthalpy of fusion', 'enthalpy of sublimation', 'enthalpy of vaporization', 'exhaust gas flow rate', 'extrapolated moisture content', 'fill depth', 'flow rate', 'flow ratio', 'fluorescence', 'foam height', 'force', 'fracture energy', 'glass transition temperature', 'gloss', 'gross weight', 'hardness', 'heat capacity', 'heat capacity (dsc)', 'heat flow', 'heat seal length', 'heat transfer coefficient', 'height', 'hold-up volume', 'humidity', 'image height', 'image width', 'incident radiation angle', 'inlet gas pressure', 'inner diameter', 'intensity', 'isocyanate reservoir temperature', 'length', 'linear velocity', 'liquid height', 'luminescence', 'm/z', 'mass', 'mass attenuation coefficient', 'mass change', 'mass concentration', 'mass fraction', 'measurement chamber free space volume', 'molar attenuation coefficient', 'molar concentration', 'molar enthalpy of fusion', 'molar enthalpy of sublimation', 'molar enthalpy of vaporization', 'molar mass', 'molecular mass', 'monolayer quantity', 'normalized foam height', 'number concentration', 'osmolality', 'pCO2', 'pCO2 (bga)', 'pH', 'pO2', 'pO2 (bga)', 'partial pressure', 'particle size', 'peak analyte amount', 'peak load force', 'peak onset temperature', 'peak temperature', 'plate heater temperature', 'plate temperature', 'plate well count', 'polarity', 'polyol reservoir temperature', 'position count', 'power', 'pressure', 'probe volume', 'protein attenuation coefficient', 'purity', 'qNMR purity result', 'reference material weight', 'reflectance', 'refractive index', 'relative humidity', 'relative intensity', 'relative permittivity', 'relative pressure (BET)', 'relative response', 'relative weight loss on drying', 'reservoir temperature', 'rotational speed', 'sample temperature', 'sample thickness', 'sample weight', 'sample weight before drying', 'sample width', 'saturated gas flow rate', 'saturation vapor pressure', 'seal initiation temperature', 'size (datum)', 'solvent reservoir temperature', 'specific enthalpy of fusion', 'specific enthalpy of sublimation', 'specific enthalpy of vaporization', 'specific heat capacity', 'specific rotation', 'specific surface area', 'start height', 'stirring rate', 'strain', 'stress', 'tablet thickness', 'tare weight', 'temperature', 'temperature rate', 'thermal conductance', 'thermal conductivity', 'thickness', 'titer', 'torque', 'total cell diameter', 'total foam height', 'total gas flow rate', 'total material height', 'transition enthalpy', 'transmittance', 'turbidity', 'velocity', 'viscosity', 'void volume', 'voltage', 'voltage range', 'volume', 'volume concentration', 'volume fraction', 'water mass concentration', 'water mass fraction', 'wavelength', 'wavenumber', 'weight loss', 'well volume', 'width', 'yield strain', 'yield stress']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v52(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "statistic dimension document" in x:
+            e = _v55(x["statistic dimension document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistic dimension document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v55(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v56(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v56(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimension identifier" in x:
+            e = _v12(x["dimension identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "dimension identifier", e)
+                if stop:
+                    return errors
+        if "statistical value" in x:
+            e = _v44(x["statistical value"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v28(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v48(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v23(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "data region document" in x:
+            e = _v57(x["data region document"], stop)
+            if e:
+                errors = _child_errors(errors, "data region document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v57(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v58(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v58(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "data region identifier" in x:
+            e = _v12(x["data region identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data region identifier", e)
+                if stop:
+                    return errors
+        if "region type" in x:
+            e = _v12(x["region type"], stop)
+            if e:
+                errors = _child_errors(errors, "region type", e)
+                if stop:
+                    return errors
+        if "parent data region identifier" in x:
+            e = _v12(x["parent data region identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "parent data region identifier", e)
+                if stop:
+                    return errors
+        if "x-coordinate dimension identifier" in x:
+            e = _v12(x["x-coordinate dimension identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "x-coordinate dimension identifier", e)
+                if stop:
+                    return errors
+        if "y-coordinate dimension identifier" in x:
+            e = _v12(x["y-coordinate dimension identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "y-coordinate dimension identifier", e)
+                if stop:
+                    return errors
+        if "vertex aggregate document" in x:
+            e = _v59(x["vertex aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "vertex aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v59(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "vertex document" in x:
+            e = _v60(x["vertex document"], stop)
+            if e:
+                errors = _child_errors(errors, "vertex document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v60(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v61(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v61(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "vertex role" in x:
+            e = _v12(x["vertex role"], stop)
+            if e:
+                errors = _child_errors(errors, "vertex role", e)
+                if stop:
+                    return errors
+        if "x-coordinate" in x:
+            e = _v62(x["x-coordinate"], stop)
+            if e:
+                errors = _child_errors(errors, "x-coordinate", e)
+                if stop:
+                    return errors
+        if "y-coordinate" in x:
+            e = _v63(x["y-coordinate"], stop)
+            if e:
+                errors = _child_errors(errors, "y-coordinate", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v63(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v64(x, True),
+                _v65(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c2[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v65(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v66(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v66(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v67(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v67(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v64(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v68(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v68(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v69(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v69(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v62(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v70(x, True),
+                _v71(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c2[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v71(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v66(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v70(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v68(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v22(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "method version" in x:
+            e = _v12(x["method version"], stop)
+            if e:
+                errors = _child_errors(errors, "method version", e)
+                if stop:
+                    return errors
+        if "data processing time" in x:
+            e = _v13(x["data processing time"], stop)
+            if e:
+                errors = _child_errors(errors, "data processing time", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v18(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "location identifier" in x:
+            e = _v12(x["location identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "location identifier", e)
+                if stop:
+                    return errors
+        if "well plate identifier" in x:
+            e = _v12(x["well plate identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "well plate identifier", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v14(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v72(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v73(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v73(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "degC":
+        errors = _error(errors, "const", "'degC' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v13(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v74(x, True),
+                _v75(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v75(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v76(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v76(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c4(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v74(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c4(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v12(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v77(x, True),
+                _v78(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v78(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v79(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v79(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v77(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v10(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "compensation matrix document" in x:
+            e = _v80(x["compensation matrix document"], stop)
+            if e:
+                errors = _child_errors(errors, "compensation matrix document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v80(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v81(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v81(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v82(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v82(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimension identifier" in x:
+            e = _v12(x["dimension identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "dimension identifier", e)
+                if stop:
+                    return errors
+        if "matrix aggregate document" in x:
+            e = _v83(x["matrix aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "matrix aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v83(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "matrix document" in x:
+            e = _v84(x["matrix document"], stop)
+            if e:
+                errors = _child_errors(errors, "matrix document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v84(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v85(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v85(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v86(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v86(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimension identifier" in x:
+            e = _v12(x["dimension identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "dimension identifier", e)
+                if stop:
+                    return errors
+        if "compensation value" in x:
+            e = _v87(x["compensation value"], stop)
+            if e:
+                errors = _child_errors(errors, "compensation value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v87(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v88(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v88(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v89(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v89(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "(unitless)":
+        errors = _error(errors, "const", "'(unitless)' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v8(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement aggregate document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'measurement aggregate document' is a required property",
+            )
+            if stop:
+                return errors
+        if "analyst" in x:
+            e = _v12(x["analyst"], stop)
+            if e:
+                errors = _child_errors(errors, "analyst", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v90(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "measurement aggregate document" in x:
+            e = _v91(x["measurement aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement aggregate document", e)
+                if stop:
+                    return errors
+        if "submitter" in x:
+            e = _v12(x["submitter"], stop)
+            if e:
+                errors = _child_errors(errors, "submitter", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v91(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement document" not in x:
+            errors = _error(
+                errors, "required", "'measurement document' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data aggregate document" in x:
+            e = _v92(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v93(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "diagnostic trace aggregate document" in x:
+            e = _v94(x["diagnostic trace aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "diagnostic trace aggregate document", e)
+                if stop:
+                    return errors
+        if "error aggregate document" in x:
+            e = _v95(x["error aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "error aggregate document", e)
+                if stop:
+                    return errors
+        if "image aggregate document" in x:
+            e = _v96(x["image aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "image aggregate document", e)
+                if stop:
+                    return errors
+        if "measurement document" in x:
+            e = _v97(x["measurement document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v98(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v99(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v99(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v100(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v100(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistics document" in x:
+            e = _v101(x["statistics document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v101(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v102(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v102(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistical feature" not in x:
+            errors = _error(
+                errors, "required", "'statistical feature' is a required property"
+            )
+            if stop:
+                return errors
+        if "statistical feature" in x:
+            e = _v103(x["statistical feature"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v103(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v104(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v104(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c6):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['BET C constant', 'Raman intensity', 'Raman interferogram intensity', 'Raman wavenumber shift', 'Young modulus', 'abrasion weight', 'absolute intensity', 'absolute water content', 'absorbance', 'acquisition volume', 'actual P/P0 result', 'adsorbed volume at STP', 'ambient humidity', 'ambient pressure', 'ambient temperature', 'amount of substance', 'angle', 'angle of optical rotation', 'angular velocity', 'area', 'attenuation coefficient', 'average dead cell diameter (cell counter)', 'average particle size', 'average total cell circularity', 'average total cell diameter', 'average viable cell circularity', 'background corrected turbidity', 'birefringence', 'break strain', 'break stress', 'cell path length', 'chemical shift', 'chromatography column film thickness', 'chromatography column length', 'chromatography column particle size', 'circularity', 'coating gap height', 'collision energy', 'column inner diameter', 'compartment temperature', 'concentration', 'container diameter', 'container height', 'degassed sample weight', 'detector view volume', 'diameter', 'dielectric polarization', 'dilution factor', 'dilution volume', 'dispensed volume', 'dry gas flow rate', 'dry sample weight', 'eccentricity', 'electric charge', 'electric conductance', 'electric conductivity', 'electric current', 'electric impedance', 'electric resistance', 'electric resistivity', 'electron beam working distance', 'end height', 'energy (datum)', 'enthalpy', 'enthalpy of fusion', 'enthalpy of sublimation', 'enthalpy of vaporization', 'exhaust gas flow rate', 'extrapolated moisture content', 'fill depth', 'flow rate', 'flow ratio', 'fluorescence', 'foam height', 'force', 'fracture energy', 'glass transition temperature', 'gloss', 'gross weight', 'hardness', 'heat capacity', 'heat capacity (dsc)', 'heat flow', 'heat seal length', 'heat transfer coefficient', 'height', 'hold-up volume', 'humidity', 'image height', 'image width', 'incident radiation angle', 'inlet gas pressure', 'inner diameter', 'intensity', 'isocyanate reservoir temperature', 'length', 'linear velocity', 'liquid height', 'luminescence', 'm/z', 'mass', 'mass attenuation coefficient', 'mass change', 'mass concentration', 'mass fraction', 'measurement chamber free space volume', 'molar attenuation coefficient', 'molar concentration', 'molar enthalpy of fusion', 'molar enthalpy of sublimation', 'molar enthalpy of vaporization', 'molar mass', 'molecular mass', 'monolayer quantity', 'normalized foam height', 'number concentration', 'osmolality', 'pCO2', 'pCO2 (bga)', 'pH', 'pO2', 'pO2 (bga)', 'partial pressure', 'particle size', 'peak analyte amount', 'peak load force', 'peak onset temperature', 'peak temperature', 'plate heater temperature', 'plate temperature', 'plate well count', 'polarity', 'polyol reservoir temperature', 'position count', 'power', 'pressure', 'probe volume', 'protein attenuation coefficient', 'purity', 'qNMR purity result', 'reference material weight', 'reflectance', 'refractive index', 'relative humidity', 'relative intensity', 'relative permittivity', 'relative pressure (BET)', 'relative response', 'relative weight loss on drying', 'reservoir temperature', 'rotational speed', 'sample temperature', 'sample thickness', 'sample weight', 'sample weight before drying', 'sample width', 'saturated gas flow rate', 'saturation vapor pressure', 'seal initiation temperature', 'size (datum)', 'solvent reservoir temperature', 'specific enthalpy of fusion', 'specific enthalpy of sublimation', 'specific enthalpy of vaporization', 'specific heat capacity', 'specific rotation', 'specific surface area', 'start height', 'stirring rate', 'strain', 'stress', 'tablet thickness', 'tare weight', 'temperature', 'temperature rate', 'thermal conductance', 'thermal conductivity', 'thickness', 'titer', 'torque', 'total cell diameter', 'total foam height', 'total gas flow rate', 'total material height', 'transition enthalpy', 'transmittance', 'turbidity', 'velocity', 'viscosity', 'void volume', 'voltage', 'voltage range', 'volume', 'volume concentration', 'volume fraction', 'water mass concentration', 'water mass fraction', 'wavelength', 'wavenumber', 'weight loss', 'well volume', 'width', 'yield strain', 'yield stress']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v98(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v105(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v105(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" not in x:
+            errors = _error(
+                errors, "required", "'processed data document' is a required property"
+            )
+            if stop:
+                return errors
+        if "custom information aggregate document" in x:
+            e = _v106(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v107(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "processed data document" in x:
+            e = _v108(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v108(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v109(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v109(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v110(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v111(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@index" in x:
+            e = _v112(x["@index"], stop)
+            if e:
+                errors = _child_errors(errors, "@index", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v112(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    if x.__class__ is float or _is_number(x):
+        if x < 1:
+            errors = _error(
+                errors, "minimum", repr(x) + " is less than the minimum of 1"
+            )
+            if stop:
+                return errors
+        if x > 2147483647:
+            errors = _error(
+                errors,
+                "maximum",
+                repr(x) + " is greater than the maximum of 2147483647",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v110(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v113(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data processing document" in x:
+            e = _v114(x["data processing document"], stop)
+            if e:
+                errors = _child_errors(errors, "data processing document", e)
+                if stop:
+                    return errors
+        if "data source aggregate document" in x:
+            e = _v115(x["data source aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source aggregate document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v116(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "processed data identifier" in x:
+            e = _v12(x["processed data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data identifier", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v116(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v117(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v117(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "written name" not in x:
+            errors = _error(errors, "required", "'written name' is a required property")
+            if stop:
+                return errors
+        if "start time" in x:
+            e = _v118(x["start time"], stop)
+            if e:
+                errors = _child_errors(errors, "start time", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v12(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v118(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v119(x, True),
+                _v120(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v120(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v121(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v121(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c4(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v119(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c4(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v115(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v122(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v122(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data source document" not in x:
+            errors = _error(
+                errors, "required", "'data source document' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source document" in x:
+            e = _v123(x["data source document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v123(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v124(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v124(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v125(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v125(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data source identifier" not in x:
+            errors = _error(
+                errors, "required", "'data source identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source feature" in x:
+            e = _v12(x["data source feature"], stop)
+            if e:
+                errors = _child_errors(errors, "data source feature", e)
+                if stop:
+                    return errors
+        if "data source identifier" in x:
+            e = _v12(x["data source identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data source identifier", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v114(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v113(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v126(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'custom information document' is a required property",
+            )
+            if stop:
+                return errors
+        if "custom information document" in x:
+            e = _v127(x["custom information document"], stop)
+            if e:
+                errors = _child_errors(errors, "custom information document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v127(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v128(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v128(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v129(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v130(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v130(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v131(x, True),
+                _v132(x, True),
+                _v133(x, True),
+                _v134(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c7[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v134(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar boolean datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar boolean datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar boolean datum" in x:
+            e = _v135(x["scalar boolean datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar boolean datum", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v135(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v136(x, True),
+                _v137(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c8[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v137(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v138(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v138(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v136(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v133(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar timestamp datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar timestamp datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar timestamp datum" in x:
+            e = _v118(x["scalar timestamp datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar timestamp datum", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v132(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar string datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar string datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar string datum" in x:
+            e = _v12(x["scalar string datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar string datum", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v131(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "scalar double datum" not in x:
+            errors = _error(
+                errors, "required", "'scalar double datum' is a required property"
+            )
+            if stop:
+                return errors
+        if "scalar double datum" in x:
+            e = _v139(x["scalar double datum"], stop)
+            if e:
+                errors = _child_errors(errors, "scalar double datum", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v12(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v139(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v140(x, True),
+                _v141(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c9[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v141(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v142(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v142(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v140(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v129(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "datum label" not in x:
+            errors = _error(errors, "required", "'datum label' is a required property")
+            if stop:
+                return errors
+        if "datum label" in x:
+            e = _v12(x["datum label"], stop)
+            if e:
+                errors = _child_errors(errors, "datum label", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v107(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v117(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v106(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v97(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v143(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v143(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "sample document" not in x:
+            errors = _error(
+                errors, "required", "'sample document' is a required property"
+            )
+            if stop:
+                return errors
+        if "device control aggregate document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'device control aggregate document' is a required property",
+            )
+            if stop:
+                return errors
+        if "analytical method identifier" in x:
+            e = _v12(x["analytical method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "analytical method identifier", e)
+                if stop:
+                    return errors
+        if "calculated data aggregate document" in x:
+            e = _v144(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v145(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "detection type" in x:
+            e = _v12(x["detection type"], stop)
+            if e:
+                errors = _child_errors(errors, "detection type", e)
+                if stop:
+                    return errors
+        if "device control aggregate document" in x:
+            e = _v146(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v147(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "error aggregate document" in x:
+            e = _v148(x["error aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "error aggregate document", e)
+                if stop:
+                    return errors
+        if "experimental data identifier" in x:
+            e = _v12(x["experimental data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "experimental data identifier", e)
+                if stop:
+                    return errors
+        if "image aggregate document" in x:
+            e = _v149(x["image aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "image aggregate document", e)
+                if stop:
+                    return errors
+        if "measurement identifier" in x:
+            e = _v12(x["measurement identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement identifier", e)
+                if stop:
+                    return errors
+        if "measurement time" in x:
+            e = _v13(x["measurement time"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement time", e)
+                if stop:
+                    return errors
+        if "method version" in x:
+            e = _v12(x["method version"], stop)
+            if e:
+                errors = _child_errors(errors, "method version", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v150(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "sample document" in x:
+            e = _v151(x["sample document"], stop)
+            if e:
+                errors = _child_errors(errors, "sample document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v152(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v152(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v100(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v151(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "sample identifier" not in x:
+            errors = _error(
+                errors, "required", "'sample identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "batch identifier" in x:
+            e = _v12(x["batch identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "batch identifier", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v153(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "location identifier" in x:
+            e = _v12(x["location identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "location identifier", e)
+                if stop:
+                    return errors
+        if "sample identifier" in x:
+            e = _v12(x["sample identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "sample identifier", e)
+                if stop:
+                    return errors
+        if "sample role type" in x:
+            e = _v154(x["sample role type"], stop)
+            if e:
+                errors = _child_errors(errors, "sample role type", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v12(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v154(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v155(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v155(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c10):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['control sample role', 'standard sample role', 'validation sample role', 'experiment sample role', 'sample role', 'spiked sample role', 'blank role', 'unknown sample role', 'calibration sample role', 'unspiked sample role', 'specimen role', 'quality control sample role', 'reference sample role']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v153(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v150(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v105(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v149(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v156(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v156(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "image document" in x:
+            e = _v157(x["image document"], stop)
+            if e:
+                errors = _child_errors(errors, "image document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v157(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v158(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v158(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "experimental data identifier" in x:
+            e = _v12(x["experimental data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "experimental data identifier", e)
+                if stop:
+                    return errors
+        if "index" in x:
+            e = _v159(x["index"], stop)
+            if e:
+                errors = _child_errors(errors, "index", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v159(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v160(x, True),
+                _v161(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c11[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v161(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v40(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v162(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v162(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v160(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v148(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v163(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v163(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "error document" in x:
+            e = _v164(x["error document"], stop)
+            if e:
+                errors = _child_errors(errors, "error document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v164(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v165(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v165(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "error" not in x:
+            errors = _error(errors, "required", "'error' is a required property")
+            if stop:
+                return errors
+        if "error" in x:
+            e = _v12(x["error"], stop)
+            if e:
+                errors = _child_errors(errors, "error", e)
+                if stop:
+                    return errors
+        if "error feature" in x:
+            e = _v12(x["error feature"], stop)
+            if e:
+                errors = _child_errors(errors, "error feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v147(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v117(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v146(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" not in x:
+            errors = _error(
+                errors, "required", "'device control document' is a required property"
+            )
+            if stop:
+                return errors
+        if "custom information aggregate document" in x:
+            e = _v166(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "device control document" in x:
+            e = _v167(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v167(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v168(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v168(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v169(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v169(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device type" not in x:
+            errors = _error(errors, "required", "'device type' is a required property")
+            if stop:
+                return errors
+        if "brand name" in x:
+            e = _v12(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v170(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "detection type" in x:
+            e = _v12(x["detection type"], stop)
+            if e:
+                errors = _child_errors(errors, "detection type", e)
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v12(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "device type" in x:
+            e = _v12(x["device type"], stop)
+            if e:
+                errors = _child_errors(errors, "device type", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v12(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v12(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v12(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v12(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v170(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v166(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v145(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v144(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v171(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v171(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "calculated data document" not in x:
+            errors = _error(
+                errors, "required", "'calculated data document' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data document" in x:
+            e = _v172(x["calculated data document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v172(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v173(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v173(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v174(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v174(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "calculated data name" not in x:
+            errors = _error(
+                errors, "required", "'calculated data name' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated result" not in x:
+            errors = _error(
+                errors, "required", "'calculated result' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data identifier" in x:
+            e = _v12(x["calculated data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data identifier", e)
+                if stop:
+                    return errors
+        if "calculated data name" in x:
+            e = _v12(x["calculated data name"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data name", e)
+                if stop:
+                    return errors
+        if "calculated result" in x:
+            e = _v175(x["calculated result"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated result", e)
+                if stop:
+                    return errors
+        if "calculation description" in x:
+            e = _v12(x["calculation description"], stop)
+            if e:
+                errors = _child_errors(errors, "calculation description", e)
+                if stop:
+                    return errors
+        if "data source aggregate document" in x:
+            e = _v176(x["data source aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source aggregate document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v177(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v177(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v117(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v176(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v122(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v175(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v44(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v96(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v156(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v95(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v163(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v94(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "custom information aggregate document" in x:
+            e = _v178(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "diagnostic trace document" in x:
+            e = _v179(x["diagnostic trace document"], stop)
+            if e:
+                errors = _child_errors(errors, "diagnostic trace document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v179(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v180(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v180(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "description" not in x:
+            errors = _error(errors, "required", "'description' is a required property")
+            if stop:
+                return errors
+        if "custom information aggregate document" in x:
+            e = _v181(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        for k, v in x.items():
+            if _c12.search(k):
+                e = _v182(v, stop)
+                if e:
+                    errors = _child_errors(errors, k, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v182(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v183(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v183(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v184(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+        if "data" in x:
+            e = _v185(x["data"], stop)
+            if e:
+                errors = _child_errors(errors, "data", e)
+                if stop:
+                    return errors
+        if "label" in x:
+            e = _v186(x["label"], stop)
+            if e:
+                errors = _child_errors(errors, "label", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v186(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v185(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v187(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v188(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v188(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v189(x, True),
+                _v190(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c13[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v190(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "points" not in x:
+            errors = _error(errors, "required", "'points' is a required property")
+            if stop:
+                return errors
+        if "points" in x:
+            e = _v191(x["points"], stop)
+            if e:
+                errors = _child_errors(errors, "points", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v191(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v192(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v192(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v193(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v193(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v194(x, True),
+                _v195(x, True),
+                _v196(x, True),
+                _v197(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c14[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v197(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v196(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v195(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v194(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v189(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measures" not in x:
+            errors = _error(errors, "required", "'measures' is a required property")
+            if stop:
+                return errors
+        if "measures" in x:
+            e = _v198(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v198(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v199(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v199(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v200(x, True),
+                _v201(x, True),
+                _v202(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c15[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v202(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str) or v is None):
+                e = _v203(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v203(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v204(x, True) and _v205(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v205(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v204(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v201(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, bool) or v is None):
+                e = _v206(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v206(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v207(x, True) and _v208(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v208(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v207(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v200(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not ((v.__class__ is float or _is_number(v)) or v is None):
+                e = _v209(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v209(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v210(x, True) and _v211(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v211(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v210(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v187(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" not in x:
+            errors = _error(errors, "required", "'dimensions' is a required property")
+            if stop:
+                return errors
+        if "dimensions" in x:
+            e = _v212(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v212(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v213(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v213(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v214(x, True),
+                _v215(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c16[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v215(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "incr" in x:
+            e = _v216(x["incr"], stop)
+            if e:
+                errors = _child_errors(errors, "incr", e)
+                if stop:
+                    return errors
+        if "length" in x:
+            e = _v217(x["length"], stop)
+            if e:
+                errors = _child_errors(errors, "length", e)
+                if stop:
+                    return errors
+        if "start" in x:
+            e = _v218(x["start"], stop)
+            if e:
+                errors = _child_errors(errors, "start", e)
+                if stop:
+                    return errors
+        if "type" in x:
+            e = _v219(x["type"], stop)
+            if e:
+                errors = _child_errors(errors, "type", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v219(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c17):
+        errors = _error(
+            errors, "enum", repr(x) + " is not one of ['linear', 'logarithmic']"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v218(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v217(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v216(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v214(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v220(x, True),
+                _v221(x, True),
+                _v222(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c18[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v222(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str)):
+                e = _v223(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v223(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v221(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, bool)):
+                e = _v224(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v224(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v220(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (v.__class__ is float or _is_number(v)):
+                e = _v225(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v225(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v184(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "dimensions" not in x:
+            errors = _error(errors, "required", "'dimensions' is a required property")
+            if stop:
+                return errors
+        if "measures" not in x:
+            errors = _error(errors, "required", "'measures' is a required property")
+            if stop:
+                return errors
+        if "dimensions" in x:
+            e = _v226(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v227(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v227(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v228(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if not _is_unique(x):
+            errors = _error(errors, "uniqueItems", repr(x) + " has non-unique elements")
+            if stop:
+                return errors
+    return errors
+
+
+def _v228(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@componentDatatype" not in x:
+            errors = _error(
+                errors, "required", "'@componentDatatype' is a required property"
+            )
+            if stop:
+                return errors
+        if "concept" not in x:
+            errors = _error(errors, "required", "'concept' is a required property")
+            if stop:
+                return errors
+        if "$asm.fill-value" in x:
+            e = _v229(x["$asm.fill-value"], stop)
+            if e:
+                errors = _child_errors(errors, "$asm.fill-value", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v230(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+        if "concept" in x:
+            e = _v40(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "scale" in x:
+            e = _v231(x["scale"], stop)
+            if e:
+                errors = _child_errors(errors, "scale", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v46(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    e = _v232(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v233(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v234(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v235(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v235(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v236(x, True) is None:
+        pass
+    return errors
+
+
+def _v236(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v237(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v237(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c19.search(x):
+            errors = _error(
+                errors, "pattern", repr(x) + " does not match 'string|dateTime|date'"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v234(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v238(x, True) is None:
+        pass
+    return errors
+
+
+def _v238(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v239(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v239(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "boolean":
+        errors = _error(errors, "const", "'boolean' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v233(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v240(x, True) is None:
+        pass
+    return errors
+
+
+def _v240(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v241(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v241(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c20.search(x):
+            errors = _error(
+                errors,
+                "pattern",
+                repr(x) + " does not match 'integer|decimal|long|int|short|byte'",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v232(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v242(x, True) is None:
+        pass
+    return errors
+
+
+def _v242(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v243(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v243(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c21.search(x):
+            errors = _error(
+                errors, "pattern", repr(x) + " does not match 'double|float'"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v231(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c22):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['nominal', 'ordinal', 'cardinal', 'interval', 'range']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v230(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c23):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['double', 'float', 'decimal', 'integer', 'byte', 'int', 'short', 'long', 'string', 'boolean', 'dateTime']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v229(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool | str)):
+        errors = _error(
+            errors,
+            "type",
+            repr(x) + " is not of type 'string', 'number', 'integer', 'boolean'",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v226(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v228(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if not _is_unique(x):
+            errors = _error(errors, "uniqueItems", repr(x) + " has non-unique elements")
+            if stop:
+                return errors
+    return errors
+
+
+def _v181(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v178(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v93(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v92(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v171(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v90(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v117(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v4(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "analysis sequence document" in x:
+            e = _v244(x["analysis sequence document"], stop)
+            if e:
+                errors = _child_errors(errors, "analysis sequence document", e)
+                if stop:
+                    return errors
+        if "calculated data aggregate document" in x:
+            e = _v245(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v246(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data system document" in x:
+            e = _v247(x["data system document"], stop)
+            if e:
+                errors = _child_errors(errors, "data system document", e)
+                if stop:
+                    return errors
+        if "device system document" in x:
+            e = _v248(x["device system document"], stop)
+            if e:
+                errors = _child_errors(errors, "device system document", e)
+                if stop:
+                    return errors
+        if "electronic project record" in x:
+            e = _v249(x["electronic project record"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic project record", e)
+                if stop:
+                    return errors
+        if "electronic signature aggregate document" in x:
+            e = _v250(x["electronic signature aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic signature aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v251(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v252(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v252(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v100(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v251(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v105(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v250(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v253(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v253(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "electronic signature document" in x:
+            e = _v254(x["electronic signature document"], stop)
+            if e:
+                errors = _child_errors(errors, "electronic signature document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v254(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v255(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v255(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v256(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v257(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v257(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v258(x, True) and _v259(x, True) and _v260(x, True) and _v261(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v261(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "method identifier" not in x:
+            errors = _error(
+                errors, "required", "'method identifier' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v260(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "processed data identifier" not in x:
+            errors = _error(
+                errors, "required", "'processed data identifier' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v259(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measurement identifier" not in x:
+            errors = _error(
+                errors, "required", "'measurement identifier' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v258(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "identifier" not in x:
+            errors = _error(errors, "required", "'identifier' is a required property")
+            if stop:
+                return errors
+    return errors
+
+
+def _v256(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "account identifier" not in x:
+            errors = _error(
+                errors, "required", "'account identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "personal name" not in x:
+            errors = _error(
+                errors, "required", "'personal name' is a required property"
+            )
+            if stop:
+                return errors
+        if "signature role type" not in x:
+            errors = _error(
+                errors, "required", "'signature role type' is a required property"
+            )
+            if stop:
+                return errors
+        if "time" not in x:
+            errors = _error(errors, "required", "'time' is a required property")
+            if stop:
+                return errors
+        if "account identifier" in x:
+            e = _v12(x["account identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "account identifier", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v12(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "measurement identifier" in x:
+            e = _v12(x["measurement identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement identifier", e)
+                if stop:
+                    return errors
+        if "method identifier" in x:
+            e = _v12(x["method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "method identifier", e)
+                if stop:
+                    return errors
+        if "personal name" in x:
+            e = _v12(x["personal name"], stop)
+            if e:
+                errors = _child_errors(errors, "personal name", e)
+                if stop:
+                    return errors
+        if "processed data identifier" in x:
+            e = _v12(x["processed data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data identifier", e)
+                if stop:
+                    return errors
+        if "signature role type" in x:
+            e = _v12(x["signature role type"], stop)
+            if e:
+                errors = _child_errors(errors, "signature role type", e)
+                if stop:
+                    return errors
+        if "time" in x:
+            e = _v12(x["time"], stop)
+            if e:
+                errors = _child_errors(errors, "time", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v249(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v117(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v248(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "asset management identifier" in x:
+            e = _v12(x["asset management identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "asset management identifier", e)
+                if stop:
+                    return errors
+        if "brand name" in x:
+            e = _v12(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v262(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "device document" in x:
+            e = _v263(x["device document"], stop)
+            if e:
+                errors = _child_errors(errors, "device document", e)
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v12(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v12(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v12(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v12(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v12(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v263(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v264(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v264(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v265(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v111(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v265(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device type" not in x:
+            errors = _error(errors, "required", "'device type' is a required property")
+            if stop:
+                return errors
+        if "brand name" in x:
+            e = _v12(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v266(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v12(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "device type" in x:
+            e = _v12(x["device type"], stop)
+            if e:
+                errors = _child_errors(errors, "device type", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v12(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v12(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v12(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v12(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v12(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v266(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v262(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v247(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "ASM file identifier" not in x:
+            errors = _error(
+                errors, "required", "'ASM file identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "data system instance identifier" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'data system instance identifier' is a required property",
+            )
+            if stop:
+                return errors
+        if "ASM converter name" in x:
+            e = _v12(x["ASM converter name"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM converter name", e)
+                if stop:
+                    return errors
+        if "ASM converter version" in x:
+            e = _v12(x["ASM converter version"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM converter version", e)
+                if stop:
+                    return errors
+        if "ASM file identifier" in x:
+            e = _v12(x["ASM file identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM file identifier", e)
+                if stop:
+                    return errors
+        if "UNC path" in x:
+            e = _v12(x["UNC path"], stop)
+            if e:
+                errors = _child_errors(errors, "UNC path", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v267(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "data system instance identifier" in x:
+            e = _v12(x["data system instance identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data system instance identifier", e)
+                if stop:
+                    return errors
+        if "database primary key" in x:
+            e = _v12(x["database primary key"], stop)
+            if e:
+                errors = _child_errors(errors, "database primary key", e)
+                if stop:
+                    return errors
+        if "file name" in x:
+            e = _v12(x["file name"], stop)
+            if e:
+                errors = _child_errors(errors, "file name", e)
+                if stop:
+                    return errors
+        if "software name" in x:
+            e = _v12(x["software name"], stop)
+            if e:
+                errors = _child_errors(errors, "software name", e)
+                if stop:
+                    return errors
+        if "software version" in x:
+            e = _v12(x["software version"], stop)
+            if e:
+                errors = _child_errors(errors, "software version", e)
+                if stop:
+                    return errors
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v268(x, True),
+                _v269(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c24[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v269(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "database primary key" not in x:
+            errors = _error(
+                errors, "required", "'database primary key' is a required property"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v268(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "UNC path" not in x:
+            errors = _error(errors, "required", "'UNC path' is a required property")
+            if stop:
+                return errors
+        if "file name" not in x:
+            errors = _error(errors, "required", "'file name' is a required property")
+            if stop:
+                return errors
+    return errors
+
+
+def _v267(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v246(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v245(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v171(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v244(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "written name" not in x:
+            errors = _error(errors, "required", "'written name' is a required property")
+            if stop:
+                return errors
+        if "UNC path" in x:
+            e = _v12(x["UNC path"], stop)
+            if e:
+                errors = _child_errors(errors, "UNC path", e)
+                if stop:
+                    return errors
+        if "custom information aggregate document" in x:
+            e = _v270(x["custom information aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "custom information aggregate document", e
+                )
+                if stop:
+                    return errors
+        if "end time" in x:
+            e = _v118(x["end time"], stop)
+            if e:
+                errors = _child_errors(errors, "end time", e)
+                if stop:
+                    return errors
+        if "file name" in x:
+            e = _v12(x["file name"], stop)
+            if e:
+                errors = _child_errors(errors, "file name", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v12(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "method identifier" in x:
+            e = _v12(x["method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "method identifier", e)
+                if stop:
+                    return errors
+        if "method name" in x:
+            e = _v12(x["method name"], stop)
+            if e:
+                errors = _child_errors(errors, "method name", e)
+                if stop:
+                    return errors
+        if "start time" in x:
+            e = _v118(x["start time"], stop)
+            if e:
+                errors = _child_errors(errors, "start time", e)
+                if stop:
+                    return errors
+        if "version number" in x:
+            e = _v12(x["version number"], stop)
+            if e:
+                errors = _child_errors(errors, "version number", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v12(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v270(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v126(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
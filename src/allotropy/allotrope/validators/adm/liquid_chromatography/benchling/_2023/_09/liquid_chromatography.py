@@ -0,0 +1,15948 @@
+"""Validator for http://purl.allotrope.org/json-schemas/adm/liquid-chromatography/BENCHLING/2023/09/liquid-chromatography.tabular.embed.schema, generated by allotropy.schema_gen."""
+
+import re
+from typing import Any
+
+from allotropy.allotrope.native_validation import (
+    child_errors as _child_errors,
+    error as _error,
+    Errors,
+    extend_errors as _extend_errors,
+    FORMAT_CHECKS as _FORMAT_CHECKS,
+    is_integer as _is_integer,
+    is_number as _is_number,
+)
+
+_c0 = (
+    "{'type': 'string', 'format': 'iri'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2023/09/manifest.schema'}",
+)
+_c1 = frozenset(
+    [
+        "arithmetic mean role",
+        "maximum value role",
+        "median role",
+        "minimum value role",
+        "relative standard deviation role",
+        "skewness role",
+        "standard deviation role",
+        "variance role",
+    ]
+)
+_c2 = (
+    "{'type': 'string'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'string'}}, 'required': ['@type', 'value']}",
+)
+_c3 = (
+    "{'properties': {'electropherogram data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0003018', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2023/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}}",
+    "{'properties': {'fluorescence emission profile data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0002965', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2023/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['fluorescence emission profile data cube']}",
+    "{'properties': {'chromatogram data cube': {'$asm.property-class': 'http://purl.allotrope.org/ontologies/result#AFR_0002550', '$asm.pattern': 'datacube', 'type': 'object', 'allOf': [{'$ref': 'http://purl.allotrope.org/json-schemas/adm/core/REC/2023/09/cube.schema#/$defs/tDatacube'}, {'properties': {'cube-structure': {'properties': {'dimensions': {'minItems': 1, 'maxItems': 1, 'prefixItems': [{'oneOf': [{'properties': {'concept': {'const': 'retention time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}, {'properties': {'concept': {'const': 'retention volume'}, 'unit': {'const': 'mL'}, '@componentDatatype': {'const': 'double'}}}]}]}, 'measures': {'minItems': 1, 'maxItems': 1, 'contains': {'oneOf': [{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}]}}}}}}]}}, 'required': ['chromatogram data cube']}",
+)
+_c4 = (
+    "{'properties': {'concept': {'const': 'fluorescence'}, 'unit': {'const': 'RFU'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c5 = (
+    "{'properties': {'concept': {'const': 'retention time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}",
+    "{'properties': {'concept': {'const': 'retention volume'}, 'unit': {'const': 'mL'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c6 = (
+    "{'properties': {'measures': {'type': 'array', 'items': {'$ref': '#/$defs/tMeasureArray'}}}, 'required': ['measures']}",
+    "{'properties': {'points': {'type': 'array', 'items': {'$ref': '#/$defs/tTupleData'}}}, 'required': ['points']}",
+)
+_c7 = (
+    "{'type': 'number'}",
+    "{'type': 'boolean'}",
+    "{'type': 'string'}",
+    "{'type': 'null'}",
+)
+_c8 = (
+    "{'$ref': '#/$defs/tNumberOrNullArray'}",
+    "{'$ref': '#/$defs/tBooleanOrNullArray'}",
+    "{'$ref': '#/$defs/tStringOrNullArray'}",
+)
+_c9 = ("{'$ref': '#/$defs/tDimensionArray'}", "{'$ref': '#/$defs/tFunction'}")
+_c10 = frozenset(["linear", "logarithmic"])
+_c11 = (
+    "{'$ref': '#/$defs/tNumberArray'}",
+    "{'$ref': '#/$defs/tBooleanArray'}",
+    "{'$ref': '#/$defs/tStringArray'}",
+)
+_c12 = re.compile("string|dateTime|date")
+_c13 = re.compile("integer|decimal|long|int|short|byte")
+_c14 = re.compile("double|float")
+_c15 = frozenset(["cardinal", "interval", "nominal", "ordinal", "range"])
+_c16 = frozenset(
+    [
+        "boolean",
+        "byte",
+        "dateTime",
+        "decimal",
+        "double",
+        "float",
+        "int",
+        "integer",
+        "long",
+        "short",
+        "string",
+    ]
+)
+_c17 = (
+    "{'properties': {'concept': {'const': 'elapsed time'}, 'unit': {'const': 's'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c18 = (
+    "{'properties': {'concept': {'const': 'delta column pressure'}, 'unit': {'const': 'MPa'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c19 = (
+    "{'properties': {'concept': {'const': 'column pressure'}, 'unit': {'const': 'MPa'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c20 = (
+    "{'properties': {'concept': {'const': 'sample pressure'}, 'unit': {'const': 'MPa'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c21 = (
+    "{'properties': {'concept': {'const': 'post-column pressure'}, 'unit': {'const': 'MPa'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c22 = (
+    "{'properties': {'concept': {'const': 'pre-column pressure'}, 'unit': {'const': 'MPa'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c23 = (
+    "{'properties': {'concept': {'const': 'solvent concentration'}, 'unit': {'const': '%'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c24 = (
+    "{'properties': {'concept': {'const': 'temperature'}, 'unit': {'const': 'degC'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c25 = (
+    "{'properties': {'concept': {'const': 'sample flow'}, 'unit': {'const': 'CV/h'}, '@componentDatatype': {'const': 'double'}}}",
+    "{'properties': {'concept': {'const': 'sample flow'}, 'unit': {'const': 'mL/min'}, '@componentDatatype': {'const': 'double'}}}",
+    "{'properties': {'concept': {'const': 'sample flow'}, 'unit': {'const': 'cm/s'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c26 = (
+    "{'properties': {'concept': {'const': 'system flow'}, 'unit': {'const': 'CV/h'}, '@componentDatatype': {'const': 'double'}}}",
+    "{'properties': {'concept': {'const': 'system flow'}, 'unit': {'const': 'mL/min'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c27 = (
+    "{'properties': {'concept': {'const': 'electric current'}, 'unit': {'const': 'pA'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c28 = (
+    "{'properties': {'concept': {'const': 'electric charge'}, 'unit': {'const': 'nC'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c29 = (
+    "{'properties': {'concept': {'const': 'voltage'}, 'unit': {'const': 'mV'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c30 = (
+    "{'properties': {'concept': {'const': 'count'}, 'unit': {'const': 'Counts'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c31 = (
+    "{'properties': {'concept': {'const': 'pH'}, 'unit': {'const': 'pH'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c32 = (
+    "{'properties': {'concept': {'const': '% conductivity'}, 'unit': {'const': '%'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c33 = (
+    "{'properties': {'concept': {'const': 'electric conductivity'}, 'unit': {'const': '%'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c34 = (
+    "{'properties': {'concept': {'const': 'electric conductivity'}, 'unit': {'const': 'S/m'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c35 = (
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2023/09/units.schema#/$defs/mAU.s'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2023/09/units.schema#/$defs/mAU.mL'}",
+)
+_c36 = (
+    "{'properties': {'concept': {'const': 'absorbance'}, 'unit': {'const': 'mAU'}, '@componentDatatype': {'const': 'double'}}}",
+)
+_c37 = (
+    "{'properties': {'@componentDatatype': {'default': 'double', 'enum': ['double', 'float']}}}",
+)
+_c38 = frozenset(["double", "float"])
+_c39 = (
+    "{'properties': {'concept': {'const': 'retention time'}, 'unit': {'const': 's'}, '@componentDatatype': {'default': 'double', 'enum': ['double', 'float']}}}",
+    "{'properties': {'concept': {'const': 'retention volume'}, 'unit': {'const': 'mL'}, '@componentDatatype': {'default': 'double', 'enum': ['double', 'float']}}}",
+)
+_c40 = (
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2023/09/units.schema#/$defs/s'}",
+    "{'$ref': 'http://purl.allotrope.org/json-schemas/qudt/REC/2023/09/units.schema#/$defs/mL'}",
+)
+_c41 = (
+    "{'type': 'string', 'format': 'date-time'}",
+    "{'type': 'object', 'properties': {'@type': {'$ref': '#/$defs/tClass'}, 'value': {'type': 'string', 'format': 'date-time'}}, 'required': ['@type', 'value']}",
+)
+_c42 = _FORMAT_CHECKS["date-time"]
+_c43 = frozenset(
+    [
+        "BET C constant",
+        "Raman intensity",
+        "Raman interferogram intensity",
+        "Raman wavenumber shift",
+        "Young modulus",
+        "abrasion weight",
+        "absolute intensity",
+        "absolute water content",
+        "absorbance",
+        "acquisition volume",
+        "actual P/P0 result",
+        "adsorbed volume at STP",
+        "ambient humidity",
+        "ambient pressure",
+        "ambient temperature",
+        "angle",
+        "angle of optical rotation",
+        "angular velocity",
+        "area",
+        "attenuation coefficient",
+        "average particle size",
+        "average total cell diameter",
+        "background corrected turbidity",
+        "birefringence",
+        "break strain",
+        "break stress",
+        "cell path length",
+        "chemical shift",
+        "chromatography column film thickness",
+        "chromatography column length",
+        "chromatography column particle size",
+        "coating gap height",
+        "collision energy",
+        "column inner diameter",
+        "compartment temperature",
+        "concentration",
+        "container diameter",
+        "container height",
+        "degassed sample weight",
+        "detector view volume",
+        "diameter",
+        "dielectric polarization",
+        "dilution factor",
+        "dilution volume",
+        "dry gas flow rate",
+        "dry sample weight",
+        "eccentricity",
+        "electric charge",
+        "electric conductance",
+        "electric conductivity",
+        "electric current",
+        "electric impedance",
+        "electric resistance",
+        "electric resistivity",
+        "electron beam working distance",
+        "end height",
+        "energy (datum)",
+        "enthalpy",
+        "enthalpy of fusion",
+        "enthalpy of sublimation",
+        "enthalpy of vaporization",
+        "exhaust gas flow rate",
+        "extrapolated moisture content",
+        "fill depth",
+        "flow rate",
+        "flow ratio",
+        "fluorescence",
+        "foam height",
+        "force",
+        "fracture energy",
+        "glass transition temperature",
+        "gloss",
+        "gross weight",
+        "hardness",
+        "heat capacity",
+        "heat capacity (dsc)",
+        "heat flow",
+        "heat seal length",
+        "heat transfer coefficient",
+        "height",
+        "hold-up volume",
+        "humidity",
+        "image height",
+        "image width",
+        "incident radiation angle",
+        "inlet gas pressure",
+        "inner diameter",
+        "intensity",
+        "isocyanate reservoir temperature",
+        "length",
+        "linear velocity",
+        "liquid height",
+        "luminescence",
+        "m/z",
+        "mass",
+        "mass change",
+        "mass concentration",
+        "mass fraction",
+        "measurement chamber free space volume",
+        "molar absorptivity",
+        "molar concentration",
+        "molar enthalpy of fusion",
+        "molar enthalpy of sublimation",
+        "molar enthalpy of vaporization",
+        "molar mass",
+        "molecular mass",
+        "monolayer quantity",
+        "normalized foam height",
+        "osmolality",
+        "pH",
+        "partial pressure",
+        "particle size",
+        "peak analyte amount",
+        "peak load force",
+        "peak onset temperature",
+        "peak temperature",
+        "plate heater temperature",
+        "plate temperature",
+        "plate well count",
+        "polarity",
+        "polyol reservoir temperature",
+        "position count",
+        "power",
+        "pressure",
+        "protein attenuation coefficient",
+        "purity",
+        "qNMR purity result",
+        "quality quantification facet",
+        "reference material weight",
+        "reflectance",
+        "refractive index",
+        "relative humidity",
+        "relative intensity",
+        "relative permittivity",
+        "relative pressure (BET)",
+        "relative response",
+        "relative weight loss on drying",
+        "reservoir temperature",
+        "sample temperature",
+        "sample thickness",
+        "sample weight",
+        "sample weight before drying",
+        "sample width",
+        "saturated gas flow rate",
+        "saturation vapor pressure",
+        "size (datum)",
+        "solvent reservoir temperature",
+        "specific enthalpy of fusion",
+        "specific enthalpy of sublimation",
+        "specific enthalpy of vaporization",
+        "specific heat capacity",
+        "specific rotation",
+        "specific surface area",
+        "start height",
+        "stirring rate",
+        "strain",
+        "stress",
+        "tablet thickness",
+        "tare weight",
+        "temperature",
+        "temperature rate",
+        "thermal conductance",
+        "thermal conductivity",
+        "thickness",
+        "titer",
+        "total cell diameter",
+        "total foam height",
+        "total gas flow rate",
+        "total material height",
+        "transition enthalpy",
+        "transmittance",
+        "turbidity",
+        "velocity",
+        "viscosity",
+        "voltage",
+        "voltage range",
+        "volume",
+        "volume concentration",
+        "volume fraction",
+        "water mass concentration",
+        "water mass fraction",
+        "wavelength",
+        "wavenumber",
+        "weight loss",
+        "well volume",
+        "width",
+        "yield strain",
+        "yield stress",
+    ]
+)
+_c44 = re.compile("data cube$")
+_c45 = frozenset(
+    [
+        "blank role",
+        "calibration sample role",
+        "control sample role",
+        "experiment sample role",
+        "quality control sample role",
+        "reference sample role",
+        "sample role",
+        "specimen role",
+        "spiked sample role",
+        "standard sample role",
+        "unknown sample role",
+        "unspiked sample role",
+        "validation sample role",
+    ]
+)
+
+
+def validate(instance: Any) -> Errors:
+    return _v1(instance, False) or []
+
+
+def _valid(x: Any, stop: bool) -> Errors | None:
+    return None
+
+
+def _v1(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "$asm.manifest" not in x:
+            errors = _error(
+                errors, "required", "'$asm.manifest' is a required property"
+            )
+            if stop:
+                return errors
+    e = _v2(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v3(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v3(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "$asm.manifest" in x:
+            e = _v4(x["$asm.manifest"], stop)
+            if e:
+                errors = _child_errors(errors, "$asm.manifest", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v4(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v5(x, True),
+                _v6(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c0[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v6(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "vocabulary" not in x:
+            errors = _error(errors, "required", "'vocabulary' is a required property")
+            if stop:
+                return errors
+        if "json-schemas" not in x:
+            errors = _error(errors, "required", "'json-schemas' is a required property")
+            if stop:
+                return errors
+        if "@id" in x:
+            e = _v7(x["@id"], stop)
+            if e:
+                errors = _child_errors(errors, "@id", e)
+                if stop:
+                    return errors
+        if "@type" in x:
+            e = _v8(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "vocabulary" in x:
+            e = _v9(x["vocabulary"], stop)
+            if e:
+                errors = _child_errors(errors, "vocabulary", e)
+                if stop:
+                    return errors
+        if "shapes" in x:
+            e = _v10(x["shapes"], stop)
+            if e:
+                errors = _child_errors(errors, "shapes", e)
+                if stop:
+                    return errors
+        if "json-schemas" in x:
+            e = _v11(x["json-schemas"], stop)
+            if e:
+                errors = _child_errors(errors, "json-schemas", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v11(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v12(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v12(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v10(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v13(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v13(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v9(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v14(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v14(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v8(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v7(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v5(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v2(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "liquid chromatography aggregate document" in x:
+            e = _v15(x["liquid chromatography aggregate document"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "liquid chromatography aggregate document", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v15(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v16(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v17(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v17(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "liquid chromatography document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'liquid chromatography document' is a required property",
+            )
+            if stop:
+                return errors
+        if "device system document" in x:
+            e = _v18(x["device system document"], stop)
+            if e:
+                errors = _child_errors(errors, "device system document", e)
+                if stop:
+                    return errors
+        if "liquid chromatography document" in x:
+            e = _v19(x["liquid chromatography document"], stop)
+            if e:
+                errors = _child_errors(errors, "liquid chromatography document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v19(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "analyst" not in x:
+            errors = _error(errors, "required", "'analyst' is a required property")
+            if stop:
+                return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v20(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v20(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v21(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v22(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v22(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement aggregate document" in x:
+            e = _v23(x["measurement aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v23(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement document" in x:
+            e = _v24(x["measurement document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement document", e)
+                if stop:
+                    return errors
+        if "fraction aggregate document" in x:
+            e = _v25(x["fraction aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "fraction aggregate document", e)
+                if stop:
+                    return errors
+        if "log aggregate document" in x:
+            e = _v26(x["log aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "log aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v26(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "log document" not in x:
+            errors = _error(errors, "required", "'log document' is a required property")
+            if stop:
+                return errors
+        if "log document" in x:
+            e = _v27(x["log document"], stop)
+            if e:
+                errors = _child_errors(errors, "log document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v27(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v28(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v28(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v29(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v29(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "index" in x:
+            e = _v30(x["index"], stop)
+            if e:
+                errors = _child_errors(errors, "index", e)
+                if stop:
+                    return errors
+        if "retention time" in x:
+            e = _v31(x["retention time"], stop)
+            if e:
+                errors = _child_errors(errors, "retention time", e)
+                if stop:
+                    return errors
+        if "retention volume" in x:
+            e = _v32(x["retention volume"], stop)
+            if e:
+                errors = _child_errors(errors, "retention volume", e)
+                if stop:
+                    return errors
+        if "method identifier" in x:
+            e = _v30(x["method identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "method identifier", e)
+                if stop:
+                    return errors
+        if "log entry" in x:
+            e = _v30(x["log entry"], stop)
+            if e:
+                errors = _child_errors(errors, "log entry", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v32(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v34(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v34(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v35(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v35(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v33(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "value" in x:
+            e = _v36(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v37(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "has statistic datum role" in x:
+            e = _v38(x["has statistic datum role"], stop)
+            if e:
+                errors = _child_errors(errors, "has statistic datum role", e)
+                if stop:
+                    return errors
+        if "@type" in x:
+            e = _v39(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v39(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v38(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c1):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['arithmetic mean role', 'median role', 'relative standard deviation role', 'skewness role', 'standard deviation role', 'variance role', 'maximum value role', 'minimum value role']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v37(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v36(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v31(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v40(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v41(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v41(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v30(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v42(x, True),
+                _v43(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c2[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v43(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v39(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v44(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v44(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v42(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v25(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "fraction document" not in x:
+            errors = _error(
+                errors, "required", "'fraction document' is a required property"
+            )
+            if stop:
+                return errors
+        if "fraction document" in x:
+            e = _v45(x["fraction document"], stop)
+            if e:
+                errors = _child_errors(errors, "fraction document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v45(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v46(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v46(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v47(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v47(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "index" in x:
+            e = _v30(x["index"], stop)
+            if e:
+                errors = _child_errors(errors, "index", e)
+                if stop:
+                    return errors
+        if "retention time" in x:
+            e = _v48(x["retention time"], stop)
+            if e:
+                errors = _child_errors(errors, "retention time", e)
+                if stop:
+                    return errors
+        if "retention volume" in x:
+            e = _v49(x["retention volume"], stop)
+            if e:
+                errors = _child_errors(errors, "retention volume", e)
+                if stop:
+                    return errors
+        if "fraction role" in x:
+            e = _v30(x["fraction role"], stop)
+            if e:
+                errors = _child_errors(errors, "fraction role", e)
+                if stop:
+                    return errors
+        if "field type" in x:
+            e = _v30(x["field type"], stop)
+            if e:
+                errors = _child_errors(errors, "field type", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v49(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v34(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v48(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v24(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v50(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v50(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v51(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v52(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v52(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if (
+        _v53(x, True)
+        and _v54(x, True)
+        and _v55(x, True)
+        and _v56(x, True)
+        and _v57(x, True)
+        and _v58(x, True)
+        and _v59(x, True)
+        and _v60(x, True)
+        and _v61(x, True)
+        and _v62(x, True)
+        and _v63(x, True)
+        and _v64(x, True)
+        and _v65(x, True)
+    ):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v65(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v66(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v67(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v68(x, True),
+                _v69(x, True),
+                _v70(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c3[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v70(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatogram data cube" not in x:
+            errors = _error(
+                errors, "required", "'chromatogram data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "chromatogram data cube" in x:
+            e = _v71(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v71(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v73(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v73(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v74(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v74(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v75(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v76(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v76(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v77(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v77(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v78(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c4[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v78(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v79(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v80(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v81(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v81(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v80(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v79(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "fluorescence":
+        errors = _error(errors, "const", "'fluorescence' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v75(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v82(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v82(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v83(x, True),
+                _v84(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v84(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v85(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v86(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v87(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v87(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v86(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v85(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v83(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v88(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v89(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v90(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v90(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v89(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v88(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v72(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "label" in x:
+            e = _v91(x["label"], stop)
+            if e:
+                errors = _child_errors(errors, "label", e)
+                if stop:
+                    return errors
+        if "cube-structure" in x:
+            e = _v92(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+        if "data" in x:
+            e = _v93(x["data"], stop)
+            if e:
+                errors = _child_errors(errors, "data", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v93(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v94(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v95(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v95(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v96(x, True),
+                _v97(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c6[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v97(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "points" not in x:
+            errors = _error(errors, "required", "'points' is a required property")
+            if stop:
+                return errors
+        if "points" in x:
+            e = _v98(x["points"], stop)
+            if e:
+                errors = _child_errors(errors, "points", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v98(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v99(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v99(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v100(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v100(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v101(x, True),
+                _v102(x, True),
+                _v103(x, True),
+                _v104(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c7[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v104(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v103(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v102(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v101(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v96(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measures" not in x:
+            errors = _error(errors, "required", "'measures' is a required property")
+            if stop:
+                return errors
+        if "measures" in x:
+            e = _v105(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v105(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v106(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v106(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v107(x, True),
+                _v108(x, True),
+                _v109(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c8[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v109(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str) or v is None):
+                e = _v110(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v110(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v111(x, True) and _v112(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v112(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v111(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v108(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, bool) or v is None):
+                e = _v113(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v113(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v114(x, True) and _v115(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v115(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v114(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v107(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not ((v.__class__ is float or _is_number(v)) or v is None):
+                e = _v116(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v116(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v117(x, True) and _v118(x, True):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v118(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x is not None:
+        errors = _error(errors, "type", repr(x) + " is not of type 'null'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v117(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v94(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" not in x:
+            errors = _error(errors, "required", "'dimensions' is a required property")
+            if stop:
+                return errors
+        if "dimensions" in x:
+            e = _v119(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v119(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v120(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v120(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v121(x, True),
+                _v122(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c9[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v122(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "type" in x:
+            e = _v123(x["type"], stop)
+            if e:
+                errors = _child_errors(errors, "type", e)
+                if stop:
+                    return errors
+        if "start" in x:
+            e = _v124(x["start"], stop)
+            if e:
+                errors = _child_errors(errors, "start", e)
+                if stop:
+                    return errors
+        if "length" in x:
+            e = _v125(x["length"], stop)
+            if e:
+                errors = _child_errors(errors, "length", e)
+                if stop:
+                    return errors
+        if "incr" in x:
+            e = _v126(x["incr"], stop)
+            if e:
+                errors = _child_errors(errors, "incr", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v126(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v125(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v124(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v123(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c10):
+        errors = _error(
+            errors, "enum", repr(x) + " is not one of ['linear', 'logarithmic']"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v121(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v127(x, True),
+                _v128(x, True),
+                _v129(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c11[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v129(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, str)):
+                e = _v130(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v130(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v128(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, bool)):
+                e = _v131(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v131(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'boolean'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v127(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (v.__class__ is float or _is_number(v)):
+                e = _v132(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v132(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (x.__class__ is float or _is_number(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'number'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v92(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "dimensions" not in x:
+            errors = _error(errors, "required", "'dimensions' is a required property")
+            if stop:
+                return errors
+        if "measures" not in x:
+            errors = _error(errors, "required", "'measures' is a required property")
+            if stop:
+                return errors
+        if "dimensions" in x:
+            e = _v133(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v134(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v134(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v135(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v135(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@componentDatatype" not in x:
+            errors = _error(
+                errors, "required", "'@componentDatatype' is a required property"
+            )
+            if stop:
+                return errors
+        if "concept" not in x:
+            errors = _error(errors, "required", "'concept' is a required property")
+            if stop:
+                return errors
+        if "@componentDatatype" in x:
+            e = _v136(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+        if "concept" in x:
+            e = _v39(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v37(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "scale" in x:
+            e = _v137(x["scale"], stop)
+            if e:
+                errors = _child_errors(errors, "scale", e)
+                if stop:
+                    return errors
+        if "$asm.fill-value" in x:
+            e = _v138(x["$asm.fill-value"], stop)
+            if e:
+                errors = _child_errors(errors, "$asm.fill-value", e)
+                if stop:
+                    return errors
+    e = _v139(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v140(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v141(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v142(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v142(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v143(x, True) is None:
+        pass
+    return errors
+
+
+def _v143(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v144(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v144(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c12.search(x):
+            errors = _error(
+                errors, "pattern", repr(x) + " does not match 'string|dateTime|date'"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v141(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v145(x, True) is None:
+        pass
+    return errors
+
+
+def _v145(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v146(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v146(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "boolean":
+        errors = _error(errors, "const", "'boolean' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v140(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v147(x, True) is None:
+        pass
+    return errors
+
+
+def _v147(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v148(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v148(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c13.search(x):
+            errors = _error(
+                errors,
+                "pattern",
+                repr(x) + " does not match 'integer|decimal|long|int|short|byte'",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v139(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if _v149(x, True) is None:
+        pass
+    return errors
+
+
+def _v149(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v150(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v150(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, str):
+        if not _c14.search(x):
+            errors = _error(
+                errors, "pattern", repr(x) + " does not match 'double|float'"
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v138(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, bool | str)):
+        errors = _error(
+            errors,
+            "type",
+            repr(x) + " is not of type 'string', 'number', 'integer', 'boolean'",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v137(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c15):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['nominal', 'ordinal', 'cardinal', 'interval', 'range']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v136(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c16):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['double', 'float', 'decimal', 'integer', 'byte', 'int', 'short', 'long', 'string', 'boolean', 'dateTime']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v133(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v135(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v91(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v69(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "fluorescence emission profile data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'fluorescence emission profile data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "fluorescence emission profile data cube" in x:
+            e = _v151(x["fluorescence emission profile data cube"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "fluorescence emission profile data cube", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v151(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v152(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v152(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v153(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v153(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v154(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v155(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v155(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v156(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v156(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v157(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c4[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v157(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v158(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v159(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v160(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v160(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v159(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v158(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "fluorescence":
+        errors = _error(errors, "const", "'fluorescence' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v154(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v161(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v161(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v162(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v162(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v163(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v164(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v165(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v165(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v164(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v163(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v68(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "electropherogram data cube" in x:
+            e = _v166(x["electropherogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "electropherogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v166(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v167(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v167(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v168(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v168(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v169(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v170(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v170(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v171(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v171(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v172(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c4[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v172(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v173(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v174(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v175(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v175(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v174(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "RFU":
+        errors = _error(errors, "const", "'RFU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v173(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "fluorescence":
+        errors = _error(errors, "const", "'fluorescence' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v169(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v176(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v176(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v177(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c17[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v177(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v178(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v179(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v180(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v180(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v179(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v178(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "elapsed time":
+        errors = _error(errors, "const", "'elapsed time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v67(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v66(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v181(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v181(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v182(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v182(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v183(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v184(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@index" in x:
+            e = _v185(x["@index"], stop)
+            if e:
+                errors = _child_errors(errors, "@index", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v185(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (_is_integer(x)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'integer'")
+        if stop:
+            return errors
+    if x.__class__ is float or _is_number(x):
+        if x < 1:
+            errors = _error(
+                errors, "minimum", repr(x) + " is less than the minimum of 1"
+            )
+            if stop:
+                return errors
+        if x > 2147483647:
+            errors = _error(
+                errors,
+                "maximum",
+                repr(x) + " is greater than the maximum of 2147483647",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v183(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v186(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v187(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+        if "excitation wavelength setting" in x:
+            e = _v188(x["excitation wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "excitation wavelength setting", e)
+                if stop:
+                    return errors
+        if "excitation bandwidth setting" in x:
+            e = _v189(x["excitation bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "excitation bandwidth setting", e)
+                if stop:
+                    return errors
+        if "total measurement time setting" in x:
+            e = _v190(x["total measurement time setting"], stop)
+            if e:
+                errors = _child_errors(errors, "total measurement time setting", e)
+                if stop:
+                    return errors
+        if "read interval setting" in x:
+            e = _v191(x["read interval setting"], stop)
+            if e:
+                errors = _child_errors(errors, "read interval setting", e)
+                if stop:
+                    return errors
+        if "number of scans setting" in x:
+            e = _v192(x["number of scans setting"], stop)
+            if e:
+                errors = _child_errors(errors, "number of scans setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v192(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v193(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v193(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v194(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v194(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "#":
+        errors = _error(errors, "const", "'#' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v191(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v190(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v189(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v195(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v196(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v196(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "nm":
+        errors = _error(errors, "const", "'nm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v188(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v187(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v186(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v64(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v197(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v198(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v198(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v199(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v199(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v200(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v200(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v201(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v201(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "derived column pressure data cube" in x:
+            e = _v202(x["derived column pressure data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "derived column pressure data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v202(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v203(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v203(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "derived column pressure data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'derived column pressure data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v204(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v204(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v205(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v206(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v206(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v207(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v207(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v208(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c18[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v208(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v209(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v210(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v211(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v211(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v210(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "MPa":
+        errors = _error(errors, "const", "'MPa' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v209(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "delta column pressure":
+        errors = _error(errors, "const", "'delta column pressure' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v205(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v212(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v212(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v213(x, True),
+                _v214(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v214(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v215(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v216(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v217(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v217(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v216(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v215(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v213(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v218(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v219(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v220(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v220(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v219(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v218(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v197(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v221(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v221(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v222(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v222(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v223(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v223(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "pre-column pressure data cube" in x:
+            e = _v224(x["pre-column pressure data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "pre-column pressure data cube", e)
+                if stop:
+                    return errors
+        if "post-column pressure data cube" in x:
+            e = _v225(x["post-column pressure data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "post-column pressure data cube", e)
+                if stop:
+                    return errors
+        if "sample pressure data cube" in x:
+            e = _v226(x["sample pressure data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "sample pressure data cube", e)
+                if stop:
+                    return errors
+        if "system pressure data cube" in x:
+            e = _v227(x["system pressure data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "system pressure data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v227(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v228(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v228(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "system pressure data cube" not in x:
+            errors = _error(
+                errors, "required", "'system pressure data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v229(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v229(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v230(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v231(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v231(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v232(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v232(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v233(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c19[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v233(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v234(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v235(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v236(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v236(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v235(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "MPa":
+        errors = _error(errors, "const", "'MPa' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v234(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "column pressure":
+        errors = _error(errors, "const", "'column pressure' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v230(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v237(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v237(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v238(x, True),
+                _v239(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v239(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v240(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v241(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v242(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v242(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v241(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v240(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v238(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v243(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v244(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v245(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v245(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v244(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v243(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v226(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v246(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v246(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "sample pressure data cube" not in x:
+            errors = _error(
+                errors, "required", "'sample pressure data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v247(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v247(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v248(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v249(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v249(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v250(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v250(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v251(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c20[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v251(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v252(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v253(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v254(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v254(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v253(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "MPa":
+        errors = _error(errors, "const", "'MPa' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v252(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "sample pressure":
+        errors = _error(errors, "const", "'sample pressure' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v248(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v255(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v255(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v256(x, True),
+                _v257(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v257(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v258(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v259(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v260(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v260(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v259(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v258(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v256(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v261(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v262(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v263(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v263(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v262(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v261(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v225(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v264(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v264(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "column pressure data cube" not in x:
+            errors = _error(
+                errors, "required", "'column pressure data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v265(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v265(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v266(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v267(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v267(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v268(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v268(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v269(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c21[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v269(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v270(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v271(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v272(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v272(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v271(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "MPa":
+        errors = _error(errors, "const", "'MPa' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v270(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "post-column pressure":
+        errors = _error(errors, "const", "'post-column pressure' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v266(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v273(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v273(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v274(x, True),
+                _v275(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v275(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v276(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v277(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v278(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v278(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v277(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v276(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v274(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v279(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v280(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v281(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v281(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v280(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v279(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v224(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v282(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v282(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "column pressure data cube" not in x:
+            errors = _error(
+                errors, "required", "'column pressure data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v283(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v283(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v284(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v285(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v285(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v286(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v286(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v287(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c22[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v287(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v288(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v289(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v290(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v290(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v289(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "MPa":
+        errors = _error(errors, "const", "'MPa' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v288(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "pre-column pressure":
+        errors = _error(errors, "const", "'pre-column pressure' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v284(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v291(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v291(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v292(x, True),
+                _v293(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v293(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v294(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v295(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v296(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v296(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v295(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v294(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v292(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v297(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v298(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v299(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v299(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v298(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v297(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v63(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v300(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v300(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v301(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v301(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v302(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v302(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v303(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v303(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "solvent concentration data cube" in x:
+            e = _v304(x["solvent concentration data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "solvent concentration data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v304(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v305(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v305(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "solvent concentration data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'solvent concentration data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v306(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v306(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v307(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v308(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v308(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v309(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v309(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v310(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c23[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v310(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v311(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v312(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v313(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v313(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v312(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "%":
+        errors = _error(errors, "const", "'%' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v311(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "solvent concentration":
+        errors = _error(errors, "const", "'solvent concentration' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v307(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v314(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v314(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v315(x, True),
+                _v316(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v316(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v317(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v318(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v319(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v319(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v318(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v317(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v315(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v320(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v321(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v322(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v322(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v321(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v320(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v62(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v323(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v323(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v324(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v324(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v325(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v325(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v326(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v326(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "temperature profile data cube" in x:
+            e = _v327(x["temperature profile data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "temperature profile data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v327(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v328(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v328(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "temperature profile data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'temperature profile data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v329(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v329(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v330(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v331(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v331(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v332(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v332(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v333(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c24[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v333(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v334(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v335(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v336(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v336(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v335(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "degC":
+        errors = _error(errors, "const", "'degC' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v334(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "temperature":
+        errors = _error(errors, "const", "'temperature' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v330(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v337(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v337(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v338(x, True),
+                _v339(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v339(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v340(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v341(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v342(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v342(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v341(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v340(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v338(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v343(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v344(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v345(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v345(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v344(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v343(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v61(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v346(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v346(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v347(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v347(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v348(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v348(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v349(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v349(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "system flow rate data cube" in x:
+            e = _v350(x["system flow rate data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "system flow rate data cube", e)
+                if stop:
+                    return errors
+        if "sample flow rate data cube" in x:
+            e = _v351(x["sample flow rate data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "sample flow rate data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v351(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v352(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v352(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "sample flow rate data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'sample flow rate data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v353(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v353(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v354(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v355(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v355(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v356(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v356(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v357(x, True),
+                _v358(x, True),
+                _v359(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c25[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v359(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v360(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v361(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v362(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v362(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v361(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "cm/s":
+        errors = _error(errors, "const", "'cm/s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v360(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "sample flow":
+        errors = _error(errors, "const", "'sample flow' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v358(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v363(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v364(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v365(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v365(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v364(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL/min":
+        errors = _error(errors, "const", "'mL/min' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v363(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "sample flow":
+        errors = _error(errors, "const", "'sample flow' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v357(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v366(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v367(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v368(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v368(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v367(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "CV/h":
+        errors = _error(errors, "const", "'CV/h' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v366(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "sample flow":
+        errors = _error(errors, "const", "'sample flow' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v354(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v369(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v369(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v370(x, True),
+                _v371(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v371(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v372(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v373(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v374(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v374(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v373(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v372(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v370(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v375(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v376(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v377(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v377(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v376(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v375(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v350(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v378(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v378(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "system flow rate data cube" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'system flow rate data cube' is a required property",
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v379(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v379(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v380(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v381(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v381(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v382(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v382(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v383(x, True),
+                _v384(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c26[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v384(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v385(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v386(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v387(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v387(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v386(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL/min":
+        errors = _error(errors, "const", "'mL/min' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v385(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "system flow":
+        errors = _error(errors, "const", "'system flow' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v383(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v388(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v389(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v390(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v390(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v389(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "CV/h":
+        errors = _error(errors, "const", "'CV/h' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v388(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "system flow":
+        errors = _error(errors, "const", "'system flow' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v380(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v391(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v391(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v392(x, True),
+                _v393(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v393(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v394(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v395(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v396(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v396(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v395(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v394(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v392(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v397(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v398(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v399(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v399(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v398(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v397(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v60(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v400(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v401(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v402(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v402(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v403(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v403(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v404(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v404(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v405(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v405(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v406(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v406(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v407(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v407(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v408(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v408(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v409(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v410(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v410(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v411(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v411(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v412(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v412(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "pA.s":
+        errors = _error(errors, "const", "'pA.s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v409(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v413(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v413(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v414(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v414(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "pA":
+        errors = _error(errors, "const", "'pA' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v401(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v415(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v415(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v416(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v416(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v417(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v418(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v418(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v419(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v419(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v420(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c27[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v420(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v421(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v422(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v423(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v423(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v422(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "pA":
+        errors = _error(errors, "const", "'pA' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v421(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "electric current":
+        errors = _error(errors, "const", "'electric current' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v417(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v424(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v424(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v425(x, True),
+                _v426(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v426(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v427(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v428(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v429(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v429(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v428(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v427(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v425(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v430(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v431(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v432(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v432(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v431(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v430(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v400(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v433(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v433(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v434(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v434(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v435(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v435(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v436(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v437(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v437(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v436(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v59(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v438(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v439(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v440(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v440(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v441(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v441(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v442(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v442(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v443(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v443(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v444(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v444(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v445(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v445(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v446(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v446(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v447(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v448(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v448(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v449(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v449(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v450(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v450(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "nC.s":
+        errors = _error(errors, "const", "'nC.s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v447(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v451(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v451(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v452(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v452(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "nC":
+        errors = _error(errors, "const", "'nC' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v439(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v453(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v453(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v454(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v454(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v455(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v456(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v456(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v457(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v457(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v458(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c28[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v458(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v459(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v460(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v461(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v461(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v460(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "nC":
+        errors = _error(errors, "const", "'nC' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v459(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "electric charge":
+        errors = _error(errors, "const", "'electric charge' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v455(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v462(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v462(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v463(x, True),
+                _v464(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v464(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v465(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v466(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v467(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v467(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v466(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v465(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v463(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v468(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v469(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v470(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v470(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v469(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v468(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v438(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v471(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v471(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v472(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v472(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v473(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v473(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v474(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v475(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v475(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v474(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v58(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v476(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v477(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v478(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v478(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v479(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v479(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v480(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v480(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v481(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v481(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v482(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v482(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v483(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v483(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v484(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v484(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v485(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v486(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v486(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v487(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v487(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v488(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v488(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mV.s":
+        errors = _error(errors, "const", "'mV.s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v485(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v489(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v489(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v490(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v490(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mV":
+        errors = _error(errors, "const", "'mV' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v477(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v491(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v491(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v492(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v492(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v493(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v494(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v494(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v495(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v495(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v496(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c29[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v496(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v497(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v498(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v499(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v499(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v498(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mV":
+        errors = _error(errors, "const", "'mV' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v497(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "voltage":
+        errors = _error(errors, "const", "'voltage' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v493(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v500(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v500(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v501(x, True),
+                _v502(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v502(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v503(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v504(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v505(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v505(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v504(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v503(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v501(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v506(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v507(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v508(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v508(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v507(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v506(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v476(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v509(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v509(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v510(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v510(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v511(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v511(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v512(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v513(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v513(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v512(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v57(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v514(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "mass chromatogram data cube" in x:
+            e = _v515(x["mass chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "mass chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v516(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v516(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v517(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v517(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v518(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v518(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v519(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v519(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v520(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v520(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v521(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v521(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v522(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v522(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v523(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v524(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v524(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v525(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v525(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v526(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v526(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "Counts.s":
+        errors = _error(errors, "const", "'Counts.s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v523(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v527(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v527(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v528(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v528(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "Counts":
+        errors = _error(errors, "const", "'Counts' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v515(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v529(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v529(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v530(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v530(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v531(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v532(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v532(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v533(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v533(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v534(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c30[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v534(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v535(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v536(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v537(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v537(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v536(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "Counts":
+        errors = _error(errors, "const", "'Counts' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v535(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "count":
+        errors = _error(errors, "const", "'count' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v531(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v538(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v538(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v539(x, True),
+                _v540(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v540(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v541(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v542(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v543(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v543(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v542(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v541(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v539(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v544(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v545(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v546(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v546(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v545(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v544(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v514(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v547(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v547(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v548(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v548(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v549(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v549(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v550(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v551(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v551(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v550(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v56(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "chromatogram data cube" in x:
+            e = _v552(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v552(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v553(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v553(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatogram data cube" not in x:
+            errors = _error(
+                errors, "required", "'chromatogram data cube' is a required property"
+            )
+            if stop:
+                return errors
+        if "cube-structure" in x:
+            e = _v554(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v554(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v555(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v556(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v556(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v557(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v557(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v558(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c31[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v558(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v559(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v560(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v561(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v561(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v560(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "pH":
+        errors = _error(errors, "const", "'pH' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v559(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "pH":
+        errors = _error(errors, "const", "'pH' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v555(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v562(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v562(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v563(x, True),
+                _v564(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v564(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v565(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v566(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v567(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v567(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v566(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v565(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v563(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v568(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v569(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v570(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v570(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v569(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v568(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v55(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v571(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v572(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v573(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v573(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v574(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v574(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v575(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v575(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v576(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v577(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v577(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v578(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v578(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v579(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v579(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v580(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v581(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v581(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v582(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v582(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v583(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c32[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v583(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v584(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v585(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v586(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v586(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v585(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "%":
+        errors = _error(errors, "const", "'%' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v584(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "% conductivity":
+        errors = _error(errors, "const", "'% conductivity' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v580(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v587(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v587(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v588(x, True),
+                _v589(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v589(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v590(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v591(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v592(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v592(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v591(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v590(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v588(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v593(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v594(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v595(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v595(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v594(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v593(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v576(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v596(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v596(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v597(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v597(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v598(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v598(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "chromatogram data cube" in x:
+            e = _v599(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "peak height" in x:
+            e = _v600(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v601(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v601(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v600(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v599(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v602(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v602(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v603(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v603(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v604(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v605(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v605(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v606(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v606(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v607(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c33[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v607(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v608(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v609(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v610(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v610(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v609(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "%":
+        errors = _error(errors, "const", "'%' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v608(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "electric conductivity":
+        errors = _error(errors, "const", "'electric conductivity' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v604(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v611(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v611(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v612(x, True),
+                _v613(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v613(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v614(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v615(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v616(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v616(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v615(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v614(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v612(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v617(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v618(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v619(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v619(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v618(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v617(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v572(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v620(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v620(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v621(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v621(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v622(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v623(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v623(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v624(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v624(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v625(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c34[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v625(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v626(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v627(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v628(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v628(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v627(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "S/m":
+        errors = _error(errors, "const", "'S/m' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v626(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "electric conductivity":
+        errors = _error(errors, "const", "'electric conductivity' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v622(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v629(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v629(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v630(x, True),
+                _v631(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v631(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v632(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v633(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v634(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v634(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v633(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v632(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v630(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v635(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v636(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v637(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v637(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v636(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v635(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v571(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v638(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v638(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v639(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v639(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v640(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v640(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v641(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v642(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v642(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v641(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v54(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v643(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "three-dimensional ultraviolet spectrum data cube" in x:
+            e = _v644(x["three-dimensional ultraviolet spectrum data cube"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "three-dimensional ultraviolet spectrum data cube", e
+                )
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v645(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v645(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v646(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v646(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v647(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v647(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v648(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v648(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v649(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v649(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v650(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v650(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v651(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v651(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v652(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v653(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v653(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v654(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v654(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v655(x, True),
+                _v656(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c35[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v656(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v657(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v657(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mAU.mL":
+        errors = _error(errors, "const", "'mAU.mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v655(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v658(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v658(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mAU.s":
+        errors = _error(errors, "const", "'mAU.s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v652(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v659(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v659(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v660(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v660(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v644(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v661(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v661(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v662(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v662(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v663(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v664(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v664(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v665(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v665(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v666(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c36[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v666(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v667(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v668(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v669(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v669(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v668(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v667(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "absorbance":
+        errors = _error(errors, "const", "'absorbance' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v663(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v670(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) > 1:
+            e = _v671(x[1], stop)
+            if e:
+                errors = _child_errors(errors, 1, e)
+                if stop:
+                    return errors
+        if len(x) < 2:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+        if len(x) > 2:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v671(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v672(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v673(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v674(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v674(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v673(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "nm":
+        errors = _error(errors, "const", "'nm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v672(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "wavelength":
+        errors = _error(errors, "const", "'wavelength' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v670(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v675(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v676(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v677(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v677(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v676(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v675(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v643(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v678(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v678(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v679(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v679(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v680(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v680(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v681(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v682(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+        if "electronic absorbance wavelength setting" in x:
+            e = _v683(x["electronic absorbance wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance wavelength setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance bandwidth setting" in x:
+            e = _v684(x["electronic absorbance bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference bandwidth setting" in x:
+            e = _v685(x["electronic absorbance reference bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference wavelength setting" in x:
+            e = _v686(x["electronic absorbance reference wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference wavelength setting", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v686(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v685(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v684(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v683(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v682(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v681(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v53(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control aggregate document" in x:
+            e = _v687(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v688(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v689(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v689(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v690(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v690(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v691(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v691(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v692(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v692(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v693(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v693(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v694(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v694(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v695(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v695(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak height" in x:
+            e = _v696(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v697(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v697(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v698(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v698(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v655(x, True),
+                _v656(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c35[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v696(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v659(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v688(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v699(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v699(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v700(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v700(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v701(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v702(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v702(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v703(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v703(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v704(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c36[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v704(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v705(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v706(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v707(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v707(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v706(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mAU":
+        errors = _error(errors, "const", "'mAU' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v705(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "absorbance":
+        errors = _error(errors, "const", "'absorbance' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v701(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v708(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v708(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v709(x, True),
+                _v710(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c5[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v710(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v711(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v712(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v713(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v713(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v712(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v711(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v709(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v714(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v715(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v716(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v716(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "double":
+        errors = _error(errors, "const", "'double' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v715(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v714(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v687(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v717(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v717(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v718(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v718(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v719(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v719(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector wavelength setting" in x:
+            e = _v720(x["detector wavelength setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector wavelength setting", e)
+                if stop:
+                    return errors
+        if "detector bandwidth setting" in x:
+            e = _v721(x["detector bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector bandwidth setting", e)
+                if stop:
+                    return errors
+        if "electronic absorbance wavelength setting" in x:
+            e = _v722(x["electronic absorbance wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance wavelength setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance bandwidth setting" in x:
+            e = _v723(x["electronic absorbance bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference bandwidth setting" in x:
+            e = _v724(x["electronic absorbance reference bandwidth setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference bandwidth setting", e
+                )
+                if stop:
+                    return errors
+        if "electronic absorbance reference wavelength setting" in x:
+            e = _v725(x["electronic absorbance reference wavelength setting"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "electronic absorbance reference wavelength setting", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v725(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v724(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v723(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v722(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v721(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v720(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v195(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v51(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatography column document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'chromatography column document' is a required property",
+            )
+            if stop:
+                return errors
+        if "chromatography column document" in x:
+            e = _v726(x["chromatography column document"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatography column document", e)
+                if stop:
+                    return errors
+        if "device control aggregate document" in x:
+            e = _v727(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "injection document" in x:
+            e = _v728(x["injection document"], stop)
+            if e:
+                errors = _child_errors(errors, "injection document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v729(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "chromatogram data cube" in x:
+            e = _v730(x["chromatogram data cube"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatogram data cube", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v730(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v731(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v731(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "cube-structure" in x:
+            e = _v732(x["cube-structure"], stop)
+            if e:
+                errors = _child_errors(errors, "cube-structure", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v732(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "dimensions" in x:
+            e = _v733(x["dimensions"], stop)
+            if e:
+                errors = _child_errors(errors, "dimensions", e)
+                if stop:
+                    return errors
+        if "measures" in x:
+            e = _v734(x["measures"], stop)
+            if e:
+                errors = _child_errors(errors, "measures", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v734(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+        if not any(_v735(v, True) is None for v in x):
+            errors = _error(
+                errors,
+                "contains",
+                repr(x) + " does not contain items matching the given schema",
+            )
+            if stop:
+                return errors
+    return errors
+
+
+def _v735(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [i for i, e in enumerate((_v736(x, True),)) if e is None]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c37[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v736(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "@componentDatatype" in x:
+            e = _v737(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v737(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c38):
+        errors = _error(errors, "enum", repr(x) + " is not one of ['double', 'float']")
+        if stop:
+            return errors
+    return errors
+
+
+def _v733(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, list):
+        if len(x) > 0:
+            e = _v738(x[0], stop)
+            if e:
+                errors = _child_errors(errors, 0, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+        if len(x) > 1:
+            errors = _error(errors, "maxItems", repr(x) + " is too long")
+            if stop:
+                return errors
+    return errors
+
+
+def _v738(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v739(x, True),
+                _v740(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c39[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v740(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v741(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v742(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v743(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v743(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c38):
+        errors = _error(errors, "enum", repr(x) + " is not one of ['double', 'float']")
+        if stop:
+            return errors
+    return errors
+
+
+def _v742(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "mL":
+        errors = _error(errors, "const", "'mL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v741(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention volume":
+        errors = _error(errors, "const", "'retention volume' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v739(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "concept" in x:
+            e = _v744(x["concept"], stop)
+            if e:
+                errors = _child_errors(errors, "concept", e)
+                if stop:
+                    return errors
+        if "unit" in x:
+            e = _v745(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+        if "@componentDatatype" in x:
+            e = _v746(x["@componentDatatype"], stop)
+            if e:
+                errors = _child_errors(errors, "@componentDatatype", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v746(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str) and x in _c38):
+        errors = _error(errors, "enum", repr(x) + " is not one of ['double', 'float']")
+        if stop:
+            return errors
+    return errors
+
+
+def _v745(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "s":
+        errors = _error(errors, "const", "'s' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v744(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if x != "retention time":
+        errors = _error(errors, "const", "'retention time' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v729(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" in x:
+            e = _v747(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v747(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v748(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v748(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak list" in x:
+            e = _v749(x["peak list"], stop)
+            if e:
+                errors = _child_errors(errors, "peak list", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v749(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak" in x:
+            e = _v750(x["peak"], stop)
+            if e:
+                errors = _child_errors(errors, "peak", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v750(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v751(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v751(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v752(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v752(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "peak end" in x:
+            e = _v753(x["peak end"], stop)
+            if e:
+                errors = _child_errors(errors, "peak end", e)
+                if stop:
+                    return errors
+        if "identifier" in x:
+            e = _v30(x["identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "identifier", e)
+                if stop:
+                    return errors
+        if "relative peak height" in x:
+            e = _v754(x["relative peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak height", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v30(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "peak height" in x:
+            e = _v755(x["peak height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak height", e)
+                if stop:
+                    return errors
+        if "capacity factor (chromatography)" in x:
+            e = _v756(x["capacity factor (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "capacity factor (chromatography)", e)
+                if stop:
+                    return errors
+        if "baseline value at start of peak" in x:
+            e = _v757(x["baseline value at start of peak"], stop)
+            if e:
+                errors = _child_errors(errors, "baseline value at start of peak", e)
+                if stop:
+                    return errors
+        if "baseline value at end of peak" in x:
+            e = _v758(x["baseline value at end of peak"], stop)
+            if e:
+                errors = _child_errors(errors, "baseline value at end of peak", e)
+                if stop:
+                    return errors
+        if "peak group" in x:
+            e = _v759(x["peak group"], stop)
+            if e:
+                errors = _child_errors(errors, "peak group", e)
+                if stop:
+                    return errors
+        if "relative peak analyte amount" in x:
+            e = _v760(x["relative peak analyte amount"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak analyte amount", e)
+                if stop:
+                    return errors
+        if "relative corrected peak area" in x:
+            e = _v761(x["relative corrected peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative corrected peak area", e)
+                if stop:
+                    return errors
+        if "peak area" in x:
+            e = _v762(x["peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "peak area", e)
+                if stop:
+                    return errors
+        if "relative peak area" in x:
+            e = _v763(x["relative peak area"], stop)
+            if e:
+                errors = _child_errors(errors, "relative peak area", e)
+                if stop:
+                    return errors
+        if "retention time" in x:
+            e = _v764(x["retention time"], stop)
+            if e:
+                errors = _child_errors(errors, "retention time", e)
+                if stop:
+                    return errors
+        if "relative retention time" in x:
+            e = _v765(x["relative retention time"], stop)
+            if e:
+                errors = _child_errors(errors, "relative retention time", e)
+                if stop:
+                    return errors
+        if "retention volume" in x:
+            e = _v766(x["retention volume"], stop)
+            if e:
+                errors = _child_errors(errors, "retention volume", e)
+                if stop:
+                    return errors
+        if "peak start" in x:
+            e = _v767(x["peak start"], stop)
+            if e:
+                errors = _child_errors(errors, "peak start", e)
+                if stop:
+                    return errors
+        if "peak selectivity (chromatography)" in x:
+            e = _v768(x["peak selectivity (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "peak selectivity (chromatography)", e)
+                if stop:
+                    return errors
+        if "peak analyte amount" in x:
+            e = _v769(x["peak analyte amount"], stop)
+            if e:
+                errors = _child_errors(errors, "peak analyte amount", e)
+                if stop:
+                    return errors
+        if "peak index" in x:
+            e = _v30(x["peak index"], stop)
+            if e:
+                errors = _child_errors(errors, "peak index", e)
+                if stop:
+                    return errors
+    if (
+        _v770(x, True)
+        and _v771(x, True)
+        and _v772(x, True)
+        and _v773(x, True)
+        and _v774(x, True)
+        and _v775(x, True)
+        and _v776(x, True)
+        and _v777(x, True)
+        and _v778(x, True)
+        and _v779(x, True)
+        and _v780(x, True)
+        and _v781(x, True)
+        and _v782(x, True)
+        and _v783(x, True)
+        and _v784(x, True)
+        and _v785(x, True)
+        and _v786(x, True)
+        and _v787(x, True)
+        and _v788(x, True)
+        and _v789(x, True)
+        and _v790(x, True)
+        and _v791(x, True)
+        and _v792(x, True)
+        and _v793(x, True)
+        and _v794(x, True)
+        and _v795(x, True)
+        and _v796(x, True)
+        and _v797(x, True)
+        and _v798(x, True)
+        and _v799(x, True)
+    ):
+        errors = _error(
+            errors, "anyOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v799(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak asymmetry factor" in x:
+            e = _v800(x["chromatographic peak asymmetry factor"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "chromatographic peak asymmetry factor", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v800(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v801(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v802(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v802(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "(unitless)":
+        errors = _error(errors, "const", "'(unitless)' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v798(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at baseline" in x:
+            e = _v803(x["asymmetry factor measured at baseline"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at baseline", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v803(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v797(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 4.4 % height" in x:
+            e = _v804(x["asymmetry factor measured at 4.4 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 4.4 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v804(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v796(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor squared measured at 4.4 % height" in x:
+            e = _v805(x["asymmetry factor squared measured at 4.4 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor squared measured at 4.4 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v805(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v795(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor squared measured at 10 % height" in x:
+            e = _v806(x["asymmetry factor squared measured at 10 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor squared measured at 10 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v806(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v794(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 10 % height" in x:
+            e = _v807(x["asymmetry factor measured at 10 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 10 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v807(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v793(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "asymmetry factor measured at 5 % height" in x:
+            e = _v808(x["asymmetry factor measured at 5 % height"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "asymmetry factor measured at 5 % height", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v808(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v792(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "statistical skew (chromatography)" in x:
+            e = _v809(x["statistical skew (chromatography)"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical skew (chromatography)", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v809(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v791(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width" in x:
+            e = _v810(x["peak width"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v810(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v811(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v811(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v40(x, True),
+                _v34(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c40[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v790(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 10 % of height" in x:
+            e = _v812(x["peak width at 10 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 10 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v812(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v789(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at inflection" in x:
+            e = _v813(x["peak width at inflection"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at inflection", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v813(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v788(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at baseline" in x:
+            e = _v814(x["peak width at baseline"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at baseline", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v814(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v787(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 5 % of height" in x:
+            e = _v815(x["peak width at 5 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 5 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v815(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v786(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at half height" in x:
+            e = _v816(x["peak width at half height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at half height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v816(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v817(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v817(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v40(x, True),
+                _v34(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c40[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v785(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 60.7 % of height" in x:
+            e = _v818(x["peak width at 60.7 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 60.7 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v818(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v784(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 32.4 % of height" in x:
+            e = _v819(x["peak width at 32.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 32.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v819(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v783(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 13.4 % of height" in x:
+            e = _v820(x["peak width at 13.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 13.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v820(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v782(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "peak width at 4.4 % of height" in x:
+            e = _v821(x["peak width at 4.4 % of height"], stop)
+            if e:
+                errors = _child_errors(errors, "peak width at 4.4 % of height", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v821(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v781(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by peak width at half height (JP14)" in x:
+            e = _v822(
+                x["number of theoretical plates by peak width at half height (JP14)"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates by peak width at half height (JP14)",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v822(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v780(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by peak width at half height" in x:
+            e = _v823(
+                x["number of theoretical plates by peak width at half height"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates by peak width at half height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v823(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v779(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates by tangent method" in x:
+            e = _v824(x["number of theoretical plates by tangent method"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "number of theoretical plates by tangent method", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v824(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v778(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 4.4 % of peak height" in x:
+            e = _v825(
+                x["number of theoretical plates measured at 4.4 % of peak height"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 4.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v825(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v777(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 13.4 % of peak height" in x:
+            e = _v826(
+                x["number of theoretical plates measured at 13.4 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 13.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v826(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v776(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 32.4 % of peak height" in x:
+            e = _v827(
+                x["number of theoretical plates measured at 32.4 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 32.4 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v827(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v775(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates measured at 60.7 % of peak height" in x:
+            e = _v828(
+                x["number of theoretical plates measured at 60.7 % of peak height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "number of theoretical plates measured at 60.7 % of peak height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v828(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v774(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "number of theoretical plates (chromatography)" in x:
+            e = _v829(x["number of theoretical plates (chromatography)"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "number of theoretical plates (chromatography)", e
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v829(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v773(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using statistical moments" in x:
+            e = _v830(
+                x["chromatographic peak resolution using statistical moments"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using statistical moments",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v830(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v772(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using peak width at half-height" in x:
+            e = _v831(
+                x["chromatographic peak resolution using peak width at half-height"],
+                stop,
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using peak width at half-height",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v831(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v771(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution using baseline peak widths" in x:
+            e = _v832(
+                x["chromatographic peak resolution using baseline peak widths"], stop
+            )
+            if e:
+                errors = _child_errors(
+                    errors,
+                    "chromatographic peak resolution using baseline peak widths",
+                    e,
+                )
+                if stop:
+                    return errors
+    return errors
+
+
+def _v832(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v770(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "chromatographic peak resolution" in x:
+            e = _v833(x["chromatographic peak resolution"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatographic peak resolution", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v833(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v769(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v768(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v767(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v834(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v834(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v40(x, True),
+                _v34(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c40[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v766(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v34(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v765(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v835(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v835(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v836(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v836(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "%":
+        errors = _error(errors, "const", "'%' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v764(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v763(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v835(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v762(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v761(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v835(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v760(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v835(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v759(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v655(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v758(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v757(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v40(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v756(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v801(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v755(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v754(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v835(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v753(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v837(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v837(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v40(x, True),
+                _v34(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c40[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v728(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "autosampler injection volume setting (chromatography)" in x:
+            e = _v838(x["autosampler injection volume setting (chromatography)"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "autosampler injection volume setting (chromatography)", e
+                )
+                if stop:
+                    return errors
+        if "injection identifier" in x:
+            e = _v30(x["injection identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "injection identifier", e)
+                if stop:
+                    return errors
+        if "injection time" in x:
+            e = _v839(x["injection time"], stop)
+            if e:
+                errors = _child_errors(errors, "injection time", e)
+                if stop:
+                    return errors
+        if "injection volume setting" in x:
+            e = _v840(x["injection volume setting"], stop)
+            if e:
+                errors = _child_errors(errors, "injection volume setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v840(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v841(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v841(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v842(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v842(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "μL":
+        errors = _error(errors, "const", "'μL' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v839(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v843(x, True),
+                _v844(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c41[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v844(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v39(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v845(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v845(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c42(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v843(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c42(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v838(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v846(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v846(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v847(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v847(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mm^3":
+        errors = _error(errors, "const", "'mm^3' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v727(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" in x:
+            e = _v848(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v848(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v849(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v849(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v850(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v850(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "detector offset setting" in x:
+            e = _v851(x["detector offset setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector offset setting", e)
+                if stop:
+                    return errors
+        if "detector sampling rate setting" in x:
+            e = _v852(x["detector sampling rate setting"], stop)
+            if e:
+                errors = _child_errors(errors, "detector sampling rate setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v852(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v853(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v853(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v854(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v854(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "Hz":
+        errors = _error(errors, "const", "'Hz' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v851(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v726(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "chromatography column part number" in x:
+            e = _v30(x["chromatography column part number"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatography column part number", e)
+                if stop:
+                    return errors
+        if "chromatography column serial number" in x:
+            e = _v30(x["chromatography column serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatography column serial number", e)
+                if stop:
+                    return errors
+        if "chromatography column length" in x:
+            e = _v855(x["chromatography column length"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatography column length", e)
+                if stop:
+                    return errors
+        if "column inner diameter" in x:
+            e = _v856(x["column inner diameter"], stop)
+            if e:
+                errors = _child_errors(errors, "column inner diameter", e)
+                if stop:
+                    return errors
+        if "chromatography column chemistry type" in x:
+            e = _v30(x["chromatography column chemistry type"], stop)
+            if e:
+                errors = _child_errors(
+                    errors, "chromatography column chemistry type", e
+                )
+                if stop:
+                    return errors
+        if "chromatography column particle size" in x:
+            e = _v857(x["chromatography column particle size"], stop)
+            if e:
+                errors = _child_errors(errors, "chromatography column particle size", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v30(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "void volume" in x:
+            e = _v858(x["void volume"], stop)
+            if e:
+                errors = _child_errors(errors, "void volume", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v858(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v34(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v857(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v859(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v859(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v860(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v860(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "µm":
+        errors = _error(errors, "const", "'µm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v856(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v861(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v861(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v862(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v862(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mm":
+        errors = _error(errors, "const", "'mm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v855(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v863(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v863(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v864(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v864(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "cm":
+        errors = _error(errors, "const", "'cm' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v21(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "measurement aggregate document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'measurement aggregate document' is a required property",
+            )
+            if stop:
+                return errors
+        if "measurement aggregate document" in x:
+            e = _v865(x["measurement aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement aggregate document", e)
+                if stop:
+                    return errors
+        if "analyst" in x:
+            e = _v30(x["analyst"], stop)
+            if e:
+                errors = _child_errors(errors, "analyst", e)
+                if stop:
+                    return errors
+        if "submitter" in x:
+            e = _v30(x["submitter"], stop)
+            if e:
+                errors = _child_errors(errors, "submitter", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v865(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "measurement document" not in x:
+            errors = _error(
+                errors, "required", "'measurement document' is a required property"
+            )
+            if stop:
+                return errors
+        if "measurement document" in x:
+            e = _v866(x["measurement document"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement document", e)
+                if stop:
+                    return errors
+        if "diagnostic trace aggregate document" in x:
+            e = _v867(x["diagnostic trace aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "diagnostic trace aggregate document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v868(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "calculated data aggregate document" in x:
+            e = _v869(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v870(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v870(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v871(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v871(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistics document" in x:
+            e = _v872(x["statistics document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v872(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v873(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v873(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "statistical feature" not in x:
+            errors = _error(
+                errors, "required", "'statistical feature' is a required property"
+            )
+            if stop:
+                return errors
+        if "statistical feature" in x:
+            e = _v874(x["statistical feature"], stop)
+            if e:
+                errors = _child_errors(errors, "statistical feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v874(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v39(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v875(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v875(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c43):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['inner diameter', 'plate heater temperature', 'linear velocity', 'enthalpy of fusion', 'angular velocity', 'purity', 'intensity', 'protein attenuation coefficient', 'electron beam working distance', 'temperature', 'end height', 'relative humidity', 'saturation vapor pressure', 'heat flow', 'quality quantification facet', 'heat transfer coefficient', 'molar concentration', 'average total cell diameter', 'pH', 'foam height', 'relative weight loss on drying', 'dilution volume', 'flow ratio', 'electric conductance', 'sample temperature', 'container diameter', 'absorbance', 'sample thickness', 'humidity', 'Raman intensity', 'voltage', 'actual P/P0 result', 'polyol reservoir temperature', 'turbidity', 'enthalpy of sublimation', 'osmolality', 'ambient humidity', 'molar enthalpy of vaporization', 'total foam height', 'strain', 'thermal conductivity', 'coating gap height', 'measurement chamber free space volume', 'fracture energy', 'heat capacity', 'yield strain', 'incident radiation angle', 'mass fraction', 'liquid height', 'chromatography column length', 'sample width', 'molar enthalpy of sublimation', 'Raman wavenumber shift', 'relative response', 'length', 'velocity', 'electric charge', 'molar mass', 'image height', 'concentration', 'sample weight before drying', 'dilution factor', 'temperature rate', 'relative permittivity', 'transition enthalpy', 'total gas flow rate', 'gloss', 'water mass fraction', 'dielectric polarization', 'normalized foam height', 'peak onset temperature', 'electric current', 'angle', 'energy (datum)', 'abrasion weight', 'absolute water content', 'electric resistance', 'attenuation coefficient', 'molar enthalpy of fusion', 'water mass concentration', 'partial pressure', 'volume', 'position count', 'thermal conductance', 'dry sample weight', 'adsorbed volume at STP', 'force', 'birefringence', 'monolayer quantity', 'peak temperature', 'dry gas flow rate', 'gross weight', 'sample weight', 'image width', 'm/z', 'container height', 'flow rate', 'solvent reservoir temperature', 'isocyanate reservoir temperature', 'ambient pressure', 'eccentricity', 'mass', 'molar absorptivity', 'height', 'column inner diameter', 'heat seal length', 'specific surface area', 'reference material weight', 'thickness', 'tare weight', 'power', 'chromatography column particle size', 'saturated gas flow rate', 'well volume', 'degassed sample weight', 'voltage range', 'relative intensity', 'width', 'yield stress', 'total cell diameter', 'stress', 'relative pressure (BET)', 'break stress', 'mass concentration', 'chromatography column film thickness', 'average particle size', 'wavelength', 'heat capacity (dsc)', 'acquisition volume', 'collision energy', 'background corrected turbidity', 'mass change', 'chemical shift', 'titer', 'refractive index', 'enthalpy of vaporization', 'volume fraction', 'transmittance', 'electric conductivity', 'fill depth', 'Young modulus', 'total material height', 'specific rotation', 'qNMR purity result', 'size (datum)', 'break strain', 'specific enthalpy of vaporization', 'absolute intensity', 'BET C constant', 'plate well count', 'plate temperature', 'volume concentration', 'specific enthalpy of sublimation', 'enthalpy', 'area', 'peak load force', 'fluorescence', 'start height', 'polarity', 'angle of optical rotation', 'peak analyte amount', 'extrapolated moisture content', 'inlet gas pressure', 'hardness', 'molecular mass', 'specific enthalpy of fusion', 'electric impedance', 'hold-up volume', 'particle size', 'diameter', 'tablet thickness', 'pressure', 'weight loss', 'cell path length', 'glass transition temperature', 'specific heat capacity', 'wavenumber', 'reservoir temperature', 'electric resistivity', 'luminescence', 'compartment temperature', 'viscosity', 'exhaust gas flow rate', 'Raman interferogram intensity', 'ambient temperature', 'reflectance', 'detector view volume', 'stirring rate']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v869(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v876(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v876(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "calculated data document" not in x:
+            errors = _error(
+                errors, "required", "'calculated data document' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated data document" in x:
+            e = _v877(x["calculated data document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v877(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v878(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v878(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v879(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v879(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "calculated data name" not in x:
+            errors = _error(
+                errors, "required", "'calculated data name' is a required property"
+            )
+            if stop:
+                return errors
+        if "calculated result" not in x:
+            errors = _error(
+                errors, "required", "'calculated result' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source aggregate document" in x:
+            e = _v880(x["data source aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source aggregate document", e)
+                if stop:
+                    return errors
+        if "calculated data identifier" in x:
+            e = _v30(x["calculated data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data identifier", e)
+                if stop:
+                    return errors
+        if "calculated data name" in x:
+            e = _v30(x["calculated data name"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data name", e)
+                if stop:
+                    return errors
+        if "calculation description" in x:
+            e = _v30(x["calculation description"], stop)
+            if e:
+                errors = _child_errors(errors, "calculation description", e)
+                if stop:
+                    return errors
+        if "calculated result" in x:
+            e = _v881(x["calculated result"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated result", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v881(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v880(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v882(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v882(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data source document" not in x:
+            errors = _error(
+                errors, "required", "'data source document' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source document" in x:
+            e = _v883(x["data source document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v883(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v884(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v884(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v885(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v885(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data source identifier" not in x:
+            errors = _error(
+                errors, "required", "'data source identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source feature" not in x:
+            errors = _error(
+                errors, "required", "'data source feature' is a required property"
+            )
+            if stop:
+                return errors
+        if "data source identifier" in x:
+            e = _v30(x["data source identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data source identifier", e)
+                if stop:
+                    return errors
+        if "data source feature" in x:
+            e = _v30(x["data source feature"], stop)
+            if e:
+                errors = _child_errors(errors, "data source feature", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v868(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v886(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v886(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "processed data document" not in x:
+            errors = _error(
+                errors, "required", "'processed data document' is a required property"
+            )
+            if stop:
+                return errors
+        if "processed data document" in x:
+            e = _v887(x["processed data document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v887(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v888(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v888(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v889(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v889(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data processing aggregate document" in x:
+            e = _v890(x["data processing aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data processing aggregate document", e)
+                if stop:
+                    return errors
+        if "data source aggregate document" in x:
+            e = _v891(x["data source aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "data source aggregate document", e)
+                if stop:
+                    return errors
+        if "processed data identifier" in x:
+            e = _v30(x["processed data identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data identifier", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v891(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v882(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v890(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "data processing document" not in x:
+            errors = _error(
+                errors, "required", "'data processing document' is a required property"
+            )
+            if stop:
+                return errors
+        if "data processing document" in x:
+            e = _v892(x["data processing document"], stop)
+            if e:
+                errors = _child_errors(errors, "data processing document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v892(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            if not (isinstance(v, dict)):
+                e = _v893(v, stop)
+                if e:
+                    errors = _child_errors(errors, i, e)
+                    if stop:
+                        return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v893(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    return errors
+
+
+def _v867(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "diagnostic trace document" in x:
+            e = _v894(x["diagnostic trace document"], stop)
+            if e:
+                errors = _child_errors(errors, "diagnostic trace document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v894(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v895(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 0:
+            errors = _error(errors, "minItems", repr(x) + " is too short")
+            if stop:
+                return errors
+    return errors
+
+
+def _v895(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "description" not in x:
+            errors = _error(errors, "required", "'description' is a required property")
+            if stop:
+                return errors
+        for k, v in x.items():
+            if _c44.search(k):
+                e = _v896(v, stop)
+                if e:
+                    errors = _child_errors(errors, k, e)
+                    if stop:
+                        return errors
+    return errors
+
+
+def _v896(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v72(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v866(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v897(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v897(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "sample document" not in x:
+            errors = _error(
+                errors, "required", "'sample document' is a required property"
+            )
+            if stop:
+                return errors
+        if "device control aggregate document" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'device control aggregate document' is a required property",
+            )
+            if stop:
+                return errors
+        if "measurement time" in x:
+            e = _v898(x["measurement time"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement time", e)
+                if stop:
+                    return errors
+        if "measurement identifier" in x:
+            e = _v30(x["measurement identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "measurement identifier", e)
+                if stop:
+                    return errors
+        if "device control aggregate document" in x:
+            e = _v899(x["device control aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control aggregate document", e)
+                if stop:
+                    return errors
+        if "sample document" in x:
+            e = _v900(x["sample document"], stop)
+            if e:
+                errors = _child_errors(errors, "sample document", e)
+                if stop:
+                    return errors
+        if "detection type" in x:
+            e = _v30(x["detection type"], stop)
+            if e:
+                errors = _child_errors(errors, "detection type", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v901(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "calculated data aggregate document" in x:
+            e = _v902(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v903(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v903(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v871(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v902(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v876(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v901(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v886(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v900(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "sample identifier" not in x:
+            errors = _error(
+                errors, "required", "'sample identifier' is a required property"
+            )
+            if stop:
+                return errors
+        if "sample identifier" in x:
+            e = _v30(x["sample identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "sample identifier", e)
+                if stop:
+                    return errors
+        if "batch identifier" in x:
+            e = _v30(x["batch identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "batch identifier", e)
+                if stop:
+                    return errors
+        if "location identifier" in x:
+            e = _v30(x["location identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "location identifier", e)
+                if stop:
+                    return errors
+        if "well location identifier" in x:
+            e = _v30(x["well location identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "well location identifier", e)
+                if stop:
+                    return errors
+        if "observation" in x:
+            e = _v30(x["observation"], stop)
+            if e:
+                errors = _child_errors(errors, "observation", e)
+                if stop:
+                    return errors
+        if "sample role type" in x:
+            e = _v904(x["sample role type"], stop)
+            if e:
+                errors = _child_errors(errors, "sample role type", e)
+                if stop:
+                    return errors
+        if "written name" in x:
+            e = _v30(x["written name"], stop)
+            if e:
+                errors = _child_errors(errors, "written name", e)
+                if stop:
+                    return errors
+        if "flow rate" in x:
+            e = _v905(x["flow rate"], stop)
+            if e:
+                errors = _child_errors(errors, "flow rate", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v905(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v33(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v906(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v906(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "unit" not in x:
+            errors = _error(errors, "required", "'unit' is a required property")
+            if stop:
+                return errors
+        if "unit" in x:
+            e = _v907(x["unit"], stop)
+            if e:
+                errors = _child_errors(errors, "unit", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v907(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if x != "mL/min":
+        errors = _error(errors, "const", "'mL/min' was expected")
+        if stop:
+            return errors
+    return errors
+
+
+def _v904(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v39(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v908(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v908(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if not (isinstance(x, str) and x in _c45):
+        errors = _error(
+            errors,
+            "enum",
+            repr(x)
+            + " is not one of ['control sample role', 'standard sample role', 'validation sample role', 'experiment sample role', 'sample role', 'spiked sample role', 'blank role', 'unknown sample role', 'calibration sample role', 'unspiked sample role', 'specimen role', 'quality control sample role', 'reference sample role']",
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v899(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device control document" not in x:
+            errors = _error(
+                errors, "required", "'device control document' is a required property"
+            )
+            if stop:
+                return errors
+        if "device control document" in x:
+            e = _v909(x["device control document"], stop)
+            if e:
+                errors = _child_errors(errors, "device control document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v909(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v910(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v910(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v911(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v911(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device type" not in x:
+            errors = _error(errors, "required", "'device type' is a required property")
+            if stop:
+                return errors
+        if "device identifier" in x:
+            e = _v30(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "device type" in x:
+            e = _v30(x["device type"], stop)
+            if e:
+                errors = _child_errors(errors, "device type", e)
+                if stop:
+                    return errors
+        if "detection type" in x:
+            e = _v30(x["detection type"], stop)
+            if e:
+                errors = _child_errors(errors, "detection type", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v30(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "brand name" in x:
+            e = _v30(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v30(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v30(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v30(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "start time setting" in x:
+            e = _v898(x["start time setting"], stop)
+            if e:
+                errors = _child_errors(errors, "start time setting", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v898(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    valid = [
+        i
+        for i, e in enumerate(
+            (
+                _v912(x, True),
+                _v913(x, True),
+            )
+        )
+        if e is None
+    ]
+    if not valid:
+        errors = _error(
+            errors, "oneOf", repr(x) + " is not valid under any of the given schemas"
+        )
+        if stop:
+            return errors
+    elif len(valid) > 1:
+        errors = _error(
+            errors,
+            "oneOf",
+            repr(x)
+            + " is valid under each of "
+            + ", ".join(_c41[i] for i in valid[1:] + valid[:1]),
+        )
+        if stop:
+            return errors
+    return errors
+
+
+def _v913(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "@type" not in x:
+            errors = _error(errors, "required", "'@type' is a required property")
+            if stop:
+                return errors
+        if "value" not in x:
+            errors = _error(errors, "required", "'value' is a required property")
+            if stop:
+                return errors
+        if "@type" in x:
+            e = _v39(x["@type"], stop)
+            if e:
+                errors = _child_errors(errors, "@type", e)
+                if stop:
+                    return errors
+        if "value" in x:
+            e = _v914(x["value"], stop)
+            if e:
+                errors = _child_errors(errors, "value", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v914(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c42(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v912(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, str)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'string'")
+        if stop:
+            return errors
+    if isinstance(x, str):
+        if not _c42(x):
+            errors = _error(errors, "format", repr(x) + " is not a 'date-time'")
+            if stop:
+                return errors
+    return errors
+
+
+def _v18(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "pump model number" in x:
+            e = _v30(x["pump model number"], stop)
+            if e:
+                errors = _child_errors(errors, "pump model number", e)
+                if stop:
+                    return errors
+        if "detector model number" in x:
+            e = _v30(x["detector model number"], stop)
+            if e:
+                errors = _child_errors(errors, "detector model number", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v16(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if isinstance(x, dict):
+        if "data system document" in x:
+            e = _v915(x["data system document"], stop)
+            if e:
+                errors = _child_errors(errors, "data system document", e)
+                if stop:
+                    return errors
+        if "device system document" in x:
+            e = _v916(x["device system document"], stop)
+            if e:
+                errors = _child_errors(errors, "device system document", e)
+                if stop:
+                    return errors
+        if "processed data aggregate document" in x:
+            e = _v917(x["processed data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "processed data aggregate document", e)
+                if stop:
+                    return errors
+        if "calculated data aggregate document" in x:
+            e = _v918(x["calculated data aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "calculated data aggregate document", e)
+                if stop:
+                    return errors
+        if "statistics aggregate document" in x:
+            e = _v919(x["statistics aggregate document"], stop)
+            if e:
+                errors = _child_errors(errors, "statistics aggregate document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v919(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v871(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v918(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v876(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v917(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v886(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v916(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "asset management identifier" not in x:
+            errors = _error(
+                errors,
+                "required",
+                "'asset management identifier' is a required property",
+            )
+            if stop:
+                return errors
+        if "asset management identifier" in x:
+            e = _v30(x["asset management identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "asset management identifier", e)
+                if stop:
+                    return errors
+        if "brand name" in x:
+            e = _v30(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v30(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "device identifier" in x:
+            e = _v30(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v30(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v30(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v30(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+        if "device document" in x:
+            e = _v920(x["device document"], stop)
+            if e:
+                errors = _child_errors(errors, "device document", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v920(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, list)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'array'")
+        if stop:
+            return errors
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            e = _v921(v, stop)
+            if e:
+                errors = _child_errors(errors, i, e)
+                if stop:
+                    return errors
+        if len(x) < 1:
+            errors = _error(errors, "minItems", repr(x) + " should be non-empty")
+            if stop:
+                return errors
+    return errors
+
+
+def _v921(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    e = _v922(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    e = _v184(x, stop)
+    if e:
+        errors = _extend_errors(errors, e)
+        if stop:
+            return errors
+    return errors
+
+
+def _v922(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "device type" not in x:
+            errors = _error(errors, "required", "'device type' is a required property")
+            if stop:
+                return errors
+        if "device identifier" in x:
+            e = _v30(x["device identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "device identifier", e)
+                if stop:
+                    return errors
+        if "device type" in x:
+            e = _v30(x["device type"], stop)
+            if e:
+                errors = _child_errors(errors, "device type", e)
+                if stop:
+                    return errors
+        if "model number" in x:
+            e = _v30(x["model number"], stop)
+            if e:
+                errors = _child_errors(errors, "model number", e)
+                if stop:
+                    return errors
+        if "product manufacturer" in x:
+            e = _v30(x["product manufacturer"], stop)
+            if e:
+                errors = _child_errors(errors, "product manufacturer", e)
+                if stop:
+                    return errors
+        if "brand name" in x:
+            e = _v30(x["brand name"], stop)
+            if e:
+                errors = _child_errors(errors, "brand name", e)
+                if stop:
+                    return errors
+        if "equipment serial number" in x:
+            e = _v30(x["equipment serial number"], stop)
+            if e:
+                errors = _child_errors(errors, "equipment serial number", e)
+                if stop:
+                    return errors
+        if "firmware version" in x:
+            e = _v30(x["firmware version"], stop)
+            if e:
+                errors = _child_errors(errors, "firmware version", e)
+                if stop:
+                    return errors
+    return errors
+
+
+def _v915(x: Any, stop: bool) -> Errors | None:
+    errors: Errors | None = None
+    if not (isinstance(x, dict)):
+        errors = _error(errors, "type", repr(x) + " is not of type 'object'")
+        if stop:
+            return errors
+    if isinstance(x, dict):
+        if "ASM converter name" in x:
+            e = _v30(x["ASM converter name"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM converter name", e)
+                if stop:
+                    return errors
+        if "ASM converter version" in x:
+            e = _v30(x["ASM converter version"], stop)
+            if e:
+                errors = _child_errors(errors, "ASM converter version", e)
+                if stop:
+                    return errors
+        if "data system instance identifier" in x:
+            e = _v30(x["data system instance identifier"], stop)
+            if e:
+                errors = _child_errors(errors, "data system instance identifier", e)
+                if stop:
+                    return errors
+        if "file name" in x:
+            e = _v30(x["file name"], stop)
+            if e:
+                errors = _child_errors(errors, "file name", e)
+                if stop:
+                    return errors
+        if "software name" in x:
+            e = _v30(x["software name"], stop)
+            if e:
+                errors = _child_errors(errors, "software name", e)
+                if stop:
+                    return errors
+        if "software version" in x:
+            e = _v30(x["software version"], stop)
+            if e:
+                errors = _child_errors(errors, "software version", e)
+                if stop:
+                    return errors
+        if "UNC path" in x:
+            e = _v30(x["UNC path"], stop)
+            if e:
+                errors = _child_errors(errors, "UNC path", e)
+                if stop:
+                    return errors
+    return errors
@@ -0,0 +1,352 @@
+"""Convert many files in parallel, isolating failures to the file that caused them.
+
+allotrope_from_files() yields a FileConversionResult per input file as soon as it is done. Errors are
+never raised for individual files, they are reported in the result instead, so that one bad file
+(an unsupported format, a timeout, running out of memory, or even crashing the worker process)
+does not stop the rest of the batch.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import tzinfo
+import multiprocessing
+import multiprocessing.connection
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+import time
+from typing import Any, Literal
+
+from allotropy.allotrope.data_cube_encoding import DataCubeEncodingOptions
+from allotropy.allotrope.schemas import preload_schema_store
+from allotropy.cache import ConversionCache
+from allotropy.to_allotrope import allotrope_from_file, VendorType
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+ExecutorType = Literal["process", "thread"]
+
+# Error types reported for failures that are not raised by the conversion itself.
+TIMEOUT_ERROR = "TimeoutError"
+WORKER_CRASH_ERROR = "WorkerCrashError"
+
+# How often the parent checks for finished, timed out or crashed workers.
+_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class FileConversionError:
+    # Name of the exception type (e.g. AllotropeConversionError), or TIMEOUT_ERROR/WORKER_CRASH_ERROR.
+    error_type: str
+    message: str
+
+
+@dataclass(frozen=True)
+class FileConversionResult:
+    filepath: str
+    duration_seconds: float
+    asm: dict[str, Any] | None = None
+    error: FileConversionError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _ConversionOptions:
+    vendor_type: VendorType | None
+    default_timezone: tzinfo | None
+    encoding: str | None
+    locale: str | None
+    cache: ConversionCache | None
+    data_cube_encoding: DataCubeEncodingOptions | None
+
+
+def _warm_up() -> None:
+    # Importing parser_factory imports every parser, and the schema store is shared by all validators.
+    import allotropy.parser_factory  # noqa: F401
+
+    preload_schema_store()
+
+
+def _convert(filepath: str, options: _ConversionOptions) -> FileConversionResult:
+    start = time.perf_counter()
+    try:
+        asm = allotrope_from_file(
+            filepath,
+            options.vendor_type,
+            default_timezone=options.default_timezone,
+            encoding=options.encoding,
+            locale=options.locale,
+            cache=options.cache,
+            data_cube_encoding=options.data_cube_encoding,
+        )
+    except Exception as e:
+        # Running out of memory is often reported wrapped in another error (e.g. a validation error),
+        # it is still reported as a MemoryError so that the worker is replaced.
+        error_type = "MemoryError" if _caused_by_memory_error(e) else type(e).__name__
+        return FileConversionResult(
+            filepath,
+            time.perf_counter() - start,
+            error=FileConversionError(error_type, str(e)),
+        )
+    return FileConversionResult(filepath, time.perf_counter() - start, asm=asm)
+
+
+def _caused_by_memory_error(error: BaseException) -> bool:
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        if isinstance(current, MemoryError):
+            return True
+        seen.add(id(current))
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _set_memory_limit(memory_limit_bytes: int) -> None:
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, hard))
+
+
+def _process_worker(
+    connection: Connection,
+    options: _ConversionOptions,
+    memory_limit_bytes: int | None,
+) -> None:
+    _warm_up()
+    if memory_limit_bytes is not None:
+        _set_memory_limit(memory_limit_bytes)
+    while (filepath := connection.recv()) is not None:
+        result = _convert(filepath, options)
+        connection.send(result)
+        if _is_memory_error(result):
+            # The interpreter may be left in a bad state, start from a clean worker.
+            return
+
+
+def _is_memory_error(result: FileConversionResult) -> bool:
+    return result.error is not None and result.error.error_type == "MemoryError"
+
+
+class _ProcessWorker:
+    def __init__(
+        self,
+        context: BaseContext,
+        options: _ConversionOptions,
+        memory_limit_bytes: int | None,
+    ) -> None:
+        # Each worker has its own pipe, so terminating a worker while it sends a result can not
+        # corrupt the results of other workers.
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(  # type: ignore[attr-defined]
+            target=_process_worker,
+            args=(worker_connection, options, memory_limit_bytes),
+            daemon=True,
+        )
+        self.process.start()
+        # Only the worker holds its end open, so recv() fails instead of blocking once it exits.
+        worker_connection.close()
+        self.filepath: str | None = None
+        self.started_at = 0.0
+
+    def submit(self, filepath: str) -> None:
+        self.filepath = filepath
+        self.started_at = time.perf_counter()
+        self.connection.send(filepath)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def error(self, timeout_seconds: float | None) -> FileConversionError | None:
+        """The error to report for the current file if the worker timed out or crashed."""
+        if not self.process.is_alive():
+            return FileConversionError(
+                WORKER_CRASH_ERROR,
+                f"Worker process exited with code {self.process.exitcode}.",
+            )
+        if (
+            self.filepath is not None
+            and timeout_seconds is not None
+            and self.elapsed() > timeout_seconds
+        ):
+            return FileConversionError(
+                TIMEOUT_ERROR,
+                f"Conversion did not finish within {timeout_seconds} seconds.",
+            )
+        return None
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def _iter_process_results(
+    filepaths: list[str],
+    workers: int,
+    options: _ConversionOptions,
+    timeout_seconds: float | None,
+    memory_limit_bytes: int | None,
+) -> Iterator[FileConversionResult]:
+    context = multiprocessing.get_context()
+    pending = deque(filepaths)
+    pool = [
+        _ProcessWorker(context, options, memory_limit_bytes)
+        for _ in range(min(workers, len(filepaths)))
+    ]
+
+    def replace(worker: _ProcessWorker) -> None:
+        worker.stop()
+        pool.remove(worker)
+        if pending:
+            pool.append(_ProcessWorker(context, options, memory_limit_bytes))
+
+    try:
+        while pending or any(worker.filepath for worker in pool):
+            for worker in list(pool):
+                if worker.filepath is None and pending:
+                    if not worker.process.is_alive():
+                        replace(worker)
+                    else:
+                        worker.submit(pending.popleft())
+
+            busy = {worker.connection: worker for worker in pool if worker.filepath}
+            for connection in multiprocessing.connection.wait(
+                list(busy), timeout=_POLL_INTERVAL_SECONDS
+            ):
+                worker = busy[connection]  # type: ignore[index]
+                try:
+                    result = worker.connection.recv()
+                except (EOFError, OSError):
+                    # The worker exited without a result, reported as a crash below.
+                    worker.process.join(timeout=1)
+                    continue
+                worker.filepath = None
+                yield result
+                if _is_memory_error(result):
+                    replace(worker)
+
+            for worker in list(pool):
+                if worker.filepath is None:
+                    continue
+                if (error := worker.error(timeout_seconds)) is not None:
+                    yield FileConversionResult(
+                        worker.filepath, worker.elapsed(), error=error
+                    )
+                    replace(worker)
+    finally:
+        for worker in pool:
+            try:
+                worker.connection.send(None)
+            except OSError:
+                pass
+        for worker in pool:
+            worker.process.join(timeout=1)
+            worker.stop()
+
+
+def _iter_thread_results(
+    filepaths: list[str],
+    workers: int,
+    options: _ConversionOptions,
+    timeout_seconds: float | None,
+) -> Iterator[FileConversionResult]:
+    _warm_up()
+    # Keyed by the index of the file, the same file may be passed more than once.
+    started_at: dict[int, float] = {}
+
+    def run(index: int, filepath: str) -> FileConversionResult:
+        started_at[index] = time.perf_counter()
+        return _convert(filepath, options)
+
+    # Threads can not be interrupted, so a timed out conversion is reported and then left to finish
+    # in the background. shutdown() does not wait for it.
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures: dict[Future[FileConversionResult], tuple[int, str]] = {
+            executor.submit(run, index, filepath): (index, filepath)
+            for index, filepath in enumerate(filepaths)
+        }
+        while futures:
+            done, _ = wait(
+                futures, timeout=_POLL_INTERVAL_SECONDS, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                del futures[future]
+                yield future.result()
+            if timeout_seconds is None:
+                continue
+            now = time.perf_counter()
+            for future, (index, filepath) in list(futures.items()):
+                start = started_at.get(index)
+                if start is not None and now - start > timeout_seconds:
+                    del futures[future]
+                    yield FileConversionResult(
+                        filepath,
+                        now - start,
+                        error=FileConversionError(
+                            TIMEOUT_ERROR,
+                            f"Conversion did not finish within {timeout_seconds} seconds.",
+                        ),
+                    )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def allotrope_from_files(
+    filepaths: Iterable[str],
+    workers: int | None = None,
+    executor: ExecutorType = "process",
+    vendor_type: VendorType | None = None,
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+    locale: str | None = None,
+    timeout_seconds: float | None = None,
+    memory_limit_bytes: int | None = None,
+    cache: ConversionCache | None = None,
+    data_cube_encoding: DataCubeEncodingOptions | None = None,
+) -> Iterator[FileConversionResult]:
+    """Convert files in parallel, yielding a FileConversionResult for each file as it completes.
+
+    Parameters:
+    filepaths: The files to convert. Results are yielded in completion order, not input order.
+    workers: The number of parallel workers, defaults to the number of CPUs.
+    executor: "process" runs each conversion in a pool of worker processes. Timed out or crashed
+        workers are terminated and replaced, without affecting other files. "thread" runs
+        conversions in threads of the current process, which avoids sending results between
+        processes, but can not enforce memory limits or stop timed out conversions.
+    vendor_type, default_timezone, encoding, locale, cache, data_cube_encoding: passed to
+        allotrope_from_file for each file.
+    timeout_seconds: Maximum time for a single file, reported as a TIMEOUT_ERROR when exceeded.
+    memory_limit_bytes: Maximum address space of each worker process (process executor, Unix only).
+        Files exceeding it are reported with a MemoryError.
+    """
+    filepath_list = list(filepaths)
+    if not filepath_list:
+        return
+    worker_count = workers or multiprocessing.cpu_count()
+    options = _ConversionOptions(
+        vendor_type, default_timezone, encoding, locale, cache, data_cube_encoding
+    )
+    if executor == "process":
+        yield from _iter_process_results(
+            filepath_list, worker_count, options, timeout_seconds, memory_limit_bytes
+        )
+    elif executor == "thread":
+        yield from _iter_thread_results(
+            filepath_list, worker_count, options, timeout_seconds
+        )
+    else:
+        msg = f"Unsupported executor: '{executor}', expected one of ['process', 'thread']."
+        raise ValueError(msg)
@@ -0,0 +1,179 @@
+"""Cache of converted ASM, keyed by the hash of the input contents and the conversion options.
+
+Unchanged files are often converted again (retried uploads, re-runs of the same export). Passing a
+ConversionCache to allotrope_from_io or allotrope_from_file returns the stored ASM for those instead of
+parsing, mapping and validating the file again.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import tzinfo
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import tempfile
+import time
+from typing import Any
+
+from allotropy.__about__ import __version__
+
+# 1 GiB
+DEFAULT_MAX_SIZE_BYTES = 1 << 30
+
+
+def cache_key(
+    contents: bytes,
+    filepath: str,
+    vendor: str | None,
+    default_timezone: tzinfo | None,
+    encoding: str | None,
+    locale: str | None,
+) -> str:
+    """Return the key of a conversion.
+
+    The file path is part of the key, since parsers may report the file name in the ASM.
+    """
+    options = json.dumps(
+        [
+            __version__,
+            filepath,
+            vendor,
+            None if default_timezone is None else str(default_timezone),
+            encoding,
+            locale,
+        ]
+    )
+    digest = hashlib.sha256(contents)
+    digest.update(options.encode())
+    return digest.hexdigest()
+
+
+class ConversionCache(ABC):
+    """Stores serialized ASM by cache key, evicting the least recently used entries over max_size_bytes."""
+
+    def __init__(self, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        self.max_size_bytes = max_size_bytes
+
+    @abstractmethod
+    def get(self, key: str) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, key: str, asm: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class DirectoryCache(ConversionCache):
+    """Stores each entry as a JSON file in a directory, using the modification time to track use."""
+
+    def __init__(self, path: str | Path, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        super().__init__(max_size_bytes)
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                asm: dict[str, Any] = json.load(f)
+            self._touch(entry_path)
+        except (FileNotFoundError, ValueError):
+            return None
+        return asm
+
+    def put(self, key: str, asm: dict[str, Any]) -> None:
+        # Write to a temporary file first so that readers never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(asm, f)
+        entry_path = self._entry_path(key)
+        os.replace(tmp_path, entry_path)
+        self._touch(entry_path)
+        self._evict()
+
+    def _touch(self, entry_path: Path) -> None:
+        now = time.time()
+        os.utime(entry_path, (now, now))
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            total_size -= size
+
+
+class SQLiteCache(ConversionCache):
+    """Stores entries in a single SQLite database file."""
+
+    def __init__(self, path: str | Path, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        super().__init__(max_size_bytes)
+        self.path = Path(path)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, asm BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per operation, so the cache can be shared by threads and worker processes.
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT asm FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        asm: dict[str, Any] = json.loads(row[0])
+        return asm
+
+    def put(self, key: str, asm: dict[str, Any]) -> None:
+        data = json.dumps(asm).encode()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, asm, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            (total_size,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            if total_size <= self.max_size_bytes:
+                return
+            for entry_key, size in connection.execute(
+                "SELECT key, size FROM entries ORDER BY accessed"
+            ).fetchall():
+                if total_size <= self.max_size_bytes:
+                    break
+                connection.execute("DELETE FROM entries WHERE key = ?", (entry_key,))
+                total_size -= size
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from io import BytesIO
 from pathlib import PureWindowsPath
+from typing import Any
 
 from allotropy.types import IOType
 
@@ -24,6 +25,11 @@ class NamedFileContents:
     contents: IOType
     original_file_path: str
     encoding: str | None = None
+    # Representations of the contents parsed while sniffing (e.g. an XML tree), reused by create_data
+    # so that vendor discovery does not parse a file twice.
+    parsed: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @cached_property
     def extension(self) -> str:
@@ -9,7 +9,9 @@ from pathlib import Path
 import re
 from typing import Any, cast
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 from allotropy.allotrope.models.shared.definitions.definitions import (
     FieldComponentDatatype,
@@ -78,8 +80,10 @@ from allotropy.parsers.utils.calculated_data_documents.definition import (
     Referenceable,
 )
 from allotropy.parsers.utils.pandas import read_csv, series_to_float_list, SeriesData
+from allotropy.parsers.utils.plate_grid import PlateGrid
 from allotropy.parsers.utils.uuids import random_uuid_str
 from allotropy.parsers.utils.values import (
+    assert_not_none,
     try_float,
     try_float_or_none,
     try_non_nan_float_or_none,
@@ -746,20 +750,13 @@ def get_concentrations(layout_lines: list[str] | None) -> dict[str, float | None
     data = read_csv(StringIO("\n".join(layout_lines[1:])), sep="\t")
     data = data.set_index(data.index.to_series().ffill(axis="index").values)
 
-    concentrations = {}
-    for row_name, row in data.iterrows():
-        label = row.iloc[-1]
-        if label == "Conc/Dil":
-            for col_index, col in enumerate(row.iloc[:-1]):
-                well_pos = f"{row_name}{col_index + 1}"
-                # Convert to float if possible
-                if not pd.isna(col):
-                    concentration_value = try_float_or_none(col)
-                    concentrations[well_pos] = concentration_value
-                else:
-                    concentrations[well_pos] = None
-
-    return concentrations
+    grid = PlateGrid.create(data, row_label_column=True)
+    grid = grid.select(assert_not_none(grid.labels) == "Conc/Dil")
+    # Values that are missing or not numbers are None
+    return {
+        well_pos: None if math.isnan(value) else value
+        for well_pos, value in zip(grid.wells, grid.get_floats().tolist(), strict=True)
+    }
 
 
 def get_identifiers(layout_lines: list[str] | None) -> dict[str, str]:
@@ -769,16 +766,18 @@ def get_identifiers(layout_lines: list[str] | None) -> dict[str, str]:
     data = read_csv(StringIO("\n".join(layout_lines[1:])), sep="\t")
     data = data.set_index(data.index.to_series().ffill(axis="index").values)
 
+    grid = PlateGrid.create(data, row_label_column=True)
+    grid = grid.select(~pd.isna(grid.values))
     identifiers = {}
-    for row_name, row in data.iterrows():
-        label = row.iloc[-1]
-        for col_index, col in enumerate(row.iloc[:-1]):
-            well_pos = f"{row_name}{col_index + 1}"
-            # Prefer Name to Well ID
-            if not pd.isna(col) and (
-                label == "Name" or label == "Well ID" and well_pos not in identifiers
-            ):
-                identifiers[well_pos] = col
+    for well_pos, label, value in zip(
+        grid.wells,
+        assert_not_none(grid.labels).tolist(),
+        grid.values.tolist(),
+        strict=True,
+    ):
+        # Prefer Name to Well ID
+        if label == "Name" or label == "Well ID" and well_pos not in identifiers:
+            identifiers[well_pos] = value
     return identifiers
 
 
@@ -794,6 +793,13 @@ def get_temperature(actual_temperature_lines: list[str] | None) -> float | None:
     )
 
 
+def _is_temperature_column(col_name: str) -> bool:
+    # Temperature columns are e.g. "T∞ 600" or "T° 600"
+    return col_name.startswith("T") and any(
+        char in col_name for char in ["∞", "°", "\u221e", "\u00b0"]
+    )
+
+
 def get_kinetic_measurements(
     kinetic_lines: list[str] | None,
 ) -> tuple[
@@ -806,63 +812,61 @@ def get_kinetic_measurements(
         .dropna(axis="columns", how="all")
         .dropna(axis="index", how="all")
     )
-
-    kinetic_measurements: defaultdict[str, list[float | None]] = defaultdict(
-        list[float | None]
+    kinetic_elapsed_time = _convert_times_to_seconds(data.index)
+    data = data.loc[:, [not _is_temperature_column(str(col)) for col in data.columns]]
+
+    # Convert the whole block at once. Columns read_csv parsed as numbers are used as they are, the
+    # others have their cells that to_numeric cannot coerce reported as errors.
+    values = np.full(data.shape, NEGATIVE_ZERO)
+    missing = np.zeros(data.shape, dtype=bool)
+    invalid = np.zeros(data.shape, dtype=bool)
+    is_numeric = np.array(
+        [is_numeric_dtype(dtype) for dtype in data.dtypes], dtype=bool
     )
-    kinetic_elapsed_time: list[float] = data.index.map(
-        lambda val: _convert_time_to_seconds(str(val))
-    ).to_list()
+    numeric_values = data.iloc[:, is_numeric.tolist()].to_numpy(dtype=np.float64)
+    values[:, is_numeric] = numeric_values
+    missing[:, is_numeric] = np.isnan(numeric_values)
+
+    raw = data.iloc[:, (~is_numeric).tolist()].to_numpy(dtype=object)
+    raw_missing = pd.isna(raw)
+    coerced = pd.to_numeric(raw.ravel(), errors="coerce").reshape(raw.shape)
+    raw_invalid = np.isnan(coerced) & ~raw_missing
+    raw_valid = ~raw_missing & ~raw_invalid
+    # Parse numeric strings with float() rather than keeping the coerced values, which can differ in
+    # the last bit for long decimal strings.
+    raw_values = np.full(raw.shape, NEGATIVE_ZERO)
+    raw_values[raw_valid] = raw[raw_valid].astype(np.float64)
+    values[:, ~is_numeric] = raw_values
+    missing[:, ~is_numeric] = raw_missing
+    invalid[:, ~is_numeric] = raw_invalid
 
     error_documents: dict[str, list[ErrorDocument]] = {}
-
-    for col_name, column in data.items():
-        # Skip temperature columns (e.g., "T∞ 600" or "T° 600")
-        col_name_str = str(col_name)
-        if col_name_str.startswith("T") and any(
-            char in col_name_str for char in ["∞", "°", "\u221e", "\u00b0"]
-        ):
+    # Column major, so that errors are grouped by well in time order.
+    for col_idx, row_idx in np.argwhere(invalid.T):
+        value = data.iat[row_idx, col_idx]
+        try:
+            # Values that float() accepts but to_numeric does not (e.g. "1_000").
+            values[row_idx, col_idx] = float(value)
             continue
+        except (ValueError, TypeError):
+            pass
+        # Only create error for non-empty values
+        if str_value := str(value).strip():
+            error_documents.setdefault(str(data.columns[col_idx]), []).append(
+                ErrorDocument(
+                    error=str_value,
+                    error_feature=f"{kinetic_elapsed_time[row_idx]}s",
+                )
+            )
 
-        well_values: list[float | None] = []
-        for idx, value in enumerate(column):
-            # Handle empty values
-            if pd.isna(value):
-                well_values.append(None)
-                continue
-
-            try:
-                float_value = float(value)
-                well_values.append(float_value)
-            except (ValueError, TypeError):
-                if value is not None:
-                    str_value = (
-                        str(value).strip()
-                        if not isinstance(value, str)
-                        else value.strip()
-                    )
-                    if str_value:  # Only create error for non-empty values
-                        time_point = (
-                            kinetic_elapsed_time[idx]
-                            if idx < len(kinetic_elapsed_time)
-                            else None
-                        )
-
-                        if str(col_name) not in error_documents:
-                            error_documents[str(col_name)] = []
-
-                        error_documents[str(col_name)].append(
-                            ErrorDocument(
-                                error=str_value,
-                                error_feature=f"{time_point}s",
-                            )
-                        )
-                # Use NEGATIVE_ZERO for non-numeric values
-                well_values.append(NEGATIVE_ZERO)
-
-        kinetic_measurements[str(col_name)] = well_values
+    well_values: list[list[float | None]] = values.T.tolist()
+    for col_idx, row_idx in np.argwhere(missing.T):
+        well_values[col_idx][row_idx] = None
+    kinetic_measurements: dict[str, list[float | None]] = {}
+    for col_name, column_values in zip(data.columns, well_values, strict=True):
+        kinetic_measurements[str(col_name)] = column_values
 
-    return dict(kinetic_measurements.items()), kinetic_elapsed_time, error_documents
+    return kinetic_measurements, kinetic_elapsed_time, error_documents
 
 
 @dataclass(frozen=True)
@@ -1604,6 +1608,23 @@ def _convert_time_to_seconds(time_str: str | None) -> float:
         raise AllotropeConversionError(msg) from None
 
 
+def _convert_times_to_seconds(times: pd.Index[Any]) -> list[float]:
+    """_convert_time_to_seconds for each of times, converting all of them at once."""
+    parts = pd.Series(times.astype(str)).str.split(":", expand=True)
+    try:
+        # Rows with fewer parts are padded with None, which would convert to NaN.
+        if parts.shape[1] != 3 or parts.isna().to_numpy().any():
+            raise ValueError
+        hours, minutes, seconds = (
+            parts[i].to_numpy(dtype=np.float64) for i in range(3)
+        )
+    except (ValueError, TypeError):
+        # Convert one at a time, for empty times, and to report the first invalid time.
+        return [_convert_time_to_seconds(str(time)) for time in times]
+    seconds_list: list[float] = (hours * 3600 + minutes * 60 + seconds).tolist()
+    return seconds_list
+
+
 class ResultProcessor(ABC):
     """Abstract base class for processing different types of Gen5 results."""
 
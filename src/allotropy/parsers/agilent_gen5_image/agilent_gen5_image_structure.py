@@ -4,8 +4,10 @@ from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass
 from io import StringIO
+import math
 import re
 
+from allotropy.allotrope.models.shared.definitions.definitions import InvalidJsonFloat
 from allotropy.allotrope.models.shared.definitions.units import UNITLESS
 from allotropy.allotrope.schema_mappers.adm.plate_reader.benchling._2023._09.plate_reader import (
     ImageFeature,
@@ -37,10 +39,11 @@ from allotropy.parsers.agilent_gen5_image.constants import (
 from allotropy.parsers.constants import NOT_APPLICABLE
 from allotropy.parsers.lines_reader import LinesReader, SectionLinesReader
 from allotropy.parsers.utils.pandas import read_csv
+from allotropy.parsers.utils.plate_grid import PlateGrid
 from allotropy.parsers.utils.uuids import random_uuid_str
 from allotropy.parsers.utils.values import (
+    assert_not_none,
     try_float,
-    try_float_or_nan,
     try_float_or_none,
 )
 
@@ -303,19 +306,21 @@ def create_results(
 
     image_features = defaultdict(list)
 
-    for row_name, row in data.iterrows():
-        feature_name = row.iloc[-1]
-        for col_index, value in enumerate(row.iloc[:-1]):
-            well_pos = f"{row_name}{col_index + 1}"
-            well_value = try_float_or_nan(value)
-
-            image_features[well_pos].append(
-                ImageFeature(
-                    identifier=random_uuid_str(),
-                    feature=feature_name,
-                    result=well_value,
-                )
+    # The last column of each row has the name of the feature in the row.
+    grid = PlateGrid.create(data, row_label_column=True)
+    for well_pos, feature_name, well_value in zip(
+        grid.wells,
+        assert_not_none(grid.labels).tolist(),
+        grid.get_floats().tolist(),
+        strict=True,
+    ):
+        image_features[well_pos].append(
+            ImageFeature(
+                identifier=random_uuid_str(),
+                feature=feature_name,
+                result=InvalidJsonFloat.NaN if math.isnan(well_value) else well_value,
             )
+        )
 
     groups = []
     num_measurements = sum(
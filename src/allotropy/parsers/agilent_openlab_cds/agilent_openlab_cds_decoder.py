@@ -1,14 +1,149 @@
 """ Decodes a zipped .rslt folder file into intermediate json"""
+from collections.abc import Collection, Iterator
+from functools import cache
 import os
 from pathlib import Path
 import re
 import tempfile
 from typing import Any, IO
+import xml.etree.ElementTree as ET  # noqa: N817
 import zipfile
 
+import numpy as np
 import rainbow.agilent.chemstation as rb  # type: ignore
 import xmltodict
 
+from allotropy.parsers.utils.xml_probe import local_name
+
+# Fields of the instrument, looked up in the instrument resource, then the first injection, then
+# the document info.
+INSTRUMENT_FIELDS = [
+    "Name",
+    "Technique",
+    "@id",
+    "Module",
+    "AcquisitionApplication",
+    "CreatedByUser",
+    "CreationDate",
+]
+_CHUNK_SIZE = 64 * 1024
+_DOC_PATH = ("ACAML", "Doc")
+_CONTENT_PATH = (*_DOC_PATH, "Content")
+_INJECTION_MEAS_DATA_PATH = (*_CONTENT_PATH, "Injections", "MeasData")
+_INJECTION_RESULT_PATH = (*_CONTENT_PATH, "Injections", "Result")
+# The elements of the sequence ACAML and of each InjectionACAML used for the ASM.
+ACAML_PATHS = [
+    (*_DOC_PATH, "DocInfo"),
+    (*_CONTENT_PATH, "Resources", "Instrument"),
+    (*_CONTENT_PATH, "Resources", "SeparationMedium"),
+    (*_CONTENT_PATH, "Samples", "Setup"),
+    (*_CONTENT_PATH, "Samples", "MeasData"),
+    (*_INJECTION_MEAS_DATA_PATH, "Signal"),
+    *[
+        (*_INJECTION_MEAS_DATA_PATH, field)
+        for field in INSTRUMENT_FIELDS
+        if not field.startswith("@")
+    ],
+]
+INJECTION_ACAML_PATHS = [
+    (*_INJECTION_RESULT_PATH, "SignalResult", "Peak"),
+    (*_INJECTION_RESULT_PATH, "SignalResult", "Signal_ID"),
+    (*_INJECTION_RESULT_PATH, "InjectionCompound"),
+]
+
+
+def _push_value(item: dict[str, Any], key: str, value: Any) -> None:
+    # As xmltodict, the values of repeated elements are collected in a list.
+    if key not in item:
+        item[key] = value
+    elif isinstance(item[key], list):
+        item[key].append(value)
+    else:
+        item[key] = [item[key], value]
+
+
+@cache
+def _get_name(tag: str) -> str:
+    return local_name(tag)
+
+
+def _get_attributes(element: ET.Element) -> dict[str, Any]:
+    return {f"@{_get_name(key)}": value for key, value in element.attrib.items()}
+
+
+def element_to_dict(element: ET.Element) -> Any:
+    """The element as converted by xmltodict.parse, with names without their namespaces."""
+    item = _get_attributes(element) if element.attrib else {}
+    if len(element):
+        for child in element:
+            _push_value(item, _get_name(child.tag), element_to_dict(child))
+        text = "".join(
+            [element.text or "", *(child.tail or "" for child in element)]
+        ).strip()
+    else:
+        text = element.text.strip() if element.text else ""
+    if not item:
+        return text or None
+    if text:
+        item["#text"] = text
+    return item
+
+
+def _iter_xml_events(xml_file: IO[bytes]) -> Iterator[tuple[str, ET.Element]]:
+    parser = ET.XMLPullParser(events=("start", "end"))
+    while chunk := xml_file.read(_CHUNK_SIZE):
+        parser.feed(chunk)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def parse_xml_elements(
+    xml_file: IO[bytes], paths: Collection[tuple[str, ...]]
+) -> dict[str, Any]:
+    """Parse the elements at paths (the local names of the element and its ancestors) as xmltodict.parse does.
+
+    The document is parsed incrementally, and every other element is left out (and discarded as
+    soon as it is parsed), except for the attributes of the ancestors of the elements at paths.
+    """
+    element_paths = set(paths)
+    ancestor_paths = {path[:i] for path in paths for i in range(1, len(path))}
+    data: dict[str, Any] = {}
+    # The items of the ancestors of the current element.
+    items = [data]
+    path: tuple[str, ...] = ()
+    # Within an element at one of paths, or an element that is left out, the depth from its start.
+    depth = 0
+    keep = False
+    for event, element in _iter_xml_events(xml_file):
+        if depth:
+            depth += 1 if event == "start" else -1
+            if depth == 0:
+                if keep:
+                    _push_value(items[-1], path[-1], element_to_dict(element))
+                element.clear()
+                path = path[:-1]
+            elif event == "end" and not keep:
+                element.clear()
+            continue
+
+        if event == "start":
+            path = (*path, _get_name(element.tag))
+            if path in ancestor_paths:
+                item = _get_attributes(element)
+                _push_value(items[-1], path[-1], item)
+                items.append(item)
+            else:
+                depth = 1
+                keep = path in element_paths
+            continue
+
+        # The end of an ancestor.
+        items.pop()
+        element.clear()
+        path = path[:-1]
+    return data
+
 
 def merge_peak_with_signal_name(
     peak_data: list[dict[str, Any]],
@@ -51,15 +186,15 @@ def decode_data_cubes(
         raw_data = rb.parse_ch(fp.name)
     if ".CH" in os.path.basename(datacube_file_name):
         datacubes = {
-            "Time": [time * 60 for time in raw_data.xlabels],
-            "Intensity": [float(sublist[0]) for sublist in raw_data.data],
+            "Time": raw_data.xlabels * 60,
+            "Intensity": raw_data.data[:, 0].astype(np.float64),
             "Metadata": raw_data.metadata,
             "Chromatogram filename": os.path.basename(datacube_file_name),
         }
     else:
         datacubes = {
-            "Time": [time * 60 for time in raw_data.xlabels],
-            "Pressure": [float(sublist[0]) / 10 for sublist in raw_data.data],
+            "Time": raw_data.xlabels * 60,
+            "Pressure": raw_data.data[:, 0].astype(np.float64) / 10,
             "Metadata": raw_data.metadata,
             "Chromatogram filename": os.path.basename(datacube_file_name),
         }
@@ -80,7 +215,7 @@ def extract_rx_file(rx_file: IO[bytes]) -> list[dict[str, Any]]:
             iter(_get_matching_filenames(zip_ref, ".*InjectionACAML"))
         )
         with zip_ref.open(processed_file_path) as processed_file:
-            peaks = xmltodict.parse(processed_file.read().decode("utf-8-sig"))
+            peaks = parse_xml_elements(processed_file, INJECTION_ACAML_PATHS)
             for peak in peaks["ACAML"]["Doc"]["Content"]["Injections"]["Result"][
                 "SignalResult"
             ]:
@@ -161,8 +296,7 @@ def extract_dx_file(
     with zipfile.ZipFile(dx_file, "r") as zip_ref:
         acmd_filepath = next(iter(_get_matching_filenames(zip_ref, r".*\.acmd")))
         with zip_ref.open(acmd_filepath) as injection_file_data:
-            acmd_data = injection_file_data.read().decode("utf-8-sig")
-            injection_data = xmltodict.parse(acmd_data)
+            injection_data = xmltodict.parse(injection_file_data)
             injection_data["ACMD"]["InjectionInfo"].pop("Signals")
             for sample_setup in injection_metadata_data["SampleSetup"]:
                 if (
@@ -209,9 +343,9 @@ def extract_sqx_file(sqx_file: IO[bytes]) -> dict[str, Any]:
             iter(_get_matching_filenames(zip_ref, ".*SampleListPart$"))
         )
         with zip_ref.open(sample_file_path) as sample_file:
-            sequence_sample_data["AnalysisMethod"] = xmltodict.parse(
-                sample_file.read()
-            )["SequenceTable"]["anyType"][0]["AnalysisMethod"]
+            sequence_sample_data["AnalysisMethod"] = xmltodict.parse(sample_file)[
+                "SequenceTable"
+            ]["anyType"][0]["AnalysisMethod"]
             return sequence_sample_data
 
 
@@ -229,16 +363,7 @@ def decode_acaml_data(
     signal_details: dict[str, Any] = {"Signal details": []}
 
     content_data = acaml_content["ACAML"]["Doc"]["Content"]
-    instrument_fields = [
-        "Name",
-        "Technique",
-        "@id",
-        "Module",
-        "AcquisitionApplication",
-        "CreatedByUser",
-        "CreationDate",
-    ]
-    for key in instrument_fields:
+    for key in INSTRUMENT_FIELDS:
         if key in content_data["Resources"]["Instrument"]:
             instrument_data[key] = content_data["Resources"]["Instrument"][key]
         elif key in content_data["Injections"]["MeasData"][0]:
@@ -287,8 +412,7 @@ def decode_data(input_bytes: IO[bytes]) -> dict[str, Any]:
     with zipfile.ZipFile(input_bytes) as zip_ref:
         acaml_path = next(iter(_get_matching_filenames(zip_ref, ".*acaml")))
         with zip_ref.open(acaml_path) as acaml_file_data:
-            acaml_file_content = acaml_file_data.read().decode("utf-8-sig")
-            decoded_acaml_content = xmltodict.parse(acaml_file_content)
+            decoded_acaml_content = parse_xml_elements(acaml_file_data, ACAML_PATHS)
         (
             intermediate_metadata,
             pump_pressure_file,
@@ -2,6 +2,9 @@
 import os
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from allotropy.allotrope.models.shared.definitions.definitions import (
     FieldComponentDatatype,
 )
@@ -26,8 +29,8 @@ from allotropy.parsers.utils.values import (
 
 def create_data_cube(
     label: str,
-    dimension_value: list[float],
-    measures_value: list[float],
+    dimension_value: NDArray[np.float64],
+    measures_value: NDArray[np.float64],
     data_cube_component: DataCubeComponent,
 ) -> DataCube:
     return DataCube(
@@ -14,6 +14,7 @@ from allotropy.parsers.agilent_tapestation_analysis.agilent_tapestation_analysis
     create_metadata,
 )
 from allotropy.parsers.release_state import ReleaseState
+from allotropy.parsers.utils.xml_probe import has_root_children, parse_xml
 from allotropy.parsers.vendor_parser import VendorParser
 
 
@@ -27,21 +28,15 @@ class AgilentTapestationAnalysisParser(VendorParser[Data, Model]):
     @classmethod
     def sniff(cls, named_file_contents: NamedFileContents) -> bool:
         try:
-            tree = ET.parse(named_file_contents.contents)  # noqa: S314
-            root = tree.getroot()
-            child_tags = {
-                child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                for child in root
-            }
-            return "FileInformation" in child_tags and "ScreenTapes" in child_tags
+            return has_root_children(
+                named_file_contents, ["FileInformation", "ScreenTapes"], root_tag="File"
+            )
         except Exception:
             return False
 
     def create_data(self, named_file_contents: NamedFileContents) -> Data:
         try:
-            root_element = ET.parse(  # noqa: S314
-                named_file_contents.contents
-            ).getroot()
+            root_element = parse_xml(named_file_contents)
         except ET.ParseError as e:
             msg = f"There was an error when trying to read the xml file: {e}"
             raise AllotropeConversionError(msg) from e
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Container
 from io import StringIO
 import re
+from typing import Any
 
 import numpy as np
+from numpy.typing import NDArray
 import pandas as pd
+from pandas.api.types import infer_dtype
 
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.appbio_quantstudio.constants import (
+    NUMERIC_SECTIONS,
+    PARSED_SECTIONS,
+)
 from allotropy.parsers.lines_reader import LinesReader, SectionLinesReader
 from allotropy.parsers.utils.pandas import (
     df_to_series_data,
@@ -20,12 +28,75 @@ from allotropy.parsers.utils.pandas import (
 )
 from allotropy.parsers.utils.values import assert_not_none, try_int_or_none
 
+_NUMERIC_INFERRED_DTYPES = ("integer", "floating", "mixed-integer-float")
+
+
+def _to_slice(positions: NDArray[np.intp]) -> slice | NDArray[np.intp]:
+    # Sorted positions without gaps select a contiguous block, which a slice views without copying.
+    if len(positions) and positions[-1] - positions[0] + 1 == len(positions):
+        return slice(int(positions[0]), int(positions[-1]) + 1)
+    return positions
+
+
+class SectionIndex:
+    """The rows of each group of a section (e.g. of each well, or each well and target).
+
+    Groups are found with a single groupby over the section. Column values of a group are slices of
+    the section's column arrays, which are views when the group's rows are contiguous, as they are in
+    instrument exports.
+    """
+
+    def __init__(self, data: pd.DataFrame, keys: list[str]) -> None:
+        self.data = data
+        self.groups: dict[Any, slice | NDArray[np.intp]] = {
+            group: _to_slice(np.asarray(positions))
+            for group, positions in data.groupby(keys).indices.items()
+        }
+        self._columns: dict[str, NDArray[Any]] = {}
+
+    def get_column(self, name: str) -> NDArray[Any]:
+        """The values of a column, as floats if they are all numbers (ints included), otherwise as objects.
+
+        Missing values are None, so columns with missing values are object arrays.
+        """
+        if (column := self._columns.get(name)) is None:
+            column = self.data[name].to_numpy()
+            if column.dtype.kind in "iu" or (
+                column.dtype == object
+                and infer_dtype(column, skipna=False) in _NUMERIC_INFERRED_DTYPES
+            ):
+                column = column.astype(np.float64)
+            if column.dtype.kind == "f" and (missing := np.isnan(column)).any():
+                column = column.astype(object)
+                column[missing] = None
+            self._columns[name] = column
+        return column
+
+    def get_values(self, group: Any, name: str) -> NDArray[Any]:
+        return self.get_column(name)[self.groups[group]]
+
+    def get_rows(self, group: Any) -> pd.DataFrame:
+        return self.data.iloc[self.groups[group]]
+
 
 class AppBioQuantStudioReader:
     SUPPORTED_EXTENSIONS = "txt,xlsx"
     header: SeriesData
     sections: dict[str, pd.DataFrame]
 
+    def __init__(self) -> None:
+        self._section_indices: dict[tuple[str, tuple[str, ...]], SectionIndex] = {}
+
+    def get_section_index(self, title: str, *keys: str) -> SectionIndex | None:
+        """The index of a section by the given columns, computed once per reader."""
+        if (data := self.sections.get(title)) is None:
+            return None
+        if (index := self._section_indices.get((title, keys))) is None:
+            index = self._section_indices[(title, keys)] = SectionIndex(
+                data, list(keys)
+            )
+        return index
+
     @staticmethod
     def create(named_file_contents: NamedFileContents) -> AppBioQuantStudioReader:
         if named_file_contents.extension == "xlsx":
@@ -49,6 +120,7 @@ class AppBioQuantStudioXLSXReader(AppBioQuantStudioReader):
         header: SeriesData | None = None,
         sections: dict[str, pd.DataFrame] | None = None,
     ) -> None:
+        super().__init__()
         self.contents = contents
         self.header = header or self.get_header(contents)
         self.sections = sections or self.get_sections(contents)
@@ -78,10 +150,16 @@ class AppBioQuantStudioXLSXReader(AppBioQuantStudioReader):
 
 
 class AppBioQuantStudioTXTReader(AppBioQuantStudioReader):
-    def __init__(self, named_file_contents: NamedFileContents) -> None:
+    def __init__(
+        self,
+        named_file_contents: NamedFileContents,
+        section_titles: Container[str] | None = PARSED_SECTIONS,
+    ) -> None:
+        """Read the header, and the sections in section_titles (all sections if None)."""
+        super().__init__()
         reader = SectionLinesReader.create(named_file_contents)
         self.header = self.get_header(reader)
-        self.sections = self.get_sections(reader)
+        self.sections = self.get_sections(reader, section_titles)
 
     def get_header(self, reader: LinesReader) -> SeriesData:
         lines = [line.strip() for line in reader.pop_until(r"^\[.+\]") if line.strip()]
@@ -96,7 +174,9 @@ class AppBioQuantStudioTXTReader(AppBioQuantStudioReader):
         raw_data.index = raw_data.index.str.replace("*", "")
         return df_to_series_data(raw_data.T.replace(np.nan, None))
 
-    def get_sections(self, reader: SectionLinesReader) -> dict[str, pd.DataFrame]:
+    def get_sections(
+        self, reader: SectionLinesReader, section_titles: Container[str] | None
+    ) -> dict[str, pd.DataFrame]:
         sections = {}
         for section_reader in reader.iter_sections(r"^\[.+\]"):
             match = re.match(
@@ -108,17 +188,24 @@ class AppBioQuantStudioTXTReader(AppBioQuantStudioReader):
                     match, f"Cannot read title section: {section_reader.get()}"
                 ).groups()[0]
             )
-            data_lines = list(section_reader.pop_until_empty())
+            if section_titles is not None and title not in section_titles:
+                continue
+
+            data_text = section_reader.pop_until_empty_as_text()
             section_reader.drop_empty()
-            metadata_lines = list(section_reader.pop_until_empty())
-            if title == "Results" and metadata_lines:
+            metadata_text = section_reader.pop_until_empty_as_text()
+            if title == "Results" and metadata_text:
                 # Treat results metadata as an additional section
-                csv_stream = StringIO("\n".join(metadata_lines))
                 sections["Results Metadata"] = read_csv(
-                    csv_stream, header=None, sep="=", skipinitialspace=True, index_col=0
+                    StringIO(metadata_text),
+                    header=None,
+                    sep="=",
+                    skipinitialspace=True,
+                    index_col=0,
                 ).T
 
-            sections[title] = read_csv(
-                StringIO("\n".join(data_lines)), sep="\t", thousands=r","
-            ).replace(np.nan, None)
+            data = read_csv(StringIO(data_text or ""), sep="\t", thousands=r",")
+            sections[title] = (
+                data if title in NUMERIC_SECTIONS else data.replace(np.nan, None)
+            )
         return sections
@@ -8,9 +8,11 @@ from typing import Any, TypeVar
 import pandas as pd
 
 from allotropy.allotrope.schema_mappers.adm.pcr.rec._2024._09.qpcr import SampleRoleType
+from allotropy.allotrope.schema_mappers.data_cube import DimensionValues, MeasureValues
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.parsers.appbio_quantstudio.appbio_quantstudio_reader import (
     AppBioQuantStudioReader,
+    SectionIndex,
 )
 from allotropy.parsers.appbio_quantstudio.constants import (
     ExperimentType,
@@ -25,10 +27,10 @@ from allotropy.parsers.utils.values import assert_not_none, try_int
 T = TypeVar("T")
 
 
-def map_wells(map_func: Callable[..., T], data: pd.DataFrame) -> dict[int, T]:
+def map_wells(map_func: Callable[[Any], T], index: SectionIndex) -> dict[int, T]:
+    """Map each well of a section indexed by "Well" to map_func(well)."""
     return {
-        try_int(str(well_id), "well id"): map_func(well_data)
-        for well_id, well_data in data.groupby("Well")
+        try_int(str(well_id), "well id"): map_func(well_id) for well_id in index.groups
     }
 
 
@@ -252,9 +254,11 @@ class Well:
         if experiment_type == ExperimentType.genotyping_qpcr_experiment:
             return map_rows(data, Well.create_genotyping)
         else:
+            index = SectionIndex(data[data["Target Name"].notnull()], ["Well"])
             return list(
                 map_wells(
-                    Well.create_generic, data[data["Target Name"].notnull()]
+                    lambda well_id: Well.create_generic(index.get_rows(well_id)),
+                    index,
                 ).values()
             )
 
@@ -262,60 +266,62 @@ class Well:
 @dataclass(frozen=True)
 class AmplificationData:
     total_cycle_number_setting: float
-    cycle: list[float]
-    rn: list[float | None]
-    delta_rn: list[float | None]
+    cycle: DimensionValues
+    rn: MeasureValues
+    delta_rn: MeasureValues
 
 
 def create_amplification_data(
     reader: AppBioQuantStudioReader,
 ) -> dict[int, dict[str, AmplificationData]]:
-    if (data := reader.sections.get("Amplification Data")) is None:
+    index = reader.get_section_index("Amplification Data", "Well", "Target Name")
+    if index is None:
         return {}
 
-    def make_data(well_data: pd.DataFrame) -> dict[str, AmplificationData]:
-        return {
-            str(target_name): AmplificationData(
-                total_cycle_number_setting=float(target_data["Cycle"].max()),
-                cycle=target_data["Cycle"].tolist(),
-                rn=target_data["Rn"].tolist(),
-                delta_rn=target_data["Delta Rn"].tolist(),
-            )
-            for target_name, target_data in well_data.groupby("Target Name")
-        }
-
-    return map_wells(make_data, data)
+    amplification_data: dict[int, dict[str, AmplificationData]] = {}
+    for group in index.groups:
+        well_id, target_name = group
+        cycle = index.get_values(group, "Cycle")
+        amplification_data.setdefault(try_int(str(well_id), "well id"), {})[
+            str(target_name)
+        ] = AmplificationData(
+            total_cycle_number_setting=float(cycle.max()),
+            cycle=cycle,
+            rn=index.get_values(group, "Rn"),
+            delta_rn=index.get_values(group, "Delta Rn"),
+        )
+    return amplification_data
 
 
 @dataclass(frozen=True)
 class MulticomponentData:
-    cycle: list[float]
-    columns: dict[str, list[float | None]]
+    cycle: DimensionValues
+    columns: dict[str, MeasureValues]
 
-    def get_column(self, name: str) -> list[float | None]:
-        return assert_not_none(
-            self.columns.get(name),
-            msg=f"Unable to obtain '{name}' from multicomponent data.",
-        )
+    def get_column(self, name: str) -> MeasureValues:
+        if (column := self.columns.get(name)) is None:
+            msg = f"Unable to obtain '{name}' from multicomponent data."
+            raise AllotropeConversionError(msg)
+        return column
 
 
 def create_multicomponent_data(
     reader: AppBioQuantStudioReader,
 ) -> dict[int, MulticomponentData]:
-    if (data := reader.sections.get("Multicomponent Data")) is None:
+    if (index := reader.get_section_index("Multicomponent Data", "Well")) is None:
         return {}
 
-    def make_data(well_data: pd.Series[Any]) -> MulticomponentData:
+    def make_data(well_id: Any) -> MulticomponentData:
         return MulticomponentData(
-            cycle=well_data["Cycle"].tolist(),
+            cycle=index.get_values(well_id, "Cycle"),
             columns={
-                name: well_data[name].tolist()
-                for name in well_data
+                str(name): index.get_values(well_id, str(name))
+                for name in index.data
                 if name not in ["Well", "Cycle", "Well Position"]
             },
         )
 
-    return map_wells(make_data, data)
+    return map_wells(make_data, index)
 
 
 @dataclass(frozen=True)
@@ -399,18 +405,18 @@ class Result:
         if experiment_type == ExperimentType.genotyping_qpcr_experiment:
             target_key = "SNP Assay Name"
 
-        def make_results(well_data: pd.DataFrame) -> dict[str, Result]:
-            return {
-                target_dna_description: result
-                for target_id, target_data in well_data.groupby(target_key)
-                for target_dna_description, result in Result.create_result(
-                    df_to_series_data(target_data),
+        results: dict[int, dict[str, Result]] = {}
+        index = SectionIndex(data, ["Well", target_key])
+        for group in index.groups:
+            well_id, target_id = group
+            results.setdefault(try_int(str(well_id), "well id"), {}).update(
+                Result.create_result(
+                    df_to_series_data(index.get_rows(group)),
                     experiment_type,
                     str(target_id),
-                ).items()
-            }
-
-        return map_wells(make_results, data)
+                )
+            )
+        return results
 
     @staticmethod
     def create_result(
@@ -516,20 +522,20 @@ class Result:
 
 @dataclass(frozen=True)
 class MeltCurveRawData:
-    reading: list[float]
-    fluorescence: list[float | None]
-    derivative: list[float | None]
+    reading: DimensionValues
+    fluorescence: MeasureValues
+    derivative: MeasureValues
 
     @staticmethod
     def create(reader: AppBioQuantStudioReader) -> dict[int, MeltCurveRawData]:
-        if (data := reader.sections.get("Melt Curve Raw Data")) is None:
+        if (index := reader.get_section_index("Melt Curve Raw Data", "Well")) is None:
             return {}
 
-        def make_data(well_data: pd.Series[Any]) -> MeltCurveRawData:
+        def make_data(well_id: Any) -> MeltCurveRawData:
             return MeltCurveRawData(
-                reading=well_data["Reading"].tolist(),
-                fluorescence=well_data["Fluorescence"].tolist(),
-                derivative=well_data["Derivative"].tolist(),
+                reading=index.get_values(well_id, "Reading"),
+                fluorescence=index.get_values(well_id, "Fluorescence"),
+                derivative=index.get_values(well_id, "Derivative"),
             )
 
-        return map_wells(make_data, data)
+        return map_wells(make_data, index)
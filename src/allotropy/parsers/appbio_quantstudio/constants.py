@@ -17,6 +17,22 @@ class ExperimentType(str, Enum):
     primary_analysis_experiment = "primary analysis experiment"
 
 
+# Sections of TXT exports read by the parser, other sections (e.g. "Raw Data") are skipped.
+PARSED_SECTIONS = frozenset(
+    {
+        "Sample Setup",
+        "Amplification Data",
+        "Multicomponent Data",
+        "Results",
+        "Melt Curve Raw Data",
+    }
+)
+# Sections of numeric data per well. They are kept with typed columns, and missing values are
+# converted to None when columns are read through a SectionIndex.
+NUMERIC_SECTIONS = frozenset(
+    {"Amplification Data", "Multicomponent Data", "Melt Curve Raw Data"}
+)
+
 SAMPLE_ROLE_TYPES_MAP = {
     "NTC": SampleRoleType.control_sample_role,
     "STANDARD": SampleRoleType.standard_sample_role,
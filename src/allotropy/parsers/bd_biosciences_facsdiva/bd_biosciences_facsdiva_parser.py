@@ -16,6 +16,7 @@ from allotropy.parsers.bd_biosciences_facsdiva.bd_biosciences_facsdiva_structure
 from allotropy.parsers.bd_biosciences_facsdiva.constants import DISPLAY_NAME
 from allotropy.parsers.release_state import ReleaseState
 from allotropy.parsers.utils.strict_xml_element import StrictXmlElement
+from allotropy.parsers.utils.xml_probe import has_any_root_child, parse_xml, probe_xml
 from allotropy.parsers.vendor_parser import VendorParser
 
 
@@ -29,25 +30,18 @@ class BDFACSDivaParser(VendorParser[Data, Model]):
     @classmethod
     def sniff(cls, named_file_contents: NamedFileContents) -> bool:
         try:
-            tree = ET.parse(named_file_contents.contents)  # noqa: S314
-            root = tree.getroot()
-            root_tag = root.tag.split("}")[-1] if "}" in root.tag else root.tag
-            if root_tag == "bdfacs":
+            probe = probe_xml(named_file_contents)
+            if probe is None:
+                return False
+            if probe.root_tag == "bdfacs":
                 return True
-            child_tags = {
-                child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                for child in root
-            }
-            return "experiment" in child_tags or "specimen" in child_tags
+            return has_any_root_child(named_file_contents, ["experiment", "specimen"])
         except Exception:
             return False
 
     def create_data(self, named_file_contents: NamedFileContents) -> Data:
         try:
-            root_element_et = ET.parse(  # noqa: S314
-                named_file_contents.contents
-            ).getroot()
-            root_element = StrictXmlElement(root_element_et)
+            root_element = StrictXmlElement(parse_xml(named_file_contents))
         except ET.ParseError as e:
             msg = f"There was an error when trying to read the xml file: {e}"
             raise AllotropeParsingError(msg) from e
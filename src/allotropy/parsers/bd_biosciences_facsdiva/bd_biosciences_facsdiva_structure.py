@@ -5,9 +5,9 @@ from pathlib import Path
 from allotropy.allotrope.models.shared.definitions.definitions import (
     TStatisticDatumRole,
 )
-from allotropy.allotrope.models.shared.definitions.quantity_values import (
-    TQuantityValueRelativeFluorescenceUnit,
-    TQuantityValueSecondTime,
+from allotropy.allotrope.models.shared.definitions.units import (
+    RelativeFluorescenceUnit,
+    SecondTime,
 )
 from allotropy.allotrope.schema_mappers.adm.flow_cytometry.benchling._2025._03.flow_cytometry import (
     CompensationMatrix,
@@ -343,14 +343,14 @@ def _create_data_regions(tube: StrictXmlElement) -> list[DataRegion]:
 
                 if x_coord is not None and y_coord is not None:
                     x_unit = (
-                        TQuantityValueSecondTime.unit
+                        SecondTime.unit
                         if x_param and "Time" in x_param
-                        else TQuantityValueRelativeFluorescenceUnit.unit
+                        else RelativeFluorescenceUnit.unit
                     )
                     y_unit = (
-                        TQuantityValueSecondTime.unit
+                        SecondTime.unit
                         if y_param and "Time" in y_param
-                        else TQuantityValueRelativeFluorescenceUnit.unit
+                        else RelativeFluorescenceUnit.unit
                     )
 
                     vertices.append(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from xml.etree import ElementTree
 import zipfile
 
 import openpyxl
@@ -20,6 +19,7 @@ from allotropy.parsers.beckman_vi_cell_xr.vi_cell_xr_structure import (
     create_metadata,
 )
 from allotropy.parsers.release_state import ReleaseState
+from allotropy.parsers.utils.xml_probe import iter_xml_text
 from allotropy.parsers.vendor_parser import VendorParser
 
 _VI_CELL_MARKERS = ("Vi-CELL", "Vi-Cell")
@@ -40,13 +40,12 @@ class ViCellXRParser(VendorParser[Data, Model]):
             if "xl/sharedStrings.xml" not in zf.namelist():
                 return False
             with zf.open("xl/sharedStrings.xml") as ss:
-                tree = ElementTree.parse(ss)  # noqa: S314
-                for elem in tree.iter():
-                    if elem.text and any(
-                        marker in elem.text for marker in _VI_CELL_MARKERS
-                    ):
-                        return True
-        return False
+                # Stop at the first match, without parsing the rest of the strings.
+                return any(
+                    marker in text
+                    for text in iter_xml_text(ss)
+                    for marker in _VI_CELL_MARKERS
+                )
 
     @classmethod
     def sniff(cls, named_file_contents: NamedFileContents) -> bool:
@@ -1,5 +1,3 @@
-import json
-
 from allotropy.allotrope.models.adm.liquid_chromatography.benchling._2023._09.liquid_chromatography import (
     Model,
 )
@@ -10,6 +8,7 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.benchling_chromeleon.benchling_chromeleon_reader import (
     BenchlingChromeleonReader,
+    has_injections,
 )
 from allotropy.parsers.benchling_chromeleon.benchling_chromeleon_structure import (
     create_measurement_groups,
@@ -17,6 +16,7 @@ from allotropy.parsers.benchling_chromeleon.benchling_chromeleon_structure impor
 )
 from allotropy.parsers.benchling_chromeleon.constants import DISPLAY_NAME
 from allotropy.parsers.release_state import ReleaseState
+from allotropy.parsers.utils.iterables import prefetch_first
 from allotropy.parsers.vendor_parser import VendorParser
 
 
@@ -30,8 +30,7 @@ class BenchlingChromeleonParser(VendorParser[Data, Model]):
     @classmethod
     def sniff(cls, named_file_contents: NamedFileContents) -> bool:
         try:
-            data = json.load(named_file_contents.contents)
-            return isinstance(data, dict) and isinstance(data.get("injections"), list)
+            return has_injections(named_file_contents)
         except Exception:
             return False
 
@@ -39,10 +38,10 @@ class BenchlingChromeleonParser(VendorParser[Data, Model]):
         reader = BenchlingChromeleonReader(named_file_contents)
         return Data(
             create_metadata(
-                reader.injections[0],
+                reader.first_injection,
                 reader.sequence,
                 named_file_contents.original_file_path,
                 reader.device_information,
             ),
-            create_measurement_groups(reader.injections),
+            prefetch_first(create_measurement_groups(reader.iter_injections())),
         )
@@ -1,22 +1,68 @@
-import json
+from collections.abc import Iterator
 from typing import Any
 
 from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.utils.json_stream import JsonStream, read_json_text
 from allotropy.parsers.utils.values import assert_not_none
 
 
+def _decode_chromatogram(stream: JsonStream) -> Any:
+    return stream.decode_object(
+        {"x": JsonStream.decode_float_array, "y": JsonStream.decode_float_array}
+    )
+
+
+def _decode_signal(stream: JsonStream) -> Any:
+    return stream.decode_object({"chromatogram": _decode_chromatogram})
+
+
+def _decode_injection(stream: JsonStream) -> Any:
+    return stream.decode_object(
+        {"signals": lambda signals: signals.decode_array(_decode_signal)}
+    )
+
+
+def has_injections(named_file_contents: NamedFileContents) -> bool:
+    stream = JsonStream(read_json_text(named_file_contents))
+    for key in stream.iter_members():
+        if key == "injections" and stream.peek() == "[":
+            return True
+    return False
+
+
 class BenchlingChromeleonReader:
+    """Reads the sequence and device information of an export, and then its injections one at a time.
+
+    Chromatograms are decoded straight into float arrays (or lists, if they have nulls), and an
+    injection is only decoded when iter_injections reaches it.
+    """
+
     SUPPORTED_EXTENSIONS = "json"
     sequence: dict[str, Any]
-    injections: list[dict[str, Any]]
     device_information: dict[str, Any]
+    first_injection: dict[str, Any]
 
     def __init__(self, named_file_contents: NamedFileContents) -> None:
-        contents: dict[str, Any] = json.load(named_file_contents.contents)
-        self.sequence: dict[str, Any] = contents.get("sequence", {})
-        self.device_information: dict[str, Any] = (
-            contents.get("device information") or {}
-        )
-        self.injections: list[dict[str, Any]] = assert_not_none(
-            contents.get("injections"), "injections"
+        self.text = read_json_text(named_file_contents)
+        self.sequence = {}
+        self.device_information = {}
+        injections_pos: int | None = None
+        stream = JsonStream(self.text)
+        for key in stream.iter_members():
+            if key == "sequence":
+                self.sequence = stream.decode()
+            elif key == "device information":
+                self.device_information = stream.decode() or {}
+            elif key == "injections" and stream.peek() == "[":
+                injections_pos = stream.pos
+            # Other members, and the injections, are skipped.
+
+        self.injections_pos = assert_not_none(injections_pos, "injections")
+        self.first_injection = assert_not_none(
+            next(self.iter_injections(), None), "injections"
         )
+
+    def iter_injections(self) -> Iterator[dict[str, Any]]:
+        stream = JsonStream(self.text, self.injections_pos)
+        for _ in stream.iter_items():
+            yield _decode_injection(stream)
@@ -1,6 +1,9 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from allotropy.allotrope.models.shared.definitions.definitions import (
     FieldComponentDatatype,
 )
@@ -89,19 +92,19 @@ def _validate_injection_volume_unit(injection_volume: float, unit: str) -> float
 
 
 def _get_chromatogram(signal: dict[str, Any]) -> DataCube | None:
-    chrom: dict[str, list[float]] | None = signal.get("chromatogram")
+    chrom: dict[str, Any] | None = signal.get("chromatogram")
     if not chrom:
         return None
     if len(chrom) != 2:
         msg = "Expected chrom to have two lists"
         raise AllotropeConversionError(msg)
 
-    dimensions = chrom["x"]
+    # Measures with nulls are decoded as lists, which keeps the nulls.
     measures = chrom["y"]
 
     # ASM expected chromatogram dimensions (x axis) to be in seconds, but Chromeleon reports it in minutes,
     # so convert here.
-    dimensions = [t * 60 for t in dimensions]
+    dimensions = np.asarray(chrom["x"], dtype=np.float64) * 60
 
     return DataCube(
         label=signal["signal name"],
@@ -295,14 +298,12 @@ def _create_measurements(injection: dict[str, Any]) -> list[Measurement] | None:
 
 
 def create_measurement_groups(
-    injections: list[dict[str, Any]]
-) -> list[MeasurementGroup]:
-    return [
-        MeasurementGroup(
-            measurements=measurements,
-            analyst=injection.get("last update user name"),
-            submitter=injection.get("creation user name"),
-        )
-        for injection in injections
-        if (measurements := _create_measurements(injection)) is not None
-    ]
+    injections: Iterable[dict[str, Any]]
+) -> Iterator[MeasurementGroup]:
+    for injection in injections:
+        if (measurements := _create_measurements(injection)) is not None:
+            yield MeasurementGroup(
+                measurements=measurements,
+                analyst=injection.get("last update user name"),
+                submitter=injection.get("creation user name"),
+            )
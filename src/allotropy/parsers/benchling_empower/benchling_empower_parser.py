@@ -1,5 +1,3 @@
-import json
-
 from allotropy.allotrope.models.adm.liquid_chromatography.benchling._2023._09.liquid_chromatography import (
     Model,
 )
@@ -10,6 +8,7 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.benchling_empower.benchling_empower_reader import (
     BenchlingEmpowerReader,
+    has_values_fields,
 )
 from allotropy.parsers.benchling_empower.benchling_empower_structure import (
     create_measurement_groups,
@@ -17,6 +16,7 @@ from allotropy.parsers.benchling_empower.benchling_empower_structure import (
 )
 from allotropy.parsers.benchling_empower.constants import DISPLAY_NAME
 from allotropy.parsers.release_state import ReleaseState
+from allotropy.parsers.utils.iterables import prefetch_first
 from allotropy.parsers.vendor_parser import VendorParser
 
 
@@ -30,13 +30,7 @@ class BenchlingEmpowerParser(VendorParser[Data, Model]):
     @classmethod
     def sniff(cls, named_file_contents: NamedFileContents) -> bool:
         try:
-            data = json.load(named_file_contents.contents)
-            return (
-                isinstance(data, dict)
-                and "values" in data
-                and isinstance(data["values"], dict)
-                and "fields" in data["values"]
-            )
+            return has_values_fields(named_file_contents)
         except Exception:
             return False
 
@@ -46,11 +40,13 @@ class BenchlingEmpowerParser(VendorParser[Data, Model]):
         return Data(
             create_metadata(
                 reader.metadata_fields,
-                reader.injections[0],
+                reader.first_injection,
                 named_file_contents.original_file_path,
             ),
-            create_measurement_groups(
-                reader.injections,
-                reader.metadata_fields,
+            prefetch_first(
+                create_measurement_groups(
+                    reader.iter_injections(),
+                    reader.metadata_fields,
+                )
             ),
         )
@@ -1,19 +1,88 @@
-import json
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from itertools import islice
 from typing import Any, cast
 
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.utils.json import JsonData
+from allotropy.parsers.utils.json_stream import JsonStream, read_json_text
 from allotropy.parsers.utils.values import assert_not_none
 
 
+def _skip_to_position(stream: JsonStream) -> int:
+    # The position of the value in the text, so that it can be decoded later.
+    stream.peek()
+    position = stream.pos
+    stream.skip()
+    return position
+
+
+def _decode_chrom(stream: JsonStream) -> Any:
+    return stream.decode_array(JsonStream.decode_float_array)
+
+
+def _decode_peaks(stream: JsonStream) -> Any:
+    peaks: list[dict[str, Any]] | None = stream.decode()
+    if peaks is None:
+        return None
+    return [cast(dict[str, Any], peak.get("fields", {})) for peak in peaks]
+
+
+# Values that are most of an export, read when their injection is decoded.
+_DECODE_LAZY: dict[str, Callable[[JsonStream], Any]] = {
+    "chrom": _decode_chrom,
+    "peaks": _decode_peaks,
+    "curves": JsonStream.decode,
+}
+
+
+def _decode_channel(stream: JsonStream) -> Any:
+    return stream.decode_object({"chrom": _skip_to_position})
+
+
+def _decode_result(stream: JsonStream) -> Any:
+    return stream.decode_object(
+        {"peaks": _skip_to_position, "curves": _skip_to_position}
+    )
+
+
+def _decode_values(stream: JsonStream) -> Any:
+    return stream.decode_object(
+        {
+            "channels": lambda channels: channels.decode_array(_decode_channel),
+            "results": lambda results: results.decode_array(_decode_result),
+        }
+    )
+
+
+def has_values_fields(named_file_contents: NamedFileContents) -> bool:
+    stream = JsonStream(read_json_text(named_file_contents))
+    for key in stream.iter_members():
+        if key == "values" and stream.peek() == "{":
+            return any(member == "fields" for member in stream.iter_members())
+    return False
+
+
 class BenchlingEmpowerReader:
+    """Reads the metadata and the fields of each injection of an export, and then its injections one at
+    a time.
+
+    Channels and results are separate arrays, joined to injections by InjectionId. Their fields are
+    read up front, and their chromatograms, peaks and calibration curves (most of the export) are
+    only decoded when iter_injections reaches their injection, chromatograms straight into float
+    arrays.
+    """
+
     SUPPORTED_EXTENSIONS = "json"
 
     metadata_fields: JsonData
-    injections: list[JsonData]
+    first_injection: JsonData
 
     def __init__(self, named_file_contents: NamedFileContents) -> None:
-        contents_dict: dict[str, Any] = json.load(named_file_contents.contents)
+        self.text = read_json_text(named_file_contents)
+        contents_dict: dict[str, Any] = JsonStream(self.text).decode_object(
+            {"values": _decode_values}
+        )
         contents = JsonData(contents_dict)
 
         values_data: dict[str, Any] = assert_not_none(
@@ -70,6 +139,9 @@ class BenchlingEmpowerReader:
 
             id_to_injection_data[injection_id] = fields_dict
 
+        # Positions of the values in _DECODE_LAZY of each injection, in the order they are set.
+        self._id_to_positions: dict[str, list[tuple[str, int]]] = defaultdict(list)
+
         # Channels contain fields and chromatograms
         channels: list[dict[str, Any]] = values.data.get("channels", [])
         for channel_dict in channels:
@@ -95,9 +167,8 @@ class BenchlingEmpowerReader:
                 id_to_injection_data[inj_id][key] = value
 
             # Add chromatogram data if present
-            chrom: list[list[float]] | None = channel.data.get("chrom")
-            if chrom is not None:
-                id_to_injection_data[inj_id]["chrom"] = chrom
+            if "chrom" in channel.data:
+                self._id_to_positions[inj_id].append(("chrom", channel.data["chrom"]))
 
             channel.mark_read({"fields", "chrom"})
 
@@ -119,18 +190,45 @@ class BenchlingEmpowerReader:
                 id_to_injection_data[inj_id]["results"] = []
             id_to_injection_data[inj_id]["results"].append(result_fields_dict)
 
-            # Add peaks if present
-            peaks: list[dict[str, Any]] | None = result.data.get("peaks")
-            if peaks is not None:
-                id_to_injection_data[inj_id]["peaks"] = [
-                    cast(dict[str, Any], peak.get("fields", {})) for peak in peaks
-                ]
-
-            # Add calibration curves if present
-            curves: list[Any] | None = result.data.get("curves")
-            if curves is not None:
-                id_to_injection_data[inj_id]["curves"] = curves
+            # Add peaks and calibration curves if present
+            for key in ("peaks", "curves"):
+                if key in result.data:
+                    self._id_to_positions[inj_id].append((key, result.data[key]))
 
             result.mark_read({"fields", "peaks", "curves"})
 
-        self.injections = [JsonData(data) for data in id_to_injection_data.values()]
+        # Measurement groups are created per sample, so injections are read grouped by sample, in
+        # the order of the first injection of each sample.
+        sample_order = {
+            sample_name: index
+            for index, sample_name in enumerate(
+                dict.fromkeys(
+                    data.get("SampleName") for data in id_to_injection_data.values()
+                )
+            )
+        }
+        self._id_to_injection_data = dict(
+            sorted(
+                id_to_injection_data.items(),
+                key=lambda item: sample_order[item[1].get("SampleName")],
+            )
+        )
+        self.first_injection = assert_not_none(
+            next(self._iter_injections(), None), "values/injections"
+        )
+
+    def _iter_injections(self, start: int = 0) -> Iterator[JsonData]:
+        for inj_id, injection_data in islice(
+            self._id_to_injection_data.items(), start, None
+        ):
+            data = dict(injection_data)
+            for key, position in self._id_to_positions.get(inj_id, []):
+                value = _DECODE_LAZY[key](JsonStream(self.text, position))
+                if value is not None:
+                    data[key] = value
+            yield JsonData(data)
+
+    def iter_injections(self) -> Iterator[JsonData]:
+        """Decode the injections one at a time, grouped by sample, starting with first_injection."""
+        yield self.first_injection
+        yield from self._iter_injections(start=1)
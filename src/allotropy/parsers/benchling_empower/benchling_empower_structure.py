@@ -1,7 +1,12 @@
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+from numpy.typing import NDArray
+
 from allotropy.allotrope.models.adm.liquid_chromatography.benchling._2023._09.liquid_chromatography import (
     SampleRoleType,
 )
@@ -81,38 +86,41 @@ def create_metadata(
 
 
 def _convert_chromatogram_units(
-    measures: list[float], detection_unit: str
-) -> list[float]:
+    measures: NDArray[np.float64] | list[float | None], detection_unit: str
+) -> NDArray[np.float64] | list[float | None]:
     if detection_unit == "AU":
-        return [m * 1000 for m in measures]
+        if isinstance(measures, list):
+            return [None if m is None else m * 1000 for m in measures]
+        return measures * 1000
     elif detection_unit != "mAU":
         msg = f"Unexpected Chromatogram detection unit: {detection_unit}"
         raise AllotropeConversionError(msg)
     return measures
 
 
-def _convert_time_units(dimensions: list[float]) -> list[float]:
+def _convert_time_units(dimensions: NDArray[np.float64]) -> NDArray[np.float64]:
     # ASM expected chromatogram dimensions (x axis) to be in seconds, but Empower reports it in minutes,
     # so convert here.
-    return [t * 60 for t in dimensions]
+    return dimensions * 60
 
 
 def _get_chromatogram(injection: JsonData) -> DataCube | None:
-    chrom: list[list[float]] | None = injection.data.get("chrom")
+    chrom: list[NDArray[np.float64] | list[float | None]] | None = injection.data.get(
+        "chrom"
+    )
     if not chrom:
         return None
     if len(chrom) != 2:
         msg = "Expected chrom to have two lists"
         raise AllotropeConversionError(msg)
 
-    dimensions, measures = chrom
-
     # Convert units based on ASM expectations
     detection_unit = injection.get(str, "DetUnits")
     if detection_unit is None:
         detection_unit = "mAU"  # Default to mAU if no unit is specified
-    measures = _convert_chromatogram_units(measures, detection_unit)
-    dimensions = _convert_time_units(dimensions)
+    # Measures with nulls are decoded as lists, which keeps the nulls.
+    measures = _convert_chromatogram_units(chrom[1], detection_unit)
+    dimensions = _convert_time_units(np.asarray(chrom[0], dtype=np.float64))
 
     return DataCube(
         label="absorbance",
@@ -580,22 +588,19 @@ def _create_measurements(
 
 
 def _group_injections_by_sample(
-    injections: list[JsonData],
-) -> defaultdict[str, list[JsonData]]:
-    sample_to_injection: defaultdict[str, list[JsonData]] = defaultdict(list)
-
-    for injection in injections:
-        sample_name = injection[str, "SampleName"]
-        sample_to_injection[sample_name].append(injection)
-
-    return sample_to_injection
+    injections: Iterable[JsonData],
+) -> Iterator[list[JsonData]]:
+    # The injections of a sample are consecutive, see BenchlingEmpowerReader.iter_injections.
+    for _, sample_injections in groupby(
+        injections, key=lambda injection: injection[str, "SampleName"]
+    ):
+        yield list(sample_injections)
 
 
 def create_measurement_groups(
-    injections: list[JsonData],
+    injections: Iterable[JsonData],
     metadata_fields: JsonData,
-) -> list[MeasurementGroup]:
-    sample_to_injection = _group_injections_by_sample(injections)
+) -> Iterator[MeasurementGroup]:
 
     measurement_aggregate_field_mappings = {
         "Node": (str, "Node", None),
@@ -609,11 +614,7 @@ def create_measurement_groups(
         measurement_aggregate_field_mappings
     )
 
-    measurement_groups = []
-    for _, sample_injections in sample_to_injection.items():
-        if not sample_injections:
-            continue
-
+    for sample_injections in _group_injections_by_sample(injections):
         first_injection = sample_injections[0]
 
         group_field_mappings = {
@@ -636,11 +637,7 @@ def create_measurement_groups(
             for measurement in _create_measurements(injection, metadata_fields)
         ]
 
-        measurement_groups.append(
-            MeasurementGroup(
-                measurements=measurements,
-                measurement_aggregate_custom_info=group_custom_info,
-            )
+        yield MeasurementGroup(
+            measurements=measurements,
+            measurement_aggregate_custom_info=group_custom_info,
         )
-
-    return measurement_groups
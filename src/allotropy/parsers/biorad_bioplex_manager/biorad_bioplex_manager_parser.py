@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET  # noqa: N817
-
 from allotropy.allotrope.models.adm.multi_analyte_profiling.benchling._2024._09.multi_analyte_profiling import (
     Model,
 )
@@ -21,6 +19,7 @@ from allotropy.parsers.biorad_bioplex_manager.biorad_bioplex_manager_structure i
     Well,
 )
 from allotropy.parsers.release_state import ReleaseState
+from allotropy.parsers.utils.xml_probe import has_root_children
 from allotropy.parsers.vendor_parser import VendorParser
 
 
@@ -34,16 +33,10 @@ class BioradBioplexParser(VendorParser[Data, Model]):
     @classmethod
     def sniff(cls, named_file_contents: NamedFileContents) -> bool:
         try:
-            tree = ET.parse(named_file_contents.contents)  # noqa: S314
-            root = tree.getroot()
-            child_tags = {
-                child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                for child in root
-            }
-            return (
-                "Samples" in child_tags
-                and "Wells" in child_tags
-                and "PlateDimensions" in child_tags
+            return has_root_children(
+                named_file_contents,
+                ["Samples", "Wells", "PlateDimensions"],
+                root_tag="BioPlexManager",
             )
         except Exception:
             return False
@@ -8,16 +8,13 @@ from allotropy.exceptions import (
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.biorad_bioplex_manager import constants
 from allotropy.parsers.utils.strict_xml_element import StrictXmlElement
+from allotropy.parsers.utils.xml_probe import parse_xml
 
 
 class BioradBioplexReader:
     def __init__(self, named_file_contents: NamedFileContents) -> None:
-        contents = named_file_contents.contents.read()
-        # Ensure contents is bytes for StrictXmlElement.create_from_bytes()
-        if isinstance(contents, str):
-            contents = contents.encode("utf-8")
         try:
-            self.root = StrictXmlElement.create_from_bytes(contents)
+            self.root = StrictXmlElement(parse_xml(named_file_contents))
             # Create a mapping of child tags to StrictXmlElement objects
             self.children = {}
             for child_tag in constants.EXPECTED_TAGS:
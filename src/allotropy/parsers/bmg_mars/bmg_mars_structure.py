@@ -23,6 +23,7 @@ from allotropy.exceptions import (
 from allotropy.parsers.bmg_mars import constants
 from allotropy.parsers.constants import NOT_APPLICABLE
 from allotropy.parsers.utils.pandas import SeriesData
+from allotropy.parsers.utils.plate_grid import PlateGrid
 from allotropy.parsers.utils.uuids import random_uuid_str
 from allotropy.parsers.utils.values import assert_not_none
 
@@ -180,6 +181,8 @@ def create_measurement_groups(
     data: pd.DataFrame,
     header: Header,
 ) -> list[MeasurementGroup]:
+    grid = PlateGrid.create(data)
+    grid = grid.select(~pd.isna(grid.values))
     return [
         MeasurementGroup(
             measurement_time=f"{header.date} {header.time}",
@@ -192,7 +195,7 @@ def create_measurement_groups(
             ],
             custom_info=header.custom_info,
         )
-        for row_name, row in data.iterrows()
-        for col_name, value in row.items()
-        if not pd.isnull(value)
+        for row_name, col_name, value in zip(
+            grid.rows.tolist(), grid.columns.tolist(), grid.values.tolist(), strict=True
+        )
     ]
@@ -48,7 +48,7 @@ from allotropy.parsers.cytiva_biacore_t200_control.cytiva_biacore_t200_control_s
 from allotropy.parsers.utils.calculated_data_documents.definition import (
     CalculatedDocument,
 )
-from allotropy.parsers.utils.pandas import series_to_float_list
+from allotropy.parsers.utils.pandas import series_to_float_array
 from allotropy.parsers.utils.values import quantity_or_none, try_float_or_none
 from allotropy.types import DictType
 
@@ -64,9 +64,9 @@ def _get_sensorgram_datacube(sensorgram_data: pd.DataFrame) -> DataCube:
         structure_measures=[
             DataCubeComponent(FieldComponentDatatype.double, "resonance", "RU")
         ],
-        dimensions=[series_to_float_list(sensorgram_data["Time (s)"], "time")],
+        dimensions=[series_to_float_array(sensorgram_data["Time (s)"], "time")],
         measures=[
-            series_to_float_list(sensorgram_data["Sensorgram (RU)"], "sensorgram")
+            series_to_float_array(sensorgram_data["Sensorgram (RU)"], "sensorgram")
         ],
     )
 
@@ -73,8 +73,8 @@ def _get_sensorgram_datacube(
         structure_measures=[
             DataCubeComponent(FieldComponentDatatype.double, "resonance", "RU")
         ],
-        dimensions=[time_vals],  # type: ignore[list-item]
-        measures=[resp_vals],  # type: ignore[list-item]
+        dimensions=[time_vals],
+        measures=[resp_vals],
     )
 
 
@@ -26,9 +26,31 @@ def fix_zip(data: BytesIO) -> BytesIO:
 
 
 class UnicornZipHandler(ZipHandler):
+    """A Unicorn result archive, which nests zip archives (e.g. one per chromatogram curve).
+
+    Members are indexed when the archive is opened, and member paths found by pattern are memoized.
+    Nested archives are not kept, each one is read when it is needed.
+    """
+
+    def __init__(self, data: BytesIO):
+        super().__init__(data)
+        self.members = {info.filename: info for info in self.zip_file.infolist()}
+        self._inner_paths: dict[str, str | None] = {}
+
     def get_zip_file(self, data: BytesIO) -> ZipFile:
         return ZipFile(fix_zip(data))
 
+    def get_inner_path_or_none(self, pattern: str) -> str | None:
+        if pattern not in self._inner_paths:
+            self._inner_paths[pattern] = super().get_inner_path_or_none(pattern)
+        return self._inner_paths[pattern]
+
+    def get_bytes(self, inner_path: str) -> bytes:
+        return self.zip_file.read(self.members.get(inner_path, inner_path))
+
+    def get_file(self, inner_path: str) -> BytesIO:
+        return BytesIO(self.get_bytes(inner_path))
+
     def get_zip(self, inner_path: str) -> UnicornZipHandler:
         return UnicornZipHandler(self.get_file(inner_path))
 
@@ -41,64 +63,52 @@ class UnicornZipHandler(ZipHandler):
             data = f.read()
         return UnicornZipHandler(data=BytesIO(data))
 
-    def filter_xml_metadata(self, stream: BytesIO) -> BytesIO:
-        data = stream.read()
-        start = -1
-        for idx, element in enumerate(data):
-            if int(element) == 60:  # 60 == '<' ASCII char
-                start = idx
-                break
-
-        end = -1
-        for idx, element in enumerate(reversed(data)):
-            if int(element) == 62:  # 62 == '>' ASCII char
-                end = len(data) - idx
-                break
-
+    def filter_xml_metadata(self, data: bytes) -> memoryview:
+        # XML members are wrapped in binary headers and trailers, the payload is from the first "<"
+        # to the last ">". Return a view of it rather than a copy, payloads can be several MB.
+        start = data.find(b"<")
+        end = data.rfind(b">")
         if start == -1 or end == -1:
             msg = "Unable to extract XML from file."
             raise AllotropeConversionError(msg)
 
-        return BytesIO(data[start:end])
+        return memoryview(data)[start : end + 1]
+
+    def get_xml_from_pattern(
+        self, pattern: str, mark_read: set[str] | None = None
+    ) -> StrictXmlElement:
+        data = self.get_bytes(self.get_inner_path(pattern))
+        return StrictXmlElement.create_from_bytes(
+            self.filter_xml_metadata(data), mark_read=mark_read
+        )
 
     def get_system_data(self) -> StrictXmlElement:
         system_data = self.get_zip_from_pattern("SystemData(.zip)?$")
-        b_stream = system_data.get_file_from_pattern("^Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(
-            raw_content, mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
+        return system_data.get_xml_from_pattern(
+            "^Xml$", mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
         )
 
     def get_results(self) -> StrictXmlElement:
-        b_stream = self.get_file_from_pattern("Result.xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return self.get_xml_from_pattern("Result.xml$")
 
     def get_instrument_config_data(self) -> StrictXmlElement:
         instrument_regex = "InstrumentConfigurationData(.zip)?$"
         instrument_config_data = self.get_zip_from_pattern(instrument_regex)
-        b_stream = instrument_config_data.get_file_from_pattern("^Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(
-            raw_content, mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
+        return instrument_config_data.get_xml_from_pattern(
+            "^Xml$", mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
         )
 
     def get_evaluation_log(self) -> StrictXmlElement:
-        b_stream = self.get_file_from_pattern("EvaluationLog.xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(
-            raw_content, mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
+        return self.get_xml_from_pattern(
+            "EvaluationLog.xml$",
+            mark_read={"attr:FormatVersion", "attr:UNICORNVersion"},
         )
 
     def get_chrom_1(self) -> StrictXmlElement:
-        b_stream = self.get_file_from_pattern("Chrom.1.Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return self.get_xml_from_pattern("Chrom.1.Xml$")
 
     def get_column_type_data(self) -> StrictXmlElement:
         column_type_data = self.get_zip_from_pattern("ColumnTypeData(.zip)?$")
-        b_stream = column_type_data.get_file_from_pattern("^Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(
-            raw_content, mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
+        return column_type_data.get_xml_from_pattern(
+            "^Xml$", mark_read={"attr:FormatVersion", "attr:UNICORNVersion"}
         )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from re import search
+
+from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
+    UnicornZipHandler,
+)
+from allotropy.parsers.cytiva_unicorn.structure.data_cube.reader import (
+    DataCubeReader,
+)
+from allotropy.parsers.utils.strict_xml_element import (
+    StrictXmlElement,
+)
+
+CURVE_DATA_NAMES = ["CurvePoints", "CurvePoint", "BinaryCurvePointsFileName"]
+
+
+@dataclass(frozen=True)
+class CurveData:
+    volumes: tuple[float, ...]
+    amplitudes: tuple[float, ...]
+
+
+def read_curve_data(handler: UnicornZipHandler) -> CurveData:
+    return CurveData(
+        volumes=DataCubeReader(handler=handler, name="Volumes").get_data(),
+        amplitudes=DataCubeReader(handler=handler, name="Amplitudes").get_data(),
+    )
+
+
+class CurveIndex:
+    """The Curve elements of a chromatogram by name, and the data of each curve.
+
+    The data of a curve is only decoded when it is requested, i.e. for the curves that a
+    measurement matches, and is kept for the conversion so that it is decoded once. Errors decoding
+    a curve are raised when its data is requested, so a curve that is never used does not fail the
+    conversion.
+    """
+
+    def __init__(self, handler: UnicornZipHandler, elements: list[StrictXmlElement]):
+        self.handler = handler
+        self.elements = elements
+        self.by_name: dict[str, StrictXmlElement] = {}
+        for element in elements:
+            name = element.find("Name").get_text_or_none()
+            if name is not None and name not in self.by_name:
+                self.by_name[name] = element
+        self._data: dict[str, CurveData | None] = {}
+
+    def find_or_none(self, pattern: str) -> StrictXmlElement | None:
+        for name, element in self.by_name.items():
+            if search(pattern, name):
+                return element
+        return None
+
+    def get_data_or_none(self, name: str) -> CurveData | None:
+        if name not in self._data:
+            self._data[name] = self._read_data_or_none(name)
+        return self._data[name]
+
+    def _read_data_or_none(self, name: str) -> CurveData | None:
+        if (element := self.by_name.get(name)) is None:
+            return None
+        if data_name := element.recursive_find_or_none(CURVE_DATA_NAMES):
+            if pattern := data_name.get_text_or_none():
+                return read_curve_data(self.handler.get_zip_from_pattern(pattern))
+        return None
@@ -2,19 +2,14 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
     FieldComponentDatatype,
 )
 from allotropy.allotrope.schema_mappers.data_cube import DataCube, DataCubeComponent
-from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
-    UnicornZipHandler,
-)
-from allotropy.parsers.cytiva_unicorn.structure.data_cube.reader import (
-    DataCubeReader,
-)
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveData
 from allotropy.parsers.cytiva_unicorn.structure.data_cube.transformations import (
     Transformation,
 )
 
 
 def create_data_cube(
-    handler: UnicornZipHandler,
+    curve_data: CurveData,
     label: str,
     data_cube_component: DataCubeComponent,
     transformation: Transformation | None,
@@ -29,21 +24,12 @@ def create_data_cube(
             ),
         ],
         structure_measures=[data_cube_component],
-        dimensions=[
-            list(
-                DataCubeReader(
-                    handler=handler,
-                    name="Volumes",
-                ).get_data()
-            )
-        ],
+        dimensions=[list(curve_data.volumes)],
         measures=[
             list(
-                DataCubeReader(
-                    handler=handler,
-                    name="Amplitudes",
-                    transformation=transformation,
-                ).get_data()
+                transformation.transform(curve_data.amplitudes)
+                if transformation
+                else curve_data.amplitudes
             )
         ],
     )
@@ -8,6 +8,7 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
     UnicornZipHandler,
 )
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.measurements.absorbance import (
     AbsorbanceMeasurement1,
     AbsorbanceMeasurement2,
@@ -51,16 +52,17 @@ def create_measurement_groups(
     static_docs = StaticDocs.create(
         handler, curves.find("Curve"), results, analysis_settings
     )
+    curve_index = CurveIndex(handler, elements)
     measurements = [
-        AbsorbanceMeasurement1.create_or_none(handler, elements, static_docs),
-        AbsorbanceMeasurement2.create_or_none(handler, elements, static_docs),
-        AbsorbanceMeasurement3.create_or_none(handler, elements, static_docs),
-        ConductivityMeasurement.create_or_none(handler, elements, static_docs),
-        PhMeasurement.create_or_none(handler, elements, static_docs),
-        ConcentrationMeasurement.create_or_none(handler, elements, static_docs),
-        PressureMeasurement.create_or_none(handler, elements, static_docs),
-        FlowMeasurement.create_or_none(handler, elements, static_docs),
-        TemperatureMeasurement.create_or_none(handler, elements, static_docs),
+        AbsorbanceMeasurement1.create_or_none(curve_index, static_docs),
+        AbsorbanceMeasurement2.create_or_none(curve_index, static_docs),
+        AbsorbanceMeasurement3.create_or_none(curve_index, static_docs),
+        ConductivityMeasurement.create_or_none(curve_index, static_docs),
+        PhMeasurement.create_or_none(curve_index, static_docs),
+        ConcentrationMeasurement.create_or_none(curve_index, static_docs),
+        PressureMeasurement.create_or_none(curve_index, static_docs),
+        FlowMeasurement.create_or_none(curve_index, static_docs),
+        TemperatureMeasurement.create_or_none(curve_index, static_docs),
     ]
     # Some curves may not be read due not matching any supported measurement type, mark these as read.
     for element in elements:
@@ -27,6 +27,7 @@ from allotropy.parsers.cytiva_unicorn.constants import (
 from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
     UnicornZipHandler,
 )
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.measurements.generic import (
     UnicornMeasurement,
 )
@@ -53,15 +54,14 @@ class AbsorbanceMeasurement(UnicornMeasurement):
     @classmethod
     def create_or_none(
         cls,
-        handler: UnicornZipHandler,
-        elements: list[StrictXmlElement],
+        curves: CurveIndex,
         static_docs: StaticDocs,
     ) -> UnicornMeasurement | None:
-        element = cls.filter_curve_or_none(elements, cls.get_curve_regex())
+        element = curves.find_or_none(cls.get_curve_regex())
         if element is None:
             return None
         data_cube = cls.get_data_cube_or_none(
-            handler,
+            curves,
             element,
             DataCubeComponent(
                 type_=FieldComponentDatatype.float,
@@ -83,7 +83,7 @@ class AbsorbanceMeasurement(UnicornMeasurement):
                     ),
                 )
             ],
-            peaks=cls.get_peaks(handler),
+            peaks=cls.get_peaks(curves.handler),
             processed_data_custom_info=cls.get_processed_data_custom_info(element),
         )
         return measurement
@@ -6,29 +6,23 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 )
 from allotropy.allotrope.schema_mappers.data_cube import DataCube, DataCubeComponent
 from allotropy.parsers.cytiva_unicorn.constants import DEVICE_TYPE
-from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
-    UnicornZipHandler,
-)
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.measurements.generic import (
     UnicornMeasurement,
 )
 from allotropy.parsers.cytiva_unicorn.structure.static_docs import (
     StaticDocs,
 )
-from allotropy.parsers.utils.strict_xml_element import (
-    StrictXmlElement,
-)
 
 
 class ConcentrationMeasurement(UnicornMeasurement):
     @classmethod
     def create_or_none(
         cls,
-        handler: UnicornZipHandler,
-        elements: list[StrictXmlElement],
+        curves: CurveIndex,
         static_docs: StaticDocs,
     ) -> UnicornMeasurement | None:
-        element = cls.filter_curve_or_none(elements, r"^Conc B$")
+        element = curves.find_or_none(r"^Conc B$")
         measurement = cls.get_measurement(
             static_docs=static_docs,
             device_control_docs=[
@@ -36,7 +30,7 @@ class ConcentrationMeasurement(UnicornMeasurement):
                     device_type=DEVICE_TYPE,
                     start_time=static_docs.start_time,
                     solvent_conc_data_cube=cls.get_data_cube_or_none(
-                        handler,
+                        curves,
                         element,
                         DataCubeComponent(
                             type_=FieldComponentDatatype.float,
@@ -6,9 +6,7 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 )
 from allotropy.allotrope.schema_mappers.data_cube import DataCube, DataCubeComponent
 from allotropy.parsers.cytiva_unicorn.constants import DEVICE_TYPE
-from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
-    UnicornZipHandler,
-)
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.data_cube.transformations import (
     MScm2Sm,
 )
@@ -18,24 +16,20 @@ from allotropy.parsers.cytiva_unicorn.structure.measurements.generic import (
 from allotropy.parsers.cytiva_unicorn.structure.static_docs import (
     StaticDocs,
 )
-from allotropy.parsers.utils.strict_xml_element import (
-    StrictXmlElement,
-)
 
 
 class ConductivityMeasurement(UnicornMeasurement):
     @classmethod
     def create_or_none(
         cls,
-        handler: UnicornZipHandler,
-        elements: list[StrictXmlElement],
+        curves: CurveIndex,
         static_docs: StaticDocs,
     ) -> UnicornMeasurement | None:
-        element = cls.filter_curve_or_none(elements, r"^Cond$")
+        element = curves.find_or_none(r"^Cond$")
         measurement = cls.get_measurement(
             static_docs=static_docs,
             chromatogram_data_cube=cls.get_data_cube_or_none(
-                handler,
+                curves,
                 element,
                 DataCubeComponent(
                     type_=FieldComponentDatatype.float,
@@ -45,8 +39,8 @@ class ConductivityMeasurement(UnicornMeasurement):
                 transformation=MScm2Sm(),
             ),
             processed_data_chromatogram_data_cube=cls.get_data_cube_or_none(
-                handler,
-                cls.filter_curve_or_none(elements, r"^% Cond$"),
+                curves,
+                curves.find_or_none(r"^% Cond$"),
                 DataCubeComponent(
                     type_=FieldComponentDatatype.float,
                     concept="electric conductivity",
@@ -6,18 +6,13 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 )
 from allotropy.allotrope.schema_mappers.data_cube import DataCube, DataCubeComponent
 from allotropy.parsers.cytiva_unicorn.constants import DEVICE_TYPE
-from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
-    UnicornZipHandler,
-)
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.measurements.generic import (
     UnicornMeasurement,
 )
 from allotropy.parsers.cytiva_unicorn.structure.static_docs import (
     StaticDocs,
 )
-from allotropy.parsers.utils.strict_xml_element import (
-    StrictXmlElement,
-)
 
 
 class FlowMeasurement(UnicornMeasurement):
@@ -41,8 +36,7 @@ class FlowMeasurement(UnicornMeasurement):
     @classmethod
     def create_or_none(
         cls,
-        handler: UnicornZipHandler,
-        elements: list[StrictXmlElement],
+        curves: CurveIndex,
         static_docs: StaticDocs,
     ) -> UnicornMeasurement | None:
         device_controls = [
@@ -50,8 +44,8 @@ class FlowMeasurement(UnicornMeasurement):
                 device_type=DEVICE_TYPE,
                 start_time=static_docs.start_time,
                 sample_flow_data_cube=cls.get_data_cube_or_none(
-                    handler,
-                    cls.filter_curve_or_none(elements, r"^Sample flow \(CV/h\)$"),
+                    curves,
+                    curves.find_or_none(r"^Sample flow \(CV/h\)$"),
                     DataCubeComponent(
                         type_=FieldComponentDatatype.float,
                         concept="sample flow",
@@ -59,8 +53,8 @@ class FlowMeasurement(UnicornMeasurement):
                     ),
                 ),
                 system_flow_data_cube=cls.get_data_cube_or_none(
-                    handler,
-                    cls.filter_curve_or_none(elements, r"^System flow \(CV/h\)$"),
+                    curves,
+                    curves.find_or_none(r"^System flow \(CV/h\)$"),
                     DataCubeComponent(
                         type_=FieldComponentDatatype.float,
                         concept="system flow",
@@ -72,8 +66,8 @@ class FlowMeasurement(UnicornMeasurement):
                 device_type=DEVICE_TYPE,
                 start_time=static_docs.start_time,
                 sample_flow_data_cube=cls.get_data_cube_or_none(
-                    handler,
-                    cls.filter_curve_or_none(elements, r"^Sample flow$"),
+                    curves,
+                    curves.find_or_none(r"^Sample flow$"),
                     DataCubeComponent(
                         type_=FieldComponentDatatype.float,
                         concept="sample flow",
@@ -81,8 +75,8 @@ class FlowMeasurement(UnicornMeasurement):
                     ),
                 ),
                 system_flow_data_cube=cls.get_data_cube_or_none(
-                    handler,
-                    cls.filter_curve_or_none(elements, r"^System flow$"),
+                    curves,
+                    curves.find_or_none(r"^System flow$"),
                     DataCubeComponent(
                         type_=FieldComponentDatatype.float,
                         concept="system flow",
@@ -94,8 +88,8 @@ class FlowMeasurement(UnicornMeasurement):
                 device_type=DEVICE_TYPE,
                 start_time=static_docs.start_time,
                 sample_flow_data_cube=cls.get_data_cube_or_none(
-                    handler,
-                    cls.filter_curve_or_none(elements, r"^Sample linear flow$"),
+                    curves,
+                    curves.find_or_none(r"^Sample linear flow$"),
                     DataCubeComponent(
                         type_=FieldComponentDatatype.float,
                         concept="sample flow",
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from re import search
 from typing import Any
 
 from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._2023._09.liquid_chromatography import (
@@ -9,9 +8,7 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
     Peak,
 )
 from allotropy.allotrope.schema_mappers.data_cube import DataCube, DataCubeComponent
-from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
-    UnicornZipHandler,
-)
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.data_cube.creator import (
     create_data_cube,
 )
@@ -82,31 +79,10 @@ class UnicornMeasurement(Measurement):
             **base_element.get_unread(),
         }
 
-    @classmethod
-    def filter_curve_or_none(
-        cls, curve_elements: list[StrictXmlElement], pattern: str
-    ) -> StrictXmlElement | None:
-        for element in curve_elements:
-            name_element = element.find("Name")
-            if name := name_element.get_text_or_none():
-                if search(pattern, name):
-                    return element
-        return None
-
-    @classmethod
-    def get_data_cube_handler_or_none(
-        cls, handler: UnicornZipHandler, curve_element: StrictXmlElement
-    ) -> UnicornZipHandler | None:
-        names = ["CurvePoints", "CurvePoint", "BinaryCurvePointsFileName"]
-        if data_name := curve_element.recursive_find_or_none(names):
-            if name := data_name.get_text_or_none():
-                return handler.get_zip_from_pattern(name)
-        return None
-
     @classmethod
     def get_data_cube_or_none(
         cls,
-        handler: UnicornZipHandler,
+        curves: CurveIndex,
         curve: StrictXmlElement | None,
         data_cube_component: DataCubeComponent,
         transformation: Transformation | None = None,
@@ -114,17 +90,15 @@ class UnicornMeasurement(Measurement):
         if curve is None:
             return None
 
-        if data_cube_handler := cls.get_data_cube_handler_or_none(handler, curve):
-            name_element = curve.find("Name")
-
-            if name := name_element.get_text_or_none():
-                data_cube = create_data_cube(
-                    data_cube_handler,
+        name_element = curve.find("Name")
+        if name := name_element.get_text_or_none():
+            if curve_data := curves.get_data_or_none(name):
+                return create_data_cube(
+                    curve_data,
                     name,
                     data_cube_component,
                     transformation,
                 )
-                return data_cube
         return None
 
     @classmethod
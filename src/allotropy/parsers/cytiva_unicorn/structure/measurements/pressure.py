@@ -6,33 +6,27 @@ from allotropy.allotrope.schema_mappers.adm.liquid_chromatography.benchling._202
 )
 from allotropy.allotrope.schema_mappers.data_cube import DataCube, DataCubeComponent
 from allotropy.parsers.cytiva_unicorn.constants import DEVICE_TYPE
-from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
-    UnicornZipHandler,
-)
+from allotropy.parsers.cytiva_unicorn.structure.curves import CurveIndex
 from allotropy.parsers.cytiva_unicorn.structure.measurements.generic import (
     UnicornMeasurement,
 )
 from allotropy.parsers.cytiva_unicorn.structure.static_docs import (
     StaticDocs,
 )
-from allotropy.parsers.utils.strict_xml_element import (
-    StrictXmlElement,
-)
 
 
 class PressureMeasurement(UnicornMeasurement):
     @classmethod
     def create_or_none(
         cls,
-        handler: UnicornZipHandler,
-        elements: list[StrictXmlElement],
+        curves: CurveIndex,
         static_docs: StaticDocs,
     ) -> UnicornMeasurement | None:
-        element = cls.filter_curve_or_none(elements, r"^DeltaC pressure$")
+        element = curves.find_or_none(r"^DeltaC pressure$")
         measurement = cls.get_measurement(
             static_docs=static_docs,
             derived_column_pressure_data_cube=cls.get_data_cube_or_none(
-                handler,
+                curves,
                 element,
                 DataCubeComponent(
                     type_=FieldComponentDatatype.float,
@@ -45,8 +39,8 @@ class PressureMeasurement(UnicornMeasurement):
                     device_type=DEVICE_TYPE,
                     start_time=static_docs.start_time,
                     pre_column_pressure_data_cube=cls.get_data_cube_or_none(
-                        handler,
-                        cls.filter_curve_or_none(elements, r"^PreC pressure$"),
+                        curves,
+                        curves.find_or_none(r"^PreC pressure$"),
                         DataCubeComponent(
                             type_=FieldComponentDatatype.float,
                             concept="pre-column pressure",
@@ -54,8 +48,8 @@ class PressureMeasurement(UnicornMeasurement):
                         ),
                     ),
                     sample_pressure_data_cube=cls.get_data_cube_or_none(
-                        handler,
-                        cls.filter_curve_or_none(elements, r"^Sample pressure$"),
+                        curves,
+                        curves.find_or_none(r"^Sample pressure$"),
                         DataCubeComponent(
                             type_=FieldComponentDatatype.float,
                             concept="sample pressure",
@@ -63,8 +57,8 @@ class PressureMeasurement(UnicornMeasurement):
                         ),
                     ),
                     system_pressure_data_cube=cls.get_data_cube_or_none(
-                        handler,
-                        cls.filter_curve_or_none(elements, r"^System pressure$"),
+                        curves,
+                        curves.find_or_none(r"^System pressure$"),
                         DataCubeComponent(
                             type_=FieldComponentDatatype.float,
                             concept="system pressure",
@@ -72,8 +66,8 @@ class PressureMeasurement(UnicornMeasurement):
                         ),
                     ),
                     post_column_pressure_data_cube=cls.get_data_cube_or_none(
-                        handler,
-                        cls.filter_curve_or_none(elements, r"^PostC pressure$"),
+                        curves,
+                        curves.find_or_none(r"^PostC pressure$"),
                         DataCubeComponent(
                             type_=FieldComponentDatatype.float,
                             concept="post-column pressure",
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import re
+import xml.etree.ElementTree as ET  # noqa: N817
+
+from allotropy.exceptions import AllotropeParsingError
+from allotropy.parsers.utils.strict_xml_element import StrictXmlElement
+from allotropy.types import IOType
+
+ROOT_DEPTH = 1
+SAMPLE_DEPTH = 3
+
+
+def extract_flowjo_namespaces(root_element: ET.Element) -> dict[str, str]:
+    attributes = root_element.attrib.items()
+    namespaces_text = next(
+        (value for key, value in attributes if re.search(r"{.*}", key) is not None),
+        None,
+    )
+    if namespaces_text is None:
+        return {}
+
+    namespace_list = namespaces_text.split()
+    namespaces = {
+        "transforms": next(
+            (ns for ns in namespace_list if "transformations" in ns), ""
+        ),
+        "data-type": next((ns for ns in namespace_list if "datatypes" in ns), ""),
+        "gating": next((ns for ns in namespace_list if "gating" in ns), ""),
+    }
+
+    # Extract all xmlns namespace declarations
+    for key, value in attributes:
+        if key.startswith("xmlns:"):
+            prefix = key[6:]  # Remove "xmlns:" prefix
+            if prefix not in namespaces:  # Don't override existing mappings
+                namespaces[prefix] = value
+
+    # ElementTree doesn't preserve xmlns declarations as attributes, but we can detect namespace usage
+    # and add common mappings manually
+    for key, _ in attributes:
+        if key.startswith("{http://www.w3.org/2001/XMLSchema-instance}"):
+            namespaces["xsi"] = "http://www.w3.org/2001/XMLSchema-instance"
+            break
+
+    return namespaces
+
+
+class FlowjoReader:
+    """Reads a FlowJo workspace one Sample at a time.
+
+    Samples hold most of a workspace (keywords, gates and populations), so instead of parsing the
+    whole tree, each Sample of the SampleList is yielded as soon as it is parsed, and is cleared once
+    the caller is done with it. Only the first Sample is kept, for the workspace metadata. The shared
+    sections (e.g. cytometers) usually come before the SampleList, and are then available to each
+    sample through root_element. Sections after the SampleList are only available once all samples
+    are read.
+    """
+
+    def __init__(self, contents: IOType) -> None:
+        self.contents = contents
+        self._root: ET.Element | None = None
+        self.namespaces: dict[str, str] = {}
+
+    @property
+    def root_element(self) -> StrictXmlElement:
+        if self._root is None:
+            msg = "No Workspace element found in XML file."
+            raise AllotropeParsingError(msg)
+        return StrictXmlElement(self._root, self.namespaces)
+
+    def iter_samples(self) -> Iterator[StrictXmlElement]:
+        sample_list: ET.Element | None = None
+        first_sample: ET.Element | None = None
+        depth = 0
+        for event, element in ET.iterparse(  # noqa: S314
+            self.contents, events=("start", "end")
+        ):
+            if event == "start":
+                depth += 1
+                if depth == ROOT_DEPTH:
+                    self._root = element
+                    self.namespaces = extract_flowjo_namespaces(element)
+                elif depth == SAMPLE_DEPTH - 1 and element.tag == "SampleList":
+                    sample_list = element
+                continue
+
+            if depth == SAMPLE_DEPTH and sample_list is not None:
+                if element.tag == "Sample":
+                    yield StrictXmlElement(element, self.namespaces)
+                    if first_sample is None:
+                        first_sample = element
+                    else:
+                        element.clear()
+                        sample_list.remove(element)
+            elif depth == SAMPLE_DEPTH - 1:
+                sample_list = None
+            depth -= 1
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, replace
 import math
 from pathlib import Path
 import re
 
-from allotropy.allotrope.models.shared.definitions.quantity_values import (
-    TQuantityValueRelativeFluorescenceUnit,
-    TQuantityValueSecondTime,
+from allotropy.allotrope.models.shared.definitions.units import (
+    RelativeFluorescenceUnit,
+    SecondTime,
 )
 from allotropy.allotrope.schema_mappers.adm.flow_cytometry.benchling._2025._03.flow_cytometry import (
     CompensationMatrix,
@@ -224,14 +225,14 @@ class VertexExtractor:
         self.x_dim = x_dim
         self.y_dim = y_dim
         self.x_unit = (
-            TQuantityValueSecondTime.unit
+            SecondTime.unit
             if x_dim is not None and x_dim.lower() == "time"
-            else TQuantityValueRelativeFluorescenceUnit.unit
+            else RelativeFluorescenceUnit.unit
         )
         self.y_unit = (
-            TQuantityValueSecondTime.unit
+            SecondTime.unit
             if y_dim is not None and y_dim.lower() == "time"
-            else TQuantityValueRelativeFluorescenceUnit.unit
+            else RelativeFluorescenceUnit.unit
         )
 
     def extract(self) -> list[Vertex] | None:
@@ -994,55 +995,69 @@ def _create_data_regions(sample: StrictXmlElement) -> list[DataRegion]:
     return data_regions
 
 
-def create_measurement_groups(root_element: StrictXmlElement) -> list[MeasurementGroup]:
+# Keyword sets for fast membership tests.
+MEASUREMENT_DOCUMENT_KEYWORD_SET = frozenset(MEASUREMENT_DOCUMENT_KEYWORDS)
+SAMPLE_DOCUMENT_KEYWORD_SET = frozenset(SAMPLE_DOCUMENT_KEYWORDS)
+PROCESSED_DATA_KEYWORD_SET = frozenset(PROCESSED_DATA_KEYWORDS)
+
+# Attributes of the workspace, cytometer, sample list and sample, reported in the measurement document.
+MEASUREMENT_FIELDS = ["modDate", "name", "clientTimestamp", "homepage"]
+# Attributes of the workspace and cytometer, reported in the data processing document.
+DATA_PROCESSING_FIELDS = [
+    "linFromKW",
+    "logFromKW",
+    "linMax",
+    "logMax",
+    "useFCS3",
+    "useGain",
+    "linearRescale",
+    "logMin",
+    "linMin",
+    "extraNegs",
+    "logRescale",
+]
+
+
+def _get_non_empty_attrs(
+    element: StrictXmlElement, fields: list[str]
+) -> dict[str, str]:
+    result: dict[str, str] = {}
+    for field in fields:
+        value = element.get_attr_or_none(field)
+        if value is not None and value.strip() != "":
+            result[field] = value.strip()
+    return result
+
 
+@dataclass(frozen=True)
+class WorkspaceFields:
+    """Fields of the workspace, cytometer and sample list, which are the same for every sample."""
+
+    method_version: str | None
+    data_processing_time: str | None
+    root_measurement_fields: dict[str, str]
+    root_processing_fields: dict[str, str]
+    cytometer_measurement_fields: dict[str, str]
+    cytometer_processing_fields: dict[str, str]
+    sample_list_measurement_fields: dict[str, str]
+
+
+def create_workspace_fields(root_element: StrictXmlElement) -> WorkspaceFields:
     sample_list = root_element.find_or_none("SampleList")
     if sample_list is None:
         msg = "No SampleList element found in XML file."
         raise AllotropeParsingError(msg)
 
-    # Precompute root-level fields (same for all samples)
-    root_element_fields = ["modDate", "name", "clientTimestamp", "homepage"]
-    pre_root_measurement_fields: dict[str, str] = {}
-    for field in root_element_fields:
-        value = root_element.get_attr_or_none(field)
-        if value is not None and value.strip() != "":
-            pre_root_measurement_fields[field] = value.strip()
-
-    root_data_processing_fields = [
-        "linFromKW",
-        "logFromKW",
-        "linMax",
-        "logMax",
-        "useFCS3",
-        "useGain",
-        "linearRescale",
-        "logMin",
-        "linMin",
-        "extraNegs",
-        "logRescale",
-    ]
-    pre_root_processing_fields: dict[str, str] = {}
-    for field in root_data_processing_fields:
-        value = root_element.get_attr_or_none(field)
-        if value is not None and value.strip() != "":
-            pre_root_processing_fields[field] = value.strip()
-
-    # Precompute cytometer-based fields (if present) once
     cytometer = root_element.recursive_find_or_none(["Cytometers", "Cytometer"])
-    pre_cytometer_measurement_fields: dict[str, str] = {}
-    pre_cytometer_processing_fields: dict[str, str] = {}
+    cytometer_measurement_fields: dict[str, str] = {}
+    cytometer_processing_fields: dict[str, str] = {}
     if cytometer:
-        for field in root_element_fields:
-            value = cytometer.get_attr_or_none(field)
-            if value is not None and value.strip() != "":
-                pre_cytometer_measurement_fields[field] = value.strip()
-
-        for field in root_data_processing_fields:
-            value = cytometer.get_attr_or_none(field)
-            if value is not None and value.strip() != "":
-                pre_cytometer_processing_fields[field] = value.strip()
-
+        cytometer_measurement_fields = _get_non_empty_attrs(
+            cytometer, MEASUREMENT_FIELDS
+        )
+        cytometer_processing_fields = _get_non_empty_attrs(
+            cytometer, DATA_PROCESSING_FIELDS
+        )
         cytometer.mark_read(
             {
                 "cyt",
@@ -1055,208 +1070,198 @@ def create_measurement_groups(root_element: StrictXmlElement) -> list[Measuremen
             }
         )
 
-    # Precompute sample_list measurement fields (if any)
-    pre_sample_list_measurement_fields: dict[str, str] = {}
-    for field in root_element_fields:
-        value = sample_list.get_attr_or_none(field)
-        if value is not None and value.strip() != "":
-            pre_sample_list_measurement_fields[field] = value.strip()
+    return WorkspaceFields(
+        method_version=root_element.get_attr_or_none("version"),
+        data_processing_time=root_element.get_attr_or_none("modDate"),
+        root_measurement_fields=_get_non_empty_attrs(root_element, MEASUREMENT_FIELDS),
+        root_processing_fields=_get_non_empty_attrs(
+            root_element, DATA_PROCESSING_FIELDS
+        ),
+        cytometer_measurement_fields=cytometer_measurement_fields,
+        cytometer_processing_fields=cytometer_processing_fields,
+        sample_list_measurement_fields=_get_non_empty_attrs(
+            sample_list, MEASUREMENT_FIELDS
+        ),
+    )
 
-    samples = sample_list.findall("Sample")
 
-    # Precompute keyword sets for fast membership tests
-    measurement_kw_set = set(MEASUREMENT_DOCUMENT_KEYWORDS)
-    sample_kw_set = set(SAMPLE_DOCUMENT_KEYWORDS)
-    processed_kw_set = set(PROCESSED_DATA_KEYWORDS)
+def _filter_keyword_map(
+    keyword_map: dict[str, str], keywords: frozenset[str]
+) -> dict[str, str]:
+    if len(keyword_map) <= len(keywords):
+        return {name: value for name, value in keyword_map.items() if name in keywords}
+    return {
+        name: value for name in keywords if (value := keyword_map.get(name)) is not None
+    }
 
-    result = []
-    for sample in samples:
-        sample_node = sample.find("SampleNode")
-        experimental_data_identifier = sample_node.get_attr_or_none("name")
-
-        # Handle compensation matrix groups and their unread data
-        compensation_matrix_groups = None
-        all_custom_info = {}
-
-        transform_matrix_element = sample.find_or_none("transforms:spilloverMatrix")
-        if transform_matrix_element is not None:
-            compensation_matrix_groups = _create_compensation_matrix_groups(
-                transform_matrix_element
+
+def add_cytometer_fields(
+    group: MeasurementGroup, workspace_fields: WorkspaceFields
+) -> MeasurementGroup:
+    """Add the cytometer fields to a group that was created before the Cytometers were read.
+
+    Cytometer fields have the lowest precedence, so adding them afterwards gives the same group as
+    creating it with them.
+    """
+    measurements = []
+    for measurement in group.measurements:
+        custom_info = dict(measurement.custom_info or {})
+        for field, value in workspace_fields.cytometer_measurement_fields.items():
+            custom_info.setdefault(field, value)
+        data_processing_custom_info = dict(
+            measurement.data_processing_custom_info or {}
+        )
+        for field, value in workspace_fields.cytometer_processing_fields.items():
+            data_processing_custom_info.setdefault(field, value)
+        measurements.append(
+            replace(
+                measurement,
+                custom_info=custom_info or None,
+                data_processing_custom_info=data_processing_custom_info or None,
             )
-            skip_keys = {
-                "id",
-                "spectral",
-                "prefix",
-                "editable",
-                "color",
-                "version",
-            }
-            matrix_unread_data = transform_matrix_element.get_unread(skip=skip_keys)
-            if matrix_unread_data:
-                filtered_matrix_unread = _filter_unread_data(matrix_unread_data)
-                if filtered_matrix_unread:
-                    # Filter out None values before updating
-                    non_none_matrix_unread = {
-                        k: v for k, v in filtered_matrix_unread.items() if v is not None
-                    }
-                    all_custom_info.update(non_none_matrix_unread)
-
-        # Collect unread data from SampleNode
-        sample_node_unread = sample_node.get_unread(
-            skip={
-                "sampleID",
-                "count",
-                "owningGroup",
-                "sortPriority",
-                "expanded",
-                "FJ FCS VERSION",
-                "curGroup",
-            }
         )
-        if sample_node_unread:
-            filtered_sample_node_unread = _filter_unread_data(sample_node_unread)
-            if filtered_sample_node_unread:
+    return replace(group, measurements=measurements)
+
+
+def create_measurement_group(
+    sample: StrictXmlElement, workspace_fields: WorkspaceFields
+) -> MeasurementGroup:
+    sample_node = sample.find("SampleNode")
+    experimental_data_identifier = sample_node.get_attr_or_none("name")
+
+    # Handle compensation matrix groups and their unread data
+    compensation_matrix_groups = None
+    all_custom_info = {}
+
+    transform_matrix_element = sample.find_or_none("transforms:spilloverMatrix")
+    if transform_matrix_element is not None:
+        compensation_matrix_groups = _create_compensation_matrix_groups(
+            transform_matrix_element
+        )
+        skip_keys = {
+            "id",
+            "spectral",
+            "prefix",
+            "editable",
+            "color",
+            "version",
+        }
+        matrix_unread_data = transform_matrix_element.get_unread(skip=skip_keys)
+        if matrix_unread_data:
+            filtered_matrix_unread = _filter_unread_data(matrix_unread_data)
+            if filtered_matrix_unread:
                 # Filter out None values before updating
-                non_none_sample_node_unread = {
-                    k: v
-                    for k, v in filtered_sample_node_unread.items()
-                    if v is not None
+                non_none_matrix_unread = {
+                    k: v for k, v in filtered_matrix_unread.items() if v is not None
                 }
-                all_custom_info.update(non_none_sample_node_unread)
+                all_custom_info.update(non_none_matrix_unread)
 
-        # Build keyword map once per sample for faster repeated access
-        keyword_map, keywords_element = _build_keyword_map(sample)
+    # Collect unread data from SampleNode
+    sample_node_unread = sample_node.get_unread(
+        skip={
+            "sampleID",
+            "count",
+            "owningGroup",
+            "sortPriority",
+            "expanded",
+            "FJ FCS VERSION",
+            "curGroup",
+        }
+    )
+    if sample_node_unread:
+        filtered_sample_node_unread = _filter_unread_data(sample_node_unread)
+        if filtered_sample_node_unread:
+            # Filter out None values before updating
+            non_none_sample_node_unread = {
+                k: v for k, v in filtered_sample_node_unread.items() if v is not None
+            }
+            all_custom_info.update(non_none_sample_node_unread)
+
+    # Build keyword map once per sample for faster repeated access
+    keyword_map, keywords_element = _build_keyword_map(sample)
+
+    # Helper uses the prebuilt map first, falling back to XML lookup if needed
+    def get_keyword_value(
+        name: str,
+        _map: dict[str, str] = keyword_map,
+        _sample: StrictXmlElement = sample,
+    ) -> str | None:
+        value = _map.get(name)
+        if value is not None:
+            return value
+        return _get_keyword_value_by_name_from_sample(_sample, name)
+
+    # Extract measurement-level metadata fields
+    measurement_custom_info = _filter_keyword_map(
+        keyword_map, MEASUREMENT_DOCUMENT_KEYWORD_SET
+    )
 
-        # Helper uses the prebuilt map first, falling back to XML lookup if needed
-        def get_keyword_value(
-            name: str,
-            _map: dict[str, str] = keyword_map,
-            _sample: StrictXmlElement = sample,
-        ) -> str | None:
-            value = _map.get(name)
-            if value is not None:
-                return value
-            return _get_keyword_value_by_name_from_sample(_sample, name)
-
-        # Extract measurement-level metadata fields
-        measurement_custom_info = {}
-        if len(keyword_map) <= len(measurement_kw_set):
-            for name, value in keyword_map.items():
-                if name in measurement_kw_set:
-                    measurement_custom_info[name] = value
-        else:
-            for name in measurement_kw_set:
-                if (value := keyword_map.get(name)) is not None:
-                    measurement_custom_info[name] = value
-
-        for field, value in pre_root_measurement_fields.items():
-            measurement_custom_info.setdefault(field, value)
-
-        for field, value in pre_sample_list_measurement_fields.items():
-            measurement_custom_info.setdefault(field, value)
-
-        # Check current sample element for measurement document fields
-        for field in root_element_fields:
-            sample_value = sample.get_attr_or_none(field)
-            if (
-                sample_value is not None
-                and sample_value.strip() != ""
-                and field not in measurement_custom_info
-            ):
-                measurement_custom_info[field] = sample_value.strip()
-
-        # Extract sample-level metadata fields
-        sample_custom_info = {}
-        if len(keyword_map) <= len(sample_kw_set):
-            for name, value in keyword_map.items():
-                if name in sample_kw_set:
-                    sample_custom_info[name] = value
-        else:
-            for name in sample_kw_set:
-                if (value := keyword_map.get(name)) is not None:
-                    sample_custom_info[name] = value
-
-        # Extract data processing document-level metadata fields
-        data_processing_custom_info = {}
-        if len(keyword_map) <= len(processed_kw_set):
-            for name, value in keyword_map.items():
-                if name in processed_kw_set:
-                    data_processing_custom_info[name] = value
-        else:
-            for name in processed_kw_set:
-                if (value := keyword_map.get(name)) is not None:
-                    data_processing_custom_info[name] = value
-
-        # Also extract root element fields for data processing document
-        root_data_processing_fields = [
-            "linFromKW",
-            "logFromKW",
-            "linMax",
-            "logMax",
-            "useFCS3",
-            "useGain",
-            "linearRescale",
-            "logMin",
-            "linMin",
-            "extraNegs",
-            "logRescale",
-        ]
-
-        for field, value in pre_root_processing_fields.items():
-            data_processing_custom_info.setdefault(field, value)
+    for field, value in workspace_fields.root_measurement_fields.items():
+        measurement_custom_info.setdefault(field, value)
 
-        for field, value in pre_cytometer_measurement_fields.items():
-            measurement_custom_info.setdefault(field, value)
-        for field, value in pre_cytometer_processing_fields.items():
-            data_processing_custom_info.setdefault(field, value)
+    for field, value in workspace_fields.sample_list_measurement_fields.items():
+        measurement_custom_info.setdefault(field, value)
 
-        device_control_custom_info = _extract_device_control_keywords_from_map(
-            keyword_map
-        )
+    # Check current sample element for measurement document fields
+    for field, value in _get_non_empty_attrs(sample, MEASUREMENT_FIELDS).items():
+        measurement_custom_info.setdefault(field, value)
 
-        keywords_custom_info = _extract_general_custom_keywords_from_map(keyword_map)
-
-        if keywords_custom_info:
-            all_custom_info.update(keywords_custom_info)
-
-        measurement_group = MeasurementGroup(
-            experimental_data_identifier=experimental_data_identifier,
-            measurement_time=_get_measurement_time_from_map(keyword_map)
-            or _get_measurement_time(sample),
-            analyst=get_keyword_value("$OP"),
-            compensation_matrix_groups=compensation_matrix_groups,
-            custom_info=all_custom_info if all_custom_info else None,
-            measurements=[
-                Measurement(
-                    measurement_identifier=random_uuid_str(),
-                    sample_identifier=sample_node.get_attr("sampleID"),
-                    location_identifier=get_keyword_value("WELL ID"),
-                    well_plate_identifier=get_keyword_value("PLATE ID"),
-                    written_name=get_keyword_value("$SRC"),
-                    device_type=constants.DEVICE_TYPE,
-                    method_version=root_element.get_attr_or_none("version"),
-                    data_processing_time=root_element.get_attr_or_none("modDate"),
-                    processed_data_identifier=random_uuid_str(),
-                    populations=_process_sample(sample),
-                    data_regions=_create_data_regions(sample),
-                    custom_info=measurement_custom_info
-                    if measurement_custom_info
-                    else None,
-                    sample_custom_info=sample_custom_info
-                    if sample_custom_info
-                    else None,
-                    data_processing_custom_info=data_processing_custom_info
-                    if data_processing_custom_info
-                    else None,
-                    device_control_custom_info=device_control_custom_info
-                    if device_control_custom_info
-                    else None,
-                )
-            ],
-        )
+    # Extract sample-level metadata fields
+    sample_custom_info = _filter_keyword_map(keyword_map, SAMPLE_DOCUMENT_KEYWORD_SET)
 
-        result.append(measurement_group)
-    return result
+    # Extract data processing document-level metadata fields
+    data_processing_custom_info = _filter_keyword_map(
+        keyword_map, PROCESSED_DATA_KEYWORD_SET
+    )
+
+    for field, value in workspace_fields.root_processing_fields.items():
+        data_processing_custom_info.setdefault(field, value)
+
+    for field, value in workspace_fields.cytometer_measurement_fields.items():
+        measurement_custom_info.setdefault(field, value)
+    for field, value in workspace_fields.cytometer_processing_fields.items():
+        data_processing_custom_info.setdefault(field, value)
+
+    device_control_custom_info = _extract_device_control_keywords_from_map(keyword_map)
+
+    keywords_custom_info = _extract_general_custom_keywords_from_map(keyword_map)
+
+    if keywords_custom_info:
+        all_custom_info.update(keywords_custom_info)
+
+    return MeasurementGroup(
+        experimental_data_identifier=experimental_data_identifier,
+        measurement_time=_get_measurement_time_from_map(keyword_map)
+        or _get_measurement_time(sample),
+        analyst=get_keyword_value("$OP"),
+        compensation_matrix_groups=compensation_matrix_groups,
+        custom_info=all_custom_info if all_custom_info else None,
+        measurements=[
+            Measurement(
+                measurement_identifier=random_uuid_str(),
+                sample_identifier=sample_node.get_attr("sampleID"),
+                location_identifier=get_keyword_value("WELL ID"),
+                well_plate_identifier=get_keyword_value("PLATE ID"),
+                written_name=get_keyword_value("$SRC"),
+                device_type=constants.DEVICE_TYPE,
+                method_version=workspace_fields.method_version,
+                data_processing_time=workspace_fields.data_processing_time,
+                processed_data_identifier=random_uuid_str(),
+                populations=_process_sample(sample),
+                data_regions=_create_data_regions(sample),
+                custom_info=measurement_custom_info
+                if measurement_custom_info
+                else None,
+                sample_custom_info=sample_custom_info if sample_custom_info else None,
+                data_processing_custom_info=data_processing_custom_info
+                if data_processing_custom_info
+                else None,
+                device_control_custom_info=device_control_custom_info
+                if device_control_custom_info
+                else None,
+            )
+        ],
+    )
 
 
 def _get_measurement_time(sample: StrictXmlElement) -> str | None:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from io import StringIO
-from re import search
-from typing import Any, Literal
+from array import array
+from collections.abc import Iterator, Sequence
+from functools import cache
+import re
+from typing import Any, Literal, TypeVar
 
 import pandas as pd
 
 from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.utils.csv_blocks import read_csv_block
 from allotropy.parsers.utils.encoding import decode
-from allotropy.parsers.utils.pandas import read_csv
 from allotropy.parsers.utils.values import assert_not_none
 
 EMPTY_STR_PATTERN = r"^\s*$"
@@ -18,6 +19,25 @@ EMPTY_CSV_LINE = r"^,*$"
 # Use to match empty string or empty CSV line
 EMPTY_STR_OR_CSV_LINE = r"^[\s,]*$"
 
+# Line terminators, "\r\n" is normalized to "\n" to match read_to_lines.
+_LINE_BREAK = re.compile(r"\r?\n")
+
+Pattern = str | re.Pattern[str]
+ReaderType = TypeVar("ReaderType", bound="LinesReader")
+
+
+@cache
+def _compile(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    return re.compile(pattern, flags)
+
+
+@cache
+def _can_search_in_buffer(pattern: str) -> bool:
+    # Patterns are matched in the shared text buffer with pos/endpos bounds and re.MULTILINE, so that
+    # "^" and "$" match at line boundaries. Lookbehinds and absolute anchors can see past those bounds,
+    # so they are matched against the line itself instead.
+    return "(?<" not in pattern and "\\A" not in pattern and "\\Z" not in pattern
+
 
 def read_to_lines(named_file_contents: NamedFileContents) -> list[str]:
     raw_contents = decode(named_file_contents.contents, named_file_contents.encoding)
@@ -25,153 +45,282 @@ def read_to_lines(named_file_contents: NamedFileContents) -> list[str]:
     return contents.split("\n")
 
 
+def _line_bounds(text: str) -> tuple[array[int], array[int]]:
+    starts = array("q", [0])
+    ends = array("q")
+    for line_break in _LINE_BREAK.finditer(text):
+        ends.append(line_break.start())
+        starts.append(line_break.end())
+    ends.append(len(text))
+    return starts, ends
+
+
 class LinesReader:
-    lines: list[str]
+    """Cursor over the lines of a text file.
+
+    Lines are stored as a single text buffer plus arrays of line start/end offsets, so that readers
+    created from a file (or sections of another reader) do not hold one str object per line. Line
+    strings are only created when accessed with get()/pop(), or when the lines property is used.
+    """
+
     current_line: int
 
-    @staticmethod
-    def create(named_file_contents: NamedFileContents) -> LinesReader:
-        return LinesReader(read_to_lines(named_file_contents))
+    @classmethod
+    def create(
+        cls: type[ReaderType], named_file_contents: NamedFileContents
+    ) -> ReaderType:
+        return cls.from_text(
+            decode(named_file_contents.contents, named_file_contents.encoding)
+        )
+
+    @classmethod
+    def from_text(cls: type[ReaderType], text: str) -> ReaderType:
+        starts, ends = _line_bounds(text)
+        reader = cls.__new__(cls)
+        reader._init_buffer(text, starts, ends, lines=None, buffer_search=True)
+        return reader
 
     def __init__(self, lines: list[str]) -> None:
-        self.lines = lines
+        text = "\n".join(lines)
+        starts = array("q")
+        ends = array("q")
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line)
+            ends.append(offset)
+            offset += 1
+        self._init_buffer(
+            text,
+            starts,
+            ends,
+            lines=lines,
+            # If any line contains a line break, per-line anchors can not be matched in the buffer.
+            buffer_search=text.count("\n") == max(len(lines) - 1, 0),
+        )
+
+    def _init_buffer(
+        self,
+        text: str,
+        starts: array[int],
+        ends: array[int],
+        *,
+        lines: list[str] | None,
+        buffer_search: bool,
+    ) -> None:
+        self._text = text
+        self._starts = starts
+        self._ends = ends
+        self._lines = lines
+        self._buffer_search = buffer_search
+        self._cached_index = -1
+        self._cached_line = ""
         self.current_line = 0
 
+    def _sub_reader(self, cls: type[ReaderType], start: int, end: int) -> ReaderType:
+        # Create a reader over lines [start, end) sharing this reader's text buffer.
+        reader = cls.__new__(cls)
+        reader._init_buffer(
+            self._text,
+            self._starts[start:end],
+            self._ends[start:end],
+            lines=None if self._lines is None else self._lines[start:end],
+            buffer_search=self._buffer_search,
+        )
+        return reader
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def lines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = [
+                self._text[start:end]
+                for start, end in zip(self._starts, self._ends, strict=True)
+            ]
+        return self._lines
+
+    def _line_at(self, line: int) -> str:
+        if self._lines is not None:
+            return self._lines[line]
+        if line != self._cached_index:
+            self._cached_line = self._text[self._starts[line] : self._ends[line]]
+            self._cached_index = line
+        return self._cached_line
+
+    def _text_between(self, start: int, end: int) -> str:
+        # Text of lines [start, end) joined by "\n", taken as a single slice of the buffer.
+        block = self._text[self._starts[start] : self._ends[end - 1]]
+        return block.replace("\r\n", "\n") if "\r" in block else block
+
     def line_exists(self, line: int) -> bool:
-        return 0 <= line < len(self.lines)
+        return 0 <= line < len(self._starts)
 
     def current_line_exists(self) -> bool:
         return self.line_exists(self.current_line)
 
     def get_line(self, line: int) -> str | None:
-        return self.lines[line] if self.line_exists(line) else None
+        return self._line_at(line) if self.line_exists(line) else None
 
     def get(self) -> str | None:
-        return self.lines[self.current_line] if self.current_line_exists() else None
+        return self.get_line(self.current_line)
+
+    def match_line(self, line: int, match_pat: Pattern) -> bool:
+        if not self.line_exists(line):
+            return False
+        if isinstance(match_pat, re.Pattern):
+            return bool(match_pat.search(self._line_at(line)))
+        if self._buffer_search and _can_search_in_buffer(match_pat):
+            return bool(
+                _compile(match_pat, re.MULTILINE).search(
+                    self._text, self._starts[line], self._ends[line]
+                )
+            )
+        return bool(_compile(match_pat).search(self._line_at(line)))
 
-    def match(self, match_pat: str) -> bool:
-        line = self.get()
-        return False if line is None else bool(search(match_pat, line))
+    def match(self, match_pat: Pattern) -> bool:
+        return self.match_line(self.current_line, match_pat)
 
-    def is_empty(self, empty_pat: str = EMPTY_STR_PATTERN) -> bool:
+    def is_empty(self, empty_pat: Pattern = EMPTY_STR_PATTERN) -> bool:
         return self.match(empty_pat)
 
+    def _step(self) -> None:
+        self.current_line += 1
+
     def pop(self) -> str | None:
         line = self.get()
         if line is not None:
-            self.current_line += 1
+            self._step()
         return line
 
-    def pop_if_match(self, match_pat: str) -> str | None:
+    def pop_if_match(self, match_pat: Pattern) -> str | None:
         return self.pop() if self.match(match_pat) else None
 
     def pop_data(self) -> str | None:
         self.drop_empty()
         return self.pop()
 
-    def drop_until(self, match_pat: str) -> str | None:
+    def drop_until(self, match_pat: Pattern) -> str | None:
         while self.current_line_exists() and not self.match(match_pat):
-            self.pop()
+            self._step()
         return self.get()
 
-    def drop_until_inclusive(self, match_pat: str) -> str | None:
+    def drop_until_inclusive(self, match_pat: Pattern) -> str | None:
         self.drop_until(match_pat)
         return self.pop()
 
-    def drop_empty(self, empty_pat: str = EMPTY_STR_PATTERN) -> str | None:
+    def drop_empty(self, empty_pat: Pattern = EMPTY_STR_PATTERN) -> str | None:
         while self.current_line_exists() and self.is_empty(empty_pat):
-            self.pop()
+            self._step()
         return self.get()
 
-    def drop_until_empty(self, empty_pat: str = EMPTY_STR_PATTERN) -> str | None:
+    def drop_until_empty(self, empty_pat: Pattern = EMPTY_STR_PATTERN) -> str | None:
         while self.current_line_exists() and not self.is_empty(empty_pat):
-            self.pop()
+            self._step()
         return self.get()
 
     def drop_until_empty_inclusive(
-        self, empty_pat: str = EMPTY_STR_PATTERN
+        self, empty_pat: Pattern = EMPTY_STR_PATTERN
     ) -> str | None:
         self.drop_until_empty(empty_pat)
         return self.pop()
 
-    def pop_while(self, match_pat: str) -> Iterator[str]:
+    def pop_while(self, match_pat: Pattern) -> Iterator[str]:
         while self.current_line_exists() and self.match(match_pat):
             line = self.pop()
             if line is not None:
                 yield line
 
-    def pop_until(self, match_pat: str) -> Iterator[str]:
+    def pop_until(self, match_pat: Pattern) -> Iterator[str]:
         while self.current_line_exists() and not self.match(match_pat):
             line = self.pop()
             if line is not None:
                 yield line
 
-    def pop_until_inclusive(self, match_pat: str) -> Iterator[str]:
+    def pop_until_inclusive(self, match_pat: Pattern) -> Iterator[str]:
         yield from self.pop_until(match_pat)
         if self.current_line_exists():
             yield assert_not_none(self.pop())
 
-    def pop_until_empty(self, empty_pat: str = EMPTY_STR_PATTERN) -> Iterator[str]:
+    def pop_until_empty(self, empty_pat: Pattern = EMPTY_STR_PATTERN) -> Iterator[str]:
         while self.current_line_exists() and not self.is_empty(empty_pat):
             line = self.pop()
             if line is not None:
                 yield line
 
+    def pop_until_empty_as_text(
+        self, empty_pat: Pattern = EMPTY_STR_PATTERN
+    ) -> str | None:
+        """Pop lines until an empty line, returned as a single slice of the underlying text."""
+        start = self.current_line
+        self.drop_until_empty(empty_pat)
+        end = self.current_line
+        return self._text_between(start, end) if end > start else None
+
 
 class SectionLinesReader(LinesReader):
-    @staticmethod
-    def create(named_file_contents: NamedFileContents) -> SectionLinesReader:
-        return SectionLinesReader(read_to_lines(named_file_contents))
-
-    def iter_sections(self, pattern: str) -> Iterator[LinesReader]:
+    def iter_sections(self, pattern: Pattern) -> Iterator[LinesReader]:
         self.drop_until(pattern)
-        while True:
-            if (initial_line := self.pop()) is None:
-                break
-            lines = [initial_line, *self.pop_until(pattern)]
-            yield LinesReader(lines)
+        while self.current_line_exists():
+            start = self.current_line
+            self._step()
+            self.drop_until(pattern)
+            yield self._sub_reader(LinesReader, start, self.current_line)
 
 
 class InvertedLinesReader(LinesReader):
-    def __init__(self, lines: list[str]) -> None:
-        self.lines = lines
-        self.current_line = len(lines) - 1
+    @staticmethod
+    def from_reader(reader: LinesReader) -> InvertedLinesReader:
+        return reader._sub_reader(InvertedLinesReader, 0, len(reader))
 
-    def pop(self) -> str | None:
-        line = self.get()
-        if line is not None:
-            self.current_line -= 1
-        return line
+    def _init_buffer(
+        self,
+        text: str,
+        starts: array[int],
+        ends: array[int],
+        *,
+        lines: list[str] | None,
+        buffer_search: bool,
+    ) -> None:
+        super()._init_buffer(
+            text, starts, ends, lines=lines, buffer_search=buffer_search
+        )
+        self.current_line = len(starts) - 1
+
+    def _step(self) -> None:
+        self.current_line -= 1
 
 
 class CsvReader(LinesReader):
-    @staticmethod
-    def create(named_file_contents: NamedFileContents) -> CsvReader:
-        return CsvReader(read_to_lines(named_file_contents))
-
-    def pop_csv_block_as_lines(self, empty_pat: str = EMPTY_STR_PATTERN) -> list[str]:
+    def pop_csv_block_as_lines(
+        self, empty_pat: Pattern = EMPTY_STR_PATTERN
+    ) -> list[str]:
         self.drop_empty(empty_pat)
         lines = list(self.pop_until_empty(empty_pat))
         self.drop_empty(empty_pat)
         return lines
 
+    def pop_csv_block_as_text(
+        self, empty_pat: Pattern = EMPTY_STR_PATTERN
+    ) -> str | None:
+        """Pop the next non-empty block, returned as a single slice of the underlying text."""
+        self.drop_empty(empty_pat)
+        block = self.pop_until_empty_as_text(empty_pat)
+        self.drop_empty(empty_pat)
+        return block
+
     def pop_csv_block_as_df(
         self,
-        empty_pat: str = EMPTY_STR_PATTERN,
+        empty_pat: Pattern = EMPTY_STR_PATTERN,
         header: int | Literal["infer"] | None = None,
         **kwargs: Any,
     ) -> pd.DataFrame | None:
-        if lines := self.pop_csv_block_as_lines(empty_pat):
-            return read_csv(
-                StringIO("\n".join(lines)),
-                # Prevent pandas from rounding decimal values, at the cost of some speed.
-                float_precision="round_trip",
-                header=header,
-                **kwargs,
-            )
+        if block := self.pop_csv_block_as_text(empty_pat):
+            return read_csv_block(block, header=header, **kwargs)
         return None
 
-    def drop_sections(self, match_pat: str) -> None:
+    def drop_sections(self, match_pat: Pattern) -> None:
         self.drop_empty()
         while self.match(match_pat):
             self.drop_until_empty()
@@ -182,7 +331,7 @@ class CsvReader(LinesReader):
         return None if line is None else pd.Series(line.split(sep))
 
     def pop_line_as_df(
-        self, sep: str = " ", empty_pat: str = EMPTY_STR_PATTERN
+        self, sep: str = " ", empty_pat: Pattern = EMPTY_STR_PATTERN
     ) -> pd.DataFrame | None:
         self.drop_empty(empty_pat)
         line = self.pop()
@@ -191,17 +340,10 @@ class CsvReader(LinesReader):
 
     def lines_as_df(
         self,
-        lines: list[str],
+        lines: Sequence[str],
         header: int | Literal["infer"] | None = None,
         **kwargs: Any,
     ) -> pd.DataFrame | None:
         if lines:
-            return read_csv(
-                StringIO("\n".join(lines)),
-                dtype=None,
-                # Prevent pandas from rounding decimal values, at the cost of some speed.
-                float_precision="round_trip",
-                header=header,
-                **kwargs,
-            )
+            return read_csv_block("\n".join(lines), header=header, **kwargs)
         return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from io import StringIO
 import re
-from typing import cast, ClassVar
+from typing import ClassVar
 
 import pandas as pd
 
@@ -11,11 +11,12 @@ from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.constants import round_to_nearest_well_count
 from allotropy.parsers.lines_reader import CsvReader, read_to_lines
 from allotropy.parsers.luminex_xponent import constants
-from allotropy.parsers.utils.pandas import read_csv
+from allotropy.parsers.utils.pandas import read_csv, series_to_float_or_nan_array
 from allotropy.parsers.utils.values import assert_not_none, try_float_or_none
 
 # Pattern to detect analyte columns: "R<digits>: RP<digits> <METRIC>"
 _ANALYTE_COLUMN_PATTERN = re.compile(r"^R\d+:\s+RP\d+\s+")
+_TABLE_HEADER_PATTERN = re.compile(constants.TABLE_HEADER_PATTERN)
 
 
 class LuminexXponentReader:
@@ -173,15 +174,15 @@ class SingleDatasetParser:
             if "TOTAL EVENTS" in df.columns:
                 out["Total Events"] = df["TOTAL EVENTS"]
             else:
-                analyte_cols = analyte_labels
-                # Convert each analyte column to numeric, coercing errors to 0.0
-                # Use try_float_or_none for locale support, then fill None with 0.0
-                converted = cast(
-                    pd.DataFrame,
-                    out[analyte_cols]
-                    .apply(lambda col: col.apply(try_float_or_none))
-                    .fillna(0.0),
-                )
+                # Convert each analyte column to numeric (with locale support), coercing
+                # values that are not numbers to 0.0
+                converted = pd.DataFrame(
+                    {
+                        analyte: series_to_float_or_nan_array(out[analyte])
+                        for analyte in analyte_labels
+                    },
+                    index=out.index,
+                ).fillna(0.0)
                 out["Total Events"] = converted.sum(axis=1)
             # Add extra per-well columns from the raw data if present (v2.2 format)
             _per_well_extra_columns = [
@@ -297,13 +298,14 @@ class SingleDatasetParser:
         # Detect whether the file uses the R##: RP# column prefix pattern (v2.2 format).
         # If so, use pattern matching to detect analyte columns; otherwise, use the
         # FIXED_INPUT_COLUMNS list as in the original format.
-        has_prefixed_columns = any(cls.is_analyte_column(str(c)) for c in df.columns)
+        analyte_column_flags = [cls.is_analyte_column(str(c)) for c in df.columns]
+        has_prefixed_columns = any(analyte_column_flags)
 
-        for col in df.columns:
+        for col, is_analyte in zip(df.columns, analyte_column_flags, strict=True):
             col_str = str(col)
             # Skip non-analyte columns
             if has_prefixed_columns:
-                if not cls.is_analyte_column(col_str):
+                if not is_analyte:
                     continue
             elif col_str in cls.FIXED_INPUT_COLUMNS:
                 continue
@@ -582,9 +584,7 @@ class MultipleDatasetParser:
         while reader.current_line_exists() and "-- CRC --" not in (reader.get() or ""):
             result_title_line = assert_not_none(reader.pop())
             match: re.Match[str] | None
-            if not (
-                match := re.match(constants.TABLE_HEADER_PATTERN, result_title_line)
-            ):
+            if not (match := _TABLE_HEADER_PATTERN.match(result_title_line)):
                 msg = f"Invalid header block start line: {result_title_line}"
                 raise AllotropeParsingError(msg)
             result_title = match.groups()[0]
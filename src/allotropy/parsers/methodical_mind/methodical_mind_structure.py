@@ -6,6 +6,7 @@ from pathlib import Path
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from allotropy.allotrope.schema_mappers.adm.plate_reader.rec._2024._06.plate_reader import (
@@ -17,6 +18,7 @@ from allotropy.allotrope.schema_mappers.adm.plate_reader.rec._2024._06.plate_rea
 from allotropy.parsers.constants import NOT_APPLICABLE
 from allotropy.parsers.methodical_mind import constants
 from allotropy.parsers.utils.pandas import SeriesData
+from allotropy.parsers.utils.plate_grid import PlateGrid
 from allotropy.parsers.utils.uuids import random_uuid_str
 
 
@@ -58,25 +60,42 @@ class PlateData:
         data: pd.DataFrame,
     ) -> PlateData:
         well_plate_id = header[str, "Barcode1"].strip("<>")
-        unique_well_labels = [
-            label for label in data.index.unique() if _is_valid_well_label(label)
-        ]
+        # Positions of the rows of each unique row label. There is a row per spot for each label.
+        label_positions: dict[str, list[int]] = {}
+        for position, label in enumerate(data.index):
+            if _is_valid_well_label(label):
+                label_positions.setdefault(label, []).append(position)
+        unique_well_labels = list(label_positions)
+        # Get each unique row label, and then all rows with that label.
+        grid = PlateGrid.create(
+            data.iloc[[p for positions in label_positions.values() for p in positions]]
+        )
+        row_indices = np.repeat(
+            [
+                i
+                for positions in label_positions.values()
+                for i in range(len(positions))
+            ],
+            data.shape[1],
+        )
+        # Only include if the measurement is not an empty string, this skips blank entries for non-visible
+        # measurements.
+        is_reported = np.array([bool(value.strip()) for value in grid.get_strings()])
+        grid = grid.select(is_reported)
         spot_id = header.get(int, "SpotID")
         well_data = [
             WellData.create(
                 luminescence=float(value),
                 location_id=str(spot_id or row_index + 1),
                 well_plate_id=well_plate_id,
-                well_location_id=f"{row_name}{col_name}",
+                well_location_id=well_location_id,
+            )
+            for value, row_index, well_location_id in zip(
+                grid.values.tolist(),
+                row_indices[is_reported].tolist(),
+                grid.wells,
+                strict=True,
             )
-            # Get each unique row label, and then iterate over all rows with that label.
-            for row_name in unique_well_labels
-            for row_index, (_, row) in enumerate(data.loc[[row_name]].iterrows())
-            for col_name, value in row.items()
-            if _is_valid_well_label(row_name)
-            # Only include if the measurement is not an empty string, this skips blank entries for non-visible
-            # measurements.
-            if str(value).strip()
         ]
         return PlateData(
             measurement_time=header[str, "Read Time"],
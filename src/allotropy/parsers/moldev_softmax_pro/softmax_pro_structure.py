@@ -21,6 +21,7 @@ from allotropy.exceptions import (
 )
 from allotropy.parsers.constants import NEGATIVE_ZERO
 from allotropy.parsers.lines_reader import CsvReader
+from allotropy.parsers.utils.csv_blocks import read_csv_blocks
 from allotropy.parsers.utils.pandas import SeriesData, set_columns
 from allotropy.parsers.utils.uuids import random_uuid_str
 from allotropy.parsers.utils.values import (
@@ -468,14 +469,7 @@ class PlateWavelengthData:
             self.data_elements[position].kinetic_measures.append(value)
 
 
-def get_plate_dataframe(
-    reader: CsvReader, header: PlateHeader, columns: pd.Series[str] | None = None
-) -> pd.DataFrame:
-    if columns is None:
-        columns = assert_not_none(
-            reader.pop_as_series(sep="\t"),
-            msg="unable to find data columns for plate block raw data.",
-        )
+def _pop_plate_block(reader: CsvReader, header: PlateHeader) -> str:
     dimensions = assert_not_none(
         NUM_WELLS_TO_PLATE_DIMENSIONS.get(header.num_wells),
         msg="unable to determine plate dimensions",
@@ -490,21 +484,50 @@ def get_plate_dataframe(
             raise AllotropeConversionError(msg)
         lines.append(line)
     reader.drop_empty()
+    return "\n".join(lines)
 
-    # convert rows to df
-    data = assert_not_none(
-        reader.lines_as_df(lines=lines, sep="\t"),
-        msg="unable to find data from plate block.",
-    )
 
-    # Truncate columns Series to match the actual number of data columns
-    if len(columns) >= data.shape[1]:
-        columns = columns.iloc[: data.shape[1]]
-    elif len(columns) < data.shape[1]:
-        data = data.loc[:, : len(columns) - 1]
+def iter_plate_dataframes(
+    reader: CsvReader, header: PlateHeader, count: int, columns: pd.Series[str]
+) -> Iterator[pd.DataFrame]:
+    """Read count consecutive plate blocks, converted together.
+
+    If a block is incomplete, the blocks before it are still yielded before the error is raised, as
+    if each block was read and processed in turn.
+    """
+    blocks: list[str] = []
+    error: AllotropeConversionError | None = None
+    try:
+        for _ in range(count):
+            blocks.append(_pop_plate_block(reader, header))
+    except AllotropeConversionError as e:
+        error = e
+
+    for block_data in read_csv_blocks(blocks, sep="\t"):
+        data = block_data
+        plate_columns = columns
+        # Truncate columns Series to match the actual number of data columns
+        if len(plate_columns) >= data.shape[1]:
+            plate_columns = plate_columns.iloc[: data.shape[1]]
+        elif len(plate_columns) < data.shape[1]:
+            data = data.loc[:, : len(plate_columns) - 1]
+
+        set_columns(data, plate_columns)
+        yield data
+
+    if error is not None:
+        raise error
 
-    set_columns(data, columns)
-    return data
+
+def get_plate_dataframe(
+    reader: CsvReader, header: PlateHeader, columns: pd.Series[str] | None = None
+) -> pd.DataFrame:
+    if columns is None:
+        columns = assert_not_none(
+            reader.pop_as_series(sep="\t"),
+            msg="unable to find data columns for plate block raw data.",
+        )
+    return next(iter_plate_dataframes(reader, header, 1, columns))
 
 
 @dataclass(frozen=True)
@@ -541,9 +564,9 @@ class PlateRawData(RawData):
         )
 
         if elapsed_time is not None and header.kinetic_points > 1:
-            for _ in range(header.kinetic_points - 1):
-                data = get_plate_dataframe(reader, header, columns=columns)
-
+            for data in iter_plate_dataframes(
+                reader, header, header.kinetic_points - 1, columns
+            ):
                 elapsed_time = time_to_seconds(str(data.iloc[0, 0]))
                 plate_raw_data._update_kinetic_data(
                     elapsed_time, header, data.iloc[:, 2:]
@@ -593,8 +616,10 @@ class SpectrumPlateRawData(RawData):
             msg="unable to find data columns for plate block raw data.",
         )
         wavelength_data: list[PlateWavelengthData] = []
-        for wavelength in header.wavelengths:
-            data = get_plate_dataframe(reader, header, columns=columns)
+        plate_dataframes = iter_plate_dataframes(
+            reader, header, len(header.wavelengths), columns
+        )
+        for wavelength, data in zip(header.wavelengths, plate_dataframes, strict=True):
             first_row_idx = int(
                 try_float(str(data.first_valid_index()), "first_valid_index")
             )
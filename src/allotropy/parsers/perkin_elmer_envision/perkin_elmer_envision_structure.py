@@ -45,6 +45,7 @@ from allotropy.exceptions import AllotropeConversionError
 from allotropy.parsers.constants import NOT_APPLICABLE
 from allotropy.parsers.lines_reader import CsvReader
 from allotropy.parsers.perkin_elmer_envision import constants
+from allotropy.parsers.utils.csv_blocks import read_csv_blocks
 from allotropy.parsers.utils.pandas import (
     df_to_series_data,
     map_rows,
@@ -240,15 +241,9 @@ class BackgroundInfo:
         )
 
 
-def create_background_infos(reader: CsvReader) -> list[BackgroundInfo]:
-    title = reader.pop_if_match("^Background information")
-    if title is None:
+def create_background_infos(data_frame: pd.DataFrame | None) -> list[BackgroundInfo]:
+    if data_frame is None:
         return []
-
-    data_frame = assert_not_none(
-        reader.pop_csv_block_as_df(header=0),
-        "background information",
-    )
     return map_rows(data_frame, BackgroundInfo.create)
 
 
@@ -263,14 +258,7 @@ class CalculatedResult:
         return f"{self.col}{self.row}"
 
 
-def create_calculated_results(reader: CsvReader) -> list[CalculatedResult]:
-    # Calculated results may or may not have a title
-    reader.pop_if_match("^Calculated results")
-
-    data_frame = assert_not_none(
-        reader.pop_csv_block_as_df(),
-        "results data",
-    )
+def create_calculated_results(data_frame: pd.DataFrame) -> list[CalculatedResult]:
     series = (
         data_frame.drop(0, axis="index").drop(0, axis="columns")
         if data_frame.iloc[1, 0] == "A"
@@ -298,14 +286,7 @@ class Result:
     value: float
 
 
-def create_results(reader: CsvReader) -> list[Result]:
-    # Results may or may not have a title
-    reader.pop_if_match("^Results")
-
-    data_frame = assert_not_none(
-        reader.pop_csv_block_as_df(),
-        "reader data",
-    )
+def create_results(data_frame: pd.DataFrame) -> list[Result]:
     series = (
         data_frame.drop(0, axis="index").drop(0, axis="columns")
         if data_frame.iloc[1, 0] == "A"
@@ -369,21 +350,84 @@ class CalculatedPlate(Plate):
         yield from zip(self.results, self.get_source_results(plate_list), strict=True)
 
 
-def create_plate(reader: CsvReader) -> ResultPlate | CalculatedPlate:
-    series = PlateInfo.get_series(reader)
-    if result_plate_info := ResultPlateInfo.create(series):
+def _pop_block(reader: CsvReader, msg: str) -> str:
+    return assert_not_none(reader.pop_csv_block_as_text() or None, msg)
+
+
+@dataclass(frozen=True)
+class PlateBlocks:
+    plate_info: ResultPlateInfo | CalculatedPlateInfo
+    custom_info: dict[str, Any] | None
+    background: str | None
+    results: str
+
+    @staticmethod
+    def pop(reader: CsvReader) -> PlateBlocks:
+        series = PlateInfo.get_series(reader)
+        plate_info: ResultPlateInfo | CalculatedPlateInfo | None
+        custom_info = None
+        if not (plate_info := ResultPlateInfo.create(series)):
+            plate_info = CalculatedPlateInfo.create(series)
+            custom_info = series.get_unread()
+
+        background = None
+        if reader.pop_if_match("^Background information"):
+            background = _pop_block(reader, "background information")
+
+        # Results may or may not have a title
+        if isinstance(plate_info, ResultPlateInfo):
+            reader.pop_if_match("^Results")
+            results = _pop_block(reader, "reader data")
+        else:
+            reader.pop_if_match("^Calculated results")
+            results = _pop_block(reader, "results data")
+        return PlateBlocks(plate_info, custom_info, background, results)
+
+
+def create_plate(
+    blocks: PlateBlocks,
+    background: pd.DataFrame | None,
+    results: pd.DataFrame,
+) -> ResultPlate | CalculatedPlate:
+    if isinstance(blocks.plate_info, ResultPlateInfo):
         return ResultPlate(
-            plate_info=result_plate_info,
-            background_infos=create_background_infos(reader),
-            results=create_results(reader),
+            plate_info=blocks.plate_info,
+            background_infos=create_background_infos(background),
+            results=create_results(results),
         )
-    else:
-        return CalculatedPlate(
-            plate_info=CalculatedPlateInfo.create(series),
-            background_infos=create_background_infos(reader),
-            results=create_calculated_results(reader),
-            custom_info=series.get_unread(),
+    return CalculatedPlate(
+        plate_info=blocks.plate_info,
+        background_infos=create_background_infos(background),
+        results=create_calculated_results(results),
+        custom_info=blocks.custom_info,
+    )
+
+
+def create_plates(reader: CsvReader) -> Iterator[ResultPlate | CalculatedPlate]:
+    # The blocks of all plates are read first, so that the background and result grids are
+    # converted together. If a plate is incomplete, the plates before it are still created before
+    # the error is raised, as if each plate was read and created in turn.
+    plate_blocks: list[PlateBlocks] = []
+    error: AllotropeConversionError | None = None
+    try:
+        while reader.match("^Plate information"):
+            plate_blocks.append(PlateBlocks.pop(reader))
+    except AllotropeConversionError as e:
+        error = e
+
+    backgrounds = iter(
+        read_csv_blocks(
+            [blocks.background for blocks in plate_blocks if blocks.background],
+            header=0,
         )
+    )
+    results = read_csv_blocks([blocks.results for blocks in plate_blocks])
+    for blocks, results_df in zip(plate_blocks, results, strict=True):
+        background = next(backgrounds) if blocks.background else None
+        yield create_plate(blocks, background, results_df)
+
+    if error is not None:
+        raise error
 
 
 @dataclass
@@ -396,8 +440,7 @@ class PlateList:
         results: list[ResultPlate] = []
         calculated: list[CalculatedPlate] = []
 
-        while reader.match("^Plate information"):
-            plate = create_plate(reader)
+        for plate in create_plates(reader):
             if isinstance(plate, CalculatedPlate):
                 calculated.append(plate)
             else:
@@ -19,7 +19,7 @@ class Version(Enum):
 
 
 def get_version(reader: CsvReader) -> str:
-    inv_reader = InvertedLinesReader(reader.lines)
+    inv_reader = InvertedLinesReader.from_reader(reader)
     last_line = assert_not_none(
         inv_reader.pop_data(),
         msg="Unable to find last line of input file.",
@@ -29,6 +29,7 @@ from allotropy.exceptions import AllotropeConversionError, AllotropeParsingError
 from allotropy.parsers.lines_reader import CsvReader, EMPTY_STR_OR_CSV_LINE
 from allotropy.parsers.revvity_kaleido import constants
 from allotropy.parsers.utils.pandas import df_to_series_data, SeriesData
+from allotropy.parsers.utils.plate_grid import PlateGrid
 from allotropy.parsers.utils.uuids import random_uuid_str
 from allotropy.parsers.utils.values import (
     assert_not_none,
@@ -114,6 +115,11 @@ class BackgroundInfo:
         return BackgroundInfo(experiment_type_value=experiment_type)
 
 
+def _get_plate_data(data: pd.DataFrame) -> dict[str, str]:
+    grid = PlateGrid.create(data)
+    return dict(zip(grid.wells, grid.get_strings(), strict=True))
+
+
 @dataclass(frozen=True)
 class Results:
     barcode: str
@@ -140,11 +146,7 @@ class Results:
 
         return Results(
             barcode=barcode,
-            data={
-                f"{row}{col}": str(values[col])
-                for row, values in results.iterrows()
-                for col in results.columns
-            },
+            data=_get_plate_data(results),
         )
 
     @classmethod
@@ -208,11 +210,7 @@ class AnalysisResult:
             )
             return None
 
-        results = {
-            f"{row}{col}": str(values[col])
-            for row, values in results_df.iterrows()
-            for col in results_df.columns
-        }
+        results = _get_plate_data(results_df)
 
         # if first value is not a valid float value the results are not useful
         if try_float_or_none(results.get("A1")) is None:
@@ -286,13 +284,7 @@ class Platemap:
             msg="Unable to find platemap information.",
         )
 
-        return Platemap(
-            data={
-                f"{row}{col}": str(values[col])
-                for row, values in data.iterrows()
-                for col in data.columns
-            }
-        )
+        return Platemap(data=_get_plate_data(data))
 
     def get(self, well_position: str) -> str:
         return assert_not_none(
@@ -3,7 +3,7 @@ from io import StringIO
 import pandas as pd
 
 from allotropy.named_file_contents import NamedFileContents
-from allotropy.parsers.lines_reader import LinesReader, read_to_lines
+from allotropy.parsers.lines_reader import LinesReader
 from allotropy.parsers.utils.pandas import df_to_series_data, read_csv, SeriesData
 
 
@@ -13,7 +13,7 @@ class ThermoFisherGenesys30Reader:
     data: pd.DataFrame
 
     def __init__(self, named_file_contents: NamedFileContents) -> None:
-        reader = LinesReader(read_to_lines(named_file_contents))
+        reader = LinesReader.create(named_file_contents)
 
         if named_file_contents.extension == "csv":
             metadata_list = [line for line in reader.pop_until("^,,") if line]
@@ -0,0 +1,283 @@
+"""Fast parsing of small, regular CSV blocks (e.g. plate grids) into DataFrames.
+
+Plate reader exports contain many small blocks of delimited values. Parsing each of them with
+pd.read_csv has a high fixed cost, so regular blocks are split and converted directly here, and
+anything that could be interpreted differently by pandas is handed back to read_csv.
+
+Blocks that are read together (e.g. the plate grids of a kinetic read) are passed to
+read_csv_blocks, which converts the numbers of all regular blocks with a single numpy conversion
+per dtype.
+
+The result of the fast path is the same DataFrame pd.read_csv(..., float_precision="round_trip")
+would return: numeric cells are converted with Python's float()/int() (the same correctly rounded
+conversion used by round_trip), so decimal values round-trip exactly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from io import StringIO
+import re
+from typing import Any, Literal
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from allotropy.parsers.utils.pandas import read_csv
+
+# Default NA strings recognized by pd.read_csv.
+_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+# Strings pd.read_csv converts to booleans when a whole column consists of them.
+_BOOL_VALUES = frozenset({"True", "TRUE", "true", "False", "FALSE", "false"})
+# Integers that always fit into int64.
+_INT = re.compile(r"[+-]?\d{1,18}")
+_LONG_INT = re.compile(r"[+-]?\d+")
+_FLOAT = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+# Characters of a column that only contains integers, or numbers and empty cells. Such columns are
+# converted with numpy without looking at each cell, invalid numbers (e.g. "1-2") make the conversion
+# fail and are handled by pandas.
+_INT_CHARS = re.compile(r"[0-9+-]*")
+_NUMBER_CHARS = re.compile(r"[0-9.eE+-]*")
+_MAX_INT_LENGTH = 18
+# Above this size the pandas C parser is faster than splitting the block in Python.
+_MAX_BLOCK_LENGTH = 200_000
+_SUPPORTED_SEPARATORS = frozenset({",", "\t", ";"})
+
+_INT_COLUMN = 1
+_FLOAT_COLUMN = 2
+_STR_COLUMN = 3
+
+Header = int | Literal["infer"] | None
+
+
+class _NotRegularError(Exception):
+    pass
+
+
+def _classify_cell(cell: str) -> int | None:
+    # Returns None for cells that pandas may interpret in a way the fast path does not handle.
+    if cell in _NA_VALUES:
+        return None
+    if _INT.fullmatch(cell):
+        return _INT_COLUMN
+    if _LONG_INT.fullmatch(cell) or cell in _BOOL_VALUES:
+        raise _NotRegularError
+    if _FLOAT.fullmatch(cell):
+        return _FLOAT_COLUMN
+    try:
+        float(cell)
+    except ValueError:
+        return _STR_COLUMN
+    # Strings like "inf", " 1.0" or "1_000" that float() accepts.
+    raise _NotRegularError
+
+
+def _column_kind(cells: tuple[str, ...]) -> int:
+    joined = "".join(cells)
+    if _INT_CHARS.fullmatch(joined) and "" not in cells:
+        if max(map(len, cells)) > _MAX_INT_LENGTH:
+            raise _NotRegularError
+        return _INT_COLUMN
+    if _NUMBER_CHARS.fullmatch(joined):
+        return _FLOAT_COLUMN
+    kinds = set(map(_classify_cell, cells))
+    if _STR_COLUMN in kinds:
+        return _STR_COLUMN
+    return _INT_COLUMN if kinds == {_INT_COLUMN} else _FLOAT_COLUMN
+
+
+def _split_block(block: str, sep: str) -> list[list[str]]:
+    if '"' in block or "\r" in block:
+        raise _NotRegularError
+    rows = [line.split(sep) for line in block.split("\n")]
+    n_cols = len(rows[0])
+    for row in rows:
+        # Ragged rows are padded/rejected by pandas, and blank lines are skipped.
+        if len(row) != n_cols or (n_cols == 1 and not row[0].strip()):
+            raise _NotRegularError
+    return rows
+
+
+@dataclass
+class _RegularBlock:
+    columns: list[Any]
+    cells: list[tuple[str, ...]]
+    kinds: list[int]
+
+    @staticmethod
+    def create(block: str, sep: str, header: Header) -> _RegularBlock | None:
+        # With no names given, "infer" reads the header from the first row.
+        header = 0 if header == "infer" else header
+        if (
+            sep not in _SUPPORTED_SEPARATORS
+            or header not in (None, 0)
+            or len(block) > _MAX_BLOCK_LENGTH
+        ):
+            return None
+        try:
+            rows = _split_block(block, sep)
+            columns: list[Any] = list(range(len(rows[0])))
+            if header == 0:
+                columns, *rows = rows
+                if (
+                    not rows
+                    or len(set(columns)) != len(columns)
+                    or not all(column.strip() for column in columns)
+                ):
+                    return None
+            cells = list(zip(*rows, strict=True))
+            kinds = [_column_kind(column_cells) for column_cells in cells]
+        except _NotRegularError:
+            return None
+        return _RegularBlock(columns, cells, kinds)
+
+    def to_df(self, values: list[Any]) -> pd.DataFrame:
+        df = pd.DataFrame(dict(enumerate(values)))
+        df.columns = pd.Index(
+            [
+                unicodedata.normalize("NFKC", column)
+                if isinstance(column, str)
+                else column
+                for column in self.columns
+            ]
+        )
+        return df
+
+
+def _as_object(cells: tuple[str, ...]) -> Any:
+    return np.array(
+        [np.nan if cell in _NA_VALUES else cell for cell in cells], dtype=object
+    )
+
+
+def _has_na(cells: tuple[str, ...]) -> bool:
+    return "" in cells or not _NUMBER_CHARS.fullmatch("".join(cells))
+
+
+def _convert_blocks(blocks: list[_RegularBlock]) -> list[pd.DataFrame]:
+    # Convert the numeric columns of all blocks with a single numpy conversion per dtype. numpy
+    # converts strings with float()/int(), so values are correctly rounded. Raises ValueError or
+    # OverflowError if any value is not a valid number.
+    int_cells: list[str] = []
+    float_cells: list[str] = []
+    for block in blocks:
+        for kind, cells in zip(block.kinds, block.cells, strict=True):
+            if kind == _INT_COLUMN:
+                int_cells.extend(cells)
+            elif kind == _FLOAT_COLUMN:
+                float_cells.extend(
+                    ["nan" if cell in _NA_VALUES else cell for cell in cells]
+                    if _has_na(cells)
+                    else cells
+                )
+    ints = np.array(int_cells, dtype=np.int64)
+    floats = np.array(float_cells, dtype=np.float64)
+
+    dfs = []
+    int_pos = float_pos = 0
+    for block in blocks:
+        values: list[Any] = []
+        for kind, cells in zip(block.kinds, block.cells, strict=True):
+            n_cells = len(cells)
+            if kind == _INT_COLUMN:
+                values.append(ints[int_pos : int_pos + n_cells])
+                int_pos += n_cells
+            elif kind == _FLOAT_COLUMN:
+                values.append(floats[float_pos : float_pos + n_cells])
+                float_pos += n_cells
+            else:
+                values.append(_as_object(cells))
+        dfs.append(block.to_df(values))
+    return dfs
+
+
+def _try_convert_blocks(
+    blocks: list[_RegularBlock],
+) -> list[pd.DataFrame | None]:
+    try:
+        return list(_convert_blocks(blocks))
+    except (ValueError, OverflowError):
+        if len(blocks) == 1:
+            return [None]
+    # Find the blocks that failed to convert, so that only they are parsed with pandas.
+    return [_try_convert_blocks([block])[0] for block in blocks]
+
+
+def try_parse_regular_block(
+    block: str, sep: str = ",", header: Header = None
+) -> pd.DataFrame | None:
+    """Parse a rectangular, unquoted block without pd.read_csv, or return None if not possible."""
+    regular_block = _RegularBlock.create(block, sep, header)
+    return None if regular_block is None else _try_convert_blocks([regular_block])[0]
+
+
+def _read_csv(block: str, sep: str, header: Header, **kwargs: Any) -> pd.DataFrame:
+    return read_csv(
+        StringIO(block),
+        sep=sep,
+        header=header,
+        # Prevent pandas from rounding decimal values, at the cost of some speed.
+        float_precision="round_trip",
+        **kwargs,
+    )
+
+
+def read_csv_blocks(
+    blocks: Sequence[str],
+    sep: str = ",",
+    header: Header = None,
+    **kwargs: Any,
+) -> list[pd.DataFrame]:
+    """Parse blocks of delimited text, equivalent to calling pd.read_csv on each block.
+
+    Regular blocks are split and converted together, irregular blocks (or calls with extra
+    read_csv arguments) fall back to pd.read_csv.
+    """
+    regular_blocks = [
+        None if kwargs else _RegularBlock.create(block, sep, header) for block in blocks
+    ]
+    converted = iter(
+        _try_convert_blocks([block for block in regular_blocks if block is not None])
+    )
+    dfs = [
+        None if regular_block is None else next(converted)
+        for regular_block in regular_blocks
+    ]
+    return [
+        _read_csv(block, sep, header, **kwargs) if df is None else df
+        for block, df in zip(blocks, dfs, strict=True)
+    ]
+
+
+def read_csv_block(
+    block: str,
+    sep: str = ",",
+    header: Header = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Parse a block of delimited text, equivalent to pd.read_csv(StringIO(block), ...)."""
+    return read_csv_blocks([block], sep, header, **kwargs)[0]
@@ -4,6 +4,7 @@ import chardet
 
 from allotropy.constants import CHARDET_ENCODING, DEFAULT_ENCODING
 from allotropy.exceptions import AllotropeConversionError, AllotropeParsingError
+from allotropy.profiling import ENCODING_DETECTION, profile_stage
 
 
 def _get_contents(contents: bytes | IO[bytes] | IO[str]) -> str | bytes:
@@ -21,7 +22,11 @@ def determine_encoding(
         return [DEFAULT_ENCODING]
     if encoding != CHARDET_ENCODING:
         return [encoding]
+    with profile_stage(ENCODING_DETECTION):
+        return _detect_encoding(contents)
 
+
+def _detect_encoding(contents: bytes | IO[bytes] | IO[str]) -> list[str | None]:
     actual_contents = _get_contents(contents)
     if isinstance(actual_contents, str):
         return [None]
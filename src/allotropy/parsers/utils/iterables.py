@@ -1,6 +1,8 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from typing import TypeVar
 
+from allotropy.profiling import CREATE_DATA, profile_stage
+
 T = TypeVar("T")
 S = TypeVar("S")
 
@@ -11,3 +13,29 @@ def get_first_not_none(func: Callable[[T], S | None], args: Iterable[T]) -> S |
         if ret is not None:
             return ret
     return None
+
+
+def prefetch_first(items: Iterable[T]) -> Iterator[T]:
+    """Create the first of items now, and the others as they are read.
+
+    Parsers that create measurement groups while they are mapped use this, so that create_data still
+    fails for input the parser cannot read, e.g. when discover_vendor tries each candidate parser.
+    The items created later are profiled as create_data stages, nested in the map_model stage.
+    """
+    iterator = iter(items)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return _iter_with_first(first, iterator)
+
+
+def _iter_with_first(first: T, iterator: Iterator[T]) -> Iterator[T]:
+    yield first
+    while True:
+        with profile_stage(CREATE_DATA):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
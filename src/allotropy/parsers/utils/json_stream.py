@@ -0,0 +1,178 @@
+"""Incremental decoding of JSON contents, one value at a time.
+
+json.load turns a whole document into Python objects at once, so converting a large export holds
+every value of the file (e.g. a Python float for each point of every chromatogram) in memory at the
+same time. A JsonStream walks the text of the document instead: the members of an object and the
+items of an array are visited in order, and only the values that are decoded become objects. Values
+are decoded with the C scanner of the json module, and arrays of numbers can be read straight into
+NumPy arrays.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+import json
+import re
+from typing import Any, NoReturn, TypeVar
+
+import numpy as np
+
+from allotropy.named_file_contents import NamedFileContents
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Strings and brackets, the only tokens that matter to find the end of a value.
+_SKIP_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_DECODER = json.JSONDecoder()
+_NUMBER = r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?"
+# The items and closing bracket of an array that can only contain numbers.
+_NUMBER_ARRAY_ITEMS = re.compile(r"[0-9eE.+\-, \t\n\r]*\]")
+# An item of such an array that is not a JSON number. np.fromstring accepts text that is not JSON
+# (e.g. "+1", ".5" or a trailing comma), so only arrays without one are read with it. Items are
+# checked one at a time, a pattern repeated over all items would keep regex state for each of them.
+_INVALID_NUMBER_ITEM = re.compile(rf"(?:\A|,)(?![ \t\n\r]*{_NUMBER}[ \t\n\r]*(?:,|\Z))")
+
+
+def read_json_text(named_file_contents: NamedFileContents) -> str:
+    """The contents as text, decoded as with json.load."""
+    contents = named_file_contents.contents.read()
+    if isinstance(contents, bytes):
+        return contents.decode(json.detect_encoding(contents), "surrogatepass")
+    return str(contents)
+
+
+class JsonStream:
+    """A position in the text of a JSON document, moved forward as values are read.
+
+    Errors in the document raise json.JSONDecodeError, as with json.load. Only the values that are
+    read are checked, a document is not validated past the last value read from it.
+    """
+
+    def __init__(self, text: str, pos: int = 0) -> None:
+        self.text = text
+        self.pos = pos
+
+    def _error(self, msg: str) -> NoReturn:
+        raise json.JSONDecodeError(msg, self.text, self.pos)
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            self._error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def peek(self) -> str:
+        """The first character of the next value (or delimiter), or "" at the end of the text."""
+        match = _WHITESPACE.match(self.text, self.pos)
+        self.pos = match.end() if match else self.pos
+        return self.text[self.pos : self.pos + 1]
+
+    def decode(self) -> Any:
+        self.peek()
+        try:
+            value, self.pos = _DECODER.raw_decode(self.text, self.pos)
+        except StopIteration:
+            self._error("Expecting value")
+        return value
+
+    def skip(self) -> None:
+        """Move past the next value without decoding it."""
+        if self.peek() not in ("[", "{"):
+            self.decode()
+            return
+        depth = 0
+        for match in _SKIP_TOKEN.finditer(self.text, self.pos):
+            token = match.group()
+            if token in ("[", "{"):
+                depth += 1
+            elif token in ("]", "}"):
+                depth -= 1
+                if depth == 0:
+                    self.pos = match.end()
+                    return
+        self._error("Unterminated value")
+
+    def _iter_values(self, end: str) -> Iterator[None]:
+        # Yields at each value of an array or object, which the caller must move past.
+        if self.peek() == end:
+            self.pos += 1
+            return
+        while True:
+            yield
+            delimiter = self.peek()
+            if delimiter == end:
+                self.pos += 1
+                return
+            if delimiter != ",":
+                self._error(f"Expecting ',' delimiter or '{end}'")
+            self.pos += 1
+
+    def _visit(self, value: T) -> Iterator[T]:
+        # Yields value with the stream at the next value, and skips it if the caller did not read it.
+        self.peek()
+        start = self.pos
+        yield value
+        if self.pos == start:
+            self.skip()
+
+    def iter_items(self) -> Iterator[int]:
+        """Visit the items of the next value, an array, yielding the index of each item.
+
+        At each index the stream is at the item, which the caller can read (or walk into) before
+        the next index. Items that are not read are skipped.
+        """
+        self._expect("[")
+        for index, _ in enumerate(self._iter_values("]")):
+            yield from self._visit(index)
+
+    def iter_members(self) -> Iterator[str]:
+        """Visit the members of the next value, an object, yielding the key of each member.
+
+        At each key the stream is at the value of the member, as with iter_items.
+        """
+        self._expect("{")
+        for _ in self._iter_values("}"):
+            if self.peek() != '"':
+                self._error("Expecting property name enclosed in double quotes")
+            key = self.decode()
+            self._expect(":")
+            yield from self._visit(key)
+
+    def decode_array(self, decode_item: Callable[[JsonStream], T]) -> Any:
+        """Decode the next value, decoding each item with decode_item if the value is an array."""
+        if self.peek() != "[":
+            return self.decode()
+        return [decode_item(self) for _ in self.iter_items()]
+
+    def decode_object(
+        self, decode_values: Mapping[str, Callable[[JsonStream], Any]]
+    ) -> Any:
+        """Decode the next value, decoding the values of the keys in decode_values with their function
+        if the value is an object.
+        """
+        if self.peek() != "{":
+            return self.decode()
+        data: dict[str, Any] = {}
+        for key in self.iter_members():
+            decode_value = decode_values.get(key)
+            data[key] = self.decode() if decode_value is None else decode_value(self)
+        return data
+
+    def decode_float_array(self) -> Any:
+        """Decode the next value, an array of numbers, straight into a float array.
+
+        Other values, including arrays with other items (e.g. null), are decoded as with decode, so
+        nulls are kept as None.
+        """
+        if self.peek() == "[" and (
+            match := _NUMBER_ARRAY_ITEMS.match(self.text, self.pos + 1)
+        ):
+            items = self.text[self.pos + 1 : match.end() - 1]
+            # np.fromstring reads blank text as [-1.0].
+            if items.isspace() or not items:
+                self.pos = match.end()
+                return np.empty(0, dtype=np.float64)
+            if not _INVALID_NUMBER_ITEM.search(items):
+                self.pos = match.end()
+                return np.fromstring(items, sep=",")
+        return self.decode()
@@ -8,6 +8,8 @@ from typing import Any, IO, Literal, overload, TypeVar
 import unicodedata
 import warnings
 
+import numpy as np
+from numpy.typing import NDArray
 import pandas as pd
 
 from allotropy.allotrope.models.shared.definitions.definitions import (
@@ -19,6 +21,7 @@ from allotropy.exceptions import (
 )
 from allotropy.parsers.utils.encoding import determine_encoding
 from allotropy.parsers.utils.iterables import get_first_not_none
+from allotropy.parsers.utils.locale_context import get_current_locale
 from allotropy.parsers.utils.values import (
     assert_is_type,
     assert_not_none,
@@ -61,6 +64,42 @@ def series_to_float_list(series: pd.Series[Any], value_name: str) -> list[float]
     return [try_float(str(v), value_name) for v in series]
 
 
+def series_to_float_array(
+    series: pd.Series[Any], value_name: str
+) -> NDArray[np.float64]:
+    """Convert pandas Series to a float64 NumPy array, e.g. for data cube values.
+
+    Numeric series are converted directly, without creating a Python float per value. Other series
+    are parsed with try_float, as in series_to_float_list.
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.to_numpy(dtype=np.float64)
+    return np.array(series_to_float_list(series, value_name), dtype=np.float64)
+
+
+def series_to_float_or_nan_array(series: pd.Series[Any]) -> NDArray[np.float64]:
+    """Convert pandas Series to a float64 NumPy array, with NaN for values that are not numbers.
+
+    Values are parsed as with try_float_or_none (e.g. "1,5" is 1.5), but a column at a time: numeric
+    series are converted directly, and strings are converted in a single cast. Values are only parsed
+    one by one if the column has values that are not numbers, or if a locale is set for parsing.
+    """
+    if get_current_locale() is None:
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(
+            series
+        ):
+            return series.to_numpy(dtype=np.float64, na_value=np.nan)
+        strings = series.astype(str).str.replace(",", ".", regex=False)
+        try:
+            return strings.to_numpy(dtype=object).astype(np.float64)
+        except ValueError:
+            pass
+    return np.array(
+        [np.nan if (value := try_float_or_none(v)) is None else value for v in series],
+        dtype=np.float64,
+    )
+
+
 def rm_df_columns(data: pd.DataFrame, pattern: str) -> pd.DataFrame:
     return data.drop(
         columns=[column for column in data.columns if re.match(pattern, column)]
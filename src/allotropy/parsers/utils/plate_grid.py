@@ -0,0 +1,79 @@
+"""Cells of plate blocks, e.g. a table of values with row letters as index and column numbers as columns.
+
+Walking a block with iterrows creates a Series for every row. A PlateGrid instead flattens the whole
+block once, row by row (A1, A2, ..., B1, ...), into arrays with the row, column and value of each
+cell, so values can be converted a column of cells at a time.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+import pandas as pd
+
+from allotropy.parsers.utils.pandas import series_to_float_or_nan_array
+
+
+@dataclass(frozen=True)
+class PlateGrid:
+    # Row name, column name and value of each cell.
+    rows: NDArray[Any]
+    columns: NDArray[Any]
+    values: NDArray[Any]
+    # Label of the row of each cell, for blocks with a label per row (see create).
+    labels: NDArray[Any] | None = None
+
+    @staticmethod
+    def create(data: pd.DataFrame, *, row_label_column: bool = False) -> PlateGrid:
+        """Flatten a block with row names as index and column names as columns.
+
+        With row_label_column, the last column of the block has a label for each row (e.g. the
+        name of the measurement in the row) instead of values, and the columns with values are
+        numbered from 1 by position.
+        """
+        # The same values, with the same types, as the rows yielded by data.iterrows().
+        values = data.to_numpy()
+        row_labels: NDArray[Any] | None = None
+        if row_label_column:
+            values, row_labels = values[:, :-1], values[:, -1]
+            column_names: NDArray[Any] = np.arange(1, values.shape[1] + 1)
+        else:
+            column_names = data.columns.to_numpy()
+        n_rows, n_columns = values.shape
+        return PlateGrid(
+            rows=np.repeat(data.index.to_numpy(), n_columns),
+            columns=np.tile(column_names, n_rows),
+            values=values.ravel(),
+            labels=None if row_labels is None else np.repeat(row_labels, n_columns),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def wells(self) -> list[str]:
+        """The well position of each cell, the row name followed by the column name (e.g. "A1")."""
+        return [
+            f"{row}{column}"
+            for row, column in zip(
+                self.rows.tolist(), self.columns.tolist(), strict=True
+            )
+        ]
+
+    def select(self, mask: NDArray[Any]) -> PlateGrid:
+        return PlateGrid(
+            rows=self.rows[mask],
+            columns=self.columns[mask],
+            values=self.values[mask],
+            labels=None if self.labels is None else self.labels[mask],
+        )
+
+    def get_strings(self) -> list[str]:
+        return [str(value) for value in self.values.tolist()]
+
+    def get_floats(self) -> NDArray[np.float64]:
+        """The values as floats, parsed as with try_float_or_none, with NaN for values that are not numbers."""
+        return series_to_float_or_nan_array(pd.Series(self.values, copy=False))
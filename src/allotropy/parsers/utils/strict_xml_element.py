@@ -15,7 +15,7 @@ from allotropy.parsers.utils.values import assert_not_none, try_float_or_none
 class StrictXmlElement:
     @classmethod
     def create_from_bytes(
-        cls, data: bytes, mark_read: set[str] | None = None
+        cls, data: bytes | memoryview, mark_read: set[str] | None = None
     ) -> StrictXmlElement:
         return StrictXmlElement(fromstring(data), mark_read=mark_read)
 
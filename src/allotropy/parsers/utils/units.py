@@ -1,9 +1,17 @@
 from dataclasses import fields, MISSING
 
+from allotropy.allotrope.models.shared.definitions import quantity_values
 from allotropy.allotrope.models.shared.definitions.definitions import TQuantityValue
 
-# We must import this to get all subclasses of TQuantityValue in scope
-import allotropy.allotrope.models.shared.definitions.quantity_values  # noqa: F401
+# Collected from the module rather than TQuantityValue.__subclasses__(), which also lists the classes
+# that dataclass(slots=True) replaced.
+QUANTITY_VALUE_CLASSES: list[type[TQuantityValue]] = [
+    value
+    for value in vars(quantity_values).values()
+    if isinstance(value, type)
+    and issubclass(value, TQuantityValue)
+    and value is not TQuantityValue
+]
 
 
 def _clean_unit(unit: str) -> str:
@@ -21,7 +29,7 @@ UNIT_TO_PROPERTY = {
     unit_entry: quantity_value
     for unit_entry, quantity_value in [
         (_make_unit_entry(quantity_value), quantity_value)
-        for quantity_value in TQuantityValue.__subclasses__()
+        for quantity_value in QUANTITY_VALUE_CLASSES
     ]
     if unit_entry
 }
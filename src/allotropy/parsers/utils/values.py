@@ -6,6 +6,7 @@ import math
 import re
 from typing import Any, TypeVar
 
+from allotropy.allotrope.converter import iter_json_fields
 from allotropy.allotrope.models.shared.definitions.definitions import (
     InvalidJsonFloat,
     JsonFloat,
@@ -195,4 +196,4 @@ def str_or_none(value: Any) -> str | None:
 
 def has_value(model: object) -> bool:
     # For models with all optional attributes, returns whether any attribute has a value.
-    return any(value is not None for value in model.__dict__.values())
+    return any(value is not None for _, value in iter_json_fields(model))
@@ -0,0 +1,163 @@
+"""Cheap checks of XML contents for sniffing, and a parsed tree shared with create_data.
+
+Sniffing an XML file only needs its root element, and usually the first children of the root.
+probe_xml reads those from a bounded prefix of the contents, instead of parsing the whole document.
+When the whole document is needed, parse_xml parses it once per NamedFileContents, so a tree parsed
+to sniff a file is reused when the data is created from it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import dataclass
+from typing import IO
+import xml.etree.ElementTree as ET  # noqa: N817
+
+from defusedxml.ElementTree import iterparse, parse
+
+from allotropy.named_file_contents import NamedFileContents
+
+# The probe stops reading after this many bytes (or characters, for text contents).
+PROBE_SIZE = 64 * 1024
+_CHUNK_SIZE = 8 * 1024
+_XML_TREE_KEY = "xml_tree"
+
+
+def local_name(tag: str) -> str:
+    """The tag without its namespace, e.g. "Wells" for "{http://www.Bio-Rad.com/...}Wells"."""
+    return tag.rsplit("}", 1)[-1]
+
+
+@dataclass(frozen=True)
+class XmlProbe:
+    # Local names of the root element and of its children.
+    root_tag: str
+    child_tags: frozenset[str]
+    # Whether the whole root element was read, i.e. child_tags has all of the root's children.
+    complete: bool
+
+
+def probe_xml(
+    named_file_contents: NamedFileContents, max_size: int = PROBE_SIZE
+) -> XmlProbe | None:
+    """Read the root element and its children from the first max_size of the contents.
+
+    Returns None if the contents are not XML, as far as they were read.
+    """
+    if (root := named_file_contents.parsed.get(_XML_TREE_KEY)) is not None:
+        return XmlProbe(
+            local_name(root.tag),
+            frozenset(local_name(c.tag) for c in root),
+            complete=True,
+        )
+
+    contents = named_file_contents.contents
+    contents.seek(0)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root_tag: str | None = None
+    child_tags: set[str] = set()
+    depth = 0
+    size = 0
+    try:
+        while size < max_size and (
+            chunk := contents.read(min(_CHUNK_SIZE, max_size - size))
+        ):
+            size += len(chunk)
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    depth += 1
+                    if depth == 1:
+                        root_tag = local_name(element.tag)
+                    elif depth == 2:
+                        child_tags.add(local_name(element.tag))
+                    continue
+                depth -= 1
+                if depth == 0:
+                    return XmlProbe(
+                        local_name(element.tag), frozenset(child_tags), complete=True
+                    )
+                if depth == 1:
+                    # Children of the root are not needed after their start, keep memory bounded.
+                    element.clear()
+    except ET.ParseError:
+        return None
+    finally:
+        contents.seek(0)
+
+    if root_tag is None:
+        return None
+    return XmlProbe(root_tag, frozenset(child_tags), complete=False)
+
+
+def parse_xml(named_file_contents: NamedFileContents) -> ET.Element:
+    """Parse the whole document, returning its root element.
+
+    The tree is parsed once per NamedFileContents, and must not be modified by callers. Raises
+    ET.ParseError if the contents are not valid XML.
+    """
+    root: ET.Element | None = named_file_contents.parsed.get(_XML_TREE_KEY)
+    if root is None:
+        named_file_contents.contents.seek(0)
+        root = parse(named_file_contents.contents).getroot()
+        named_file_contents.parsed[_XML_TREE_KEY] = root
+    return root
+
+
+def _check_root_children(
+    named_file_contents: NamedFileContents,
+    check: Callable[[frozenset[str]], bool],
+    root_tag: str | None,
+) -> bool:
+    probe = probe_xml(named_file_contents)
+    if probe is None or (root_tag is not None and probe.root_tag != root_tag):
+        return False
+    # Children are only added as more of the document is read, so a passing check is final.
+    if check(probe.child_tags):
+        return True
+    if probe.complete:
+        return False
+    root = parse_xml(named_file_contents)
+    if check(frozenset(local_name(child.tag) for child in root)):
+        return True
+    # Only keep the tree for the parser that accepts the file.
+    named_file_contents.parsed.pop(_XML_TREE_KEY, None)
+    return False
+
+
+def has_root_children(
+    named_file_contents: NamedFileContents,
+    tags: Collection[str],
+    *,
+    root_tag: str | None = None,
+) -> bool:
+    """Whether the root element (named root_tag, if given) has children with all of tags (as local names).
+
+    The whole document is only parsed if the root matches and the children are not found in the
+    probed prefix.
+    """
+    return _check_root_children(
+        named_file_contents, lambda child_tags: child_tags.issuperset(tags), root_tag
+    )
+
+
+def has_any_root_child(
+    named_file_contents: NamedFileContents,
+    tags: Collection[str],
+    *,
+    root_tag: str | None = None,
+) -> bool:
+    """Whether the root element (named root_tag, if given) has a child with any of tags (as local names)."""
+    return _check_root_children(
+        named_file_contents,
+        lambda child_tags: not child_tags.isdisjoint(tags),
+        root_tag,
+    )
+
+
+def iter_xml_text(stream: IO[bytes]) -> Iterator[str]:
+    """Yield the text of each element of a document as it is parsed, without keeping the tree."""
+    for _, element in iterparse(stream, events=("end",)):
+        if element.text:
+            yield element.text
+        element.clear()
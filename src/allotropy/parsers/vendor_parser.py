@@ -7,6 +7,7 @@ from allotropy.constants import ASM_CONVERTER_NAME
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.release_state import ReleaseState
 from allotropy.parsers.utils.timestamp_parser import TimestampParser
+from allotropy.profiling import CREATE_DATA, MAP_MODEL, profile_stage
 
 Data = TypeVar("Data")
 Model = TypeVar("Model")
@@ -43,8 +44,14 @@ class VendorParser(ABC, Generic[Data, Model]):
     def create_data(self, named_file_contents: NamedFileContents) -> Data:
         raise NotImplementedError
 
+    def map_model(self, data: Data) -> Model:
+        return self._get_mapper().map_model(data)
+
     def to_allotrope(self, named_file_contents: NamedFileContents) -> Model:
-        return self._get_mapper().map_model(self.create_data(named_file_contents))
+        with profile_stage(CREATE_DATA):
+            data = self.create_data(named_file_contents)
+        with profile_stage(MAP_MODEL):
+            return self.map_model(data)
 
     @property
     def asm_converter_name(self) -> str:
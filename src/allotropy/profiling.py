@@ -0,0 +1,191 @@
+"""Per-stage timing and memory profiles of conversions.
+
+Conversion stages (encoding detection, vendor discovery, create_data, map_model, serialization and
+validation) are wrapped in profile_stage(). Stages are only measured while a profile is being
+collected, either for a single call with allotrope_from_io_with_profile/allotrope_from_file_with_profile,
+or for every conversion after set_profile_callback(). Otherwise profile_stage() does nothing but look
+up a context variable.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import logging
+import time
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+# Stage names
+ENCODING_DETECTION = "encoding_detection"
+VENDOR_DISCOVERY = "vendor_discovery"
+CREATE_DATA = "create_data"
+MAP_MODEL = "map_model"
+UNSTRUCTURE = "unstructure"
+VALIDATE = "validate"
+
+
+@dataclass(frozen=True)
+class StageProfile:
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    # Peak memory allocated during the stage, above what was allocated when it started. None unless
+    # memory tracing was requested.
+    memory_peak_bytes: int | None = None
+    # Nesting depth, e.g. encoding detection during create_data has depth 1.
+    depth: int = 0
+
+
+@dataclass
+class ConversionProfile:
+    filepath: str
+    vendor: str | None = None
+    input_size_bytes: int | None = None
+    stages: list[StageProfile] = field(default_factory=list)
+    # Name of the exception type that stopped the conversion, None if it completed.
+    error: str | None = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    @property
+    def wall_seconds(self) -> float:
+        return sum(stage.wall_seconds for stage in self.stages if stage.depth == 0)
+
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(stage.cpu_seconds for stage in self.stages if stage.depth == 0)
+
+    def get_stages(self, name: str) -> list[StageProfile]:
+        return [stage for stage in self.stages if stage.name == name]
+
+
+ProfileCallback = Callable[[ConversionProfile], None]
+
+
+@dataclass
+class _StageFrame:
+    memory_start: int
+    memory_peak: int
+
+
+@dataclass
+class _ProfileState:
+    profile: ConversionProfile
+    trace_memory: bool
+    frames: list[_StageFrame] = field(default_factory=list)
+
+
+_current_state: ContextVar[_ProfileState | None] = ContextVar(
+    "allotropy_profile", default=None
+)
+_profile_callback: ProfileCallback | None = None
+_trace_memory_for_callback = False
+
+
+def set_profile_callback(
+    callback: ProfileCallback | None, *, trace_memory: bool = False
+) -> None:
+    """Profile every conversion, calling callback with the profile when it completes or fails.
+
+    Pass None to stop profiling. Tracing memory slows down conversion considerably.
+    """
+    global _profile_callback, _trace_memory_for_callback  # noqa: PLW0603
+    _profile_callback = callback
+    _trace_memory_for_callback = trace_memory
+
+
+@contextmanager
+def collect_profile(
+    filepath: str, *, trace_memory: bool = False
+) -> Iterator[ConversionProfile]:
+    """Collect a profile of the stages run within the context."""
+    state = _ProfileState(ConversionProfile(filepath), trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    token = _current_state.set(state)
+    try:
+        yield state.profile
+    finally:
+        _current_state.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def collect_profile_for_callback(filepath: str) -> Iterator[ConversionProfile | None]:
+    """Collect a profile and pass it to the profile callback, if one is set and no profile is active.
+
+    The callback is also called when the conversion raises, with the error recorded in the profile.
+    Errors raised by the callback are logged, they never change the result of the conversion.
+    """
+    callback = _profile_callback
+    if callback is None or _current_state.get() is not None:
+        yield None
+        return
+    profile = ConversionProfile(filepath)
+    try:
+        with collect_profile(
+            filepath, trace_memory=_trace_memory_for_callback
+        ) as profile:
+            yield profile
+    except BaseException as e:
+        profile.error = type(e).__name__
+        raise
+    finally:
+        try:
+            callback(profile)
+        except Exception:
+            logger.exception("Profile callback failed for %s", filepath)
+
+
+def current_profile() -> ConversionProfile | None:
+    state = _current_state.get()
+    return None if state is None else state.profile
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    state = _current_state.get()
+    if state is None:
+        yield
+        return
+
+    frames = state.frames
+    frame = _StageFrame(0, 0)
+    trace_memory = state.trace_memory and tracemalloc.is_tracing()
+    if trace_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        # Resetting the peak for this stage would lose the peak of the enclosing stage so far.
+        if frames:
+            frames[-1].memory_peak = max(frames[-1].memory_peak, peak)
+        tracemalloc.reset_peak()
+        frame = _StageFrame(current, current)
+    depth = len(frames)
+    frames.append(frame)
+    # Stages are listed in the order they start, nested stages after the stage containing them.
+    index = len(state.profile.stages)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        frames.pop()
+        memory_peak_bytes = None
+        if trace_memory:
+            peak = max(frame.memory_peak, tracemalloc.get_traced_memory()[1])
+            memory_peak_bytes = peak - frame.memory_start
+            if frames:
+                frames[-1].memory_peak = max(frames[-1].memory_peak, peak)
+        state.profile.stages.insert(
+            index,
+            StageProfile(name, wall_seconds, cpu_seconds, memory_peak_bytes, depth),
+        )
@@ -81,6 +81,8 @@ class GeneratedClass:
     fields: list[FieldDef] | None = None
     bases: list[str] = field(default_factory=list)
     frozen: bool = True
+    # Slotted dataclasses keep instances small, but at most one base of a class can have slots.
+    slots: bool = True
     # Enum members: list of (member_name, value)
     enum_members: list[tuple[str, str]] | None = None
     # Type alias target expression (e.g., "Foo | Bar")
@@ -125,9 +127,10 @@ class GeneratedClass:
 
         # Dataclass
         frozen_str = "frozen=True, " if self.frozen else ""
+        slots_str = ", slots=True" if self.slots else ""
         bases_str = f"({', '.join(self.bases)})" if self.bases else ""
         lines = [
-            f"@dataclass({frozen_str}kw_only=True)",
+            f"@dataclass({frozen_str}kw_only=True{slots_str})",
             f"class {self.name}{bases_str}:",
         ]
 
@@ -165,6 +168,7 @@ class GeneratedClass:
             else None,
             bases=list(self.bases),
             frozen=self.frozen,
+            slots=self.slots,
             enum_members=list(self.enum_members)
             if self.enum_members is not None
             else None,
@@ -232,6 +236,12 @@ class ModuleCode:
         This method is pure — it does not mutate ``self.classes``.
         """
         classes = topological_sort_classes(_deduplicate_classes(self.classes))
+        # Instances of a class with several slotted bases would have conflicting layouts, so only
+        # the first base of a class keeps its slots (the classes are copies, so this is pure too).
+        secondary_bases = {base for c in classes for base in c.bases[1:]}
+        for c in classes:
+            if c.name in secondary_bases:
+                c.slots = False
 
         has_reexports = any(imp.reexport for imp in self.imports)
 
@@ -0,0 +1,576 @@
+"""Generates native Python validators from JSON schemas.
+
+The generated module defines one function per schema node, with the keyword checks of the node
+written out as straight-line Python, and $refs resolved at generation time to direct calls. Each
+function takes the instance and a ``stop`` flag, and returns None when the instance is valid or a
+list of SchemaError otherwise (only the first one when ``stop`` is set, which is used to check
+anyOf/oneOf/not/if branches).
+
+The errors reported match those of jsonschema's Draft202012Validator: same path, keyword and
+message. Schemas using keywords that are not supported raise UnsupportedSchemaError, so callers can
+fall back to jsonschema.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+from urllib.parse import unquote, urldefrag, urljoin
+
+from allotropy.allotrope.native_validation import FORMAT_CHECKS
+
+SchemaLoader = Callable[[str], "dict[str, Any] | None"]
+
+# Draft 2020-12 keywords supported by the generator.
+_SUPPORTED_KEYWORDS = frozenset(
+    {
+        "$ref",
+        "allOf",
+        "anyOf",
+        "const",
+        "contains",
+        "enum",
+        "format",
+        "if",
+        "items",
+        "maxItems",
+        "maximum",
+        "minItems",
+        "minimum",
+        "not",
+        "oneOf",
+        "pattern",
+        "patternProperties",
+        "prefixItems",
+        "properties",
+        "required",
+        "type",
+        "uniqueItems",
+    }
+)
+# The other Draft 2020-12 keywords. Anything else (title, $defs, $asm.* annotations...) is ignored,
+# like jsonschema does.
+_UNSUPPORTED_KEYWORDS = frozenset(
+    {
+        "$dynamicRef",
+        "additionalProperties",
+        "dependentRequired",
+        "dependentSchemas",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "maxContains",
+        "maxLength",
+        "maxProperties",
+        "minContains",
+        "minLength",
+        "minProperties",
+        "multipleOf",
+        "propertyNames",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+
+_TYPE_CHECKS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": "_is_integer({0})",
+    "null": "{0} is None",
+    # Most numbers are floats, skip the slower ABC check for them.
+    "number": "({0}.__class__ is float or _is_number({0}))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+_VALID = "_valid"
+
+
+class UnsupportedSchemaError(Exception):
+    pass
+
+
+class _UnresolvableReferenceError(Exception):
+    pass
+
+
+def _function_header(name: str) -> str:
+    return f"def {name}(x: Any, stop: bool) -> Errors | None:"
+
+
+def _as_list(value: Any) -> list[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _type_check(types: Any, var: str) -> str:
+    checks = []
+    for type_ in _as_list(types):
+        if type_ not in _TYPE_CHECKS:
+            msg = f"Unsupported type: {type_!r}"
+            raise UnsupportedSchemaError(msg)
+        checks.append(_TYPE_CHECKS[type_].format(var))
+    return " or ".join(checks)
+
+
+def _iter_subschemas_with_id(schema: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(schema, dict):
+        if isinstance(schema.get("$id"), str):
+            yield schema
+        for value in schema.values():
+            yield from _iter_subschemas_with_id(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _iter_subschemas_with_id(value)
+
+
+def _resolve_fragment(document: Any, fragment: str) -> Any:
+    for escaped_part in unquote(fragment.lstrip("/")).split("/") if fragment else []:
+        part = escaped_part.replace("~1", "/").replace("~0", "~")
+        if isinstance(document, list):
+            try:
+                document = document[int(part)]
+            except (ValueError, IndexError) as e:
+                msg = f"Unresolvable JSON pointer: {fragment!r}"
+                raise _UnresolvableReferenceError(msg) from e
+        elif isinstance(document, dict) and part in document:
+            document = document[part]
+        else:
+            msg = f"Unresolvable JSON pointer: {fragment!r}"
+            raise _UnresolvableReferenceError(msg)
+    return document
+
+
+class _Function:
+    """Accumulates the body of a generated node function."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def add(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def fail(self, indent: int, validator: str, message: str) -> None:
+        self.add(indent, f"errors = _error(errors, {validator!r}, {message})")
+        self.add(indent, "if stop:")
+        self.add(indent + 1, "return errors")
+
+    def descend(self, indent: int, call: str, key: str | None = None) -> None:
+        self.add(indent, f"e = {call}")
+        self.add(indent, "if e:")
+        if key is None:
+            self.add(indent + 1, "errors = _extend_errors(errors, e)")
+        else:
+            self.add(indent + 1, f"errors = _child_errors(errors, {key}, e)")
+        self.add(indent + 1, "if stop:")
+        self.add(indent + 2, "return errors")
+
+
+class ValidatorCodeGenerator:
+    """Generates the source of a validator module for a schema.
+
+    load_schema returns the schema with the given $id, for references to other schemas, or None if
+    there is no such schema.
+    """
+
+    def __init__(self, load_schema: SchemaLoader) -> None:
+        self._load_schema = load_schema
+        self._embedded: dict[str, dict[str, Any]] = {}
+        self._names: dict[tuple[int, str], str] = {}
+        self._function_count = 0
+        self._pending: list[tuple[str, dict[str, Any], str]] = []
+        self._functions: list[str] = []
+        self._constants: dict[str, str] = {}
+        # Keeps the schemas that function names are keyed by (the id() of) alive.
+        self._documents: list[Any] = []
+
+    def generate(self, schema: dict[str, Any]) -> str:
+        schema_id = schema.get("$id", "")
+        # Like jsonschema, schemas embedded in the root schema take precedence over loaded ones.
+        for subschema in _iter_subschemas_with_id(schema):
+            self._embedded.setdefault(
+                urljoin(schema_id, subschema["$id"]).rstrip("/"), subschema
+            )
+        self._documents.append(schema)
+        root = self._function_for(schema, schema_id)
+        while self._pending:
+            self._generate_function(*self._pending.pop())
+
+        constants = [f"{name} = {value}" for value, name in self._constants.items()]
+        return "\n".join(
+            [
+                f'"""Validator for {schema_id or "a schema"}, generated by allotropy.schema_gen."""',
+                "",
+                "import re",
+                "from typing import Any",
+                "",
+                "from allotropy.allotrope.native_validation import (",
+                "    child_errors as _child_errors,",
+                "    equal as _equal,",
+                "    error as _error,",
+                "    Errors,",
+                "    extend_errors as _extend_errors,",
+                "    FORMAT_CHECKS as _FORMAT_CHECKS,",
+                "    in_enum as _in_enum,",
+                "    is_integer as _is_integer,",
+                "    is_number as _is_number,",
+                "    is_unique as _is_unique,",
+                ")",
+                "",
+                *constants,
+                "",
+                "",
+                "def validate(instance: Any) -> Errors:",
+                f"    return {root}(instance, False) or []",
+                "",
+                "",
+                _function_header(_VALID),
+                "    return None",
+                *self._functions,
+                "",
+            ]
+        )
+
+    def _constant(self, source: str) -> str:
+        if source not in self._constants:
+            self._constants[source] = f"_c{len(self._constants)}"
+        return self._constants[source]
+
+    def _validation_keywords(self, node: dict[str, Any]) -> set[str]:
+        keywords = node.keys() & _SUPPORTED_KEYWORDS
+        unsupported = node.keys() & _UNSUPPORTED_KEYWORDS
+        if unsupported:
+            msg = f"Unsupported keywords: {sorted(unsupported)}"
+            raise UnsupportedSchemaError(msg)
+        if "contains" in node and ("minContains" in node or "maxContains" in node):
+            msg = "Unsupported keywords: minContains/maxContains"
+            raise UnsupportedSchemaError(msg)
+        return keywords
+
+    def _resolve(self, ref: str, scope: str) -> tuple[dict[str, Any], str]:
+        url = urljoin(scope, ref).rstrip("/")
+        document_url, fragment = urldefrag(url)
+        document = self._embedded.get(document_url.rstrip("/"))
+        if document is None:
+            document = self._load_schema(document_url)
+        if document is None:
+            msg = f"Unresolvable reference: {ref!r}"
+            raise _UnresolvableReferenceError(msg)
+        self._documents.append(document)
+        return _resolve_fragment(document, fragment), document_url
+
+    def _function_for(self, node: Any, scope: str) -> str:
+        """Return the name of the function validating node, queueing it for generation if needed."""
+        if node is True:
+            return _VALID
+        if not isinstance(node, dict):
+            msg = f"Unsupported schema: {node!r}"
+            raise UnsupportedSchemaError(msg)
+        if isinstance(node.get("$id"), str):
+            scope = urljoin(scope, node["$id"])
+        # Refs to a fragment of the current document don't change how further refs are resolved.
+        scope = urldefrag(scope)[0]
+        key = (id(node), scope)
+        if key in self._names:
+            return self._names[key]
+
+        keywords = self._validation_keywords(node)
+        if not keywords:
+            name = _VALID
+        elif keywords == {"$ref"}:
+            # A plain reference, call the referenced schema's function directly.
+            name = self._ref_function(node["$ref"], scope)
+        else:
+            name = self._new_function_name()
+            self._pending.append((name, node, scope))
+        self._names[key] = name
+        return name
+
+    def _new_function_name(self) -> str:
+        self._function_count += 1
+        return f"_v{self._function_count}"
+
+    def _ref_function(self, ref: str, scope: str) -> str:
+        try:
+            return self._function_for(*self._resolve(ref, scope))
+        except _UnresolvableReferenceError as e:
+            # Like jsonschema, only fail if the reference is used to validate an instance.
+            name = self._new_function_name()
+            self._functions.extend(
+                ["", "", _function_header(name), f"    raise ValueError({str(e)!r})"]
+            )
+            return name
+
+    def _generate_function(self, name: str, node: dict[str, Any], scope: str) -> None:
+        function = _Function()
+        keywords = self._validation_keywords(node)
+
+        if "type" in keywords:
+            types = _as_list(node["type"])
+            reprs = ", ".join(repr(type_) for type_ in types)
+            function.add(0, f"if not ({_type_check(types, 'x')}):")
+            function.fail(1, "type", f"repr(x) + {' is not of type ' + reprs!r}")
+        if "const" in keywords:
+            const = node["const"]
+            condition = (
+                f"x != {const!r}"
+                if isinstance(const, str)
+                else f"not _equal(x, {self._constant(repr(const))})"
+            )
+            function.add(0, f"if {condition}:")
+            function.fail(0 + 1, "const", repr(f"{const!r} was expected"))
+        if "enum" in keywords:
+            enum = node["enum"]
+            if all(isinstance(value, str) for value in enum):
+                values = self._constant(f"frozenset({sorted(set(enum))!r})")
+                function.add(0, f"if not (isinstance(x, str) and x in {values}):")
+            else:
+                function.add(0, f"if not _in_enum(x, {self._constant(repr(enum))}):")
+            function.fail(1, "enum", f"repr(x) + {' is not one of ' + repr(enum)!r}")
+        self._add_object_checks(function, node, keywords, scope)
+        self._add_array_checks(function, node, keywords, scope)
+        self._add_string_checks(function, node, keywords)
+        if keywords & {"minimum", "maximum"}:
+            function.add(0, "if x.__class__ is float or _is_number(x):")
+            if "minimum" in keywords:
+                minimum = node["minimum"]
+                function.add(1, f"if x < {minimum!r}:")
+                function.fail(
+                    2,
+                    "minimum",
+                    f"repr(x) + {' is less than the minimum of ' + repr(minimum)!r}",
+                )
+            if "maximum" in keywords:
+                maximum = node["maximum"]
+                function.add(1, f"if x > {maximum!r}:")
+                function.fail(
+                    2,
+                    "maximum",
+                    f"repr(x) + {' is greater than the maximum of ' + repr(maximum)!r}",
+                )
+        self._add_applicators(function, node, keywords, scope)
+
+        self._functions.extend(
+            ["", "", _function_header(name), "    errors: Errors | None = None"]
+        )
+        self._functions.extend("    " + line for line in function.lines)
+        self._functions.append("    return errors")
+
+    def _add_object_checks(
+        self,
+        function: _Function,
+        node: dict[str, Any],
+        keywords: set[str],
+        scope: str,
+    ) -> None:
+        if not keywords & {"properties", "required", "patternProperties"}:
+            return
+        function.add(0, "if isinstance(x, dict):")
+        start = len(function.lines)
+        for property_ in node.get("required", []):
+            function.add(1, f"if {property_!r} not in x:")
+            function.fail(2, "required", repr(f"{property_!r} is a required property"))
+        for property_, subschema in node.get("properties", {}).items():
+            child = self._function_for(subschema, scope)
+            if child == _VALID:
+                continue
+            function.add(1, f"if {property_!r} in x:")
+            function.descend(2, f"{child}(x[{property_!r}], stop)", repr(property_))
+        for pattern, subschema in node.get("patternProperties", {}).items():
+            child = self._function_for(subschema, scope)
+            if child == _VALID:
+                continue
+            regex = self._constant(f"re.compile({pattern!r})")
+            function.add(1, "for k, v in x.items():")
+            function.add(2, f"if {regex}.search(k):")
+            function.descend(3, f"{child}(v, stop)", "k")
+        if len(function.lines) == start:
+            function.add(1, "pass")
+
+    def _item_check(self, items: Any) -> str | None:
+        """An inline check equivalent to validating an item against items, for simple type checks."""
+        if not isinstance(items, dict):
+            return None
+        keywords = self._validation_keywords(items)
+        if keywords == {"type"}:
+            return _type_check(items["type"], "v")
+        if keywords == {"anyOf"} and all(
+            isinstance(option, dict) and self._validation_keywords(option) == {"type"}
+            for option in items["anyOf"]
+        ):
+            return " or ".join(
+                _type_check(option["type"], "v") for option in items["anyOf"]
+            )
+        return None
+
+    def _add_array_checks(
+        self,
+        function: _Function,
+        node: dict[str, Any],
+        keywords: set[str],
+        scope: str,
+    ) -> None:
+        array_keywords = {
+            "prefixItems",
+            "items",
+            "minItems",
+            "maxItems",
+            "contains",
+            "uniqueItems",
+        }
+        if not keywords & array_keywords:
+            return
+        function.add(0, "if isinstance(x, list):")
+        start = len(function.lines)
+        prefix_items = node.get("prefixItems", [])
+        for index, subschema in enumerate(prefix_items):
+            child = self._function_for(subschema, scope)
+            if child == _VALID:
+                continue
+            function.add(1, f"if len(x) > {index}:")
+            function.descend(2, f"{child}(x[{index}], stop)", str(index))
+        if "items" in keywords:
+            items = node["items"]
+            if items is False:
+                prefix = len(prefix_items)
+                item = "items" if prefix != 1 else "item"
+                function.add(1, f"if len(x) > {prefix}:")
+                function.fail(
+                    2,
+                    "items",
+                    f"{f'Expected at most {prefix} {item} but found '!r} + str(len(x) - {prefix})"
+                    f" + ' extra: ' + repr(x[{prefix}:] if len(x) - {prefix} != 1 else x[{prefix}])",
+                )
+            elif (child := self._function_for(items, scope)) != _VALID:
+                function.add(
+                    1,
+                    f"for i in range({len(prefix_items)}, len(x)):"
+                    if prefix_items
+                    else "for i, v in enumerate(x):",
+                )
+                if prefix_items:
+                    function.add(2, "v = x[i]")
+                check = self._item_check(items)
+                if check is None:
+                    function.descend(2, f"{child}(v, stop)", "i")
+                else:
+                    # Data cubes have many items, only call the item function for errors.
+                    function.add(2, f"if not ({check}):")
+                    function.descend(3, f"{child}(v, stop)", "i")
+        if "minItems" in keywords:
+            message = (
+                " should be non-empty" if node["minItems"] == 1 else " is too short"
+            )
+            function.add(1, f"if len(x) < {node['minItems']!r}:")
+            function.fail(2, "minItems", f"repr(x) + {message!r}")
+        if "maxItems" in keywords:
+            message = (
+                " is expected to be empty" if node["maxItems"] == 0 else " is too long"
+            )
+            function.add(1, f"if len(x) > {node['maxItems']!r}:")
+            function.fail(2, "maxItems", f"repr(x) + {message!r}")
+        if "contains" in keywords:
+            child = self._function_for(node["contains"], scope)
+            function.add(1, f"if not any({child}(v, True) is None for v in x):")
+            function.fail(
+                2,
+                "contains",
+                f"repr(x) + {' does not contain items matching the given schema'!r}",
+            )
+        if node.get("uniqueItems"):
+            function.add(1, "if not _is_unique(x):")
+            function.fail(2, "uniqueItems", f"repr(x) + {' has non-unique elements'!r}")
+        if len(function.lines) == start:
+            function.add(1, "pass")
+
+    def _add_string_checks(
+        self, function: _Function, node: dict[str, Any], keywords: set[str]
+    ) -> None:
+        format_ = node.get("format")
+        check_format = format_ in FORMAT_CHECKS
+        if "pattern" not in keywords and not check_format:
+            return
+        function.add(0, "if isinstance(x, str):")
+        if "pattern" in keywords:
+            pattern = node["pattern"]
+            regex = self._constant(f"re.compile({pattern!r})")
+            function.add(1, f"if not {regex}.search(x):")
+            function.fail(
+                2, "pattern", f"repr(x) + {' does not match ' + repr(pattern)!r}"
+            )
+        if check_format:
+            checker = self._constant(f"_FORMAT_CHECKS[{format_!r}]")
+            function.add(1, f"if not {checker}(x):")
+            function.fail(2, "format", f"repr(x) + {' is not a ' + repr(format_)!r}")
+
+    def _add_applicators(
+        self,
+        function: _Function,
+        node: dict[str, Any],
+        keywords: set[str],
+        scope: str,
+    ) -> None:
+        if "$ref" in keywords:
+            child = self._ref_function(node["$ref"], scope)
+            if child != _VALID:
+                function.descend(0, f"{child}(x, stop)")
+        for subschema in node.get("allOf", []) if "allOf" in keywords else []:
+            child = self._function_for(subschema, scope)
+            if child != _VALID:
+                function.descend(0, f"{child}(x, stop)")
+        if "anyOf" in keywords:
+            children = [self._function_for(option, scope) for option in node["anyOf"]]
+            if _VALID not in children:
+                invalid = " and ".join(f"{child}(x, True)" for child in children)
+                function.add(0, f"if {invalid or 'True'}:")
+                function.fail(
+                    1,
+                    "anyOf",
+                    f"repr(x) + {' is not valid under any of the given schemas'!r}",
+                )
+        if "oneOf" in keywords:
+            options = node["oneOf"]
+            children = [self._function_for(option, scope) for option in options]
+            results = ", ".join(f"{child}(x, True)" for child in children)
+            function.add(
+                0, f"valid = [i for i, e in enumerate(({results},)) if e is None]"
+            )
+            function.add(0, "if not valid:")
+            function.fail(
+                1,
+                "oneOf",
+                f"repr(x) + {' is not valid under any of the given schemas'!r}",
+            )
+            function.add(0, "elif len(valid) > 1:")
+            # Like jsonschema, list the other valid options first, then the first one.
+            reprs = self._constant(repr(tuple(repr(option) for option in options)))
+            function.fail(
+                1,
+                "oneOf",
+                f"repr(x) + ' is valid under each of ' + "
+                f"', '.join({reprs}[i] for i in valid[1:] + valid[:1])",
+            )
+        if "not" in keywords:
+            child = self._function_for(node["not"], scope)
+            function.add(0, f"if {child}(x, True) is None:")
+            function.fail(
+                1,
+                "not",
+                f"repr(x) + {' should not be valid under ' + repr(node['not'])!r}",
+            )
+        if "if" in keywords and ("then" in node or "else" in node):
+            condition = self._function_for(node["if"], scope)
+            function.add(0, f"if {condition}(x, True) is None:")
+            then = self._function_for(node.get("then", True), scope)
+            if then == _VALID:
+                function.add(1, "pass")
+            else:
+                function.descend(1, f"{then}(x, stop)")
+            if "else" in node:
+                else_ = self._function_for(node["else"], scope)
+                if else_ != _VALID:
+                    function.add(0, "else:")
+                    function.descend(1, f"{else_}(x, stop)")
+
+
+def generate_validator_source(schema: dict[str, Any], load_schema: SchemaLoader) -> str:
+    """Generate the source of a module whose validate(instance) function validates schema."""
+    return ValidatorCodeGenerator(load_schema).generate(schema)
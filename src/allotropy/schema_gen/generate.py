@@ -17,14 +17,20 @@ import subprocess
 import sys
 from typing import Any
 
+from allotropy.allotrope.path_util import get_model_path_from_schema_path
 from allotropy.schema_gen.codegen.generator import SchemaCodeGenerator
 from allotropy.schema_gen.codegen.ir import quote_python_literal
 from allotropy.schema_gen.codegen.type_resolver import extract_unit_const
+from allotropy.schema_gen.codegen.validator import (
+    generate_validator_source,
+    UnsupportedSchemaError,
+)
 from allotropy.schema_gen.fetcher import build_dependency_order, SchemaFetcher
 from allotropy.schema_gen.naming import (
     ALLOTROPE_URL_PREFIX,
     DEFAULT_MODEL_OUTPUT_DIR,
     DEFAULT_SCHEMA_CACHE_DIR,
+    DEFAULT_VALIDATOR_OUTPUT_DIR,
     normalize_schema_url,
     schema_url_to_model_file,
     unit_symbol_to_class_name,
@@ -646,7 +652,7 @@ def _regenerate_quantity_values(
             [
                 "",
                 "",
-                "@dataclass(frozen=True, kw_only=True)",
+                "@dataclass(frozen=True, kw_only=True, slots=True)",
                 f"class {class_name}(TQuantityValue):",
                 f"    unit: str = {quoted}",
             ]
@@ -659,6 +665,62 @@ def _regenerate_quantity_values(
     return qv_path
 
 
+# ---------------------------------------------------------------------------
+# Validator generation
+# ---------------------------------------------------------------------------
+
+
+def generate_validators(
+    schema_dir: Path = DEFAULT_SCHEMA_CACHE_DIR,
+    output_dir: Path = DEFAULT_VALIDATOR_OUTPUT_DIR,
+) -> list[Path]:
+    """Generate a validator module for each technique schema in schema_dir.
+
+    Modules are written to the path of the schema's model under output_dir, and are used by
+    validate_asm_schema. Schemas using keywords the generator does not support are skipped, they
+    are validated with jsonschema.
+
+    Returns:
+        List of generated Python file paths.
+    """
+    schema_files = sorted(schema_dir.rglob("*.schema.json"))
+    schemas_by_id: dict[str, dict[str, Any]] = {}
+    for schema_file in schema_files:
+        schema = json.loads(schema_file.read_text(encoding="utf-8"))
+        if isinstance(schema.get("$id"), str):
+            schemas_by_id[schema["$id"]] = schema
+
+    print("\nGenerating validators...")
+    generated_files: list[Path] = []
+    for schema_file in schema_files:
+        rel_path = schema_file.relative_to(schema_dir)
+        if rel_path.parts[0] != "adm" or rel_path.parts[1] in _SHARED_SCHEMA_NAMES:
+            continue
+        schema = json.loads(schema_file.read_text(encoding="utf-8"))
+        try:
+            source = generate_validator_source(schema, schemas_by_id.get)
+        except UnsupportedSchemaError as e:
+            print(f"  Skipped {rel_path}: {e}")
+            continue
+        output_path = Path(output_dir, get_model_path_from_schema_path(rel_path))
+        _ensure_packages(output_dir, output_path.parent)
+        _write_and_lint(output_path, source)
+        generated_files.append(output_path)
+        print(f"  Generated: {output_path}")
+    print(f"\nDone! Generated {len(generated_files)} validator(s)")
+    return generated_files
+
+
+def _ensure_packages(root: Path, directory: Path) -> None:
+    """Create directory, with an __init__.py in it and each of its parents up to root."""
+    directory.mkdir(parents=True, exist_ok=True)
+    rel_dir = directory.relative_to(root)
+    for package_dir in [rel_dir, *rel_dir.parents]:
+        init_file = Path(root, package_dir, "__init__.py")
+        if not init_file.exists():
+            init_file.touch()
+
+
 # ---------------------------------------------------------------------------
 # File writing and formatting
 # ---------------------------------------------------------------------------
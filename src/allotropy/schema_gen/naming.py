@@ -24,6 +24,7 @@ UNITS_SCHEMA_MARKER = "units.schema"
 # Default output directories (relative to project root)
 DEFAULT_SCHEMA_CACHE_DIR = Path("src/allotropy/allotrope/schemas")
 DEFAULT_MODEL_OUTPUT_DIR = Path("src/allotropy/allotrope/models")
+DEFAULT_VALIDATOR_OUTPUT_DIR = Path("src/allotropy/allotrope/validators")
 
 # Pre-compiled regex patterns
 _RE_GITLAB_URL = re.compile(r"https?://gitlab\.com/.+?/json-schemas/(.+?)(?:\.json)?$")
@@ -0,0 +1,460 @@
+"""Benchmark conversion of the test data under tests/parsers/*/testdata.
+
+Each file is converted with its vendor's parser, recording the time of each conversion stage, the
+output size and, with --trace-memory, the peak memory allocated and the memory held by the mapped
+model. Results are compared to a baseline JSON file, reporting the files that got slower, or use
+more memory, than the tolerance allows.
+
+Timings depend on the machine, so the baseline also records the time of a fixed reference
+workload, and baseline timings are scaled by how much faster or slower the reference workload is on
+the machine running the comparison.
+
+    python -m allotropy.testing.bench --vendor AGILENT_GEN5 --vendor MOLDEV_SOFTMAX_PRO
+    python -m allotropy.testing.bench --update-baseline
+    python -m allotropy.testing.bench --technique plate_reader --technique pcr --largest 5 --trace-memory
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field, replace
+import gc
+import json
+from pathlib import Path
+import re
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from allotropy.allotrope.schemas import preload_schema_store
+from allotropy.constants import CHARDET_ENCODING
+from allotropy.exceptions import AllotropeConversionError, AllotropeParsingError
+from allotropy.parser_factory import Vendor
+from allotropy.profiling import ConversionProfile, ENCODING_DETECTION
+from allotropy.testing.utils import get_test_cases, ROOT_DIR
+from allotropy.to_allotrope import (
+    allotrope_from_file_with_profile,
+    allotrope_model_from_file,
+)
+
+TESTDATA_ROOT = Path(ROOT_DIR, "tests", "parsers")
+DEFAULT_BASELINE_PATH = Path(ROOT_DIR, "benchmarks", "baseline.json")
+# Times the reference workload is run, see measure_reference_seconds.
+REFERENCE_REPEAT = 50
+# Allowed relative increase over the baseline.
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.1
+# Changes below these are noise, regardless of the relative increase.
+MIN_TIME_INCREASE_SECONDS = 0.05
+MIN_MEMORY_INCREASE_BYTES = 1 << 20
+
+
+@dataclass
+class FileBenchmark:
+    path: str
+    vendor: str
+    wall_seconds: float
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    memory_peak_bytes: int | None = None
+    # Memory held by the model returned by the schema mapper.
+    model_bytes: int | None = None
+    output_bytes: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class Baseline:
+    files: dict[str, FileBenchmark] = field(default_factory=dict)
+    # Time of the reference conversion on the machine that recorded the baseline.
+    reference_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class Regression:
+    path: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def get_technique(vendor: Vendor) -> str:
+    """The technique of the schema a vendor's parser maps to, e.g. "plate_reader"."""
+    # Schema mappers live in allotropy.allotrope.schema_mappers.adm.<technique>.
+    return vendor.get_parser().SCHEMA_MAPPER.__module__.split(".")[4]
+
+
+def get_vendor_test_files(
+    vendors: Iterable[Vendor] | None = None,
+    pattern: str | None = None,
+    techniques: Iterable[str] | None = None,
+) -> list[tuple[Vendor, Path]]:
+    """Return the test data files of each vendor, as collected by the parser tests."""
+    files: list[tuple[Vendor, Path]] = []
+    for vendor in vendors or Vendor:
+        if techniques is not None and get_technique(vendor) not in techniques:
+            continue
+        # Test data lives in the tests/parsers folder named after the parser package.
+        package = type(vendor.get_parser()).__module__.split(".")[2]
+        testdata_dir = Path(TESTDATA_ROOT, package, "testdata")
+        if not testdata_dir.exists():
+            continue
+        files.extend(
+            (vendor, path)
+            for path in sorted(get_test_cases(testdata_dir))
+            if pattern is None or re.search(pattern, str(path))
+        )
+    return files
+
+
+def get_largest_files(
+    files: Sequence[tuple[Vendor, Path]], count: int
+) -> list[tuple[Vendor, Path]]:
+    """Return the count largest files, in their original order."""
+    largest = set(
+        sorted(files, key=lambda file: file[1].stat().st_size, reverse=True)[:count]
+    )
+    return [file for file in files if file in largest]
+
+
+def _stage_seconds(profile: ConversionProfile) -> dict[str, float]:
+    stage_seconds: dict[str, float] = defaultdict(float)
+    for stage in profile.stages:
+        stage_seconds[stage.name] += stage.wall_seconds
+    return dict(stage_seconds)
+
+
+def _convert_with_profile(
+    vendor: Vendor, path: Path, *, trace_memory: bool = False
+) -> tuple[dict[str, Any], ConversionProfile]:
+    # Like the parser tests, only fall back to (slow) encoding detection for files that are not UTF-8.
+    try:
+        return allotrope_from_file_with_profile(
+            str(path), vendor, trace_memory=trace_memory
+        )
+    except (AllotropeConversionError, AllotropeParsingError) as e:
+        if "decode" not in str(e).lower() and "codec" not in str(e).lower():
+            raise
+    return allotrope_from_file_with_profile(
+        str(path), vendor, encoding=CHARDET_ENCODING, trace_memory=trace_memory
+    )
+
+
+def _measure_model_bytes(vendor: Vendor, path: Path, encoding: str | None) -> int:
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        memory_start, _ = tracemalloc.get_traced_memory()
+        model = allotrope_model_from_file(str(path), vendor, encoding=encoding)
+        # Everything else allocated while parsing has been freed by now.
+        memory_end, _ = tracemalloc.get_traced_memory()
+        del model
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return memory_end - memory_start
+
+
+def benchmark_file(
+    vendor: Vendor, path: Path, repeat: int = 1, *, trace_memory: bool = False
+) -> FileBenchmark:
+    """Convert a file repeat times, keeping the fastest run."""
+    relative_path = str(path.relative_to(ROOT_DIR).as_posix())
+    best: ConversionProfile | None = None
+    try:
+        for _ in range(repeat):
+            asm, profile = _convert_with_profile(vendor, path)
+            if best is None or profile.wall_seconds < best.wall_seconds:
+                best = profile
+        memory_peak_bytes = model_bytes = None
+        if trace_memory:
+            # Tracing slows down conversion, so memory is measured in separate runs.
+            _, profile = _convert_with_profile(vendor, path, trace_memory=True)
+            memory_peak_bytes = max(
+                stage.memory_peak_bytes or 0 for stage in profile.stages
+            )
+            # Use the encoding the conversion ended up with.
+            encoding = (
+                CHARDET_ENCODING if profile.get_stages(ENCODING_DETECTION) else None
+            )
+            model_bytes = _measure_model_bytes(vendor, path, encoding)
+    except Exception as e:
+        return FileBenchmark(relative_path, vendor.name, 0, error=str(e))
+
+    assert best is not None  # noqa: S101
+    return FileBenchmark(
+        relative_path,
+        vendor.name,
+        best.wall_seconds,
+        _stage_seconds(best),
+        memory_peak_bytes,
+        model_bytes,
+        len(json.dumps(asm).encode()),
+    )
+
+
+def _run_reference_workload() -> None:
+    # Plain Python work, similar to parsing and serializing, that does not depend on allotropy code.
+    document = {
+        f"measurement {index}": {"value": index * 0.1, "unit": "RFU", "flags": [index]}
+        for index in range(2000)
+    }
+    for entry in json.loads(json.dumps(document)).values():
+        entry["flags"] = sorted(str(flag) for flag in entry["flags"])
+
+
+def measure_reference_seconds(repeat: int = REFERENCE_REPEAT) -> float:
+    """Time of the fastest of repeat runs of a fixed workload, a measure of the speed of the machine.
+
+    Baseline timings are compared relative to it, so that a baseline recorded on one machine can be
+    checked on another. The workload does not use allotropy, so changes to the code do not change it.
+    """
+    times = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _run_reference_workload()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return min(times)
+
+
+def run_benchmarks(
+    files: Sequence[tuple[Vendor, Path]],
+    repeat: int = 1,
+    *,
+    trace_memory: bool = False,
+    verbose: bool = False,
+) -> list[FileBenchmark]:
+    # Keep the one-time cost of loading schemas out of the first file's time.
+    preload_schema_store()
+    results = []
+    for index, (vendor, path) in enumerate(files, start=1):
+        result = benchmark_file(vendor, path, repeat, trace_memory=trace_memory)
+        if verbose:
+            status = result.error or f"{result.wall_seconds:.3f}s"
+            print(f"[{index}/{len(files)}] {result.path}: {status}", file=sys.stderr)
+        results.append(result)
+    return results
+
+
+def load_baseline(baseline_path: Path) -> Baseline:
+    with open(baseline_path, encoding="UTF-8") as f:
+        data = json.load(f)
+    return Baseline(
+        {entry["path"]: FileBenchmark(**entry) for entry in data["files"]},
+        data.get("reference_seconds"),
+    )
+
+
+def _scale_time(result: FileBenchmark, factor: float) -> FileBenchmark:
+    return replace(
+        result,
+        wall_seconds=result.wall_seconds * factor,
+        stage_seconds={
+            stage: seconds * factor for stage, seconds in result.stage_seconds.items()
+        },
+    )
+
+
+def _get_time_scale(baseline: Baseline, reference_seconds: float | None) -> float:
+    # How much slower the current machine is than the one that recorded the baseline.
+    if reference_seconds is None or baseline.reference_seconds is None:
+        return 1.0
+    return reference_seconds / baseline.reference_seconds
+
+
+def save_baseline(
+    results: Iterable[FileBenchmark],
+    baseline_path: Path,
+    reference_seconds: float | None = None,
+    existing: Baseline | None = None,
+) -> None:
+    """Write results to the baseline, keeping existing entries for files that were not run.
+
+    Times of existing entries are scaled to the reference time of the results.
+    """
+    entries = {}
+    if existing is not None:
+        scale = _get_time_scale(existing, reference_seconds)
+        entries = {
+            path: _scale_time(entry, scale) for path, entry in existing.files.items()
+        }
+    entries.update({result.path: result for result in results if not result.error})
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_path, "w", encoding="UTF-8") as f:
+        json.dump(
+            {
+                "reference_seconds": reference_seconds,
+                "files": [asdict(entries[path]) for path in sorted(entries)],
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def find_regressions(
+    results: Iterable[FileBenchmark],
+    baseline: Baseline,
+    reference_seconds: float | None = None,
+    time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+) -> list[Regression]:
+    """Return the regressions against the baseline, worst first.
+
+    Baseline times are scaled by reference_seconds relative to the reference time of the baseline.
+    """
+    time_scale = _get_time_scale(baseline, reference_seconds)
+    regressions = []
+    for result in results:
+        expected = baseline.files.get(result.path)
+        if expected is None or result.error:
+            continue
+        expected_seconds = expected.wall_seconds * time_scale
+        if result.wall_seconds > max(
+            expected_seconds * (1 + time_tolerance),
+            expected_seconds + MIN_TIME_INCREASE_SECONDS * time_scale,
+        ):
+            regressions.append(
+                Regression(
+                    result.path,
+                    "wall_seconds",
+                    expected_seconds,
+                    result.wall_seconds,
+                )
+            )
+        for metric in ("memory_peak_bytes", "model_bytes"):
+            current = getattr(result, metric)
+            expected_bytes = getattr(expected, metric)
+            if (
+                current is not None
+                and expected_bytes is not None
+                and current
+                > max(
+                    expected_bytes * (1 + memory_tolerance),
+                    expected_bytes + MIN_MEMORY_INCREASE_BYTES,
+                )
+            ):
+                regressions.append(
+                    Regression(result.path, metric, expected_bytes, current)
+                )
+    return sorted(regressions, key=lambda regression: -regression.ratio)
+
+
+def format_report(
+    results: Sequence[FileBenchmark],
+    regressions: Sequence[Regression],
+    top: int = 10,
+) -> str:
+    lines = []
+    total = sum(result.wall_seconds for result in results)
+    lines.append(f"Converted {len(results)} files in {total:.2f}s")
+
+    stage_totals: dict[str, float] = defaultdict(float)
+    for result in results:
+        for stage, seconds in result.stage_seconds.items():
+            stage_totals[stage] += seconds
+    for stage, seconds in sorted(stage_totals.items(), key=lambda item: -item[1]):
+        lines.append(f"  {stage:<20} {seconds:10.2f}s")
+
+    errors = [result for result in results if result.error]
+    if errors:
+        lines.append(f"\n{len(errors)} files failed to convert:")
+        lines.extend(f"  {result.path}: {result.error}" for result in errors)
+
+    lines.append(f"\nSlowest {min(top, len(results))} files:")
+    for result in sorted(results, key=lambda result: -result.wall_seconds)[:top]:
+        lines.append(f"  {result.wall_seconds:8.3f}s  {result.path}")
+
+    if regressions:
+        lines.append(f"\n{len(regressions)} regressions against baseline:")
+        for regression in regressions[:top]:
+            lines.append(
+                f"  {regression.ratio:6.2f}x  {regression.metric}: {regression.baseline:.3f} -> "
+                f"{regression.current:.3f}  {regression.path}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m allotropy.testing.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--vendor",
+        action="append",
+        choices=[vendor.name for vendor in Vendor],
+        help="Only benchmark this vendor, can be repeated.",
+    )
+    parser.add_argument(
+        "--technique",
+        action="append",
+        help="Only benchmark vendors whose schema is of this technique, e.g. plate_reader, can be repeated.",
+    )
+    parser.add_argument(
+        "--filter", help="Only benchmark files whose path matches this regex."
+    )
+    parser.add_argument(
+        "--largest", type=int, help="Only benchmark this many of the largest files."
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results to the baseline instead of comparing against it.",
+    )
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE
+    )
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", type=Path, help="Also write the results here.")
+    args = parser.parse_args(argv)
+
+    files = get_vendor_test_files(
+        [Vendor[name] for name in args.vendor] if args.vendor else None,
+        args.filter,
+        args.technique,
+    )
+    if args.largest is not None:
+        files = get_largest_files(files, args.largest)
+    reference_seconds = measure_reference_seconds()
+    results = run_benchmarks(
+        files, args.repeat, trace_memory=args.trace_memory, verbose=True
+    )
+    # The speed of shared machines varies over time, keep the fastest of both measurements.
+    reference_seconds = min(reference_seconds, measure_reference_seconds())
+    if args.json:
+        save_baseline(results, args.json, reference_seconds)
+
+    baseline = load_baseline(args.baseline) if args.baseline.exists() else Baseline()
+    if args.update_baseline:
+        save_baseline(results, args.baseline, reference_seconds, baseline)
+        regressions: list[Regression] = []
+    else:
+        regressions = find_regressions(
+            results,
+            baseline,
+            reference_seconds,
+            args.time_tolerance,
+            args.memory_tolerance,
+        )
+    print(format_report(results, regressions, args.top))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
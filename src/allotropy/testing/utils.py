@@ -253,6 +253,43 @@ def get_testdata_dir(test_filepath: str) -> Path:
     return Path(Path(test_filepath).parent.relative_to(ROOT_DIR), "testdata")
 
 
+# ParserTest will ignore any files with "error",  "exclude", or "invalid" in their path.
+EXCLUDE_KEYWORDS = {"error", "exclude", "invalid"}
+# Only the folders included in this will be treated as folders for parsing
+PARSE_FOLDER = [".rslt"]
+
+
+def _is_valid_testcase(path: Path) -> bool:
+    if not path.is_file():
+        return False
+    if str(path.stem).startswith("."):
+        return False
+    if "__pycache__" in str(path):
+        return False
+    if path.suffix.lower() in (".pyc", ".py"):
+        return False
+    # Special case to be used when input files are json, test files are put in an input/ folder to indicate.
+    if path.parts[-2] == "input":
+        return True
+    if path.suffix.lower() == ".json":
+        return False
+    if path.suffix.lower() == ".parquet":
+        return False
+    return all(keyword not in str(path).lower() for keyword in EXCLUDE_KEYWORDS)
+
+
+def get_test_cases(testdata_dir: Path) -> list[Path]:
+    test_folders = [
+        path
+        for path in testdata_dir.glob("*")
+        if path.is_dir() and path.suffix in PARSE_FOLDER
+    ]
+    if test_folders:
+        return test_folders
+    else:
+        return [path for path in testdata_dir.rglob("*") if _is_valid_testcase(path)]
+
+
 def from_file(
     test_file: Path | str, vendor: Vendor, encoding: str | None = None
 ) -> DictType:
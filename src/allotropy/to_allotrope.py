@@ -1,13 +1,26 @@
 from datetime import tzinfo
-from io import BytesIO
+from io import BytesIO, StringIO
 import os
 from typing import Any
 
 from allotropy.allotrope.allotrope import serialize_and_validate_allotrope
+from allotropy.allotrope.data_cube_encoding import (
+    DataCubeEncodingOptions,
+    encode_data_cubes,
+)
+from allotropy.cache import cache_key, ConversionCache
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parser_factory import discover_vendor, Vendor
 from allotropy.parsers.utils.locale_context import set_locale_context
+from allotropy.profiling import (
+    collect_profile,
+    collect_profile_for_callback,
+    ConversionProfile,
+    current_profile,
+    profile_stage,
+    VENDOR_DISCOVERY,
+)
 from allotropy.types import IOType
 
 VendorType = Vendor | str
@@ -20,36 +33,130 @@ def allotrope_from_io(
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
     locale: str | None = None,
+    cache: ConversionCache | None = None,
+    data_cube_encoding: DataCubeEncodingOptions | None = None,
 ) -> dict[str, Any]:
-    model = allotrope_model_from_io(
-        contents, filepath, vendor_type, default_timezone, encoding, locale
+    """Convert contents to ASM.
+
+    With data_cube_encoding, the numeric arrays of data cubes are encoded as they are serialized
+    (see allotropy.allotrope.data_cube_encoding), and the result is not valid ASM until decoded.
+    """
+    with collect_profile_for_callback(filepath):
+        if cache is not None:
+            asm = _cached_allotrope_from_io(
+                contents,
+                filepath,
+                vendor_type,
+                default_timezone,
+                encoding,
+                locale,
+                cache,
+            )
+            return _encode_cached(asm, data_cube_encoding)
+        model = allotrope_model_from_io(
+            contents, filepath, vendor_type, default_timezone, encoding, locale
+        )
+        return serialize_and_validate_allotrope(model, data_cube_encoding)
+
+
+def _encode_cached(
+    asm: dict[str, Any], data_cube_encoding: DataCubeEncodingOptions | None
+) -> dict[str, Any]:
+    # The cache holds the ASM of a conversion, which is encoded as it is read.
+    if data_cube_encoding is None:
+        return asm
+    return encode_data_cubes(
+        asm,
+        data_cube_encoding.encoding,
+        float_dtype=data_cube_encoding.float_dtype,
+        sidecar_dir=data_cube_encoding.sidecar_dir,
     )
-    return serialize_and_validate_allotrope(model)
 
 
-def allotrope_model_from_io(
+def allotrope_from_io_with_profile(
     contents: IOType,
     filepath: str,
     vendor_type: VendorType | None = None,
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
     locale: str | None = None,
-) -> Any:
-    named_file_contents = NamedFileContents(contents, filepath, encoding)
+    *,
+    trace_memory: bool = False,
+) -> tuple[dict[str, Any], ConversionProfile]:
+    """Convert contents like allotrope_from_io, returning the ASM and a profile of each stage."""
+    with collect_profile(filepath, trace_memory=trace_memory) as profile:
+        asm = allotrope_from_io(
+            contents, filepath, vendor_type, default_timezone, encoding, locale
+        )
+    return asm, profile
+
+
+def _cached_allotrope_from_io(
+    contents: IOType,
+    filepath: str,
+    vendor_type: VendorType | None,
+    default_timezone: tzinfo | None,
+    encoding: str | None,
+    locale: str | None,
+    cache: ConversionCache,
+) -> dict[str, Any]:
+    data = contents.read()
+    key = cache_key(
+        data.encode() if isinstance(data, str) else data,
+        filepath,
+        vendor_type.value if isinstance(vendor_type, Vendor) else vendor_type,
+        default_timezone,
+        encoding,
+        locale,
+    )
+    if (asm := cache.get(key)) is not None:
+        return asm
+    asm = allotrope_from_io(
+        StringIO(data) if isinstance(data, str) else BytesIO(data),
+        filepath,
+        vendor_type,
+        default_timezone,
+        encoding,
+        locale,
+    )
+    cache.put(key, asm)
+    return asm
+
 
+def get_vendor(
+    named_file_contents: NamedFileContents, vendor_type: VendorType | None = None
+) -> Vendor:
+    """Return the vendor for vendor_type, or discover it from the contents if not specified."""
     if vendor_type is None:
-        vendor = discover_vendor(named_file_contents)
+        with profile_stage(VENDOR_DISCOVERY):
+            vendor = discover_vendor(named_file_contents)
         named_file_contents.contents.seek(0)
-    else:
-        try:
-            vendor = Vendor(vendor_type)
-        except ValueError as e:
-            msg = f"Failed to create parser, unregistered vendor: {vendor_type}."
-            raise AllotropeConversionError(msg) from e
-        if named_file_contents.extension not in vendor.supported_extensions:
-            msg = f"Unsupported file extension '{named_file_contents.extension}' for parser '{vendor.display_name}', expected one of '{vendor.supported_extensions}'."
-            raise AllotropeConversionError(msg)
+        return vendor
+
+    try:
+        vendor = Vendor(vendor_type)
+    except ValueError as e:
+        msg = f"Failed to create parser, unregistered vendor: {vendor_type}."
+        raise AllotropeConversionError(msg) from e
+    if named_file_contents.extension not in vendor.supported_extensions:
+        msg = f"Unsupported file extension '{named_file_contents.extension}' for parser '{vendor.display_name}', expected one of '{vendor.supported_extensions}'."
+        raise AllotropeConversionError(msg)
+    return vendor
+
 
+def allotrope_model_from_io(
+    contents: IOType,
+    filepath: str,
+    vendor_type: VendorType | None = None,
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+    locale: str | None = None,
+) -> Any:
+    named_file_contents = NamedFileContents(contents, filepath, encoding)
+    vendor = get_vendor(named_file_contents, vendor_type)
+    if (profile := current_profile()) is not None:
+        profile.vendor = vendor.name
+        profile.input_size_bytes = _get_size(contents)
     parser = vendor.get_parser(default_timezone=default_timezone)
     if locale:
         with set_locale_context(locale):
@@ -64,11 +171,45 @@ def allotrope_from_file(
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
     locale: str | None = None,
+    cache: ConversionCache | None = None,
+    data_cube_encoding: DataCubeEncodingOptions | None = None,
 ) -> dict[str, Any]:
-    model = allotrope_model_from_file(
-        filepath, vendor_type, default_timezone, encoding, locale
-    )
-    return serialize_and_validate_allotrope(model)
+    """Convert a file (or folder) to ASM, see allotrope_from_io for data_cube_encoding."""
+    with collect_profile_for_callback(filepath):
+        # Folders are parsed from their path rather than contents, so their results are not cached.
+        if cache is not None and os.path.isfile(filepath):
+            with open(filepath, "rb") as f:
+                return allotrope_from_io(
+                    f,
+                    filepath,
+                    vendor_type,
+                    default_timezone,
+                    encoding,
+                    locale,
+                    cache,
+                    data_cube_encoding,
+                )
+        model = allotrope_model_from_file(
+            filepath, vendor_type, default_timezone, encoding, locale
+        )
+        return serialize_and_validate_allotrope(model, data_cube_encoding)
+
+
+def allotrope_from_file_with_profile(
+    filepath: str,
+    vendor_type: VendorType | None = None,
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+    locale: str | None = None,
+    *,
+    trace_memory: bool = False,
+) -> tuple[dict[str, Any], ConversionProfile]:
+    """Convert a file like allotrope_from_file, returning the ASM and a profile of each stage."""
+    with collect_profile(filepath, trace_memory=trace_memory) as profile:
+        asm = allotrope_from_file(
+            filepath, vendor_type, default_timezone, encoding, locale
+        )
+    return asm, profile
 
 
 def allotrope_model_from_file(
@@ -104,6 +245,15 @@ def allotrope_model_from_file(
         raise AllotropeConversionError(msg) from e
 
 
+def _get_size(contents: IOType) -> int | None:
+    if not contents.seekable():
+        return None
+    position = contents.tell()
+    size = contents.seek(0, os.SEEK_END)
+    contents.seek(position)
+    return size
+
+
 def vendor_from_file(filepath: str, encoding: str | None = None) -> Vendor:
     with open(filepath, "rb") as f:
         return vendor_from_io(f, filepath, encoding)
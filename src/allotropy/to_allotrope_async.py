@@ -0,0 +1,266 @@
+"""asyncio versions of the to_allotrope entry points.
+
+Conversion is CPU bound, so each stage (vendor detection, create_data, map_model, serialization and
+schema validation) runs in an executor, returning control to the event loop between stages. A
+cancelled conversion stops before its next stage starts, and a concurrency limit keeps a burst of
+requests from queueing an unbounded amount of work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import tzinfo
+from functools import partial
+from io import BytesIO, StringIO
+import os
+from typing import Any, Protocol, TypeVar
+
+from allotropy.allotrope.allotrope import serialize_allotrope, validate_allotrope
+from allotropy.allotrope.data_cube_encoding import DataCubeEncodingOptions
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parser_factory import discover_vendor, Vendor
+from allotropy.parsers.utils.locale_context import set_locale_context
+from allotropy.to_allotrope import get_vendor, VendorType
+from allotropy.types import IOType
+
+T = TypeVar("T")
+
+
+class AsyncReadable(Protocol):
+    async def read(self) -> bytes | str:
+        ...
+
+
+AsyncContentsType = IOType | bytes | str | AsyncReadable | AsyncIterable[bytes]
+
+
+async def _read_contents(contents: AsyncContentsType) -> IOType:
+    if isinstance(contents, bytes):
+        return BytesIO(contents)
+    if isinstance(contents, str):
+        return StringIO(contents)
+    if isinstance(contents, AsyncIterable):
+        return BytesIO(b"".join([chunk async for chunk in contents]))
+    read = getattr(contents, "read", None)
+    if read is not None and asyncio.iscoroutinefunction(read):
+        data = await read()
+        return BytesIO(data) if isinstance(data, bytes) else StringIO(data)
+    return contents  # type: ignore[return-value]
+
+
+def _run_with_locale(locale: str | None, func: Callable[[], T]) -> T:
+    # Locale is held in a context variable, which executor threads do not inherit.
+    if not locale:
+        return func()
+    with set_locale_context(locale):
+        return func()
+
+
+def _default_max_workers() -> int:
+    # The default number of threads of ThreadPoolExecutor.
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class AsyncConverter:
+    """Runs conversions for asyncio applications.
+
+    Parameters:
+    max_workers: Number of threads of the default executor. Ignored if executor is given.
+    max_concurrency: Maximum number of conversions in progress at a time, defaults to max_workers
+        (or the default number of threads of a ThreadPoolExecutor). Further conversions wait for a
+        slot before reading their contents.
+    executor: Thread pool to run conversion stages in, it is not shut down by close(). Stages are
+        passed file contents and parsers, which can not be sent to other processes, so a
+        ProcessPoolExecutor is not supported.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+        executor: Executor | None = None,
+    ):
+        if isinstance(executor, ProcessPoolExecutor):
+            msg = "AsyncConverter requires a thread pool executor, ProcessPoolExecutor is not supported."
+            raise ValueError(msg)
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="allotropy"
+        )
+        self._max_concurrency = max_concurrency or max_workers or _default_max_workers()
+        # Semaphores are bound to the event loop they are used in.
+        self._semaphore: tuple[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self._max_concurrency))
+        return self._semaphore[1]
+
+    async def _limit(self, coroutine: Awaitable[T]) -> T:
+        async with self._get_semaphore():
+            return await coroutine
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(func, *args)
+        )
+
+    async def _model_from_io(
+        self,
+        contents: AsyncContentsType,
+        filepath: str,
+        vendor_type: VendorType | None,
+        default_timezone: tzinfo | None,
+        encoding: str | None,
+        locale: str | None,
+    ) -> Any:
+        named_file_contents = NamedFileContents(
+            await _read_contents(contents), filepath, encoding
+        )
+        vendor = await self._run(
+            _run_with_locale,
+            locale,
+            partial(get_vendor, named_file_contents, vendor_type),
+        )
+        parser = vendor.get_parser(default_timezone=default_timezone)
+        data = await self._run(
+            _run_with_locale, locale, partial(parser.create_data, named_file_contents)
+        )
+        return await self._run(
+            _run_with_locale, locale, partial(parser.map_model, data)
+        )
+
+    async def _from_io(
+        self,
+        contents: AsyncContentsType,
+        filepath: str,
+        vendor_type: VendorType | None,
+        default_timezone: tzinfo | None,
+        encoding: str | None,
+        locale: str | None,
+        data_cube_encoding: DataCubeEncodingOptions | None,
+    ) -> dict[str, Any]:
+        model = await self._model_from_io(
+            contents, filepath, vendor_type, default_timezone, encoding, locale
+        )
+        asm = await self._run(serialize_allotrope, model, data_cube_encoding)
+        await self._run(
+            partial(
+                validate_allotrope,
+                encoded_data_cubes=data_cube_encoding is not None,
+            ),
+            asm,
+        )
+        return asm
+
+    async def allotrope_from_io(
+        self,
+        contents: AsyncContentsType,
+        filepath: str,
+        vendor_type: VendorType | None = None,
+        default_timezone: tzinfo | None = None,
+        encoding: str | None = None,
+        locale: str | None = None,
+        data_cube_encoding: DataCubeEncodingOptions | None = None,
+    ) -> dict[str, Any]:
+        return await self._limit(
+            self._from_io(
+                contents,
+                filepath,
+                vendor_type,
+                default_timezone,
+                encoding,
+                locale,
+                data_cube_encoding,
+            )
+        )
+
+    async def allotrope_model_from_io(
+        self,
+        contents: AsyncContentsType,
+        filepath: str,
+        vendor_type: VendorType | None = None,
+        default_timezone: tzinfo | None = None,
+        encoding: str | None = None,
+        locale: str | None = None,
+    ) -> Any:
+        return await self._limit(
+            self._model_from_io(
+                contents, filepath, vendor_type, default_timezone, encoding, locale
+            )
+        )
+
+    async def vendor_from_io(
+        self, contents: AsyncContentsType, filepath: str, encoding: str | None = None
+    ) -> Vendor:
+        async def run() -> Vendor:
+            named_file_contents = NamedFileContents(
+                await _read_contents(contents), filepath, encoding
+            )
+            return await self._run(discover_vendor, named_file_contents)
+
+        return await self._limit(run())
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> AsyncConverter:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self.close()
+
+
+_default_converter: AsyncConverter | None = None
+
+
+def _get_default_converter() -> AsyncConverter:
+    global _default_converter  # noqa: PLW0603
+    if _default_converter is None:
+        _default_converter = AsyncConverter()
+    return _default_converter
+
+
+async def allotrope_from_io_async(
+    contents: AsyncContentsType,
+    filepath: str,
+    vendor_type: VendorType | None = None,
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+    locale: str | None = None,
+    data_cube_encoding: DataCubeEncodingOptions | None = None,
+) -> dict[str, Any]:
+    return await _get_default_converter().allotrope_from_io(
+        contents,
+        filepath,
+        vendor_type,
+        default_timezone,
+        encoding,
+        locale,
+        data_cube_encoding,
+    )
+
+
+async def allotrope_model_from_io_async(
+    contents: AsyncContentsType,
+    filepath: str,
+    vendor_type: VendorType | None = None,
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+    locale: str | None = None,
+) -> Any:
+    return await _get_default_converter().allotrope_model_from_io(
+        contents, filepath, vendor_type, default_timezone, encoding, locale
+    )
+
+
+async def vendor_from_io_async(
+    contents: AsyncContentsType, filepath: str, encoding: str | None = None
+) -> Vendor:
+    return await _get_default_converter().vendor_from_io(contents, filepath, encoding)
@@ -5,6 +5,8 @@ from enum import Enum
 import importlib
 from pathlib import Path
 
+import numpy as np
+
 from allotropy.allotrope.converter import (
     add_custom_information_document,
     structure,
@@ -191,6 +193,11 @@ class TestUnstructure:
         result = unstructure({"a": 1, "b": 2})
         assert result == {"a": 1, "b": 2}
 
+    def test_numpy_array_to_list(self) -> None:
+        result = unstructure([np.array([1.5, 2.0]), np.array([1, 2], dtype=np.int32)])
+        assert result == [[1.5, 2.0], [1, 2]]
+        assert not any(isinstance(v, np.generic) for values in result for v in values)
+
 
 # ---------------------------------------------------------------------------
 # structure
@@ -418,6 +425,24 @@ class TestCustomInformationDocument:
         }
         assert structure(asm_dict, ProcessedDataDocumentItem) == item
 
+    def test_slotted_model(self) -> None:
+        document = DataProcessingDocument(
+            cycle_threshold_value_setting=TQuantityValueUnitless(value=1.0),
+        )
+        item = add_custom_information_document(document, {"extra key": "Value"})
+
+        assert isinstance(item, DataProcessingDocument)
+        assert not hasattr(item, "__dict__")
+        assert not hasattr(document, "custom_information_document")
+        assert item.custom_information_document.extra_key == "Value"  # type: ignore
+        assert unstructure(item) == {
+            **unstructure(document),
+            "custom information document": {"extra key": "Value"},
+        }
+        # Attaching another document to the copy replaces it.
+        item = add_custom_information_document(item, {"extra key": "Other value"})
+        assert item.custom_information_document.extra_key == "Other value"  # type: ignore
+
     def test_nested_list_preserved(self) -> None:
         """Nested lists (e.g. data cube arrays) should pass through unchanged."""
         from allotropy.allotrope.converter import (
@@ -0,0 +1,243 @@
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from allotropy.allotrope.converter import unstructure
+from allotropy.allotrope.data_cube_encoding import (
+    DataCubeEncoding,
+    DataCubeEncodingOptions,
+    decode_data_cubes,
+    encode_data_cubes,
+    unstructure_with_encoded_data_cubes,
+    with_placeholder_arrays,
+)
+from allotropy.allotrope.schemas import DEFAULT_ENCODING, validate_asm_schema
+from allotropy.exceptions import AllotropeSerializationError
+from allotropy.parser_factory import Vendor
+from allotropy.to_allotrope import allotrope_model_from_file
+
+TESTDATA = "tests/parsers/benchling_empower/testdata/output/example_01.json"
+INPUT_TESTDATA = "tests/parsers/benchling_empower/testdata/input/example_01.json"
+
+
+def _data_cube(dimensions: list[Any], measures: list[Any]) -> dict[str, Any]:
+    return {
+        "document": [
+            {
+                "data cube": {
+                    "label": "test",
+                    "cube-structure": {"dimensions": [], "measures": []},
+                    "data": {"dimensions": dimensions, "measures": measures},
+                }
+            }
+        ]
+    }
+
+
+def _data(asm: dict[str, Any]) -> dict[str, Any]:
+    data: dict[str, Any] = asm["document"][0]["data cube"]["data"]
+    return data
+
+
+def test_encode_base64() -> None:
+    asm = _data_cube([[0.5, 1.0, 1.5]], [[1, 2, 3], [1.0, None, 3.0], [1, 2.5]])
+    encoded = encode_data_cubes(asm)
+    assert _data(encoded) == {
+        "dimensions": [
+            {
+                "@encoding": "base64",
+                "dtype": "<f8",
+                "data": "AAAAAAAA4D8AAAAAAADwPwAAAAAAAPg/",
+            }
+        ],
+        "measures": [
+            {
+                "@encoding": "base64",
+                "dtype": "<i8",
+                "data": "AQAAAAAAAAACAAAAAAAAAAMAAAAAAAAA",
+            },
+            # Nulls and mixed ints and floats are not encoded.
+            [1.0, None, 3.0],
+            [1, 2.5],
+        ],
+    }
+    assert _data(asm)["dimensions"] == [[0.5, 1.0, 1.5]]
+    assert decode_data_cubes(encoded) == asm
+
+
+def test_encode_float32() -> None:
+    asm = _data_cube([[0.5, 1.0], [0.1, 1.0]], [])
+    encoded = encode_data_cubes(asm, float_dtype="float32")
+    # 0.1 is not exactly representable as float32, so keeps its float64 encoding.
+    assert [array["dtype"] for array in _data(encoded)["dimensions"]] == ["<f4", "<f8"]
+    assert decode_data_cubes(encoded) == asm
+
+
+def test_encode_npy(tmp_path: Path) -> None:
+    asm = _data_cube([[0.5, 1.0]], [[1.0, 2.0]])
+    encoded = encode_data_cubes(
+        asm, DataCubeEncoding.NPY, sidecar_dir=tmp_path, name="example"
+    )
+    assert _data(encoded)["measures"] == [
+        {"@encoding": "npy", "path": "example-data-cube-0-measures-0.npy"}
+    ]
+    assert (tmp_path / "example-data-cube-0-dimensions-0.npy").exists()
+    assert decode_data_cubes(encoded, sidecar_dir=tmp_path) == asm
+
+
+def test_encode_npy_documents_share_sidecar_dir(tmp_path: Path) -> None:
+    first = _data_cube([[0.5, 1.0]], [[1.0, 2.0]])
+    second = _data_cube([[0.5, 1.0]], [[3.0, 4.0]])
+    encoded_first = encode_data_cubes(first, DataCubeEncoding.NPY, sidecar_dir=tmp_path)
+    encoded_second = encode_data_cubes(
+        second, DataCubeEncoding.NPY, sidecar_dir=tmp_path
+    )
+    assert len(list(tmp_path.iterdir())) == 4
+    assert decode_data_cubes(encoded_first, sidecar_dir=tmp_path) == first
+    assert decode_data_cubes(encoded_second, sidecar_dir=tmp_path) == second
+
+
+def test_decode_npy_rejects_paths_outside_sidecar_dir(tmp_path: Path) -> None:
+    sidecar_dir = tmp_path / "sidecar"
+    encoded = encode_data_cubes(
+        _data_cube([[0.5, 1.0]], []),
+        DataCubeEncoding.NPY,
+        sidecar_dir=tmp_path,
+        name="example",
+    )
+    for path in (
+        "../example-data-cube-0-dimensions-0.npy",
+        str(tmp_path / "example-data-cube-0-dimensions-0.npy"),
+    ):
+        _data(encoded)["dimensions"][0]["path"] = path
+        with pytest.raises(
+            AllotropeSerializationError, match="outside of the sidecar directory"
+        ):
+            decode_data_cubes(encoded, sidecar_dir=sidecar_dir)
+
+
+def test_encode_asm_roundtrip(tmp_path: Path) -> None:
+    with open(TESTDATA, encoding=DEFAULT_ENCODING) as f:
+        asm = json.load(f)
+    validate_asm_schema(asm)
+    for encoding, sidecar_dir in (
+        (DataCubeEncoding.BASE64, None),
+        (DataCubeEncoding.NPY, tmp_path),
+    ):
+        encoded = encode_data_cubes(asm, encoding, sidecar_dir=sidecar_dir)
+        assert len(json.dumps(encoded)) < len(json.dumps(asm))
+        decoded = decode_data_cubes(encoded, sidecar_dir=sidecar_dir)
+        assert json.dumps(decoded) == json.dumps(asm)
+        validate_asm_schema(decoded)
+
+
+def test_encode_errors(tmp_path: Path) -> None:
+    asm = _data_cube([[0.5, 1.0]], [])
+    with pytest.raises(
+        AllotropeSerializationError, match="sidecar directory is required"
+    ):
+        encode_data_cubes(asm, DataCubeEncoding.NPY)
+    with pytest.raises(
+        AllotropeSerializationError, match="Unsupported data cube float dtype"
+    ):
+        encode_data_cubes(asm, float_dtype="float16")
+    with pytest.raises(AllotropeSerializationError, match="Invalid data cube sidecar"):
+        encode_data_cubes(
+            asm, DataCubeEncoding.NPY, sidecar_dir=tmp_path, name="../example"
+        )
+
+    encoded = encode_data_cubes(asm, DataCubeEncoding.NPY, sidecar_dir=tmp_path)
+    with pytest.raises(
+        AllotropeSerializationError, match="sidecar directory is required"
+    ):
+        decode_data_cubes(encoded)
+    with pytest.raises(AllotropeSerializationError, match="Failed to decode npy"):
+        decode_data_cubes(encoded, sidecar_dir=tmp_path / "missing")
+    with pytest.raises(
+        AllotropeSerializationError, match="Unrecognized data cube encoding: zip"
+    ):
+        decode_data_cubes(_data_cube([{"@encoding": "zip"}], []))
+
+
+@dataclass
+class _Data:
+    dimensions: list[Any]
+    measures: list[Any]
+
+
+@dataclass
+class _DataCube:
+    cube_structure: dict[str, Any] = field(metadata={"json_name": "cube-structure"})
+    data: _Data
+
+
+@dataclass
+class _Document:
+    data_cube: _DataCube
+
+
+@pytest.mark.parametrize("float_dtype", ["float64", "float32"])
+def test_unstructure_with_encoded_data_cubes_numpy_arrays(float_dtype: str) -> None:
+    model = {
+        "document": [
+            _Document(
+                _DataCube(
+                    {"dimensions": [], "measures": []},
+                    _Data(
+                        dimensions=[
+                            np.array([0.5, 0.1], dtype=np.float32),
+                            np.array([1, 2], dtype=np.int32),
+                            np.array([], dtype=np.float64),
+                        ],
+                        measures=[
+                            np.array([2**64 - 1], dtype=np.uint64),
+                            np.array([True, False]),
+                            np.array([[1.0, 2.0]]),
+                            [1.0, None],
+                        ],
+                    ),
+                )
+            )
+        ]
+    }
+    options = DataCubeEncodingOptions(float_dtype=float_dtype)
+
+    encoded = unstructure_with_encoded_data_cubes(model, options)
+
+    assert encoded == encode_data_cubes(unstructure(model), float_dtype=float_dtype)
+    arrays = _data(encoded)["dimensions"] + _data(encoded)["measures"]
+    assert [array["dtype"] if "@encoding" in array else array for array in arrays] == [
+        "<f4" if float_dtype == "float32" else "<f8",
+        "<i8",
+        # Values that can not be packed, or packed exactly, are converted as by unstructure.
+        [],
+        [2**64 - 1],
+        [True, False],
+        [[1.0, 2.0]],
+        [1.0, None],
+    ]
+    assert decode_data_cubes(encoded) == unstructure(model)
+
+
+def test_unstructure_with_encoded_data_cubes_matches_encode_data_cubes(
+    tmp_path: Path,
+) -> None:
+    model = allotrope_model_from_file(INPUT_TESTDATA, Vendor.BENCHLING_EMPOWER)
+    asm = unstructure(model)
+    assert unstructure_with_encoded_data_cubes(
+        model, DataCubeEncodingOptions()
+    ) == encode_data_cubes(asm)
+
+    encoded = unstructure_with_encoded_data_cubes(
+        model,
+        DataCubeEncodingOptions(DataCubeEncoding.NPY, sidecar_dir=tmp_path / "model"),
+    )
+    assert encoded == encode_data_cubes(
+        asm, DataCubeEncoding.NPY, sidecar_dir=tmp_path / "asm"
+    )
+    assert decode_data_cubes(encoded, sidecar_dir=tmp_path / "model") == asm
+    validate_asm_schema(with_placeholder_arrays(encoded))
@@ -0,0 +1,61 @@
+from allotropy.allotrope.schema_mappers.adm.cell_counting.rec._2024._09.cell_counting import (
+    CalculatedDataItem,
+    Data,
+    Mapper,
+    Measurement,
+    MeasurementGroup,
+    Metadata,
+)
+
+
+def _measurement_group(identifier: str) -> MeasurementGroup:
+    return MeasurementGroup(
+        measurements=[
+            Measurement(
+                measurement_identifier=identifier,
+                timestamp="2024-01-01T00:00:00+00:00",
+                sample_identifier="sample",
+                viability=90.0,
+                viable_cell_density=1.5,
+            )
+        ]
+    )
+
+
+def test_map_model_with_iterables() -> None:
+    calculated_data = (
+        CalculatedDataItem(
+            identifier="calculated",
+            name="average",
+            value=1.0,
+            unit="(unitless)",
+            data_sources=[],
+        )
+        for _ in range(1)
+    )
+    data = Data(
+        metadata=Metadata(
+            asm_file_identifier="file.json",
+            data_system_instance_id="N/A",
+            device_type="cell counter",
+        ),
+        measurement_groups=(_measurement_group(name) for name in ("a", "b")),
+        calculated_data=calculated_data,
+    )
+    model = Mapper("converter", lambda value: value).map_model(data)
+
+    aggregate_document = model.cell_counting_aggregate_document
+    assert aggregate_document is not None
+    documents = aggregate_document.cell_counting_document
+    assert len(documents) == 2
+    # Calculated data is reported in every group, even when it is a generator.
+    for document in documents:
+        assert document.measurement_aggregate_document is not None
+        aggregate = (
+            document.measurement_aggregate_document.calculated_data_aggregate_document
+        )
+        assert aggregate is not None
+        assert [
+            item.calculated_data_identifier
+            for item in aggregate.calculated_data_document
+        ] == ["calculated"]
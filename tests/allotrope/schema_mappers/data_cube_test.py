@@ -0,0 +1,87 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from allotropy.allotrope.converter import unstructure
+from allotropy.allotrope.models.adm.core.rec._2024._09.cube import TDatacube
+from allotropy.allotrope.models.shared.definitions.definitions import (
+    FieldComponentDatatype,
+)
+from allotropy.allotrope.schema_mappers.data_cube import (
+    DataCube,
+    DataCubeComponent,
+    get_data_cube,
+)
+from allotropy.exceptions import AllotropeConversionError
+
+
+def _data_cube(dimension: Any, measure: Any) -> DataCube:
+    return DataCube(
+        label="test",
+        structure_dimensions=[
+            DataCubeComponent(FieldComponentDatatype.double, "elapsed time", "s")
+        ],
+        structure_measures=[
+            DataCubeComponent(FieldComponentDatatype.double, "absorbance", "mAU")
+        ],
+        dimensions=[dimension],
+        measures=[measure],
+    )
+
+
+@pytest.mark.parametrize(
+    "dimension,measure,expected_dimension,expected_measure",
+    [
+        ([1, 2.5], [1.0, None], [1.0, 2.5], [1.0, None]),
+        ([True, False], [1, 2], [1.0, 0.0], [1.0, 2.0]),
+        (["a", "b"], ["c", None], ["a", "b"], ["c", None]),
+        ([], [None, None], [], [None, None]),
+        ((np.float64(1.5),), (np.int64(2),), [1.5], [2.0]),
+        (np.array([1.5, 2.5]), np.array([1, 2]), [1.5, 2.5], [1, 2]),
+        (np.array(["a"]), np.array([True]), ["a"], [True]),
+        (
+            np.array([1.5], dtype=object),
+            np.array(["a", None], dtype=object),
+            [1.5],
+            ["a", None],
+        ),
+    ],
+)
+def test_get_data_cube(
+    dimension: Any, measure: Any, expected_dimension: Any, expected_measure: Any
+) -> None:
+    data_cube = get_data_cube(_data_cube(dimension, measure), TDatacube)
+    assert data_cube is not None
+    data = unstructure(data_cube)["data"]
+    assert data == {"dimensions": [expected_dimension], "measures": [expected_measure]}
+    for expected, actual in zip(
+        expected_dimension + expected_measure,
+        data["dimensions"][0] + data["measures"][0],
+        strict=True,
+    ):
+        assert type(actual) is type(expected)
+
+
+def test_get_data_cube_carries_arrays() -> None:
+    dimension = np.arange(3, dtype=np.float64)
+    measure = np.arange(3, dtype=np.float32)
+    data_cube = get_data_cube(_data_cube(dimension, measure), TDatacube)
+    assert data_cube is not None
+    assert data_cube.data is not None
+    assert data_cube.data.dimensions[0] is dimension
+    assert data_cube.data.measures is not None
+    assert data_cube.data.measures[0] is measure
+
+
+def test_get_data_cube_invalid_values() -> None:
+    with pytest.raises(
+        AllotropeConversionError,
+        match="Unable to extract a TDimensionArray from datacube dimension",
+    ):
+        get_data_cube(_data_cube([1.0, None], [1.0]), TDatacube)
+    with pytest.raises(
+        AllotropeConversionError,
+        match="Unable to extract a TMeasureArray from datacube measure",
+    ):
+        get_data_cube(_data_cube([1.0], [1.0, "a"]), TDatacube)
@@ -1,6 +1,25 @@
+import importlib
+import json
 from pathlib import Path
+from unittest import mock
 
-from allotropy.allotrope.path_util import SCHEMA_DIR_PATH
+import pytest
+from referencing import Registry
+
+from allotropy.allotrope import schemas
+from allotropy.allotrope.path_util import (
+    get_schema_path_from_manifest,
+    get_validator_import_path_from_schema_path,
+    SCHEMA_DIR_PATH,
+)
+from allotropy.allotrope.schemas import (
+    build_schema_index,
+    DEFAULT_ENCODING,
+    SCHEMA_INDEX_PATH,
+    validate_asm_schema,
+)
+from allotropy.exceptions import AllotropeValidationError
+from allotropy.parser_factory import Vendor
 
 
 def test_custom_schemas_have_changenotes() -> None:
@@ -9,3 +28,108 @@ def test_custom_schemas_have_changenotes() -> None:
             continue
         if "BENCHLING" in str(file):
             assert Path(file.parent, "CHANGE_NOTES.md").exists()
+
+
+def test_schema_index_is_up_to_date() -> None:
+    with open(SCHEMA_INDEX_PATH, encoding=DEFAULT_ENCODING) as f:
+        index = json.load(f)
+    # Run write_schema_index() if this fails after adding schemas.
+    assert index == build_schema_index()
+
+
+def test_every_vendor_schema_has_generated_validator() -> None:
+    # Run generate_validators() if this fails after adding schemas.
+    for vendor in Vendor:
+        for manifest in vendor.manifests:
+            import_path = get_validator_import_path_from_schema_path(
+                get_schema_path_from_manifest(manifest)
+            )
+            assert callable(importlib.import_module(import_path).validate)
+
+
+def test_generated_validator_does_not_load_schemas() -> None:
+    with open(
+        "tests/parsers/example_weyland_yutani/testdata/Weyland_Yutani_simple_correct.json",
+        encoding=DEFAULT_ENCODING,
+    ) as f:
+        asm = json.load(f)
+
+    with mock.patch.dict(schemas._schema_cache, clear=True), mock.patch.dict(
+        schemas._native_validator_cache, clear=True
+    ):
+        validate_asm_schema(asm)
+        assert not schemas._schema_cache
+
+
+def test_validation_only_loads_referenced_schemas() -> None:
+    with open(
+        "tests/parsers/example_weyland_yutani/testdata/Weyland_Yutani_simple_correct.json",
+        encoding=DEFAULT_ENCODING,
+    ) as f:
+        asm = json.load(f)
+
+    with mock.patch.object(
+        schemas, "_get_native_validator", return_value=None
+    ), mock.patch.dict(schemas._schema_cache, clear=True), mock.patch.dict(
+        schemas._validator_cache, clear=True
+    ), mock.patch.object(
+        schemas, "_schema_registry", Registry(retrieve=schemas._retrieve_schema)  # type: ignore[call-arg]
+    ):
+        validate_asm_schema(asm)
+        loaded = set(schemas._schema_cache)
+
+    assert "adm/plate-reader/REC/2025/03/plate-reader.schema.json" in loaded
+    assert "qudt/REC/2025/03/units.schema.json" in loaded
+    assert len(loaded) < len(build_schema_index()) / 2
+
+
+def test_jsonschema_fallback_does_not_retrieve_schemas_while_validating() -> None:
+    with open(
+        "tests/parsers/agilent_tapestation_analysis/testdata/agilent_tapestation_analysis_example_01.json",
+        encoding=DEFAULT_ENCODING,
+    ) as f:
+        asm = json.load(f)
+
+    retrieve_schema = mock.Mock(wraps=schemas._retrieve_schema)
+    with mock.patch.object(
+        schemas, "_get_native_validator", return_value=None
+    ), mock.patch.dict(schemas._validator_cache, clear=True), mock.patch.object(
+        schemas, "_schema_registry", Registry(retrieve=retrieve_schema)  # type: ignore[call-arg]
+    ):
+        validate_asm_schema(asm)
+
+    # Referenced schemas are added to the registry with the validator, retrieving them while
+    # validating would crawl them again on every lookup.
+    retrieve_schema.assert_not_called()
+
+
+def test_validate_asm_schema_reports_best_error() -> None:
+    with open(
+        "tests/parsers/example_weyland_yutani/testdata/Weyland_Yutani_simple_correct.json",
+        encoding=DEFAULT_ENCODING,
+    ) as f:
+        asm = json.load(f)
+    measurement = asm["plate reader aggregate document"]["plate reader document"][0][
+        "measurement aggregate document"
+    ]["measurement document"][0]
+    del measurement["measurement identifier"]
+
+    with pytest.raises(
+        AllotropeValidationError,
+        match="'measurement identifier' is a required property",
+    ):
+        validate_asm_schema(asm)
+
+
+def test_validate_asm_schema_falls_back_to_jsonschema() -> None:
+    with open(
+        "tests/parsers/example_weyland_yutani/testdata/Weyland_Yutani_simple_correct.json",
+        encoding=DEFAULT_ENCODING,
+    ) as f:
+        asm = json.load(f)
+
+    with mock.patch.object(schemas, "_get_native_validator", return_value=None):
+        validate_asm_schema(asm)
+        asm["plate reader aggregate document"]["device system document"] = "invalid"
+        with pytest.raises(AllotropeValidationError, match="is not of type 'object'"):
+            validate_asm_schema(asm)
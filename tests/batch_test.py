@@ -0,0 +1,237 @@
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+import pytest
+
+from allotropy.allotrope.data_cube_encoding import (
+    DataCubeEncoding,
+    DataCubeEncodingOptions,
+    decode_data_cubes,
+)
+from allotropy.allotrope.schemas import validate_asm_schema
+from allotropy.batch import (
+    allotrope_from_files,
+    ExecutorType,
+    FileConversionResult,
+    TIMEOUT_ERROR,
+    WORKER_CRASH_ERROR,
+)
+from allotropy.exceptions import AllotropeValidationError
+from allotropy.parser_factory import Vendor
+
+VALID_FILE = (
+    "tests/parsers/example_weyland_yutani/testdata/Weyland_Yutani_simple_correct.csv"
+)
+INVALID_FILE = "not/a/path.csv"
+
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="Patched conversion functions are only inherited by forked workers.",
+)
+
+
+def _by_path(results: list[FileConversionResult]) -> dict[str, FileConversionResult]:
+    return {result.filepath: result for result in results}
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_allotrope_from_files(executor: ExecutorType) -> None:
+    results = _by_path(
+        list(
+            allotrope_from_files(
+                [VALID_FILE, INVALID_FILE],
+                workers=2,
+                executor=executor,
+                vendor_type=Vendor.EXAMPLE_WEYLAND_YUTANI,
+            )
+        )
+    )
+
+    assert results[VALID_FILE].ok
+    assert results[VALID_FILE].asm is not None
+    assert not results[INVALID_FILE].ok
+    assert results[INVALID_FILE].asm is None
+    error = results[INVALID_FILE].error
+    assert error is not None
+    assert error.error_type == "AllotropeConversionError"
+    assert error.message == f"File not found: {INVALID_FILE}."
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_allotrope_from_files_with_data_cube_encoding(
+    executor: ExecutorType, tmp_path: Path
+) -> None:
+    data_cube_file = "tests/parsers/benchling_empower/testdata/input/example_01.json"
+    (result,) = allotrope_from_files(
+        [data_cube_file],
+        executor=executor,
+        vendor_type=Vendor.BENCHLING_EMPOWER,
+        data_cube_encoding=DataCubeEncodingOptions(
+            DataCubeEncoding.NPY, sidecar_dir=tmp_path
+        ),
+    )
+
+    assert result.asm is not None
+    assert '"@encoding": "npy"' in json.dumps(result.asm)
+    validate_asm_schema(decode_data_cubes(result.asm, sidecar_dir=tmp_path))
+
+
+def test_allotrope_from_files_empty() -> None:
+    assert list(allotrope_from_files([])) == []
+
+
+def test_allotrope_from_files_invalid_executor() -> None:
+    with pytest.raises(ValueError, match="Unsupported executor: 'fiber'"):
+        list(allotrope_from_files([VALID_FILE], executor="fiber"))  # type: ignore[arg-type]
+
+
+def _slow_or_crashing_conversion(filepath: str, *_: Any, **__: Any) -> dict[str, Any]:
+    if filepath == "crash.csv":
+        os._exit(1)
+    if filepath == "slow.csv":
+        time.sleep(60)
+    return {"filepath": filepath}
+
+
+@requires_fork
+def test_allotrope_from_files_isolates_timeouts_and_crashes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "allotropy.batch.allotrope_from_file", _slow_or_crashing_conversion
+    )
+    filepaths = ["crash.csv", "slow.csv", "a.csv", "b.csv", "c.csv"]
+    results = _by_path(
+        list(allotrope_from_files(filepaths, workers=2, timeout_seconds=2))
+    )
+
+    assert set(results) == set(filepaths)
+    assert results["crash.csv"].error is not None
+    assert results["crash.csv"].error.error_type == WORKER_CRASH_ERROR
+    assert results["slow.csv"].error is not None
+    assert results["slow.csv"].error.error_type == TIMEOUT_ERROR
+    for filepath in ("a.csv", "b.csv", "c.csv"):
+        assert results[filepath].asm == {"filepath": filepath}
+
+
+def _out_of_memory_conversion(filepath: str, *_: Any, **__: Any) -> dict[str, Any]:
+    if filepath == "oom.csv":
+        raise MemoryError
+    return {"filepath": filepath}
+
+
+@requires_fork
+def test_allotrope_from_files_replaces_worker_after_memory_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "allotropy.batch.allotrope_from_file", _out_of_memory_conversion
+    )
+    filepaths = ["oom.csv", "a.csv", "b.csv"]
+    results = _by_path(list(allotrope_from_files(filepaths, workers=1)))
+
+    assert set(results) == set(filepaths)
+    assert results["oom.csv"].error is not None
+    assert results["oom.csv"].error.error_type == "MemoryError"
+    for filepath in ("a.csv", "b.csv"):
+        assert results[filepath].asm == {"filepath": filepath}
+
+
+def _address_space_bytes() -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmSize:"):
+                return int(line.split()[1]) * 1024
+    msg = "VmSize not found"
+    raise AssertionError(msg)
+
+
+def _allocating_conversion(filepath: str, *_: Any, **__: Any) -> dict[str, Any]:
+    if filepath == "large.csv":
+        import resource  # Not available on Windows.
+
+        soft_limit, _hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+        assert soft_limit != resource.RLIM_INFINITY
+        try:
+            bytearray(soft_limit)
+        except MemoryError as e:
+            # Wrapped as schema validation wraps the errors it runs into.
+            msg = f"Failed to validate in worker {os.getpid()}"
+            raise AllotropeValidationError(msg) from e
+    return {"pid": os.getpid()}
+
+
+@requires_fork
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="The address space limit is only enforced on Linux."
+)
+def test_allotrope_from_files_reports_wrapped_memory_error_under_memory_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("allotropy.batch.allotrope_from_file", _allocating_conversion)
+    # Room for the worker, forked from this process, to convert small files.
+    memory_limit_bytes = _address_space_bytes() + 512 * 1024 * 1024
+    results = _by_path(
+        list(
+            allotrope_from_files(
+                ["large.csv", "small.csv"],
+                workers=1,
+                memory_limit_bytes=memory_limit_bytes,
+            )
+        )
+    )
+
+    error = results["large.csv"].error
+    assert error is not None
+    assert error.error_type == "MemoryError"
+    assert error.message.startswith("Failed to validate in worker")
+    # The worker that ran out of memory is replaced before converting the next file.
+    asm = results["small.csv"].asm
+    assert asm is not None
+    assert error.message != f"Failed to validate in worker {asm['pid']}"
+
+
+def _slow_or_steady_conversion(filepath: str, *_: Any, **__: Any) -> dict[str, Any]:
+    time.sleep(60 if filepath == "slow.csv" else 0.05)
+    return {"filepath": filepath}
+
+
+@requires_fork
+def test_allotrope_from_files_times_out_while_results_arrive(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "allotropy.batch.allotrope_from_file", _slow_or_steady_conversion
+    )
+    filepaths = ["slow.csv", *(f"{index}.csv" for index in range(60))]
+    results = list(allotrope_from_files(filepaths, workers=2, timeout_seconds=1))
+
+    assert {result.filepath for result in results} == set(filepaths)
+    # The other worker keeps delivering results for ~3 seconds, the timeout is reported meanwhile.
+    assert results[-1].filepath != "slow.csv"
+
+
+def test_allotrope_from_files_thread_timeout_with_repeated_filepath(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def slow_conversion(filepath: str, *_: Any, **__: Any) -> dict[str, Any]:
+        time.sleep(1)
+        return {"filepath": filepath}
+
+    monkeypatch.setattr("allotropy.batch.allotrope_from_file", slow_conversion)
+    start = time.perf_counter()
+    yielded_at = [
+        time.perf_counter() - start
+        for _ in allotrope_from_files(
+            ["a.csv", "a.csv"], workers=1, executor="thread", timeout_seconds=0.5
+        )
+    ]
+
+    # The second conversion only starts once the first one is done, and times out on its own.
+    assert len(yielded_at) == 2
+    assert yielded_at[1] > 1
@@ -0,0 +1,68 @@
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from allotropy.cache import cache_key, ConversionCache, DirectoryCache, SQLiteCache
+from allotropy.parser_factory import Vendor
+from allotropy.testing.utils import mock_uuid_generation
+from allotropy.to_allotrope import allotrope_from_file
+
+TEST_FILE = (
+    "tests/parsers/example_weyland_yutani/testdata/Weyland_Yutani_simple_correct.csv"
+)
+
+
+@pytest.fixture(params=["directory", "sqlite"])
+def cache(request: pytest.FixtureRequest, tmp_path: Path) -> ConversionCache:
+    if request.param == "directory":
+        return DirectoryCache(tmp_path / "cache", max_size_bytes=80)
+    return SQLiteCache(tmp_path / "cache.db", max_size_bytes=80)
+
+
+def test_cache_key() -> None:
+    key = cache_key(b"contents", "file.csv", None, None, None, None)
+    assert key == cache_key(b"contents", "file.csv", None, None, None, None)
+    assert key != cache_key(b"other", "file.csv", None, None, None, None)
+    assert key != cache_key(b"contents", "file.csv", "VENDOR", None, None, None)
+    assert key != cache_key(b"contents", "file.csv", None, None, "latin-1", None)
+    assert key != cache_key(b"contents", "file.csv", None, None, None, "de_DE")
+
+
+def test_cache_get_put(cache: ConversionCache) -> None:
+    assert cache.get("a") is None
+    cache.put("a", {"value": "a"})
+    assert cache.get("a") == {"value": "a"}
+
+
+def test_cache_evicts_least_recently_used(cache: ConversionCache) -> None:
+    # Each entry is 33 bytes, so only two fit in the cache.
+    cache.put("a", {"value": "a" * 20})
+    cache.put("b", {"value": "b" * 20})
+    with mock.patch("time.time", return_value=2e9):
+        assert cache.get("a") is not None
+        cache.put("c", {"value": "c" * 20})
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_allotrope_from_file_uses_cache(cache: ConversionCache) -> None:
+    cache.max_size_bytes = 1 << 20
+    with mock_uuid_generation():
+        expected = allotrope_from_file(TEST_FILE, Vendor.EXAMPLE_WEYLAND_YUTANI)
+    with mock_uuid_generation():
+        assert (
+            allotrope_from_file(TEST_FILE, Vendor.EXAMPLE_WEYLAND_YUTANI, cache=cache)
+            == expected
+        )
+
+    with mock.patch(
+        "allotropy.to_allotrope.allotrope_model_from_io"
+    ) as allotrope_model_from_io:
+        assert (
+            allotrope_from_file(TEST_FILE, Vendor.EXAMPLE_WEYLAND_YUTANI, cache=cache)
+            == expected
+        )
+    allotrope_model_from_io.assert_not_called()
@@ -1,17 +1,11 @@
 import inspect
-from pathlib import Path
 import re
 from typing import Any
 
 import pytest
 from pytest import FixtureRequest, Parser
 
-from allotropy.testing.utils import get_testdata_dir
-
-# ParserTest will ignore any files with "error",  "exclude", or "invalid" in their path.
-EXCLUDE_KEYWORDS = {"error", "exclude", "invalid"}
-# Only the folders included in this will be treated as folders for parsing
-PARSE_FOLDER = [".rslt"]
+from allotropy.testing.utils import get_test_cases, get_testdata_dir
 
 
 def pytest_addoption(parser: Parser) -> None:
@@ -59,37 +53,6 @@ def warn_unread_keys(request: FixtureRequest) -> Any:
     return request.config.getoption("--warn_unread_keys")
 
 
-def _is_valid_testcase(path: Path) -> bool:
-    if not path.is_file():
-        return False
-    if str(path.stem).startswith("."):
-        return False
-    if "__pycache__" in str(path):
-        return False
-    if path.suffix.lower() in (".pyc", ".py"):
-        return False
-    # Special case to be used when input files are json, test files are put in an input/ folder to indicate.
-    if path.parts[-2] == "input":
-        return True
-    if path.suffix.lower() == ".json":
-        return False
-    if path.suffix.lower() == ".parquet":
-        return False
-    return all(keyword not in str(path).lower() for keyword in EXCLUDE_KEYWORDS)
-
-
-def get_test_cases(testdata_dir: Path) -> list[Path]:
-    test_folders = [
-        path
-        for path in testdata_dir.glob("*")
-        if path.is_dir() and path.suffix in PARSE_FOLDER
-    ]
-    if test_folders:
-        return test_folders
-    else:
-        return [path for path in testdata_dir.rglob("*") if _is_valid_testcase(path)]
-
-
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     # Only parametrize test_file_path if class variable VENDOR is defined, signifying a ParserTest
     if "test_file_path" in metafunc.fixturenames and metafunc.cls.VENDOR:
@@ -1,13 +1,23 @@
+import math
+
 import pandas as pd
+import pytest
 
+from allotropy.allotrope.schema_mappers.adm.plate_reader.rec._2025._03.plate_reader import (
+    ErrorDocument,
+)
+from allotropy.exceptions import AllotropeConversionError
 from allotropy.parsers.agilent_gen5.agilent_gen5_structure import (
     FilterSet,
     get_identifiers,
+    get_kinetic_measurements,
     HeaderData,
     ReadData,
 )
 from allotropy.parsers.agilent_gen5.constants import ReadMode
+from allotropy.parsers.constants import NEGATIVE_ZERO
 from allotropy.parsers.utils.pandas import SeriesData
+from allotropy.parsers.utils.values import assert_not_none
 
 
 def test_create_header_data_no_well_plate_id_in_filename() -> None:
@@ -585,3 +595,28 @@ def test_create_two_read_modes_from_file() -> None:
             gain="extended",
         ),
     }
+
+
+def test_get_kinetic_measurements() -> None:
+    kinetic_lines = [
+        "Time\tT° 600\tA1\tA2\tA3",
+        "0:00:00\t25.0\t0.1\tOVRFLW\t",
+        "0:01:30\t25.1\t0.2\t0.30000000000000004\t",
+        "1:00:00.5\t25.2\t\t0.4\t",
+    ]
+    result = get_kinetic_measurements(kinetic_lines)
+    assert result is not None
+    measurements, elapsed_time, errors = result
+
+    assert elapsed_time == [0.0, 90.0, 3600.5]
+    # Temperature columns and empty wells are dropped.
+    assert list(measurements) == ["A1", "A2"]
+    assert measurements["A1"] == [0.1, 0.2, None]
+    assert measurements["A2"] == [NEGATIVE_ZERO, 0.30000000000000004, 0.4]
+    assert math.copysign(1, assert_not_none(measurements["A2"][0])) == -1
+    assert errors == {"A2": [ErrorDocument(error="OVRFLW", error_feature="0.0s")]}
+
+
+def test_get_kinetic_measurements_invalid_time() -> None:
+    with pytest.raises(AllotropeConversionError, match="Invalid time string: '0:01'"):
+        get_kinetic_measurements(["Time\tA1", "0:00:00\t0.1", "0:01\t0.2"])
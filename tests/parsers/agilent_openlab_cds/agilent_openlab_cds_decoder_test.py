@@ -0,0 +1,53 @@
+from io import BytesIO
+
+import xmltodict
+
+from allotropy.parsers.agilent_openlab_cds.agilent_openlab_cds_decoder import (
+    parse_xml_elements,
+)
+
+XML = b"""\xef\xbb\xbf<?xml version="1.0"?>
+<ACAML xmlns="urn:schemas-agilent-com:acaml21">
+  <Doc>
+    <DocInfo><CreatedByUser>user</CreatedByUser></DocInfo>
+    <Content>
+      <Injections>
+        <MeasData id="1">
+          <Signal id="s1"><Name>DAD1A</Name></Signal>
+          <Signal id="s2"><Name>Pressure</Name></Signal>
+          <DiagnosticData><Item>left out</Item></DiagnosticData>
+        </MeasData>
+        <MeasData id="2">
+          <Signal id="s3"><Name>DAD1A</Name></Signal>
+          <Area val="1.5" unit="mAU*s"/>
+          <Empty/>
+          <Mixed unit="s">text<Child/>tail</Mixed>
+        </MeasData>
+      </Injections>
+    </Content>
+  </Doc>
+</ACAML>
+"""
+MEAS_DATA_PATH = ("ACAML", "Doc", "Content", "Injections", "MeasData")
+
+
+def test_parse_xml_elements() -> None:
+    paths = [
+        ("ACAML", "Doc", "DocInfo"),
+        (*MEAS_DATA_PATH, "Signal"),
+        (*MEAS_DATA_PATH, "Area"),
+        (*MEAS_DATA_PATH, "Empty"),
+        (*MEAS_DATA_PATH, "Mixed"),
+    ]
+    data = parse_xml_elements(BytesIO(XML), paths)
+
+    expected = xmltodict.parse(XML)
+    expected["ACAML"].pop("@xmlns")
+    for meas_data in expected["ACAML"]["Doc"]["Content"]["Injections"]["MeasData"]:
+        meas_data.pop("DiagnosticData", None)
+    assert data == expected
+
+
+def test_parse_xml_elements_missing_paths() -> None:
+    data = parse_xml_elements(BytesIO(XML), [("ACAML", "Doc", "Missing", "Element")])
+    assert data == {"ACAML": {"Doc": {}}}
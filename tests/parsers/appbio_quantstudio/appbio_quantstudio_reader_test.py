@@ -1,12 +1,19 @@
 from io import StringIO
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.appbio_quantstudio.appbio_quantstudio_reader import (
     AppBioQuantStudioReader,
+    AppBioQuantStudioTXTReader,
+    SectionIndex,
 )
+from allotropy.testing.utils import get_testdata_dir
+
+TESTDATA = get_testdata_dir(__file__)
 
 
 def test_header_builder_no_header_then_raise() -> None:
@@ -17,3 +24,49 @@ def test_header_builder_no_header_then_raise() -> None:
         AppBioQuantStudioReader.create(
             NamedFileContents(contents=StringIO(""), original_file_path="tmp.txt")
         )
+
+
+def test_section_index() -> None:
+    data = pd.DataFrame(
+        {
+            "Well": [1, 1, 2, 2, 1],
+            "Cycle": [1, 2, 1, 2, 3],
+            "Rn": [0.5, np.nan, 1.5, 2.5, 3.5],
+            "Task": ["UNKNOWN", "UNKNOWN", "NTC", "NTC", "UNKNOWN"],
+        }
+    )
+    index = SectionIndex(data, ["Well"])
+
+    assert list(index.groups) == [1, 2]
+    assert index.groups[2] == slice(2, 4)
+    assert index.get_values(1, "Cycle").tolist() == [1.0, 2.0, 3.0]
+    assert index.get_values(1, "Rn").tolist() == [0.5, None, 3.5]
+    assert index.get_values(2, "Task").tolist() == ["NTC", "NTC"]
+    assert index.get_rows(2)["Rn"].tolist() == [1.5, 2.5]
+    assert index.get_column("Cycle") is index.get_column("Cycle")
+
+
+def test_txt_reader_sections() -> None:
+    path = TESTDATA / "appbio_quantstudio_example01.txt"
+    with open(path, "rb") as contents:
+        reader = AppBioQuantStudioTXTReader(
+            NamedFileContents(contents=contents, original_file_path=str(path))
+        )
+    assert set(reader.sections) == {
+        "Sample Setup",
+        "Amplification Data",
+        "Multicomponent Data",
+        "Results",
+        "Melt Curve Raw Data",
+    }
+    # Numeric sections keep typed columns.
+    amplification_data = reader.sections["Amplification Data"]
+    assert amplification_data["Cycle"].dtype == np.int64
+    assert amplification_data["Rn"].dtype == np.float64
+
+    with open(path, "rb") as contents:
+        reader = AppBioQuantStudioTXTReader(
+            NamedFileContents(contents=contents, original_file_path=str(path)),
+            section_titles=None,
+        )
+    assert "Raw Data" in reader.sections
@@ -147,8 +147,10 @@ def test_create_metadata(mock_data: dict[str, Any]) -> None:
 
 
 def test_create_measurement_groups(mock_data: dict[str, Any]) -> None:
-    measurement_groups = create_measurement_groups(
-        injections=mock_data["injections"],
+    measurement_groups = list(
+        create_measurement_groups(
+            injections=mock_data["injections"],
+        )
     )
     measurement = measurement_groups[0].measurements[0]
     assert measurement.chromatography_serial_num == NOT_APPLICABLE
@@ -0,0 +1,73 @@
+from io import BytesIO
+import json
+from typing import Any
+from unittest import mock
+
+import numpy as np
+
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.benchling_empower import benchling_empower_reader
+from allotropy.parsers.benchling_empower.benchling_empower_reader import (
+    BenchlingEmpowerReader,
+)
+
+
+def _injection(injection_id: int, sample_name: str) -> dict[str, Any]:
+    return {"fields": {"InjectionId": injection_id, "SampleName": sample_name}}
+
+
+def _get_reader() -> BenchlingEmpowerReader:
+    contents = {
+        "values": {
+            "fields": {"SampleSetName": "set"},
+            # Channels and results come before the injections they belong to.
+            "channels": [
+                {"fields": {"InjectionId": 2}, "chrom": [[0, 1], [2.5, 3.5]]},
+                {"fields": {"InjectionId": 1}, "chrom": [[0, 1], [None, 1.5]]},
+            ],
+            "results": [
+                {
+                    "fields": {"InjectionId": 3, "ResultId": 30},
+                    "peaks": [{"fields": {"PeakId": 300}}],
+                    "curves": None,
+                },
+            ],
+            "injections": [
+                _injection(1, "A"),
+                _injection(2, "B"),
+                _injection(3, "A"),
+            ],
+        }
+    }
+    return BenchlingEmpowerReader(
+        NamedFileContents(BytesIO(json.dumps(contents).encode()), "export.json")
+    )
+
+
+def test_iter_injections_grouped_by_sample() -> None:
+    reader = _get_reader()
+    injections = list(reader.iter_injections())
+
+    assert [injection.data["InjectionId"] for injection in injections] == [1, 3, 2]
+    assert injections[0] is reader.first_injection
+    # Chromatograms with nulls are kept as lists.
+    assert injections[0].data["chrom"][1] == [None, 1.5]
+    assert injections[1].data["results"] == [{"InjectionId": 3, "ResultId": 30}]
+    assert injections[1].data["peaks"] == [{"PeakId": 300}]
+    assert "curves" not in injections[1].data
+    chrom = injections[2].data["chrom"]
+    assert isinstance(chrom[1], np.ndarray)
+    assert chrom[1].tolist() == [2.5, 3.5]
+
+
+def test_iter_injections_decodes_chromatograms_lazily() -> None:
+    reader = _get_reader()
+    decode_chrom = mock.Mock(wraps=benchling_empower_reader._decode_chrom)
+    with mock.patch.dict(benchling_empower_reader._DECODE_LAZY, chrom=decode_chrom):
+        injections = reader.iter_injections()
+        next(injections)
+        decode_chrom.assert_not_called()
+        next(injections)
+        decode_chrom.assert_not_called()
+        next(injections)
+        decode_chrom.assert_called_once()